@@ -0,0 +1,85 @@
+"""Normalize analyses so they can be compared with the stored snapshots.
+
+This is plain Python, so that it can be used both by the snapshot tests and by the
+benchmark harness, which runs in the opentrons package's environment.
+"""
+
+import re
+from typing import Any, Dict, List, Tuple, Union
+
+ReplacementPatterns = Dict[str, List[Tuple[str, str]]]
+
+REPLACEMENT_PATTERNS: ReplacementPatterns = {
+    "detail": [
+        (r"moduleId='[^']+'", "moduleId='UUID'"),
+    ],
+    "traceback": [
+        (r"line \d+,", "line N,"),
+    ],
+}
+ID_KEYS_TO_REPLACE: List[str] = [
+    "id",
+    "pipetteId",
+    "labwareId",
+    "serialNumber",
+    "moduleId",
+    "liquidId",
+    "offsetId",
+]
+TIMESTAMP_KEYS_TO_REPLACE: List[str] = [
+    "createdAt",
+    "startedAt",
+    "completedAt",
+    "lastModified",
+    "created",
+]
+
+
+def sort_all_lists(d: Any, sort_key: str | None = None) -> Any:
+    """Recursively sorts lists in a nested dictionary.
+
+    :param d: The dictionary or list to sort.
+    :param sort_key: The key to sort dictionaries on if they are in a list.
+    """
+    if isinstance(d, dict):
+        return {k: sort_all_lists(v, sort_key) for k, v in d.items()}
+    elif isinstance(d, list):
+        # Sort each item in the list
+        sorted_list = [sort_all_lists(x, sort_key) for x in d]
+        # Try to sort the list if it contains comparable items
+        try:
+            if sort_key and all(isinstance(x, dict) and sort_key in x for x in sorted_list):
+                return sorted(sorted_list, key=lambda x: x[sort_key])
+            else:
+                return sorted(sorted_list)
+        except TypeError:
+            # If items are not comparable, return the list as is
+            return sorted_list
+    else:
+        return d
+
+
+def replace_volatile_values(data: Any) -> Any:
+    """Replace IDs, timestamps and line numbers, which change from run to run."""
+    if isinstance(data, dict):
+        return {k: _process_field(k, replace_volatile_values(v)) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [replace_volatile_values(v) for v in data]
+    return data
+
+
+def normalize_analysis(analysis: Any) -> Any:
+    """Prepare an analysis the way the snapshot tests do before comparing it."""
+    return replace_volatile_values(sort_all_lists(analysis, sort_key="name"))
+
+
+def _process_field(key: str, value: Union[str, Any]) -> Union[str, Any]:
+    if key in ID_KEYS_TO_REPLACE:
+        return "UUID"
+    if key in TIMESTAMP_KEYS_TO_REPLACE:
+        return "TIMESTAMP"
+    if isinstance(value, str):
+        patterns = REPLACEMENT_PATTERNS.get(key, [])
+        for pattern, replacement in patterns:
+            value = re.sub(pattern, replacement, value)
+    return value
@@ -0,0 +1,216 @@
+"""Benchmark protocol analysis over the snapshot protocols, without Docker.
+
+Runs `opentrons.cli.analyze` in-process, in a pool of worker processes, for each
+protocol from the protocol registry. For each protocol it records:
+
+* the wall time of the analysis, not counting importing opentrons;
+* the peak RSS of the process that analyzed it, which analyzes nothing else;
+* the number of commands in the analysis;
+* whether the analysis matches its snapshot in tests/__snapshots__.
+
+The results are compared with a baseline from an earlier run, and protocols that
+got slower or bigger beyond the tolerances, or whose command count changed, are
+reported as regressions. The exit code is 1 if there are regressions, snapshot
+differences, or protocols that couldn't be analyzed.
+
+This must run in an environment with the opentrons package installed, e.g. the
+api project's. It doesn't need Docker or this project's other dependencies.
+
+Usage:
+    python -m citools.benchmark_analyses [--protocol-names NAMES]
+        [--override-protocol-names NAMES] [--workers N] [--baseline PATH]
+        [--update-baseline] [--time-tolerance F] [--rss-tolerance F]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from automation.data.protocol import Protocol
+from automation.data.protocol_registry import ALL_PROTOCOLS, ProtocolRegistry
+from citools.analysis_normalization import normalize_analysis
+
+ROOT: Path = Path(__file__).parent.parent
+SNAPSHOTS: Path = Path(ROOT, "tests", "__snapshots__", "analyses_snapshot_test")
+HOST_RESULTS: Path = Path(ROOT, "analysis_results")
+RESULTS_SUFFIX: str = "benchmark_analysis.json"
+DEFAULT_BASELINE: Path = Path(HOST_RESULTS, "benchmark_baseline.json")
+DEFAULT_REPORT: Path = Path(HOST_RESULTS, "benchmark_report.json")
+# Slowdowns smaller than this are noise, however large they are relative to a fast analysis.
+MIN_TIME_REGRESSION_SECONDS: float = 0.25
+
+
+@dataclass
+class BenchmarkResult:
+    """How analyzing one protocol went."""
+
+    file_stem: str
+    wall_time: float
+    peak_rss_kb: int
+    command_count: int
+    exit_code: int
+    snapshot_matches: Optional[bool]
+    error: Optional[str] = None
+
+
+def _snapshot_path(protocol: Protocol) -> Path:
+    return Path(SNAPSHOTS, f"test_analysis_snapshot[{protocol.short_sha}][{protocol.file_stem}].json")
+
+
+def _analyze(protocol: Protocol) -> BenchmarkResult:
+    """Analyze one protocol. Runs in a worker process that's used only for this protocol."""
+    from opentrons.cli.analyze import analyze as analyze_command
+
+    analysis_file = Path(HOST_RESULTS, f"{protocol.file_stem}_{RESULTS_SUFFIX}")
+    labware = [str(path) for path in protocol.labware_paths if path.exists()]
+    args = ["--json-output", str(analysis_file), "--log-output", os.devnull, str(protocol.file_path), *labware]
+
+    error = None
+    start = time.perf_counter()
+    try:
+        analyze_command.main(args, standalone_mode=False)
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        exit_code = 1
+        error = repr(e)
+    wall_time = time.perf_counter() - start
+    # On Linux, ru_maxrss is in kilobytes.
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    command_count = 0
+    snapshot_matches = None
+    if analysis_file.exists():
+        analysis = json.loads(analysis_file.read_text(encoding="utf-8"))
+        command_count = len(analysis.get("commands", []))
+        snapshot = _snapshot_path(protocol)
+        if snapshot.exists():
+            snapshot_matches = normalize_analysis(analysis) == json.loads(snapshot.read_text(encoding="utf-8"))
+    elif error is None:
+        error = f"No analysis was written (exit code {exit_code})."
+
+    return BenchmarkResult(
+        file_stem=protocol.file_stem,
+        wall_time=wall_time,
+        peak_rss_kb=peak_rss_kb,
+        command_count=command_count,
+        exit_code=exit_code,
+        snapshot_matches=snapshot_matches,
+        error=error,
+    )
+
+
+def _import_opentrons() -> None:
+    # Import in each worker before it starts, so that import time isn't part of any analysis.
+    import opentrons.cli.analyze  # noqa: F401
+
+
+def run_benchmarks(protocols: List[Protocol], workers: int) -> List[BenchmarkResult]:
+    """Analyze every protocol, each in a fresh process, at most `workers` at a time."""
+    HOST_RESULTS.mkdir(exist_ok=True)
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers, initializer=_import_opentrons, maxtasksperchild=1) as pool:
+        results = []
+        for result in pool.imap_unordered(_analyze, protocols):
+            status = "error" if result.error else f"{result.wall_time:6.2f}s {result.peak_rss_kb / 1024:7.1f} MiB"
+            print(f"{result.file_stem}: {status}", flush=True)
+            results.append(result)
+    return sorted(results, key=lambda result: result.file_stem)
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    time_tolerance: float,
+    rss_tolerance: float,
+) -> List[Tuple[str, str]]:
+    """Compare results to the baseline, returning (protocol, description) pairs for regressions."""
+    regressions = []
+    for result in results:
+        before = baseline.get(result.file_stem)
+        if before is None:
+            continue
+        slowdown = result.wall_time - before.wall_time
+        if slowdown > MIN_TIME_REGRESSION_SECONDS and result.wall_time > before.wall_time * (1 + time_tolerance):
+            regressions.append((result.file_stem, f"wall time {before.wall_time:.2f}s -> {result.wall_time:.2f}s"))
+        if result.peak_rss_kb > before.peak_rss_kb * (1 + rss_tolerance):
+            regressions.append((result.file_stem, f"peak RSS {before.peak_rss_kb / 1024:.1f} -> {result.peak_rss_kb / 1024:.1f} MiB"))
+        if result.command_count != before.command_count:
+            regressions.append((result.file_stem, f"command count {before.command_count} -> {result.command_count}"))
+    return regressions
+
+
+def load_results(path: Path) -> Dict[str, BenchmarkResult]:
+    """Load results saved by `save_results`, by protocol file stem."""
+    entries: List[Dict[str, Any]] = json.loads(path.read_text(encoding="utf-8"))["results"]
+    return {entry["file_stem"]: BenchmarkResult(**entry) for entry in entries}
+
+
+def save_results(path: Path, results: List[BenchmarkResult]) -> None:
+    """Save results as JSON, to use as a baseline or report."""
+    path.write_text(
+        json.dumps({"results": [asdict(result) for result in results]}, indent=2),
+        encoding="utf-8",
+    )
+
+
+def main() -> None:
+    """Analyze the protocols and report errors, snapshot differences and regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--protocol-names", default=os.getenv("PROTOCOL_NAMES", ALL_PROTOCOLS))
+    parser.add_argument("--override-protocol-names", default=os.getenv("OVERRIDE_PROTOCOL_NAMES", ALL_PROTOCOLS))
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="save these results as the baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.2, help="allowed fractional slowdown")
+    parser.add_argument("--rss-tolerance", type=float, default=0.1, help="allowed fractional peak RSS growth")
+    args = parser.parse_args()
+
+    protocols = ProtocolRegistry(args.protocol_names, args.override_protocol_names).protocols_to_test
+    if not protocols:
+        sys.exit("No protocols were resolved from the protocol names provided.")
+
+    print(f"Analyzing {len(protocols)} protocol(s) with {args.workers} worker(s).")
+    start = time.perf_counter()
+    results = run_benchmarks(protocols, args.workers)
+    elapsed = time.perf_counter() - start
+    save_results(DEFAULT_REPORT, results)
+
+    errors = [result for result in results if result.error]
+    snapshot_diffs = [result for result in results if result.snapshot_matches is False]
+    no_snapshot = [result for result in results if result.snapshot_matches is None and not result.error]
+    print(f"\n{len(results)} protocols analyzed in {elapsed:.2f}s," f" {sum(result.wall_time for result in results):.2f}s of analysis.")
+    print(f"Report written to {DEFAULT_REPORT}.")
+    for result in errors:
+        print(f"ERROR {result.file_stem}: {result.error}")
+    for result in snapshot_diffs:
+        print(f"SNAPSHOT DIFF {result.file_stem}")
+    for result in no_snapshot:
+        print(f"NO SNAPSHOT {result.file_stem}")
+
+    regressions: List[Tuple[str, str]] = []
+    if args.update_baseline:
+        save_results(args.baseline, results)
+        print(f"Baseline written to {args.baseline}.")
+    elif args.baseline.exists():
+        regressions = find_regressions(results, load_results(args.baseline), args.time_tolerance, args.rss_tolerance)
+        for file_stem, description in regressions:
+            print(f"REGRESSION {file_stem}: {description}")
+        print(f"{len(regressions)} regression(s) compared to {args.baseline}.")
+    else:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to save one.")
+
+    if regressions or snapshot_diffs or errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
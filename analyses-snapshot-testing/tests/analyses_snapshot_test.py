@@ -1,11 +1,12 @@
 import json
 import os
 from pathlib import Path
-from typing import Any, List
+from typing import List
 
 import pytest
 from automation.data.protocol import Protocol
 from automation.data.protocol_registry import ProtocolRegistry
+from citools.analysis_normalization import sort_all_lists
 from citools.generate_analyses import ANALYSIS_SUFFIX, generate_analyses_from_test
 from rich.console import Console
 from syrupy.types import SerializableData
@@ -46,30 +47,6 @@ def analyze_protocols() -> None:
         generate_analyses_from_test(tag=analysis_ref, protocols=tests)
 
 
-def sort_all_lists(d: Any, sort_key: str | None = None) -> Any:
-    """Recursively sorts lists in a nested dictionary.
-
-    :param d: The dictionary or list to sort.
-    :param sort_key: The key to sort dictionaries on if they are in a list.
-    """
-    if isinstance(d, dict):
-        return {k: sort_all_lists(v, sort_key) for k, v in d.items()}
-    elif isinstance(d, list):
-        # Sort each item in the list
-        sorted_list = [sort_all_lists(x, sort_key) for x in d]
-        # Try to sort the list if it contains comparable items
-        try:
-            if sort_key and all(isinstance(x, dict) and sort_key in x for x in sorted_list):
-                return sorted(sorted_list, key=lambda x: x[sort_key])
-            else:
-                return sorted(sorted_list)
-        except TypeError:
-            # If items are not comparable, return the list as is
-            return sorted_list
-    else:
-        return d
-
-
 @pytest.mark.parametrize(
     "protocol",
     protocols_under_test(),
@@ -0,0 +1,97 @@
+"""Micro-benchmark for calls into the hardware API through a ThreadManager.
+
+Builds a simulating hardware controller with a couple of modules behind a
+ThreadManager, the way the robot server runs it, and reports the mean cost of:
+
+* looking up an async method, a sync method and a module's async method,
+  which is what every call pays before it does any work;
+* calling a sync method;
+* reading `attached_modules`;
+* calling a cheap async method, including the round trip to the hardware
+  thread.
+
+Usage:
+    python benchmarks/hardware_call_bridge.py [--calls N] [--repeat R]
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Callable
+
+from opentrons.hardware_control import API, ThreadManager
+from opentrons.hardware_control.modules import SimulatingModule
+
+
+def _time_sync(func: Callable[[], Any], calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+async def _time_async(func: Callable[[], Any], calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+async def _run(calls: int, repeat: int) -> None:
+    thread_manager = ThreadManager(
+        API.build_hardware_simulator,
+        attached_modules={
+            "tempdeck": [
+                SimulatingModule(serial_number="temp-1", model="temperatureModuleV2")
+            ],
+            "magdeck": [
+                SimulatingModule(serial_number="mag-1", model="magneticModuleV2")
+            ],
+        },
+    )
+    hardware = thread_manager.wrapped()
+    try:
+        module = thread_manager.attached_modules[0]
+        results = {
+            "look up async method": _time_sync(lambda: hardware.home, calls, repeat),
+            "look up sync method": _time_sync(
+                lambda: hardware.has_gripper, calls, repeat
+            ),
+            "look up module method": _time_sync(
+                lambda: module.deactivate, calls, repeat
+            ),
+            "call sync method": _time_sync(
+                lambda: hardware.has_gripper(), calls, repeat
+            ),
+            "read attached_modules": _time_sync(
+                lambda: thread_manager.attached_modules, calls, repeat
+            ),
+            "call async method": await _time_async(
+                lambda: hardware.get_lights(), calls // 10, repeat
+            ),
+        }
+    finally:
+        for module in thread_manager.attached_modules:
+            await module.cleanup()
+        thread_manager.clean_up()
+
+    for name, seconds in results.items():
+        print(f"{name + ':':24}{seconds * 1e6:8.2f} us/call")
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(_run(args.calls, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
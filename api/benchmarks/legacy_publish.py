@@ -0,0 +1,85 @@
+"""Micro-benchmark for methods decorated with the legacy command publisher.
+
+Calls a method decorated with `@publish`, like the Python Protocol API's
+`InstrumentContext` methods, and a `publish_context` block that builds its
+command lazily, and reports the mean cost of each:
+
+* unobserved: nothing is subscribed to the broker and its logger is above
+  INFO level, as when a protocol is simulated or analyzed without a log.
+* subscribed: a subscriber receives every message, as when a run is shown
+  in the app.
+
+Usage:
+    python benchmarks/legacy_publish.py [--calls N] [--repeat R]
+"""
+import argparse
+import logging
+import time
+from typing import Any, Callable, Dict
+
+from opentrons.legacy_broker import LegacyBroker
+from opentrons.legacy_commands import protocol_commands as cmds
+from opentrons.legacy_commands.publisher import (
+    CommandPublisher,
+    publish,
+    publish_context,
+)
+
+
+class _Publisher(CommandPublisher):
+    @publish(command=cmds.comment)
+    def comment(self, msg: str) -> None:
+        pass
+
+    @publish(command=cmds.delay)
+    def delay(self, seconds: float = 0, minutes: float = 0, msg: str = "") -> None:
+        pass
+
+    def pause(self, msg: str) -> None:
+        with publish_context(broker=self.broker, command=lambda: cmds.pause(msg)):
+            pass
+
+
+def _time(func: Callable[[], Any], calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def _run(publisher: _Publisher, calls: int, repeat: int) -> Dict[str, float]:
+    return {
+        "decorated, positional": _time(lambda: publisher.comment("hi"), calls, repeat),
+        "decorated, defaults": _time(lambda: publisher.delay(minutes=1), calls, repeat),
+        "publish_context": _time(lambda: publisher.pause("hi"), calls, repeat),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per call."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    broker = LegacyBroker()
+    broker.set_logger(logging.getLogger("benchmarks.legacy_publish"))
+    broker.logger.setLevel(logging.WARNING)
+    publisher = _Publisher(broker)
+
+    unobserved = _run(publisher, args.calls, args.repeat)
+    broker.subscribe("command", lambda message: None)
+    subscribed = _run(publisher, args.calls, args.repeat)
+
+    print(f"{'us/call':24}{'unobserved':>12}{'subscribed':>12}")
+    for name in unobserved:
+        print(
+            f"{name + ':':24}{unobserved[name] * 1e6:12.2f}{subscribed[name] * 1e6:12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
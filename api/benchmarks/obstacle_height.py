@@ -0,0 +1,301 @@
+"""Micro-benchmark for GeometryView obstacle heights on a fully loaded Flex deck.
+
+Loads labware into every slot and staging slot of a Flex, with adapters,
+stacks and a module, then replays a stream of pipette moves through a
+StateStore. After each move it asks for the deck-wide highest Z, the way
+`get_min_travel_z()` does for every arc between labware, and the highest Z
+of each slot, the way partial tip configurations check their neighbours:
+
+* uncached: recomputed from labware, modules and fixtures on every call.
+* cached: `get_all_obstacle_highest_z()` and `get_highest_z_in_slot()`,
+  which reuse their results until labware, modules or the deck change.
+
+Usage:
+    python benchmarks/obstacle_height.py [--moves N] [--repeat R]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Any, Callable, List, Tuple, Type, Union
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.labware_definition import LabwareDefinition
+from opentrons_shared_data.load import load_shared_data
+from opentrons_shared_data.robot import load as load_robot
+
+from opentrons.protocol_engine import commands as cmd
+from opentrons.protocol_engine.actions import (
+    Action,
+    PlayAction,
+    QueueCommandAction,
+    RunCommandAction,
+    SetDeckConfigurationAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.error_recovery_policy import never_recover
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.config import Config
+from opentrons.protocol_engine.state.geometry import GeometryView
+from opentrons.protocol_engine.state.state import StateStore
+from opentrons.protocol_engine.types import (
+    AddressableAreaLocation,
+    DeckSlotLocation,
+    DeckType,
+    LabwareLocation,
+    ModuleDefinition,
+    ModuleModel,
+    OnLabwareLocation,
+    ModuleLocation,
+    StagingSlotLocation,
+)
+from opentrons.types import DeckSlotName, StagingSlotName
+
+_DECK_CONFIGURATION = [
+    ("cutoutA1", "singleLeftSlot", None),
+    ("cutoutB1", "singleLeftSlot", None),
+    ("cutoutC1", "singleLeftSlot", None),
+    ("cutoutD1", "temperatureModuleV2", "temperature-module-serial"),
+    ("cutoutA2", "singleCenterSlot", None),
+    ("cutoutB2", "singleCenterSlot", None),
+    ("cutoutC2", "singleCenterSlot", None),
+    ("cutoutD2", "singleCenterSlot", None),
+    ("cutoutA3", "trashBinAdapter", None),
+    ("cutoutB3", "stagingAreaRightSlot", None),
+    ("cutoutC3", "stagingAreaRightSlot", None),
+    ("cutoutD3", "stagingAreaRightSlot", None),
+]
+
+_PLATE = ("nest_96_wellplate_100ul_pcr_full_skirt", 2)
+_TIP_RACK = ("opentrons_flex_96_tiprack_1000ul", 1)
+_ADAPTER = ("opentrons_96_well_aluminum_block", 1)
+_RESERVOIR = ("nest_12_reservoir_15ml", 1)
+
+_Slot = Union[DeckSlotLocation, StagingSlotLocation]
+
+
+def _build_store() -> StateStore:
+    return StateStore(
+        config=Config(
+            robot_type="OT-3 Standard",
+            deck_type=DeckType.OT3_STANDARD,
+            use_simulated_deck_config=False,
+        ),
+        deck_definition=load_deck("ot3_standard", 5),
+        deck_fixed_labware=[],
+        robot_definition=load_robot("OT-3 Standard"),
+        is_door_open=False,
+        error_recovery_policy=never_recover,
+        deck_configuration=_DECK_CONFIGURATION,
+    )
+
+
+def _run_command(
+    command_id: str,
+    command_type: Type[cmd.Command],
+    request: cmd.CommandCreate,
+    result: Any,
+    state_update: update_types.StateUpdate,
+) -> List[Action]:
+    now = datetime.now()
+    command = command_type.construct(  # type: ignore[union-attr]
+        id=command_id,
+        key=command_id,
+        status=cmd.CommandStatus.SUCCEEDED,
+        createdAt=now,
+        startedAt=now,
+        completedAt=now,
+        params=request.params,
+        result=result,
+    )
+    return [
+        QueueCommandAction(
+            command_id=command_id, created_at=now, request=request, request_hash=None
+        ),
+        RunCommandAction(command_id=command_id, started_at=now),
+        SucceedCommandAction(command=command, state_update=state_update),
+    ]
+
+
+def _load_module(module_id: str, slot_name: DeckSlotName) -> List[Action]:
+    definition = ModuleDefinition.parse_raw(
+        load_shared_data("module/definitions/3/temperatureModuleV2.json")
+    )
+    return _run_command(
+        f"load-{module_id}",
+        cmd.LoadModule,
+        cmd.LoadModuleCreate(
+            params=cmd.LoadModuleParams(
+                model=ModuleModel.TEMPERATURE_MODULE_V2,
+                location=DeckSlotLocation(slotName=slot_name),
+            )
+        ),
+        cmd.LoadModuleResult(
+            moduleId=module_id,
+            model=ModuleModel.TEMPERATURE_MODULE_V2,
+            serialNumber="temperature-module-serial",
+            definition=definition,
+        ),
+        update_types.StateUpdate(),
+    )
+
+
+def _load_labware(
+    labware_id: str, load_name_and_version: Tuple[str, int], location: LabwareLocation
+) -> List[Action]:
+    definition = LabwareDefinition.parse_obj(load_definition(*load_name_and_version))
+    # The labware store only needs the state update, so skip the details of a
+    # real loadLabware command.
+    return _run_command(
+        f"load-{labware_id}",
+        cmd.Comment,
+        cmd.CommentCreate(params=cmd.CommentParams(message=f"load {labware_id}")),
+        cmd.CommentResult(),
+        update_types.StateUpdate(
+            loaded_labware=update_types.LoadedLabwareUpdate(
+                labware_id=labware_id,
+                new_location=location,
+                offset_id=None,
+                display_name=None,
+                definition=definition,
+            )
+        ),
+    )
+
+
+def _build_deck() -> List[Action]:
+    now = datetime.now()
+    actions: List[Action] = [
+        PlayAction(requested_at=now),
+        SetDeckConfigurationAction(deck_configuration=_DECK_CONFIGURATION),
+        *_load_module("temperature-module", DeckSlotName.SLOT_D1),
+        *_load_labware(
+            "adapter-D1", _ADAPTER, ModuleLocation(moduleId="temperature-module")
+        ),
+        *_load_labware("plate-D1", _PLATE, OnLabwareLocation(labwareId="adapter-D1")),
+    ]
+    for slot_name in ["A1", "B1", "C1", "A2", "B2", "C2", "D2", "B3", "C3", "D3"]:
+        if slot_name in ("A2", "B2"):
+            load_name = _TIP_RACK
+        elif slot_name == "C1":
+            load_name = _RESERVOIR
+        else:
+            load_name = _PLATE
+        actions.extend(
+            _load_labware(
+                f"labware-{slot_name}",
+                load_name,
+                DeckSlotLocation(slotName=DeckSlotName.from_primitive(slot_name)),
+            )
+        )
+    # Stack a couple of plates, like a protocol that keeps lids or spares on deck.
+    actions.extend(
+        _load_labware("stacked-C2", _PLATE, OnLabwareLocation(labwareId="labware-C2"))
+    )
+    for slot_name in ["B4", "C4", "D4"]:
+        actions.extend(
+            _load_labware(
+                f"labware-{slot_name}",
+                _PLATE,
+                AddressableAreaLocation(addressableAreaName=slot_name),
+            )
+        )
+    return actions
+
+
+def _build_moves(move_count: int) -> List[Action]:
+    actions: List[Action] = []
+    for i in range(move_count):
+        actions.extend(
+            _run_command(
+                f"move-{i}",
+                cmd.Comment,
+                cmd.CommentCreate(params=cmd.CommentParams(message="move")),
+                cmd.CommentResult(),
+                update_types.StateUpdate(
+                    pipette_location=update_types.PipetteLocationUpdate(
+                        pipette_id="pipette-id",
+                        new_location=update_types.AddressableArea(
+                            addressable_area_name="movableTrashA3"
+                        ),
+                        new_deck_point=update_types.NO_CHANGE,
+                    )
+                ),
+            )
+        )
+    return actions
+
+
+def _all_slots() -> List[_Slot]:
+    slots: List[_Slot] = [
+        DeckSlotLocation(slotName=DeckSlotName.from_primitive(f"{row}{column}"))
+        for row in "ABCD"
+        for column in "123"
+    ]
+    slots.extend(
+        StagingSlotLocation(slotName=StagingSlotName.from_primitive(f"{row}4"))
+        for row in "BCD"
+    )
+    return slots
+
+
+def _uncached(geometry: GeometryView, slots: List[_Slot]) -> float:
+    highest_z = geometry._get_all_obstacle_highest_z()
+    for slot in slots:
+        geometry._get_highest_z_in_slot(slot)
+    return highest_z
+
+
+def _cached(geometry: GeometryView, slots: List[_Slot]) -> float:
+    highest_z = geometry.get_all_obstacle_highest_z()
+    for slot in slots:
+        geometry.get_highest_z_in_slot(slot)
+    return highest_z
+
+
+def _time_moves(
+    query: Callable[[GeometryView, List[_Slot]], float], move_count: int, repeat: int
+) -> float:
+    best = float("inf")
+    slots = _all_slots()
+    for _ in range(repeat):
+        store = _build_store()
+        for action in _build_deck():
+            store.handle_action(action)
+        moves = _build_moves(move_count)
+        geometry = store.geometry
+        start = time.perf_counter()
+        for action in moves:
+            store.handle_action(action)
+            query(geometry, slots)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed / len(moves))
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per move."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--moves", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    store = _build_store()
+    for action in _build_deck():
+        store.handle_action(action)
+    assert _uncached(store.geometry, _all_slots()) == _cached(
+        store.geometry, _all_slots()
+    )
+
+    uncached = _time_moves(_uncached, args.moves, args.repeat)
+    cached = _time_moves(_cached, args.moves, args.repeat)
+    print(
+        f"{len(store.labware.get_all())} labware, {len(store.modules.get_all())} modules"
+    )
+    print(f"uncached: {uncached * 1e6:8.2f} us/move")
+    print(f"cached:   {cached * 1e6:8.2f} us/move")
+    print(f"speedup:  {uncached / cached:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
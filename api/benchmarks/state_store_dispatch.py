@@ -0,0 +1,136 @@
+"""Micro-benchmark for ProtocolEngine StateStore action dispatch.
+
+Replays a synthetic stream of queue/run/succeed actions for commands that
+move a pipette, interleaved with liquid definitions, through a StateStore and reports the
+mean cost per dispatched action. For comparison, the same stream is replayed
+through a store that fans every action out to every substore, which is how
+dispatch worked before substores declared the actions they handle.
+
+Usage:
+    python benchmarks/state_store_dispatch.py [--commands N] [--repeat R]
+"""
+import argparse
+import time
+from datetime import datetime
+from typing import Callable, List
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.robot import load as load_robot
+
+from opentrons.protocol_engine import commands as cmd
+from opentrons.protocol_engine.actions import (
+    Action,
+    AddLiquidAction,
+    PlayAction,
+    QueueCommandAction,
+    RunCommandAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.error_recovery_policy import never_recover
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.config import Config
+from opentrons.protocol_engine.state.state import StateStore
+from opentrons.protocol_engine.types import DeckType, Liquid
+
+
+class _FanOutStateStore(StateStore):
+    """A StateStore that dispatches every action to every substore."""
+
+    def handle_action(self, action: Action) -> None:
+        for substore in self._substores:
+            substore.handle_action(action)
+        self._update_state_views()
+
+
+def _build_store(store_cls: Callable[..., StateStore]) -> StateStore:
+    return store_cls(
+        config=Config(robot_type="OT-2 Standard", deck_type=DeckType.OT2_STANDARD),
+        deck_definition=load_deck("ot2_standard", 5),
+        deck_fixed_labware=[],
+        robot_definition=load_robot("OT-2 Standard"),
+        is_door_open=False,
+        error_recovery_policy=never_recover,
+    )
+
+
+def _build_actions(command_count: int) -> List[Action]:
+    now = datetime.now()
+    actions: List[Action] = [PlayAction(requested_at=now)]
+    for i in range(command_count):
+        command_id = f"command-{i}"
+        request = cmd.CommentCreate(params=cmd.CommentParams(message="hello"))
+        command = cmd.Comment(
+            id=command_id,
+            key=command_id,
+            status=cmd.CommandStatus.SUCCEEDED,
+            createdAt=now,
+            startedAt=now,
+            completedAt=now,
+            params=request.params,
+            result=cmd.CommentResult(),
+        )
+        actions.append(
+            QueueCommandAction(
+                command_id=command_id,
+                created_at=now,
+                request=request,
+                request_hash=None,
+            )
+        )
+        actions.append(RunCommandAction(command_id=command_id, started_at=now))
+        actions.append(
+            SucceedCommandAction(
+                command=command,
+                state_update=update_types.StateUpdate(
+                    pipette_location=update_types.PipetteLocationUpdate(
+                        pipette_id="pipette-id",
+                        new_location=update_types.AddressableArea(
+                            addressable_area_name="fixedTrash"
+                        ),
+                        new_deck_point=update_types.NO_CHANGE,
+                    )
+                ),
+            )
+        )
+        if i % 10 == 0:
+            actions.append(
+                AddLiquidAction(
+                    liquid=Liquid.construct(
+                        id=f"liquid-{i}", displayName="water", description=""
+                    )
+                )
+            )
+    return actions
+
+
+def _time_dispatch(
+    store_cls: Callable[..., StateStore], command_count: int, repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        store = _build_store(store_cls)
+        actions = _build_actions(command_count)
+        start = time.perf_counter()
+        for action in actions:
+            store.handle_action(action)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed / len(actions))
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print per-action dispatch cost."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    fan_out = _time_dispatch(_FanOutStateStore, args.commands, args.repeat)
+    routed = _time_dispatch(StateStore, args.commands, args.repeat)
+    print(f"fan-out dispatch: {fan_out * 1e6:8.2f} us/action")
+    print(f"routed dispatch:  {routed * 1e6:8.2f} us/action")
+    print(f"speedup:          {fan_out / routed:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
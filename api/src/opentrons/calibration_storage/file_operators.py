@@ -8,6 +8,8 @@ the v1 API.
 import datetime
 import json
 import logging
+import os
+import threading
 import typing
 from pathlib import Path
 
@@ -22,6 +24,44 @@ _log = logging.getLogger(__name__)
 DecoderType = typing.Type[json.JSONDecoder]
 EncoderType = typing.Type[json.JSONEncoder]
 
+# The file's inode, modification time and size, which change when it's rewritten.
+_FileStamp = typing.Tuple[int, int, int]
+
+# Calibration files that have been read, by absolute path and decoder, with the
+# stamp of the file when it was read. Reads happen in worker threads, so this is
+# guarded by a lock.
+_cal_file_cache: typing.Dict[
+    typing.Tuple[str, DecoderType],
+    typing.Tuple[_FileStamp, typing.Dict[str, typing.Any]],
+] = {}
+_cal_file_cache_lock = threading.Lock()
+
+
+def _cache_path(file_path: Path) -> str:
+    return os.path.abspath(file_path)
+
+
+def _invalidate_cal_file(file_path: Path) -> None:
+    path = _cache_path(file_path)
+    with _cal_file_cache_lock:
+        for key in [key for key in _cal_file_cache if key[0] == path]:
+            del _cal_file_cache[key]
+
+
+def clear_cal_file_cache() -> None:
+    """Forget every calibration file that has been read."""
+    with _cal_file_cache_lock:
+        _cal_file_cache.clear()
+
+
+def _copy_json_data(data: typing.Any) -> typing.Any:
+    # Much faster than copy.deepcopy() for decoded JSON, whose leaves are immutable.
+    if isinstance(data, dict):
+        return {key: _copy_json_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_json_data(value) for value in data]
+    return data
+
 
 # TODO(mc, 2022-06-07): replace with Path.unlink(missing_ok=True)
 # when we are on Python >= 3.8
@@ -30,6 +70,7 @@ def delete_file(path: Path) -> None:
         path.unlink()
     except FileNotFoundError:
         pass
+    _invalidate_cal_file(path)
 
 
 # TODO: This is private but used by other files.
@@ -62,7 +103,19 @@ def read_cal_file(
     :param decoder: if there is any specialized decoder needed.
     The default decoder is the date time decoder.
     :return: Data from the file
+
+    Parsed files are kept in memory, and read again only if they were written
+    through :py:func:`save_to_file` or their modification time or size changed.
+    Each call returns its own copy of the data, which callers are free to modify.
     """
+    file_stat = os.stat(file_path)
+    stamp = (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+    cache_key = (_cache_path(file_path), decoder)
+    with _cal_file_cache_lock:
+        cached = _cal_file_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return typing.cast(typing.Dict[str, typing.Any], _copy_json_data(cached[1]))
+
     # TODO(6/16): We should use tagged unions for
     # both the calibration and tip length dicts to better
     # categorize the Typed Dicts used here.
@@ -78,6 +131,9 @@ def read_cal_file(
         _assert_last_modified_value(dict(calibration_data.values()))
     else:
         _assert_last_modified_value(calibration_data)
+
+    with _cal_file_cache_lock:
+        _cal_file_cache[cache_key] = (stamp, _copy_json_data(calibration_data))
     return calibration_data
 
 
@@ -108,6 +164,7 @@ def save_to_file(
         else json.dumps(data, cls=encoder)
     )
     file_path.write_text(json_data, encoding="utf-8")
+    _invalidate_cal_file(file_path)
 
 
 def serialize_pydantic_model(data: pydantic.BaseModel) -> bytes:
@@ -233,6 +233,17 @@ settings = [
         robot_type=[RobotTypeEnum.OT2, RobotTypeEnum.FLEX],
         internal_only=True,
     ),
+    SettingDefinition(
+        _id="enableSmoothieLookAhead",
+        title="Enable Smoothie look-ahead motion",
+        description=(
+            "Do not enable."
+            " This is an Opentrons internal setting to stream OT-2 gantry moves"
+            " to the motion controller without waiting for each one to finish."
+        ),
+        robot_type=[RobotTypeEnum.OT2],
+        internal_only=True,
+    ),
 ]
 
 
@@ -736,6 +747,16 @@ def _migrate35to36(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
+def _migrate36to37(previous: SettingsMap) -> SettingsMap:
+    """Migrate to version 37 of the feature flags file.
+
+    - Adds the enableSmoothieLookAhead config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap["enableSmoothieLookAhead"] = None
+    return newmap
+
+
 _MIGRATIONS = [
     _migrate0to1,
     _migrate1to2,
@@ -773,6 +794,7 @@ _MIGRATIONS = [
     _migrate33to34,
     _migrate34to35,
     _migrate35to36,
+    _migrate36to37,
 ]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
@@ -82,3 +82,10 @@ def oem_mode_enabled() -> bool:
 
 def allow_liquid_classes(robot_type: RobotTypeEnum) -> bool:
     return advs.get_setting_with_env_overload("allowLiquidClasses", robot_type)
+
+
+def smoothie_look_ahead() -> bool:
+    """Whether the OT-2 should stream gantry moves to the Smoothie's planner."""
+    return advs.get_setting_with_env_overload(
+        "enableSmoothieLookAhead", RobotTypeEnum.OT2
+    )
@@ -13,7 +13,17 @@ import contextlib
 import logging
 from os import environ
 from time import time
-from typing import Any, Dict, Optional, Union, List, Tuple, cast, AsyncIterator
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Union,
+    List,
+    Set,
+    Tuple,
+    cast,
+    AsyncIterator,
+)
 
 from math import isclose
 
@@ -92,6 +102,7 @@ class SmoothieDriver:
         port: str,
         config: RobotConfig,
         gpio_chardev: Optional[GPIODriverLike] = None,
+        look_ahead: bool = False,
     ) -> SmoothieDriver:
         """
         Build a smoothie driver
@@ -100,6 +111,7 @@ class SmoothieDriver:
             port: The port
             config: Robot configuration
             gpio_chardev: Optional GPIO driver
+            look_ahead: Whether to stream gantry moves to the motion planner
 
         Returns:
             A SmoothieDriver instance.
@@ -114,7 +126,12 @@ class SmoothieDriver:
         )
         gpio_chardev = gpio_chardev or SimulatingGPIOCharDev("simulated")
 
-        instance = cls(config=config, connection=connection, gpio_chardev=gpio_chardev)
+        instance = cls(
+            config=config,
+            connection=connection,
+            gpio_chardev=gpio_chardev,
+            look_ahead=look_ahead,
+        )
         await instance._setup()
         return instance
 
@@ -123,6 +140,7 @@ class SmoothieDriver:
         config: RobotConfig,
         gpio_chardev: GPIODriverLike,
         connection: Optional[SerialConnection] = None,
+        look_ahead: bool = False,
     ):
         """
         Constructor
@@ -131,6 +149,9 @@ class SmoothieDriver:
             config: The robot configuration
             gpio_chardev: GPIO device.
             connection: The serial connection.
+            look_ahead: Whether to stream gantry moves to the motion planner
+                without waiting for each one to finish, so that it can blend
+                consecutive moves. See `move`.
         """
         self.run_flag = asyncio.Event()
         self.run_flag.set()
@@ -202,6 +223,13 @@ class SmoothieDriver:
         #: Cache of currently configured splits from callers
         self._axes_moved_at = AxisMoveTimestamp(AXES)
 
+        # Look-ahead mode: moves that were sent without waiting for them to
+        # finish, by the axes they move, and the current command that was
+        # last sent with one of them
+        self._look_ahead = look_ahead
+        self._queued_move_axes: Set[str] = set()
+        self._queued_current_command: Optional[str] = None
+
     @property
     def gpio_chardev(self) -> GPIODriverLike:
         return self._gpio_chardev
@@ -472,7 +500,8 @@ class SmoothieDriver:
         """
         Instead of sending M114.2 we are storing target values in
         self._position since movement and home commands are blocking and
-        assumed to go the correct place.
+        assumed to go the correct place. In look-ahead mode, this is where
+        queued moves will end up once they finish.
 
         Cases where Smoothie would not be in the correct place (such as if a
         belt slips) would not be corrected by getting position with M114.2
@@ -811,6 +840,7 @@ class SmoothieDriver:
         await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
         log.debug("reset_from_error")
         self._is_hard_halting.clear()
+        self._clear_queued_moves()
         await self._send_command(
             _command_builder().add_gcode(gcode=GCODE.RESET_FROM_ERROR)
         )
@@ -824,6 +854,7 @@ class SmoothieDriver:
         suppress_error_msg: bool = False,
         ack_timeout: float = DEFAULT_ACK_TIMEOUT,
         suppress_home_after_error: bool = False,
+        queue: bool = False,
     ) -> str:
         """
         Submit a GCODE command to the robot, followed by M400 to block until
@@ -859,31 +890,78 @@ class SmoothieDriver:
             like home, it should be long enough to allow the command to
             complete in the worst case. If this is None, the timeout will
             be infinite. This is almost certainly not what you want.
+        :param queue: In look-ahead mode, send the command without the M400,
+            so that Smoothie can plan it together with the commands after it.
+            Every command that isn't queued is a barrier: it first waits for
+            the queued commands to finish.
         """
         if self.simulating:
             return ""
+        moves_were_queued = bool(self._queued_move_axes)
         try:
+            if queue and self._look_ahead:
+                return await self._send_command_queued(command, timeout)
+            await self._wait_for_queued_moves()
+            moves_were_queued = False
             return await self._send_command_unsynchronized(
                 command, ack_timeout, timeout
             )
         except SmoothieError as se:
-            # XXX: This is a reentrancy error because another command could
-            # swoop in here. We're already resetting though and errors (should
-            # be) rare so it's probably fine, but the actual solution to this
-            # is locking at a higher level like in APIv2.
-            await self._reset_from_error()
-            error_axis = se.ret_code.strip()[-1]
-            if not suppress_error_msg:
-                log.warning(f"alarm/error: command={command}, resp={se.ret_code}")
-            if (
-                GCODE.MOVE in command or GCODE.PROBE in command
-            ) and not suppress_home_after_error:
-                if error_axis not in "XYZABC":
-                    error_axis = AXES
-                log.info("Homing after alarm/error")
-                await self.home(error_axis)
+            await self._recover_from_error(
+                error=se,
+                command=command,
+                suppress_error_msg=suppress_error_msg,
+                home_after_error=(
+                    GCODE.MOVE in command or GCODE.PROBE in command or moves_were_queued
+                )
+                and not suppress_home_after_error,
+            )
             raise SmoothieError(se.ret_code, str(command))
 
+    async def wait_for_queued_moves(self) -> None:
+        """Wait for the moves queued in look-ahead mode to finish.
+
+        Commands sent to the Smoothie already wait for the queued moves.
+        Call this before anything else that needs the gantry to have
+        arrived, like a delay, a pause or a module command.
+        """
+        if self.simulating or not self._queued_move_axes:
+            return
+        try:
+            await self._wait_for_queued_moves()
+        except SmoothieError as se:
+            wait_command = _command_builder().add_gcode(gcode=GCODE.WAIT)
+            await self._recover_from_error(
+                error=se,
+                command=wait_command,
+                suppress_error_msg=False,
+                home_after_error=True,
+            )
+            raise SmoothieError(se.ret_code, str(wait_command))
+
+    async def _recover_from_error(
+        self,
+        error: SmoothieError,
+        command: CommandBuilder,
+        suppress_error_msg: bool,
+        home_after_error: bool,
+    ) -> None:
+        # Smoothie drops its queue when it reports an alarm or error
+        self._clear_queued_moves()
+        # XXX: This is a reentrancy error because another command could
+        # swoop in here. We're already resetting though and errors (should
+        # be) rare so it's probably fine, but the actual solution to this
+        # is locking at a higher level like in APIv2.
+        await self._reset_from_error()
+        error_axis = error.ret_code.strip()[-1]
+        if not suppress_error_msg:
+            log.warning(f"alarm/error: command={command}, resp={error.ret_code}")
+        if home_after_error:
+            if error_axis not in "XYZABC":
+                error_axis = AXES
+            log.info("Homing after alarm/error")
+            await self.home(error_axis)
+
     async def _send_command_unsynchronized(
         self, command: CommandBuilder, ack_timeout: float, execute_timeout: float
     ) -> str:
@@ -905,6 +983,51 @@ class SmoothieDriver:
             self._handle_return(ret_code=e.response, is_error=True)
         return command_result
 
+    async def _send_command_queued(
+        self, command: CommandBuilder, ack_timeout: float
+    ) -> str:
+        """Send a command and wait only for its ack.
+
+        Smoothie acks a move once it's in the planner's queue, which holds
+        back the ack while the queue is full, so the ack timeout should be
+        long enough for the queued moves ahead of it to execute. It isn't
+        retried, because a move that timed out might still be in the queue.
+        """
+        assert self._connection, "There is no connection."
+        command_result = ""
+        try:
+            command_result = await self._connection.send_command(
+                command=command, retries=0, timeout=ack_timeout
+            )
+        except AlarmResponse as e:
+            self._handle_return(ret_code=e.response, is_alarm=True)
+        except ErrorResponse as e:
+            self._handle_return(ret_code=e.response, is_error=True)
+        return command_result
+
+    async def _wait_for_queued_moves(self) -> None:
+        """Send M400 to wait for the queued moves, if there are any."""
+        self._queued_current_command = None
+        if not self._queued_move_axes:
+            return
+        assert self._connection, "There is no connection."
+        wait_command = _command_builder().add_gcode(gcode=GCODE.WAIT)
+        try:
+            await self._connection.send_command(
+                command=wait_command, retries=0, timeout=DEFAULT_EXECUTE_TIMEOUT
+            )
+        except AlarmResponse as e:
+            self._handle_return(ret_code=e.response, is_alarm=True)
+        except ErrorResponse as e:
+            self._handle_return(ret_code=e.response, is_error=True)
+        # the queued moves are done now, rather than when they were sent
+        self._axes_moved_at.mark_moved(sorted(self._queued_move_axes))
+        self._queued_move_axes.clear()
+
+    def _clear_queued_moves(self) -> None:
+        self._queued_move_axes.clear()
+        self._queued_current_command = None
+
     def _handle_return(
         self, ret_code: str, is_alarm: bool = False, is_error: bool = False
     ) -> None:
@@ -1230,6 +1353,15 @@ class SmoothieDriver:
 
         This command respects the run flag and will wait until it is set.
 
+        In look-ahead mode, moves that don't need a split and don't move a
+        plunger are queued: they return once Smoothie has accepted them, not
+        once they're done, so that its planner can blend them with the moves
+        after them. Moves that aren't queued, and every other command, wait
+        for the queued moves to finish first. While moves are queued, the axes
+        they don't move are kept at their active current, and the current
+        command is only sent when it changes, because changing the current
+        waits for Smoothie to stop.
+
         The function may issue up to 3 moves:
         - if move splitting is required, the split move
         - the actual move, plus a bit extra to give room to preload backlash
@@ -1322,7 +1454,11 @@ class SmoothieDriver:
         primary_command_string = create_coords_list(moving_target)
         backlash_command_string = create_coords_list(backlash_target)
 
-        self.dwell_axes("".join(non_moving_axes))
+        plunger_axis_moved = "".join(set("BC") & set(target.keys()))
+        queue = self._look_ahead and not split_command_string and not plunger_axis_moved
+
+        if not queue:
+            self.dwell_axes("".join(non_moving_axes))
         self.activate_axes("".join(moving_axes))
 
         checked_speed = speed or self._combined_speed
@@ -1373,7 +1509,9 @@ class SmoothieDriver:
             command.add_builder(builder=self._build_speed_command(checked_speed))
 
         # introduce the standard currents
-        command.add_builder(builder=self._generate_current_command())
+        current_command = self._generate_current_command()
+        if not (queue and str(current_command) == self._queued_current_command):
+            command.add_builder(builder=current_command)
 
         # move to target position, including any added backlash to B/C axes
         command.add_gcode(GCODE.MOVE).add_builder(builder=primary_command_string)
@@ -1404,10 +1542,14 @@ class SmoothieDriver:
             # TODO (hmg) a movement's timeout should be calculated by
             # how long the movement is expected to take.
             await _do_split()
-            await self._send_command(command, timeout=DEFAULT_EXECUTE_TIMEOUT)
+            await self._send_command(
+                command, timeout=DEFAULT_EXECUTE_TIMEOUT, queue=queue
+            )
+            if queue and not self.simulating:
+                self._queued_move_axes.update(moving_axes)
+                self._queued_current_command = str(current_command)
         finally:
             # dwell pipette motors because they get hot
-            plunger_axis_moved = "".join(set("BC") & set(target.keys()))
             if plunger_axis_moved:
                 self.dwell_axes(plunger_axis_moved)
                 await self._set_saved_current()
@@ -1839,6 +1981,7 @@ class SmoothieDriver:
     async def hard_halt(self) -> None:
         log.debug(f"Halting Smoothie (simulating: {self.simulating}")
         self._is_hard_halting.set()
+        self._clear_queued_moves()
         if self.simulating:
             pass
         else:
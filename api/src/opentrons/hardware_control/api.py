@@ -143,6 +143,7 @@ class API(
         self._door_state = DoorState.CLOSED
         self._pause_manager = PauseManager()
         ExecutionManagerProvider.__init__(self, isinstance(backend, Simulator))
+        self._execution_manager.set_motion_barrier(self.wait_for_queued_moves)
         RobotCalibrationProvider.__init__(self)
         PipetteHandlerProvider.__init__(
             self, {top_types.Mount.LEFT: None, top_types.Mount.RIGHT: None}
@@ -369,6 +370,7 @@ class API(
         self, button: Optional[bool] = None, rails: Optional[bool] = None
     ) -> None:
         """Control the robot lights."""
+        await self.wait_for_queued_moves()
         self._backend.set_lights(button, rails)
 
     async def get_lights(self) -> Dict[str, bool]:
@@ -405,12 +407,16 @@ class API(
     @ExecutionManagerProvider.wait_for_running
     async def delay(self, duration_s: float) -> None:
         """Delay execution by pausing and sleeping."""
+        await self.wait_for_queued_moves()
         self.pause(PauseType.DELAY)
         try:
             await self.do_delay(duration_s)
         finally:
             self.resume(PauseType.DELAY)
 
+    async def wait_for_queued_moves(self) -> None:
+        await self._backend.wait_for_queued_moves()
+
     @property
     def attached_modules(self) -> List[modules.AbstractModule]:
         return self._backend.module_controls.available_modules
@@ -499,6 +505,10 @@ class API(
         async def _chained_calls() -> None:
             await self._execution_manager.pause()
             self._backend.pause()
+            try:
+                await self._backend.wait_for_queued_moves()
+            except Exception:
+                self._log.exception("Failed to finish the queued moves on pause")
 
         asyncio.run_coroutine_threadsafe(_chained_calls(), self._loop)
 
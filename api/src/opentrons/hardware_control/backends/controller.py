@@ -32,6 +32,7 @@ from opentrons_shared_data.pipette.types import PipetteName
 from opentrons.drivers.smoothie_drivers import SmoothieDriver
 from opentrons.drivers.rpi_drivers import build_gpio_chardev
 import opentrons.config
+from opentrons.config import feature_flags as ff
 from opentrons.config.types import RobotConfig
 from opentrons.types import Mount
 
@@ -94,7 +95,9 @@ class Controller:
         self._board_revision: Final = self.gpio_chardev.board_rev
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = SmoothieDriver(
-            config=self.config, gpio_chardev=self._gpio_chardev
+            config=self.config,
+            gpio_chardev=self._gpio_chardev,
+            look_ahead=ff.smoothie_look_ahead(),
         )
         self._cached_fw_version: Optional[str] = None
         self._module_controls: Optional[AttachedModulesControl] = None
@@ -347,6 +350,9 @@ class Controller:
     def pause(self) -> None:
         self._smoothie_driver.pause()
 
+    async def wait_for_queued_moves(self) -> None:
+        await self._smoothie_driver.wait_for_queued_moves()
+
     def resume(self) -> None:
         self._smoothie_driver.resume()
 
@@ -396,6 +396,10 @@ class Simulator:
     def pause(self) -> None:
         self._run_flag.clear()
 
+    @ensure_yield
+    async def wait_for_queued_moves(self) -> None:
+        pass
+
     def resume(self) -> None:
         self._run_flag.set()
 
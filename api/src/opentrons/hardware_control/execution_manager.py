@@ -7,7 +7,9 @@ from typing import (
     cast,
     Callable,
     Any,
+    Awaitable,
     Coroutine,
+    Optional,
     ParamSpec,
     Concatenate,
 )
@@ -32,6 +34,7 @@ class ExecutionManager:
         # that you could possible call register_cancellable_task on unfortunately
         # so it's not gonna get typechecked
         self._cancellable_tasks: Set["asyncio.Task[Any]"] = set()
+        self._motion_barrier: Optional[Callable[[], Awaitable[None]]] = None
 
     async def pause(self) -> None:
         async with self._condition:
@@ -83,6 +86,21 @@ class ExecutionManager:
             else:
                 pass
 
+    def set_motion_barrier(
+        self, barrier: Optional[Callable[[], Awaitable[None]]]
+    ) -> None:
+        """Set the coroutine function that waits for queued gantry motion."""
+        self._motion_barrier = barrier
+
+    async def wait_for_motion(self) -> None:
+        """Wait for gantry motion that the motion controller is still running.
+
+        Modules share the execution manager with the hardware controller, so
+        this lets them wait for the gantry before they do anything.
+        """
+        if self._motion_barrier is not None:
+            await self._motion_barrier()
+
 
 SubclassInstance = TypeVar("SubclassInstance", bound="ExecutionManagerProvider")
 DecoratedMethodParams = ParamSpec("DecoratedMethodParams")
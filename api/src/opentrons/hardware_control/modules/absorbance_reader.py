@@ -278,6 +278,7 @@ class AbsorbanceReader(mod_abc.AbstractModule):
     async def wait_for_is_running(self) -> None:
         if not self.is_simulated:
             await self._execution_manager.wait_for_is_running()
+            await self._execution_manager.wait_for_motion()
 
     async def prep_for_update(self) -> str:
         """Prepare for an update.
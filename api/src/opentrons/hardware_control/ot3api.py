@@ -585,6 +585,10 @@ class OT3API(
         finally:
             self.resume(PauseType.DELAY)
 
+    async def wait_for_queued_moves(self) -> None:
+        """The Flex finishes every move before it returns."""
+        return None
+
     @property
     def attached_modules(self) -> List[modules.AbstractModule]:
         return self._backend.module_controls.available_modules
@@ -31,3 +31,12 @@ class ExecutionControllable(Protocol):
     async def delay(self, duration_s: float) -> None:
         """Delay execution by pausing and sleeping."""
         ...
+
+    async def wait_for_queued_moves(self) -> None:
+        """Wait for the motion controller to finish the moves it has queued.
+
+        A move can return while the motion controller is still running it.
+        Call this before anything that needs the gantry to have arrived and
+        doesn't go through the motion controller.
+        """
+        ...
@@ -9,6 +9,7 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Dict,
     Generic,
     Optional,
     TypeVar,
@@ -120,24 +121,53 @@ async def execute_asyncgen_threadsafe(
 WrappedObj = TypeVar("WrappedObj", bound=AsyncioConfigurable, covariant=True)
 
 
+def _is_method(obj: object, attr_name: str) -> bool:
+    """Whether `obj.attr_name` is a plain method defined by the object's class."""
+    return attr_name not in getattr(obj, "__dict__", {}) and inspect.isfunction(
+        inspect.getattr_static(type(obj), attr_name, None)
+    )
+
+
 class CallBridger(Generic[WrappedObj]):
     def __init__(
         self, wrapped_obj: WrappedObj, loop: asyncio.AbstractEventLoop
     ) -> None:
         self.wrapped_obj = wrapped_obj
         self._loop = loop
+        # What we return for each of the wrapped object's methods, by name, so
+        # that a method is only inspected and wrapped the first time it's looked
+        # up. Properties and other attributes are looked up every time, since
+        # their values can change.
+        self._bridged_methods: Dict[str, Any] = {}
+        # Where an instance attribute would shadow a method, for instance if a
+        # test patches one after we've cached it.
+        self._wrapped_obj_dict: Mapping[str, Any] = getattr(wrapped_obj, "__dict__", {})
 
     def __getattribute__(self, attr_name: str) -> Any:
+        bridged_methods = object.__getattribute__(self, "_bridged_methods")
+        bridged_method = bridged_methods.get(attr_name)
+        if bridged_method is not None and attr_name not in object.__getattribute__(
+            self, "_wrapped_obj_dict"
+        ):
+            return bridged_method
+
         # Almost every attribute retrieved from us will be for people actually
         # looking for an attribute of the managed object, so check there first.
         managed_obj = object.__getattribute__(self, "wrapped_obj")
-        loop = object.__getattribute__(self, "_loop")
         try:
             attr = getattr(managed_obj, attr_name)
         except AttributeError:
             # Maybe this actually was for us? Let’s find it
             return object.__getattribute__(self, attr_name)
 
+        bridged = object.__getattribute__(self, "_bridge")(attr)
+        if _is_method(managed_obj, attr_name):
+            bridged_methods[attr_name] = bridged
+        return bridged
+
+    def _bridge(self, attr: Any) -> Any:
+        loop = object.__getattribute__(self, "_loop")
+
         if asyncio.iscoroutinefunction(attr):
             # Return coroutine result of async function
             # executed in managed thread to calling thread
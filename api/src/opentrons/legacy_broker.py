@@ -44,6 +44,16 @@ class LegacyBroker:
 
         return unsubscribe
 
+    def is_observed(self, topic: Literal["command"]) -> bool:
+        """Whether messages on the given topic would be seen by anything.
+
+        Messages are seen by the topic's subscribers, and logged by publishers
+        at INFO level. If neither would happen, publishers can skip building them.
+        """
+        return bool(self.subscriptions.get(topic)) or self.logger.isEnabledFor(
+            logging.INFO
+        )
+
     def publish(  # noqa: D102
         self, topic: Literal["command"], message: types.CommandMessage
     ) -> None:
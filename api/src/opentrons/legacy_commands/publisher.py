@@ -1,7 +1,19 @@
 import functools
 import inspect
+import logging
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Optional, TypeVar, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
 from opentrons.legacy_broker import LegacyBroker
@@ -39,22 +51,28 @@ FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 """A function wrapped by the @publish decorator."""
 
 
+CommandArgsGetter = Callable[[Tuple[Any, ...], Dict[str, Any]], Dict[str, Any]]
+"""A function that maps a decorated call's arguments to its CommandPayloadCreator's."""
+
+
 def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
-    """Publish messages before and after the decorated function has run."""
+    """Publish messages before and after the decorated function has run.
+
+    If nothing is listening for the messages, the decorated function is just called,
+    without building the messages at all.
+    """
 
     def _decorator(func: FuncT) -> FuncT:
+        get_message_creator_args = _make_command_args_getter(func, command)
+
         @functools.wraps(func)
         def _decorated(*args: Any, **kwargs: Any) -> Any:
             """Use the args passed to wrapped `func` to build the message payload.
 
-            1. Inspect signature of `func` and bind arguments to signature to map
-               argument names to called (and/or default) values.
-            2. Inspect signature of `command` and map values from `func` call to
-               argument names expected by `command`.
-            3. Map `self` argument of `func` to the `instrument` argument of `command`,
-               where applicable.
-            4. Construct the command payload and publish it using `publish_context`
-            5. Return the value of calling `func` with `*args` and `**kwargs`
+            1. Map the arguments of the call to the argument names expected by
+               `command`, using the mapping prepared when `func` was decorated.
+            2. Construct the command payload and publish it using `publish_context`
+            3. Return the value of calling `func` with `*args` and `**kwargs`
             """
 
             broker = getattr(args[0], "broker", None)
@@ -63,33 +81,10 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, LegacyBroker
             ), "Only methods of CommandPublisher classes should be decorated."
 
-            func_sig = _inspect_signature(func)
-            bound_func_args = func_sig.bind(*args, **kwargs)
-            bound_func_args.apply_defaults()
-            func_args = bound_func_args.arguments
-
-            message_creator_sig = _inspect_signature(command)
-            message_creator_arg_names = set(message_creator_sig.parameters.keys())
-            message_creator_args = {
-                n: func_args[n] for n in message_creator_arg_names if n in func_args
-            }
-
-            # TODO (artyom, 20170927): we are doing this to be able to use
-            # the decorator in Instrument class methods, in which case
-            # self is effectively an instrument.
-            # To narrow the scope of this hack, we are checking if the
-            # command is expecting instrument first.
-            # We are also checking if call arguments have 'self' and
-            # don't have instruments specified, in which case
-            # instruments should take precedence.
-            if (
-                "instrument" in message_creator_arg_names
-                and "instrument" not in message_creator_args
-                and "self" in func_args
-            ):
-                message_creator_args["instrument"] = func_args["self"]
-
-            command_message = command(**message_creator_args)
+            if not broker.is_observed(COMMAND_TOPIC):
+                return func(*args, **kwargs)
+
+            command_message = command(**get_message_creator_args(args, kwargs))
 
             with publish_context(broker=broker, command=command_message):
                 return func(*args, **kwargs)
@@ -100,12 +95,25 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
 
 
 @contextmanager
-def publish_context(broker: LegacyBroker, command: CommandPayload) -> Iterator[None]:
+def publish_context(
+    broker: LegacyBroker,
+    command: Union[CommandPayload, Callable[[], CommandPayload]],
+) -> Iterator[None]:
     """Publish messages before and after the `with` block has run.
 
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
+
+    `command` can be a function that creates the command payload, which is only
+    called if something is listening for the messages.
     """
+    if not broker.is_observed(COMMAND_TOPIC):
+        yield
+        return
+
+    if callable(command):
+        command = command()
+
     message_id = str(uuid4())
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
@@ -124,10 +132,96 @@ def publish_context(broker: LegacyBroker, command: CommandPayload) -> Iterator[N
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
-@functools.lru_cache(maxsize=None)
-def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
-    """Inspect function signatures, memoized because it is called very often."""
-    return inspect.signature(func)
+def _make_command_args_getter(
+    func: Callable[..., Any], command: CommandPayloadCreator
+) -> CommandArgsGetter:
+    """Prepare how to map calls of `func` to the arguments of `command`.
+
+    Binding each call to `func`'s full signature is slow, and the decorated methods
+    are called very often, so this works out once which positional index, keyword,
+    or default each of `command`'s arguments comes from.
+
+    `self` is passed to `command` as its `instrument` argument if `func` doesn't
+    have one of its own. This lets the decorator be used on instrument methods.
+    """
+    func_params = inspect.signature(func).parameters
+    message_creator_arg_names = list(inspect.signature(command).parameters.keys())
+
+    if any(
+        param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for param in func_params.values()
+    ):
+        return functools.partial(_bind_command_args, func, message_creator_arg_names)
+
+    positional_names = [
+        name
+        for name, param in func_params.items()
+        if param.kind
+        in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+    ]
+    # (command arg name, func arg name, func arg position, func arg default)
+    plan: List[Tuple[str, str, Optional[int], Any]] = [
+        (
+            name,
+            name,
+            positional_names.index(name) if name in positional_names else None,
+            func_params[name].default,
+        )
+        for name in message_creator_arg_names
+        if name in func_params
+    ]
+    if (
+        "instrument" in message_creator_arg_names
+        and "instrument" not in func_params
+        and "self" in func_params
+    ):
+        plan.append(
+            (
+                "instrument",
+                "self",
+                positional_names.index("self"),
+                inspect.Parameter.empty,
+            )
+        )
+
+    def _get_command_args(
+        args: Tuple[Any, ...], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        message_creator_args = {}
+        for name, func_arg_name, position, default in plan:
+            if position is not None and position < len(args):
+                message_creator_args[name] = args[position]
+            elif func_arg_name in kwargs:
+                message_creator_args[name] = kwargs[func_arg_name]
+            elif default is not inspect.Parameter.empty:
+                message_creator_args[name] = default
+            else:
+                raise TypeError(f"missing a required argument: {func_arg_name!r}")
+        return message_creator_args
+
+    return _get_command_args
+
+
+def _bind_command_args(
+    func: Callable[..., Any],
+    message_creator_arg_names: List[str],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Map a call of `func` to the arguments of a command by binding its signature."""
+    bound_func_args = inspect.signature(func).bind(*args, **kwargs)
+    bound_func_args.apply_defaults()
+    func_args = bound_func_args.arguments
+    message_creator_args = {
+        n: func_args[n] for n in message_creator_arg_names if n in func_args
+    }
+    if (
+        "instrument" in message_creator_arg_names
+        and "instrument" not in message_creator_args
+        and "self" in func_args
+    ):
+        message_creator_args["instrument"] = func_args["self"]
+    return message_creator_args
 
 
 def _do_publish(
@@ -148,7 +242,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
@@ -610,12 +610,18 @@ class ProtocolCore(
         """Move all axes to their home positions."""
         self._engine_client.execute_command(cmd.HomeParams(axes=None))
 
+    def flush_commands(self) -> None:
+        """Execute any commands that the engine client has left pending."""
+        self._engine_client.flush_commands()
+
     def set_rail_lights(self, on: bool) -> None:
         """Set the device's rail lights."""
         self._engine_client.execute_command(cmd.SetRailLightsParams(on=on))
 
     def get_rail_lights_on(self) -> bool:
         """Get whether the device's rail lights are on."""
+        # A pending setRailLights command wouldn't have reached the hardware yet.
+        self._engine_client.flush_commands()
         return self._sync_hardware.get_lights()["rails"]  # type: ignore[no-any-return]
 
     def door_closed(self) -> bool:
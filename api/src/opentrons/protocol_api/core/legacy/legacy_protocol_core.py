@@ -432,6 +432,10 @@ class LegacyProtocolCore(
         self.set_last_location(None)
         self._sync_hardware.home()
 
+    def flush_commands(self) -> None:
+        """Do nothing, since every command completes before it returns."""
+        pass
+
     def get_deck(self) -> Deck:
         """Get the deck layout."""
         return self._deck_layout
@@ -160,6 +160,11 @@ class AbstractProtocol(
     def home(self) -> None:
         ...
 
+    @abstractmethod
+    def flush_commands(self) -> None:
+        """Wait for any commands that haven't completed yet to complete."""
+        ...
+
     @abstractmethod
     def set_rail_lights(self, on: bool) -> None:
         ...
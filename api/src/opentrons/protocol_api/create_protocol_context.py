@@ -52,6 +52,7 @@ def create_protocol_context(
     broker: Optional[LegacyBroker] = None,
     equipment_broker: Optional[Broker[Any]] = None,
     use_simulating_core: bool = False,
+    pipeline_engine_commands: bool = False,
     extra_labware: Optional[Dict[str, LabwareDefinition]] = None,
     bundled_labware: Optional[Dict[str, LabwareDefinition]] = None,
     bundled_data: Optional[Dict[str, bytes]] = None,
@@ -73,6 +74,10 @@ def create_protocol_context(
         use_simulating_core: For pre-ProtocolEngine API versions,
             use a simulating protocol core that will skip _most_ calls
             to the `hardware_api`.
+        pipeline_engine_commands: For ProtocolEngine API versions, let commands
+            that can't fail, like comments and delays, be sent to `protocol_engine`
+            in batches. Only suitable for simulation.
+            See `ChildThreadTransport.submit_command()`.
         extra_labware: Extra labware definitions to include in
             labware definition lookup paths.
         bundled_labware: Do not use in new code. Leftover from
@@ -113,7 +118,9 @@ def create_protocol_context(
             )
 
         engine_client_transport = ChildThreadTransport(
-            engine=protocol_engine, loop=protocol_engine_loop
+            engine=protocol_engine,
+            loop=protocol_engine_loop,
+            pipeline_commands=pipeline_engine_commands,
         )
         engine_client = SyncClient(transport=engine_client_transport)
         core = ProtocolCore(
@@ -263,7 +263,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.aspirate(
+            command=lambda: cmds.aspirate(
                 instrument=self,
                 volume=c_vol,
                 location=move_to_location,
@@ -429,7 +429,7 @@ class InstrumentContext(publisher.CommandPublisher):
         if isinstance(target, (TrashBin, WasteChute)):
             with publisher.publish_context(
                 broker=self.broker,
-                command=cmds.dispense_in_disposal_location(
+                command=lambda: cmds.dispense_in_disposal_location(
                     instrument=self,
                     volume=c_vol,
                     location=target,
@@ -450,7 +450,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.dispense(
+            command=lambda: cmds.dispense(
                 instrument=self,
                 volume=c_vol,
                 location=move_to_location,
@@ -532,7 +532,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.mix(
+            command=lambda: cmds.mix(
                 instrument=self,
                 repetitions=repetitions,
                 volume=c_vol,
@@ -606,7 +606,7 @@ class InstrumentContext(publisher.CommandPublisher):
         elif isinstance(target, (TrashBin, WasteChute)):
             with publisher.publish_context(
                 broker=self.broker,
-                command=cmds.blow_out_in_disposal_location(
+                command=lambda: cmds.blow_out_in_disposal_location(
                     instrument=self, location=target
                 ),
             ):
@@ -619,7 +619,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.blow_out(instrument=self, location=move_to_location),
+            command=lambda: cmds.blow_out(instrument=self, location=move_to_location),
         ):
             self._core.blow_out(
                 location=move_to_location,
@@ -1025,7 +1025,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.pick_up_tip(instrument=self, location=well),
+            command=lambda: cmds.pick_up_tip(instrument=self, location=well),
         ):
             self._core.pick_up_tip(
                 location=move_to_location,
@@ -1115,7 +1115,7 @@ class InstrumentContext(publisher.CommandPublisher):
             else:  # implicit drop tip in disposal location, not well
                 with publisher.publish_context(
                     broker=self.broker,
-                    command=cmds.drop_tip_in_disposal_location(
+                    command=lambda: cmds.drop_tip_in_disposal_location(
                         instrument=self, location=trash_container
                     ),
                 ):
@@ -1154,7 +1154,7 @@ class InstrumentContext(publisher.CommandPublisher):
                 alternate_drop_location = True
             with publisher.publish_context(
                 broker=self.broker,
-                command=cmds.drop_tip_in_disposal_location(
+                command=lambda: cmds.drop_tip_in_disposal_location(
                     instrument=self, location=location
                 ),
             ):
@@ -1176,7 +1176,7 @@ class InstrumentContext(publisher.CommandPublisher):
 
         with publisher.publish_context(
             broker=self.broker,
-            command=cmds.drop_tip(instrument=self, location=well),
+            command=lambda: cmds.drop_tip(instrument=self, location=well),
         ):
             self._core.drop_tip(
                 location=location,
@@ -1200,7 +1200,7 @@ class InstrumentContext(publisher.CommandPublisher):
         mount_name = self._core.get_mount().name.lower()
 
         with publisher.publish_context(
-            broker=self.broker, command=cmds.home(mount_name)
+            broker=self.broker, command=lambda: cmds.home(mount_name)
         ):
             self._core.home()
 
@@ -1567,7 +1567,7 @@ class InstrumentContext(publisher.CommandPublisher):
                     contexts.enter_context(
                         publisher.publish_context(
                             broker=self.broker,
-                            command=cmds.move_to_disposal_location(
+                            command=lambda: cmds.move_to_disposal_location(
                                 instrument=self, location=location
                             ),
                         )
@@ -1585,7 +1585,9 @@ class InstrumentContext(publisher.CommandPublisher):
                     contexts.enter_context(
                         publisher.publish_context(
                             broker=self.broker,
-                            command=cmds.move_to(instrument=self, location=location),
+                            command=lambda: cmds.move_to(
+                                instrument=self, location=location
+                            ),
                         )
                     )
 
@@ -52,12 +52,18 @@ class SyncClient:
     def execute_command(self, params: commands.CommandParams) -> None:
         """Execute a ProtocolEngine command, including error recovery.
 
-        See `ChildThreadTransport.execute_command_wait_for_recovery()` for exact
-        behavior.
+        See `ChildThreadTransport.submit_command()` for exact behavior.
         """
         CreateType = CREATE_TYPES_BY_PARAMS_TYPE[type(params)]
         create_request = CreateType(params=cast(Any, params))
-        self._transport.execute_command_wait_for_recovery(create_request)
+        self._transport.submit_command(create_request)
+
+    def flush_commands(self) -> None:
+        """Wait for any commands that `execute_command()` left pending to complete.
+
+        See `ChildThreadTransport.flush_commands()` for exact behavior.
+        """
+        self._transport.flush_commands()
 
     @overload
     def execute_command_without_recovery(
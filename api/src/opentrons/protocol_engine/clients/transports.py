@@ -1,6 +1,21 @@
 """A helper for controlling a `ProtocolEngine` without async/await."""
+import sys
 from asyncio import AbstractEventLoop, run_coroutine_threadsafe
-from typing import Any, Final, overload
+from dataclasses import dataclass
+from functools import partial
+from types import FrameType, TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Final,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    overload,
+)
 from typing_extensions import Literal
 
 from opentrons_shared_data.labware.types import LabwareUri
@@ -11,7 +26,25 @@ from ..protocol_engine import ProtocolEngine
 from ..errors import ProtocolCommandFailedError
 from ..error_recovery_policy import ErrorRecoveryType
 from ..state.state import StateView
-from ..commands import Command, CommandCreate, CommandResult, CommandStatus
+from ..commands import (
+    Command,
+    CommandCreate,
+    CommandResult,
+    CommandStatus,
+    CommentCreate,
+    WaitForDurationCreate,
+)
+
+_T = TypeVar("_T")
+
+# How many commands a pipelining transport may hold back before it flushes them
+# on its own.
+_MAX_PENDING_COMMANDS: Final = 100
+
+# The commands that a pipelining transport may hold back. These must be commands
+# that can't fail: a Python protocol may catch a command's error, so any other
+# command's error has to be raised from the call that submitted it.
+_PIPELINED_COMMAND_TYPES: Final = (CommentCreate, WaitForDurationCreate)
 
 
 class RunStoppedBeforeCommandError(RuntimeError):
@@ -25,6 +58,57 @@ class RunStoppedBeforeCommandError(RuntimeError):
         )
 
 
+@dataclass(frozen=True)
+class _PendingCommand:
+    """A command that was submitted, but that hasn't been sent to the engine yet."""
+
+    request: CommandCreate
+
+    # The stack of the submitting thread when the command was submitted,
+    # innermost frame first, as (frame, lasti, lineno) tuples. A frame's line
+    # keeps moving as it runs, so it's recorded alongside.
+    submitted_from: List[Tuple[FrameType, int, int]]
+
+    @classmethod
+    def submit(cls, request: CommandCreate) -> "_PendingCommand":
+        """Create a pending command, submitted from the caller of the caller of this."""
+        submitted_from = []
+        frame: Optional[FrameType] = sys._getframe(2)
+        while frame is not None:
+            submitted_from.append((frame, frame.f_lasti, frame.f_lineno))
+            frame = frame.f_back
+        return cls(request=request, submitted_from=submitted_from)
+
+    def get_submission_traceback(self) -> Optional[TracebackType]:
+        """Get a traceback that leads to where this command was submitted.
+
+        It starts from the innermost frame that's still on the current stack, so
+        that when it's raised from here, the full traceback goes from here back
+        into that frame, and then down to where the command was submitted.
+        """
+        current_frames: Set[int] = set()
+        frame: Optional[FrameType] = sys._getframe()
+        while frame is not None:
+            current_frames.add(id(frame))
+            frame = frame.f_back
+
+        traceback: Optional[TracebackType] = None
+        for frame, lasti, lineno in self.submitted_from:
+            traceback = TracebackType(traceback, frame, lasti, lineno)
+            if id(frame) in current_frames:
+                break
+        return traceback
+
+
+class _PendingCommandFailedError(Exception):
+    """Raised in the engine's thread when a pending command fails."""
+
+    def __init__(self, error: Exception, pending_command: _PendingCommand) -> None:
+        super().__init__()
+        self.error = error
+        self.pending_command = pending_command
+
+
 class ChildThreadTransport:
     """A helper for controlling a `ProtocolEngine` without async/await.
 
@@ -34,7 +118,12 @@ class ChildThreadTransport:
     to non-async ones, and doing it in a thread-safe way.
     """
 
-    def __init__(self, engine: ProtocolEngine, loop: AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        engine: ProtocolEngine,
+        loop: AbstractEventLoop,
+        pipeline_commands: bool = False,
+    ) -> None:
         """Initialize the `ChildThreadTransport`.
 
         Args:
@@ -42,17 +131,72 @@ class ChildThreadTransport:
                 It must be running in a thread *other* than the one from which you
                 want to synchronously access it.
             loop: The event loop that `engine` is running in (in the other thread).
+            pipeline_commands: Whether `submit_command()` may hold commands back
+                and send them to the engine in batches, instead of waiting for each
+                one to complete. Only suitable for simulation.
+                See `submit_command()`.
         """
         # We might access these from different threads,
         # so let's make them Final for (shallow) immutability.
         self._engine: Final = engine
         self._loop: Final = loop
+        self._pipeline_commands: Final = pipeline_commands
+
+        # Only accessed from the thread that submits commands.
+        self._pending_commands: List[_PendingCommand] = []
 
     @property
     def state(self) -> StateView:
-        """Get a view of the Protocol Engine's state."""
+        """Get a view of the Protocol Engine's state.
+
+        Any pending commands are executed first, so that the view reflects them.
+        """
+        if self._pending_commands:
+            self.flush_commands()
         return self._engine.state_view
 
+    def submit_command(self, request: CommandCreate) -> None:
+        """Execute a ProtocolEngine command whose result isn't needed.
+
+        Without pipelining, this is the same as `execute_command_wait_for_recovery()`.
+
+        With pipelining, if the command can't fail, like a comment or a delay, this
+        may return before the command has even been added to the engine. The
+        command is kept pending, and is executed in order with the other pending
+        commands, all with a single round trip to the engine's thread, the next
+        time this transport needs the engine: when its state is read, when a method
+        is called or another command is executed, or when `flush_commands()` is
+        called. Any other command is executed right away, so that its error is
+        raised from here, where the protocol can catch it.
+
+        If a pending command fails anyway, for example because the run was
+        stopped, its error is raised from there instead of from here, but with a
+        traceback that leads back to where the command was submitted, so that
+        it's reported at the right line of the protocol. The pending commands
+        after it are discarded without being added to the engine, just as if this
+        had raised the error.
+
+        Args:
+            request: The ProtocolEngine command request.
+        """
+        if not self._pipeline_commands or not isinstance(
+            request, _PIPELINED_COMMAND_TYPES
+        ):
+            self.execute_command_wait_for_recovery(request)
+            return
+
+        self._pending_commands.append(_PendingCommand.submit(request))
+        if len(self._pending_commands) >= _MAX_PENDING_COMMANDS:
+            self.flush_commands()
+
+    def flush_commands(self) -> None:
+        """Execute any pending commands, and wait for them to complete.
+
+        See `submit_command()` for how their errors are raised.
+        """
+        if self._pending_commands:
+            self._run_in_pe_thread(_do_nothing)
+
     def execute_command(self, request: CommandCreate) -> CommandResult:
         """Execute a ProtocolEngine command.
 
@@ -73,10 +217,9 @@ class ChildThreadTransport:
                 If the run was stopped before the command could complete, that's
                 also signaled as this exception.
         """
-        command = run_coroutine_threadsafe(
-            self._engine.add_and_execute_command(request=request),
-            loop=self._loop,
-        ).result()
+        command = self._run_in_pe_thread(
+            partial(self._engine.add_and_execute_command, request=request)
+        )
 
         # TODO: this needs to have an actual code
         if command.error is not None:
@@ -118,45 +261,9 @@ class ChildThreadTransport:
                 If the run was stopped before the command could complete, that's
                 also signalled as this exception.
         """
-
-        async def run_in_pe_thread() -> Command:
-            command = await self._engine.add_and_execute_command_wait_for_recovery(
-                request=request
-            )
-
-            if command.error is not None:
-                error_recovery_type = (
-                    self._engine.state_view.commands.get_error_recovery_type(command.id)
-                )
-                error_should_fail_run = (
-                    error_recovery_type == ErrorRecoveryType.FAIL_RUN
-                )
-                if error_should_fail_run:
-                    error = command.error
-                    # TODO: this needs to have an actual code
-                    raise ProtocolCommandFailedError(
-                        original_error=error,
-                        message=f"{error.errorType}: {error.detail}",
-                    )
-
-            elif command.status == CommandStatus.QUEUED:
-                # This can happen with a certain pause timing:
-                #
-                # 1. The engine is paused.
-                # 2. The user's Python script calls this method to start a new command,
-                #    which remains `queued` because of the pause.
-                # 3. The engine is stopped. The returned command will be `queued`,
-                #    and won't have a result.
-                raise RunStoppedBeforeCommandError(command)
-
-            return command
-
-        command = run_coroutine_threadsafe(
-            run_in_pe_thread(),
-            loop=self._loop,
-        ).result()
-
-        return command
+        return self._run_in_pe_thread(
+            partial(self._execute_command_wait_for_recovery, request)
+        )
 
     @overload
     def call_method(
@@ -186,12 +293,72 @@ class ChildThreadTransport:
 
     def call_method(self, method_name: str, **kwargs: Any) -> Any:
         """Execute a ProtocolEngine method, returning the result."""
-        return run_coroutine_threadsafe(
-            self._call_method(method_name, **kwargs),
-            loop=self._loop,
-        ).result()
+        return self._run_in_pe_thread(partial(self._call_method, method_name, **kwargs))
+
+    def _run_in_pe_thread(self, func: Callable[[], Awaitable[_T]]) -> _T:
+        """Run `func` in the engine's thread after any pending commands, and wait for it."""
+        pending_commands = self._pending_commands
+        self._pending_commands = []
+
+        async def run_pending_commands_then_func() -> _T:
+            for pending_command in pending_commands:
+                try:
+                    await self._execute_command_wait_for_recovery(
+                        pending_command.request
+                    )
+                except Exception as error:
+                    raise _PendingCommandFailedError(error, pending_command)
+            return await func()
+
+        try:
+            return run_coroutine_threadsafe(
+                run_pending_commands_then_func(),
+                loop=self._loop,
+            ).result()
+        except _PendingCommandFailedError as e:
+            failure = e
+        # Raised out here so it isn't chained to the _PendingCommandFailedError.
+        raise failure.error.with_traceback(
+            failure.pending_command.get_submission_traceback()
+        )
+
+    async def _execute_command_wait_for_recovery(
+        self, request: CommandCreate
+    ) -> Command:
+        command = await self._engine.add_and_execute_command_wait_for_recovery(
+            request=request
+        )
+
+        if command.error is not None:
+            error_recovery_type = (
+                self._engine.state_view.commands.get_error_recovery_type(command.id)
+            )
+            error_should_fail_run = error_recovery_type == ErrorRecoveryType.FAIL_RUN
+            if error_should_fail_run:
+                error = command.error
+                # TODO: this needs to have an actual code
+                raise ProtocolCommandFailedError(
+                    original_error=error,
+                    message=f"{error.errorType}: {error.detail}",
+                )
+
+        elif command.status == CommandStatus.QUEUED:
+            # This can happen with a certain pause timing:
+            #
+            # 1. The engine is paused.
+            # 2. The user's Python script calls this method to start a new command,
+            #    which remains `queued` because of the pause.
+            # 3. The engine is stopped. The returned command will be `queued`,
+            #    and won't have a result.
+            raise RunStoppedBeforeCommandError(command)
+
+        return command
 
     async def _call_method(self, method_name: str, **kwargs: Any) -> Any:
         method = getattr(self._engine, method_name)
         assert callable(method), f"{method_name} is not a method of ProtocolEngine"
         return method(**kwargs)
+
+
+async def _do_nothing() -> None:
+    pass
@@ -72,6 +72,7 @@ def create_queue_worker(
     run_control_handler = RunControlHandler(
         state_store=state_store,
         action_dispatcher=action_dispatcher,
+        hardware_api=hardware_api,
     )
     rail_lights_handler = RailLightsHandler(
         hardware_api=hardware_api,
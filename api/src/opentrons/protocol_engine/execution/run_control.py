@@ -1,6 +1,8 @@
 """Run control command side-effect logic."""
 import asyncio
 
+from opentrons.hardware_control import HardwareControlAPI
+
 from ..state.state import StateStore
 from ..actions import ActionDispatcher, PauseAction, PauseSource
 
@@ -9,19 +11,23 @@ class RunControlHandler:
     """Implementation logic for protocol run control."""
 
     _state_store: StateStore
+    _hardware_api: HardwareControlAPI
 
     def __init__(
         self,
         state_store: StateStore,
         action_dispatcher: ActionDispatcher,
+        hardware_api: HardwareControlAPI,
     ) -> None:
         """Initialize a RunControlHandler instance."""
         self._state_store = state_store
         self._action_dispatcher = action_dispatcher
+        self._hardware_api = hardware_api
 
     async def wait_for_resume(self) -> None:
         """Issue a PauseAction to the store, pausing the run."""
         if not self._state_store.config.ignore_pause:
+            await self._hardware_api.wait_for_queued_moves()
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
             await self._state_store.wait_for(
                 condition=self._state_store.commands.get_is_running
@@ -30,4 +36,5 @@ class RunControlHandler:
     async def wait_for_duration(self, seconds: float) -> None:
         """Delay protocol execution for a duration."""
         if not self._state_store.config.ignore_pause:
+            await self._hardware_api.wait_for_queued_moves()
             await asyncio.sleep(seconds)
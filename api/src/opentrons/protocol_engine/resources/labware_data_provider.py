@@ -7,7 +7,7 @@ import logging
 from anyio import to_thread
 
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.protocols.labware import get_labware_definition
+from opentrons.protocols.labware_definition_cache import get_labware_definition_cache
 
 # TODO (lc 09-26-2022) We should conditionally import ot2 or ot3 calibration
 from opentrons.hardware_control.instruments.ot2 import (
@@ -30,8 +30,8 @@ class LabwareDataProvider:
     ) -> LabwareDefinition:
         """Get a labware definition given the labware's identification.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Definitions are cached process-wide, so only the first request for a
+        given labware hits the filesystem and parses the definition.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -44,9 +44,7 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.parse_obj(
-            get_labware_definition(load_name, namespace, version)
-        )
+        return get_labware_definition_cache().get(load_name, namespace, version)
 
     @staticmethod
     async def get_calibrated_tip_length(
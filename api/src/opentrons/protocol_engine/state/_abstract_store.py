@@ -1,8 +1,18 @@
 """Abstract state store interfaces."""
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import (
+    AbstractSet,
+    ClassVar,
+    FrozenSet,
+    Generic,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from ..actions import Action
+from ..actions import Action, get_state_updates
+from . import update_types
 
 StateT = TypeVar("StateT")
 
@@ -21,7 +31,45 @@ class HasState(ABC, Generic[StateT]):
 class HandlesActions(ABC):
     """Abstract interface for an object that reacts to actions."""
 
+    handled_action_types: ClassVar[Optional[Tuple[Type[Action], ...]]] = None
+    """The action classes this object reacts to directly.
+
+    `None` means the object may react to any action, and it will always be
+    dispatched to.
+    """
+
+    handled_state_update_fields: ClassVar[FrozenSet[str]] = frozenset()
+    """The `StateUpdate` fields this object reacts to.
+
+    An action whose state updates set any of these fields will be dispatched to
+    this object, even if its class isn't listed in `handled_action_types`.
+    """
+
     @abstractmethod
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def handles(self, action: Action, state_update_fields: AbstractSet[str]) -> bool:
+        """Return whether `handle_action(action)` could modify this object's state.
+
+        Arguments:
+            action: The action about to be dispatched.
+            state_update_fields: The `StateUpdate` fields that `action` sets,
+                as returned by `get_changed_state_update_fields(action)`.
+        """
+        return (
+            self.handled_action_types is None
+            or isinstance(action, self.handled_action_types)
+            or not self.handled_state_update_fields.isdisjoint(state_update_fields)
+        )
+
+
+def get_changed_state_update_fields(action: Action) -> FrozenSet[str]:
+    """Return the names of the `StateUpdate` fields that `action` actually sets."""
+    return frozenset(
+        field
+        for state_update in get_state_updates(action)
+        for field, value in state_update.__dict__.items()
+        if value is not update_types.NO_CHANGE
+    )
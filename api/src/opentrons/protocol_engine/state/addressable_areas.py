@@ -1,5 +1,5 @@
 """Basic addressable area data state and store."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from typing import Dict, List, Optional, Set, Union
 
@@ -81,6 +81,13 @@ class AddressableAreaState:
     """Information about the current robot model."""
     robot_definition: RobotDefinition
 
+    generation: int = field(default=0, compare=False)
+    """Incremented whenever addressable areas are loaded or the deck configuration changes.
+
+    Derived state, like the heights of obstacles on the deck, can be cached
+    until this changes.
+    """
+
 
 _OT2_ORDERED_SLOTS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "11", "12"]
 _FLEX_ORDERED_SLOTS = [
@@ -163,6 +170,12 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
 
     _state: AddressableAreaState
 
+    handled_action_types = (
+        SucceedCommandAction,
+        AddAddressableAreaAction,
+        SetDeckConfigurationAction,
+    )
+
     def __init__(
         self,
         deck_configuration: DeckConfigurationType,
@@ -204,6 +217,7 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
                 and not self._state.use_simulated_deck_config
             ):
                 self._state.deck_configuration = action.deck_configuration
+                self._state.generation += 1
                 self._state.loaded_addressable_areas_by_name = (
                     self._get_addressable_areas_from_deck_configuration(
                         deck_config=action.deck_configuration,
@@ -290,6 +304,7 @@ class AddressableAreaStore(HasState[AddressableAreaState], HandlesActions):
             self._state.loaded_addressable_areas_by_name[
                 addressable_area.area_name
             ] = addressable_area
+            self._state.generation += 1
 
     def _validate_addressable_area_for_simulation(
         self, addressable_area_name: str
@@ -336,6 +351,10 @@ class AddressableAreaView(HasState[AddressableAreaState]):
         """
         self._state = state
 
+    def get_generation(self) -> int:
+        """Get a number that changes whenever loaded addressable areas or the deck configuration change."""
+        return self._state.generation
+
     @cached_property
     def deck_extents(self) -> Point:
         """The maximum space on the deck."""
@@ -246,6 +246,21 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
     _state: CommandState
 
+    handled_action_types = (
+        QueueCommandAction,
+        RunCommandAction,
+        SucceedCommandAction,
+        FailCommandAction,
+        PlayAction,
+        PauseAction,
+        ResumeFromRecoveryAction,
+        StopAction,
+        FinishAction,
+        HardwareStoppedAction,
+        DoorChangeAction,
+        SetErrorRecoveryPolicyAction,
+    )
+
     def __init__(
         self,
         *,
@@ -22,6 +22,8 @@ class FileStore(HasState[FileState], HandlesActions):
 
     _state: FileState
 
+    handled_action_types = (SucceedCommandAction,)
+
     def __init__(self) -> None:
         """Initialize a File store and its state."""
         self._state = FileState(file_ids=[])
@@ -1,6 +1,21 @@
 """Helper functions for liquid-level related calculations inside a given frustum."""
-from typing import List, Tuple
-from numpy import pi, iscomplex, roots, real
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+from typing import List, Optional, Tuple
+from numpy import (
+    array,
+    float64,
+    insert,
+    interp,
+    iscomplex,
+    linspace,
+    maximum,
+    pi,
+    real,
+    roots,
+)
+from numpy.typing import NDArray
 from math import isclose
 
 from ..errors.exceptions import InvalidLiquidHeightFound
@@ -14,6 +29,15 @@ from opentrons_shared_data.labware.labware_definition import (
     SquaredConeSegment,
 )
 
+# Heights found from volumes are rounded to this many decimal places.
+_HEIGHT_DECIMALS = 4
+# How far interpolating a volume table may be from the exact height, in mm.
+_MAX_TABLE_HEIGHT_ERROR = 0.001
+_MAX_TABLE_SIZE = 4097
+_SOLVER_HEIGHT_TOLERANCE = 1e-10
+_MAX_SOLVER_ITERATIONS = 100
+_MAX_CACHED_VOLUME_TABLES = 256
+
 
 def _reject_unacceptable_heights(
     potential_heights: List[float], max_height: float
@@ -24,7 +48,7 @@ def _reject_unacceptable_heights(
         # reject any heights that are negative or greater than the max height
         if not iscomplex(root):
             # take only the real component of the root and round to 4 decimal places
-            rounded_root = round(real(root), 4)
+            rounded_root = round(real(root), _HEIGHT_DECIMALS)
             if (rounded_root <= max_height) and (rounded_root >= 0):
                 if not any([isclose(rounded_root, height) for height in valid_heights]):
                     valid_heights.append(rounded_root)
@@ -295,8 +319,8 @@ def height_at_volume_within_section(
         case ConicalFrustum():
             return _height_from_volume_circular(
                 volume=target_volume_relative,
-                top_radius=(section.bottomDiameter / 2),
-                bottom_radius=(section.topDiameter / 2),
+                top_radius=(section.topDiameter / 2),
+                bottom_radius=(section.bottomDiameter / 2),
                 total_frustum_height=section_height,
             )
         case CuboidalFrustum():
@@ -366,100 +390,234 @@ def volume_at_height_within_section(
             )
 
 
-def _find_volume_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    target_height: float,
-) -> float:
-    """Look through a sorted list of frusta for a target height, and find the volume at that height."""
-    for segment in sorted_well:
-        if segment.bottomHeight < target_height < segment.topHeight:
-            relative_target_height = target_height - segment.bottomHeight
-            section_height = segment.topHeight - segment.bottomHeight
-            return volume_at_height_within_section(
-                section=segment,
-                target_height_relative=relative_target_height,
-                section_height=section_height,
+def _section_polynomial(
+    section: WellSegment, section_height: float
+) -> Tuple[float, float, float]:
+    """Get (a, b, c) such that a section's volume at height h is ah^3 + bh^2 + ch."""
+    match section:
+        case SphericalSegment():
+            a, b, c = -pi / 3, pi * section.radiusOfCurvature, 0.0
+        case ConicalFrustum():
+            a, b, c = _circular_frustum_polynomial_roots(
+                bottom_radius=(section.bottomDiameter / 2),
+                top_radius=(section.topDiameter / 2),
+                total_frustum_height=section_height,
             )
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find volume at given well-height {target_height}."
-    )
-
-
-def find_volume_at_well_height(
-    target_height: float, well_geometry: InnerWellGeometry
+        case CuboidalFrustum():
+            a, b, c = _rectangular_frustum_polynomial_roots(
+                bottom_length=section.bottomYDimension,
+                bottom_width=section.bottomXDimension,
+                top_length=section.topYDimension,
+                top_width=section.topXDimension,
+                total_frustum_height=section_height,
+            )
+        case _:
+            raise NotImplementedError(
+                "Height from volume calculation not yet implemented for this well shape."
+            )
+    return a * section.count, b * section.count, c * section.count
+
+
+class _SectionTable:
+    """A dense, monotonic table of volumes at heights within one well section.
+
+    Heights are relative to the bottom of the section, and volumes include
+    every instance of the section.
+    """
+
+    def __init__(self, section: WellSegment) -> None:
+        self.section = section
+        self.section_height = section.topHeight - section.bottomHeight
+        # Squared cone volumes are already a lookup table of their own, so
+        # they're looked up in it like they always have been.
+        self.polynomial: Optional[Tuple[float, float, float]] = None
+        heights: "NDArray[float64]"
+        volumes: "NDArray[float64]"
+        if isinstance(section, SquaredConeSegment):
+            table = sorted(section.height_to_volume_table.items())
+            heights = array([height for height, _ in table], dtype=float64)
+            volumes = array([volume for _, volume in table], dtype=float64)
+            volumes *= section.count
+        else:
+            self.polynomial = _section_polynomial(section, self.section_height)
+            heights, volumes = self._build_from_polynomial(*self.polynomial)
+        # Rounding error can make a table that should be flat wobble a little.
+        volumes = maximum.accumulate(volumes)
+        self.heights: List[float] = heights.tolist()
+        self.volumes: List[float] = volumes.tolist()
+
+    def _build_from_polynomial(
+        self, a: float, b: float, c: float
+    ) -> Tuple["NDArray[float64]", "NDArray[float64]"]:
+        # Sample more densely until interpolating between samples is within
+        # _MAX_TABLE_HEIGHT_ERROR of the exact height at every midpoint.
+        heights = linspace(0, self.section_height, 17)
+        volumes = ((a * heights + b) * heights + c) * heights
+        while len(heights) < _MAX_TABLE_SIZE:
+            midpoint_heights = (heights[:-1] + heights[1:]) / 2
+            midpoint_volumes = (
+                (a * midpoint_heights + b) * midpoint_heights + c
+            ) * midpoint_heights
+            interpolated_heights = interp(midpoint_volumes, volumes, heights)
+            if max(abs(interpolated_heights - midpoint_heights)) <= (
+                _MAX_TABLE_HEIGHT_ERROR
+            ):
+                break
+            heights = insert(heights, range(1, len(heights)), midpoint_heights)
+            volumes = insert(volumes, range(1, len(volumes)), midpoint_volumes)
+        return heights, volumes
+
+    def volume_at_height(self, height: float) -> float:
+        """Get the volume at a height relative to the bottom of the section."""
+        if self.polynomial is None:
+            return self.volumes[_nearest_index(self.heights, height)]
+        a, b, c = self.polynomial
+        return ((a * height + b) * height + c) * height
+
+    def height_at_volume(self, volume: float) -> float:
+        """Get the height relative to the bottom of the section at a volume."""
+        if self.polynomial is None:
+            return self.heights[_nearest_index(self.volumes, volume)]
+        index = bisect_left(self.volumes, volume)
+        if index == 0:
+            return self.heights[0]
+        if index == len(self.volumes):
+            return self.heights[-1]
+        low, high = self.heights[index - 1], self.heights[index]
+        low_volume, high_volume = self.volumes[index - 1], self.volumes[index]
+        if high_volume == volume:
+            return high
+        # Interpolate within the bracketing samples, then polish the height
+        # against the exact volume so the result doesn't depend on the table.
+        guess = low + (volume - low_volume) / (high_volume - low_volume) * (high - low)
+        return _solve_cubic(self.polynomial, volume, low, high, guess)
+
+
+def _nearest_index(values: List[float], target: float) -> int:
+    """Get the index of the value nearest target, preferring the lower one on ties."""
+    index = bisect_left(values, target)
+    if index == 0:
+        return 0
+    if index == len(values):
+        return index - 1
+    if values[index] - target < target - values[index - 1]:
+        return index
+    return index - 1
+
+
+def _solve_cubic(
+    polynomial: Tuple[float, float, float],
+    volume: float,
+    low: float,
+    high: float,
+    guess: float,
 ) -> float:
-    """Find the volume within a well, at a known height."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_height = volumetric_capacity[-1][0]
-    if target_height < 0 or target_height > max_height:
-        raise InvalidLiquidHeightFound("Invalid target height.")
-    # volumes in volumetric_capacity are relative to each frustum,
-    # so we have to find the volume of all the full sections enclosed
-    # beneath the target height
-    closed_section_volume = 0.0
-    for boundary_height, section_volume in volumetric_capacity:
-        if boundary_height > target_height:
+    """Find the height between low and high where an increasing cubic equals volume.
+
+    This is Newton's method, falling back to bisection whenever a step would
+    leave the bracket, so it converges in a couple of steps from a good guess.
+    """
+    a, b, c = polynomial
+    height = guess
+    for _ in range(_MAX_SOLVER_ITERATIONS):
+        error = ((a * height + b) * height + c) * height - volume
+        if error == 0:
             break
-        closed_section_volume += section_volume
+        if error < 0:
+            low = height
+        else:
+            high = height
+        slope = (3 * a * height + 2 * b) * height + c
+        next_height = height - error / slope if slope > 0 else low
+        if not low < next_height < high:
+            next_height = (low + high) / 2
+        if abs(next_height - height) < _SOLVER_HEIGHT_TOLERANCE:
+            return next_height
+        height = next_height
+    return height
+
+
+class _WellVolumeTable:
+    """Height and volume lookups for every section of a well."""
+
+    def __init__(self, well_geometry: InnerWellGeometry) -> None:
+        sorted_well = sorted(
+            well_geometry.sections, key=lambda section: section.topHeight
+        )
+        self.sections = [_SectionTable(section) for section in sorted_well]
+        self.top_heights = [section.topHeight for section in sorted_well]
+        capacities = [_get_segment_capacity(section) for section in sorted_well]
+        # The volume below each section, and the volume at each section's top.
+        self.bottom_volumes = [sum(capacities[:i]) for i in range(len(capacities))]
+        self.top_volumes = [
+            bottom_volume + capacity
+            for bottom_volume, capacity in zip(self.bottom_volumes, capacities)
+        ]
+
+    def volume_at_height(self, target_height: float) -> float:
+        if target_height < 0 or target_height > self.top_heights[-1]:
+            raise InvalidLiquidHeightFound("Invalid target height.")
+        index = bisect_left(self.top_heights, target_height)
         # if target height is a boundary cross-section, we already know the volume
-        if target_height == boundary_height:
-            return closed_section_volume
-    # find the section the target height is in and compute the volume
+        if target_height == self.top_heights[index]:
+            return self.top_volumes[index]
+        section = self.sections[index]
+        if target_height < section.section.bottomHeight:
+            raise InvalidLiquidHeightFound(
+                f"Unable to find volume at given well-height {target_height}."
+            )
+        return self.bottom_volumes[index] + section.volume_at_height(
+            target_height - section.section.bottomHeight
+        )
+
+    def height_at_volume(self, target_volume: float) -> float:
+        if target_volume < 0 or target_volume > self.top_volumes[-1]:
+            raise InvalidLiquidHeightFound("Invalid target volume.")
+        index = bisect_left(self.top_volumes, target_volume)
+        section = self.sections[index]
+        partial_height = section.height_at_volume(
+            target_volume - self.bottom_volumes[index]
+        )
+        if section.polynomial is not None:
+            partial_height = round(partial_height, _HEIGHT_DECIMALS)
+        return partial_height + section.section.bottomHeight
 
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    partial_volume = _find_volume_in_partial_frustum(
-        sorted_well=sorted_well,
-        target_height=target_height,
-    )
-    return partial_volume + closed_section_volume
 
+_volume_tables: "OrderedDict[int, Tuple[InnerWellGeometry, _WellVolumeTable]]" = (
+    OrderedDict()
+)
+_volume_tables_lock = Lock()
+
+
+def _get_volume_table(well_geometry: InnerWellGeometry) -> _WellVolumeTable:
+    """Get the volume table for a well geometry, building it the first time.
+
+    Tables are keyed by the geometry object itself, which every labware
+    loaded from the same definition shares.
+    """
+    key = id(well_geometry)
+    with _volume_tables_lock:
+        cached = _volume_tables.get(key)
+        if cached is not None and cached[0] is well_geometry:
+            _volume_tables.move_to_end(key)
+            return cached[1]
+    table = _WellVolumeTable(well_geometry)
+    with _volume_tables_lock:
+        _volume_tables[key] = (well_geometry, table)
+        while len(_volume_tables) > _MAX_CACHED_VOLUME_TABLES:
+            _volume_tables.popitem(last=False)
+    return table
 
-def _find_height_in_partial_frustum(
-    sorted_well: List[WellSegment],
-    volumetric_capacity: List[Tuple[float, float]],
-    target_volume: float,
+
+def find_volume_at_well_height(
+    target_height: float, well_geometry: InnerWellGeometry
 ) -> float:
-    """Look through a sorted list of frusta for a target volume, and find the height at that volume."""
-    bottom_section_volume = 0.0
-    for section, capacity in zip(sorted_well, volumetric_capacity):
-        section_top_height, section_volume = capacity
-        if (
-            bottom_section_volume
-            < target_volume
-            < (bottom_section_volume + section_volume)
-        ):
-            relative_target_volume = target_volume - bottom_section_volume
-            section_height = section.topHeight - section.bottomHeight
-            partial_height = height_at_volume_within_section(
-                section=section,
-                target_volume_relative=relative_target_volume,
-                section_height=section_height,
-            )
-            return partial_height + section.bottomHeight
-        # bottom section volume should always be the volume enclosed in the previously
-        # viewed section
-        bottom_section_volume += section_volume
-
-    # if we've looked through all sections and can't find the target volume, raise an error
-    raise InvalidLiquidHeightFound(
-        f"Unable to find height at given volume {target_volume}."
-    )
+    """Find the volume within a well, at a known height."""
+    return _get_volume_table(well_geometry).volume_at_height(target_height)
 
 
 def find_height_at_well_volume(
     target_volume: float, well_geometry: InnerWellGeometry
 ) -> float:
     """Find the height within a well, at a known volume."""
-    volumetric_capacity = get_well_volumetric_capacity(well_geometry)
-    max_volume = sum(row[1] for row in volumetric_capacity)
-    if target_volume < 0 or target_volume > max_volume:
-        raise InvalidLiquidHeightFound("Invalid target volume.")
-
-    sorted_well = sorted(well_geometry.sections, key=lambda section: section.topHeight)
-    # find the section the target volume is in and compute the height
-    return _find_height_in_partial_frustum(
-        sorted_well=sorted_well,
-        volumetric_capacity=volumetric_capacity,
-        target_volume=target_volume,
-    )
+    return _get_volume_table(well_geometry).height_at_volume(target_volume)
@@ -122,6 +122,11 @@ class GeometryView:
         self._pipettes = pipette_view
         self._addressable_areas = addressable_area_view
         self._last_drop_tip_location_spot: Dict[str, _TipDropSection] = {}
+        # Obstacle heights only change when labware, modules, or the deck do,
+        # which is far less often than they're queried for moves.
+        self._highest_z_generation: Optional[Tuple[int, int, int]] = None
+        self._all_obstacle_highest_z: Optional[float] = None
+        self._highest_z_by_slot: Dict[Union[DeckSlotName, StagingSlotName], float] = {}
 
     @cached_property
     def absolute_deck_extents(self) -> _AbsoluteRobotExtents:
@@ -153,8 +158,25 @@ class GeometryView:
 
         return self._get_highest_z_from_labware_data(labware_data)
 
+    def _invalidate_stale_highest_z(self) -> None:
+        generation = (
+            self._labware.get_generation(),
+            self._modules.get_generation(),
+            self._addressable_areas.get_generation(),
+        )
+        if generation != self._highest_z_generation:
+            self._highest_z_generation = generation
+            self._all_obstacle_highest_z = None
+            self._highest_z_by_slot.clear()
+
     def get_all_obstacle_highest_z(self) -> float:
         """Get the highest Z-point across all obstacles that the instruments need to fly over."""
+        self._invalidate_stale_highest_z()
+        if self._all_obstacle_highest_z is None:
+            self._all_obstacle_highest_z = self._get_all_obstacle_highest_z()
+        return self._all_obstacle_highest_z
+
+    def _get_all_obstacle_highest_z(self) -> float:
         highest_labware_z = max(
             (
                 self._get_highest_z_from_labware_data(lw_data)
@@ -210,6 +232,16 @@ class GeometryView:
         This height includes the height of any module that occupies the given slot
         even if it wasn't loaded in that slot (e.g., thermocycler).
         """
+        self._invalidate_stale_highest_z()
+        highest_z = self._highest_z_by_slot.get(slot.slotName)
+        if highest_z is None:
+            highest_z = self._get_highest_z_in_slot(slot)
+            self._highest_z_by_slot[slot.slotName] = highest_z
+        return highest_z
+
+    def _get_highest_z_in_slot(
+        self, slot: Union[DeckSlotLocation, StagingSlotLocation]
+    ) -> float:
         slot_item = self.get_slot_item(slot.slotName)
         if isinstance(slot_item, LoadedModule):
             # get height of module + all labware on it
@@ -1,7 +1,7 @@
 """Basic labware data state and store."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     Dict,
@@ -110,12 +110,22 @@ class LabwareState:
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV5
 
+    generation: int = field(default=0, compare=False)
+    """Incremented whenever labware, their locations, or their offsets change.
+
+    Derived state, like the heights of obstacles on the deck, can be cached
+    until this changes.
+    """
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
 
     _state: LabwareState
 
+    handled_action_types = (AddLabwareOffsetAction, AddLabwareDefinitionAction)
+    handled_state_update_fields = frozenset({"loaded_labware", "labware_location"})
+
     def __init__(
         self,
         deck_definition: DeckDefinitionV5,
@@ -154,6 +164,8 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
+        self._state.generation += 1
+
         for state_update in get_state_updates(action):
             self._add_loaded_labware(state_update)
             self._set_labware_location(state_update)
@@ -257,6 +269,10 @@ class LabwareView(HasState[LabwareState]):
         """
         self._state = state
 
+    def get_generation(self) -> int:
+        """Get a number that changes whenever labware, their locations, or their offsets change."""
+        return self._state.generation
+
     def get(self, labware_id: str) -> LoadedLabware:
         """Get labware data by the labware's unique identifier."""
         try:
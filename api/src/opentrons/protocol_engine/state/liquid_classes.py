@@ -28,6 +28,9 @@ class LiquidClassStore(HasState[LiquidClassState], HandlesActions):
 
     _state: LiquidClassState
 
+    handled_action_types = ()
+    handled_state_update_fields = frozenset({"liquid_class_loaded"})
+
     def __init__(self) -> None:
         self._state = LiquidClassState(
             liquid_class_record_by_id={},
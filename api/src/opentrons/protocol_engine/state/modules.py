@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Dict,
     List,
@@ -196,12 +196,23 @@ class ModuleState:
     is identified.
     """
 
+    generation: int = field(default=0, compare=False)
+    """Incremented whenever modules are loaded or calibrated.
+
+    Derived state, like the heights of obstacles on the deck, can be cached
+    until this changes. Module substate changes, like temperatures, don't
+    increment it.
+    """
+
 
 class ModuleStore(HasState[ModuleState], HandlesActions):
     """Module state container."""
 
     _state: ModuleState
 
+    handled_action_types = (SucceedCommandAction, AddModuleAction)
+    handled_state_update_fields = frozenset({"absorbance_reader_lid"})
+
     def __init__(
         self,
         config: Config,
@@ -344,6 +355,8 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
         actual_model = definition.model
         live_data = module_live_data["data"] if module_live_data else None
 
+        self._state.generation += 1
+
         self._state.requested_model_by_id[module_id] = requested_model
         self._state.slot_by_module_id[module_id] = slot_name
         self._state.hardware_by_module_id[module_id] = HardwareModule(
@@ -436,6 +449,7 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
                 moduleOffsetVector=module_offset,
                 location=location,
             )
+            self._state.generation += 1
 
     def _handle_heater_shaker_commands(
         self,
@@ -641,6 +655,10 @@ class ModuleView(HasState[ModuleState]):
         """Initialize the view with its backing state value."""
         self._state = state
 
+    def get_generation(self) -> int:
+        """Get a number that changes whenever loaded modules or their calibrations change."""
+        return self._state.generation
+
     def get(self, module_id: str) -> LoadedModule:
         """Get module data by the module's unique identifier."""
         try:
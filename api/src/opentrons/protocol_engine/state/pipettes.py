@@ -125,6 +125,18 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
 
     _state: PipetteState
 
+    handled_action_types = (SetPipetteMovementSpeedAction,)
+    handled_state_update_fields = frozenset(
+        {
+            "loaded_pipette",
+            "pipette_location",
+            "pipette_config",
+            "pipette_nozzle_map",
+            "pipette_tip_state",
+            "pipette_aspirated_fluid",
+        }
+    )
+
     def __init__(self) -> None:
         """Initialize a PipetteStore and its state."""
         self._state = PipetteState(
@@ -2,7 +2,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, TypeVar
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 from typing_extensions import ParamSpec
 
 from opentrons_shared_data.deck.types import DeckDefinitionV5
@@ -14,7 +23,11 @@ from opentrons.util.change_notifier import ChangeNotifier
 
 from ..resources import DeckFixedLabware
 from ..actions import Action, ActionHandler
-from ._abstract_store import HasState, HandlesActions
+from ._abstract_store import (
+    HasState,
+    HandlesActions,
+    get_changed_state_update_fields,
+)
 from .commands import CommandState, CommandStore, CommandView
 from .addressable_areas import (
     AddressableAreaState,
@@ -73,6 +86,7 @@ class StateView(HasState[State]):
     _motion: MotionView
     _files: FileView
     _config: Config
+    _version: int
 
     @property
     def commands(self) -> CommandView:
@@ -139,6 +153,14 @@ class StateView(HasState[State]):
         """Get ProtocolEngine configuration."""
         return self._config
 
+    def get_version(self) -> int:
+        """Get a counter that increases every time the state changes.
+
+        Callers can compare this against a previously read value to cheaply
+        tell whether anything could have changed in between.
+        """
+        return self._version
+
     def get_summary(self) -> StateSummary:
         """Get protocol run data."""
         error = self._commands.get_error()
@@ -239,6 +261,11 @@ class StateStore(StateView, ActionHandler):
             self._well_store,
             self._file_store,
         ]
+        # Which substores handle an action only depends on its type and on which
+        # StateUpdate fields it sets, so we only need to work it out once per route.
+        self._substores_by_route: Dict[
+            Tuple[type, FrozenSet[str]], List[HandlesActions]
+        ] = {}
         self._config = config
         self._change_notifier = change_notifier or ChangeNotifier()
         self._notify_robot_server = notify_publishers
@@ -249,9 +276,24 @@ class StateStore(StateView, ActionHandler):
 
         Arguments:
             action: An action object representing a state change. Will be
-                passed to all substores so they can react accordingly.
+                passed to every substore that declares it handles the action,
+                so they can react accordingly. If no substore handles it,
+                state is left untouched and no change is notified.
         """
-        for substore in self._substores:
+        state_update_fields = get_changed_state_update_fields(action)
+        route = (type(action), state_update_fields)
+        changed_substores = self._substores_by_route.get(route)
+        if changed_substores is None:
+            changed_substores = [
+                substore
+                for substore in self._substores
+                if substore.handles(action, state_update_fields)
+            ]
+            self._substores_by_route[route] = changed_substores
+        if not changed_substores:
+            return
+
+        for substore in changed_substores:
             substore.handle_action(action)
 
         self._update_state_views()
@@ -365,6 +407,7 @@ class StateStore(StateView, ActionHandler):
 
         # Base states
         self._state = state
+        self._version = 0
         self._commands = CommandView(state.commands)
         self._addressable_areas = AddressableAreaView(state.addressable_areas)
         self._labware = LabwareView(state.labware)
@@ -407,6 +450,8 @@ class StateStore(StateView, ActionHandler):
         self._liquid_classes._state = next_state.liquid_classes
         self._tips._state = next_state.tips
         self._wells._state = next_state.wells
+        self._files._state = next_state.files
+        self._version += 1
         self._change_notifier.notify()
         if self._notify_robot_server is not None:
             self._notify_robot_server()
@@ -1,8 +1,7 @@
 """Tip state tracking."""
 
 from dataclasses import dataclass
-from enum import Enum
-from typing import Dict, Optional, List, Union
+from typing import Dict, Optional, List
 
 from opentrons.types import NozzleMapInterface
 from opentrons.protocol_engine.state import update_types
@@ -14,14 +13,65 @@ from ..actions import Action, ResetTipsAction, get_state_updates
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 
 
-class TipRackWellState(Enum):
-    """The state of a single tip in a tip rack's well."""
-
-    CLEAN = "clean"
-    USED = "used"
+@dataclass(frozen=True)
+class _TipRackLayout:
+    """The wells of a tip rack, laid out as bits of an integer bitmask.
+
+    Well (column c, row r) is bit ``c * row_count + r``, so ascending bits run
+    down each column in turn, like the labware definition's ``ordering``.
+    Columns shorter than the longest one leave their missing rows' bits unset
+    in ``all_wells_mask``.
+    """
+
+    columns: List[List[str]]
+    row_count: int
+    column_count: int
+    well_names_by_bit: List[Optional[str]]
+    bits_by_well_name: Dict[str, int]
+    all_wells_mask: int
+    column_masks: List[int]
+    top_row_mask: int
+
+    @classmethod
+    def build(cls, ordering: List[List[str]]) -> "_TipRackLayout":
+        columns = [list(column) for column in ordering]
+        row_count = max((len(column) for column in columns), default=0)
+        well_names_by_bit: List[Optional[str]] = [None] * (row_count * len(columns))
+        bits_by_well_name: Dict[str, int] = {}
+        all_wells_mask = 0
+        for column_index, column in enumerate(columns):
+            for row_index, well_name in enumerate(column):
+                bit = column_index * row_count + row_index
+                well_names_by_bit[bit] = well_name
+                bits_by_well_name[well_name] = bit
+                all_wells_mask |= 1 << bit
+        return cls(
+            columns=columns,
+            row_count=row_count,
+            column_count=len(columns),
+            well_names_by_bit=well_names_by_bit,
+            bits_by_well_name=bits_by_well_name,
+            all_wells_mask=all_wells_mask,
+            column_masks=[
+                ((1 << row_count) - 1) << (column_index * row_count)
+                for column_index in range(len(columns))
+            ],
+            top_row_mask=sum(
+                1 << (column_index * row_count) for column_index in range(len(columns))
+            ),
+        )
 
+    def rows_mask(self, first_row: int, last_row: int) -> int:
+        """Get the mask of every column's rows from first_row to last_row, inclusive."""
+        return (
+            ((1 << (last_row - first_row + 1)) - 1) << first_row
+        ) * self.top_row_mask
 
-TipRackStateByWellName = Dict[str, TipRackWellState]
+    def columns_mask(self, first_column: int, last_column: int) -> int:
+        """Get the mask of every row of columns first_column to last_column, inclusive."""
+        return ((1 << ((last_column - first_column + 1) * self.row_count)) - 1) << (
+            first_column * self.row_count
+        )
 
 
 # todo(mm, 2024-10-10): This info is duplicated between here and PipetteState because
@@ -40,8 +90,9 @@ class _PipetteInfo:
 class TipState:
     """State of all tips."""
 
-    tips_by_labware_id: Dict[str, TipRackStateByWellName]
-    column_by_labware_id: Dict[str, List[List[str]]]
+    layout_by_labware_id: Dict[str, _TipRackLayout]
+    # Bit i is set if the tip at bit i of the rack's layout has been used.
+    used_tips_by_labware_id: Dict[str, int]
 
     pipette_info_by_pipette_id: Dict[str, _PipetteInfo]
 
@@ -51,11 +102,16 @@ class TipStore(HasState[TipState], HandlesActions):
 
     _state: TipState
 
+    handled_action_types = (ResetTipsAction,)
+    handled_state_update_fields = frozenset(
+        {"loaded_labware", "pipette_config", "pipette_nozzle_map", "tips_used"}
+    )
+
     def __init__(self) -> None:
         """Initialize a liquid store and its state."""
         self._state = TipState(
-            tips_by_labware_id={},
-            column_by_labware_id={},
+            layout_by_labware_id={},
+            used_tips_by_labware_id={},
             pipette_info_by_pipette_id={},
         )
 
@@ -65,12 +121,7 @@ class TipStore(HasState[TipState], HandlesActions):
             self._handle_state_update(state_update)
 
         if isinstance(action, ResetTipsAction):
-            labware_id = action.labware_id
-
-            for well_name in self._state.tips_by_labware_id[labware_id].keys():
-                self._state.tips_by_labware_id[labware_id][
-                    well_name
-                ] = TipRackWellState.CLEAN
+            self._state.used_tips_by_labware_id[action.labware_id] = 0
 
     def _handle_state_update(self, state_update: update_types.StateUpdate) -> None:
         if state_update.pipette_config != update_types.NO_CHANGE:
@@ -102,21 +153,21 @@ class TipStore(HasState[TipState], HandlesActions):
             labware_id = state_update.loaded_labware.labware_id
             definition = state_update.loaded_labware.definition
             if definition.parameters.isTiprack:
-                self._state.tips_by_labware_id[labware_id] = {
-                    well_name: TipRackWellState.CLEAN
-                    for column in definition.ordering
-                    for well_name in column
-                }
-                self._state.column_by_labware_id[labware_id] = [
-                    column for column in definition.ordering
-                ]
+                self._state.layout_by_labware_id[labware_id] = _TipRackLayout.build(
+                    definition.ordering
+                )
+                self._state.used_tips_by_labware_id[labware_id] = 0
 
     def _set_used_tips(self, pipette_id: str, well_name: str, labware_id: str) -> None:
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        columns = layout.columns if layout is not None else []
         nozzle_map = self._state.pipette_info_by_pipette_id[pipette_id].nozzle_map
-        for well in wells_covered_dense(nozzle_map, well_name, columns):
-            wells[well] = TipRackWellState.USED
+        wells = list(wells_covered_dense(nozzle_map, well_name, columns))
+        if layout is not None:
+            for well in wells:
+                self._state.used_tips_by_labware_id[labware_id] |= (
+                    1 << layout.bits_by_well_name[well]
+                )
 
 
 class TipView(HasState[TipState]):
@@ -140,188 +191,11 @@ class TipView(HasState[TipState]):
         nozzle_map: Optional[NozzleMapInterface],
     ) -> Optional[str]:
         """Get the next available clean tip. Does not support use of a starting tip if the pipette used is in a partial configuration."""
-        wells = self._state.tips_by_labware_id.get(labware_id, {})
-        columns = self._state.column_by_labware_id.get(labware_id, [])
-
-        # TODO(sf): I'm pretty sure this can be replaced with wells_covered_96 but I'm not quite sure how
-        def _identify_tip_cluster(
-            active_columns: int,
-            active_rows: int,
-            critical_column: int,
-            critical_row: int,
-            entry_well: str,
-        ) -> Optional[List[str]]:
-            tip_cluster: list[str] = []
-            for i in range(active_columns):
-                if entry_well == "A1" or entry_well == "H1":
-                    if critical_column - i >= 0:
-                        column = columns[critical_column - i]
-                    else:
-                        return None
-                elif entry_well == "A12" or entry_well == "H12":
-                    if critical_column + i < len(columns):
-                        column = columns[critical_column + i]
-                    else:
-                        return None
-                else:
-                    raise ValueError(
-                        f"Invalid entry well {entry_well} for tip cluster identification."
-                    )
-                for j in range(active_rows):
-                    if entry_well == "A1" or entry_well == "A12":
-                        if critical_row - j >= 0:
-                            well = column[critical_row - j]
-                        else:
-                            return None
-                    elif entry_well == "H1" or entry_well == "H12":
-                        if critical_row + j < len(column):
-                            well = column[critical_row + j]
-                        else:
-                            return None
-                    tip_cluster.append(well)
-
-            if any(well not in [*wells] for well in tip_cluster):
-                return None
-
-            return tip_cluster
-
-        def _validate_tip_cluster(
-            active_columns: int, active_rows: int, tip_cluster: List[str]
-        ) -> Union[str, int, None]:
-            if not any(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return tip_cluster[0]
-            elif all(wells[well] == TipRackWellState.USED for well in tip_cluster):
-                return None
-            else:
-                # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
-                if nozzle_map is not None and nozzle_map.physical_nozzle_count == 8:
-                    return None
-
-                # In the case of a 96ch we can attempt to index in by singular rows and columns assuming that indexed direction is safe
-                # The tip cluster list is ordered: Each row from a column in order by columns
-                tip_cluster_final_column: list[str] = []
-                for i in range(active_rows):
-                    tip_cluster_final_column.append(
-                        tip_cluster[((active_columns * active_rows) - 1) - i]
-                    )
-                tip_cluster_final_row: list[str] = []
-                for i in range(active_columns):
-                    tip_cluster_final_row.append(
-                        tip_cluster[(active_rows - 1) + (i * active_rows)]
-                    )
-                if all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_column
-                ):
-                    return None
-                elif all(
-                    wells[well] == TipRackWellState.USED
-                    for well in tip_cluster_final_row
-                ):
-                    return None
-                else:
-                    # Tiprack has no valid tip selection, cannot progress
-                    return -1
-
-        # Search through the tiprack beginning at A1
-        def _cluster_search_A1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = active_rows - 1
-
-            while critical_column < len(columns):
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column += 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at A12
-        def _cluster_search_A12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = active_rows - 1
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "A12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row + 1 < len(columns[0]):
-                    critical_row = critical_row + 1
-                else:
-                    critical_column -= 1
-                    critical_row = active_rows - 1
-            return None
-
-        # Search through the tiprack beginning at H1
-        def _cluster_search_H1(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = active_columns - 1
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column <= len(columns):  # change to max size of labware
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H1"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column += 1
-                    if critical_column >= len(columns):
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
-            return None
-
-        # Search through the tiprack beginning at H12
-        def _cluster_search_H12(active_columns: int, active_rows: int) -> Optional[str]:
-            critical_column = len(columns) - active_columns
-            critical_row = len(columns[critical_column]) - active_rows
-
-            while critical_column >= 0:
-                tip_cluster = _identify_tip_cluster(
-                    active_columns, active_rows, critical_column, critical_row, "H12"
-                )
-                if tip_cluster is not None:
-                    result = _validate_tip_cluster(
-                        active_columns, active_rows, tip_cluster
-                    )
-                    if isinstance(result, str):
-                        return result
-                    elif isinstance(result, int) and result == -1:
-                        return None
-                if critical_row - 1 >= 0:
-                    critical_row = critical_row - 1
-                else:
-                    critical_column -= 1
-                    if critical_column < 0:
-                        return None
-                    critical_row = len(columns[critical_column]) - active_rows
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        if layout is None:
             return None
+        used_tips = self._state.used_tips_by_labware_id[labware_id]
+        columns = layout.columns
 
         if starting_tip_name is None and nozzle_map is not None and columns:
             num_channels = nozzle_map.physical_nozzle_count
@@ -334,22 +208,36 @@ class TipView(HasState[TipState]):
             # - 96 Channel pipettes will begin in the corner opposite their primary/starting nozzle (if starting nozzle = A1, enter tiprack at H12)
             #   The 96 channel will then progress towards the opposite corner, either going up or down, left or right depending on configuration.
 
+            def _cluster_search(
+                left_to_right: bool, top_to_bottom: bool
+            ) -> Optional[str]:
+                return _find_tip_cluster(
+                    layout=layout,
+                    used_tips=used_tips,
+                    active_columns=num_nozzle_cols,
+                    active_rows=num_nozzle_rows,
+                    left_to_right=left_to_right,
+                    top_to_bottom=top_to_bottom,
+                    # In the case of an 8ch pipette where a column has mixed state tips we may simply progress to the next column in our search
+                    skip_mixed_clusters=num_channels == 8,
+                )
+
             if num_channels == 1:
-                return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                return _cluster_search(left_to_right=True, top_to_bottom=True)
             elif num_channels == 8:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=True, top_to_bottom=False)
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=True, top_to_bottom=True)
             elif num_channels == 96:
                 if nozzle_map.starting_nozzle == "A1":
-                    return _cluster_search_H12(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=False, top_to_bottom=False)
                 elif nozzle_map.starting_nozzle == "A12":
-                    return _cluster_search_H1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=True, top_to_bottom=False)
                 elif nozzle_map.starting_nozzle == "H1":
-                    return _cluster_search_A12(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=False, top_to_bottom=True)
                 elif nozzle_map.starting_nozzle == "H12":
-                    return _cluster_search_A1(num_nozzle_cols, num_nozzle_rows)
+                    return _cluster_search(left_to_right=True, top_to_bottom=True)
                 else:
                     raise ValueError(
                         f"Nozzle {nozzle_map.starting_nozzle} is an invalid starting tip for automatic tip pickup."
@@ -360,37 +248,40 @@ class TipView(HasState[TipState]):
                 )
         else:
             if columns and num_tips == len(columns[0]):  # Get next tips for 8-channel
-                column_head = [column[0] for column in columns]
                 starting_column_index = 0
 
-                if starting_tip_name:
-                    for idx, column in enumerate(columns):
-                        if starting_tip_name in column:
-                            if starting_tip_name not in column_head:
-                                starting_column_index = idx + 1
-                            else:
-                                starting_column_index = idx
+                if starting_tip_name in layout.bits_by_well_name:
+                    starting_bit = layout.bits_by_well_name[starting_tip_name]
+                    starting_column_index, starting_row_index = divmod(
+                        starting_bit, layout.row_count
+                    )
+                    if starting_row_index != 0:
+                        starting_column_index += 1
 
-                for column in columns[starting_column_index:]:
-                    if not any(wells[well] == TipRackWellState.USED for well in column):
-                        return column[0]
+                for column_index in range(starting_column_index, len(columns)):
+                    if not used_tips & layout.column_masks[column_index]:
+                        return columns[column_index][0]
 
-            elif num_tips == len(wells.keys()):  # Get next tips for 96 channel
+            elif num_tips == len(
+                layout.bits_by_well_name
+            ):  # Get next tips for 96 channel
                 if starting_tip_name and starting_tip_name != columns[0][0]:
                     return None
 
-                if not any(
-                    tip_state == TipRackWellState.USED for tip_state in wells.values()
-                ):
-                    return next(iter(wells))
+                if not used_tips and layout.all_wells_mask:
+                    return _lowest_well_name(layout, layout.all_wells_mask)
 
             else:  # Get next tips for single channel
+                clean_tips = layout.all_wells_mask & ~used_tips
                 if starting_tip_name is not None:
-                    wells = _drop_wells_before_starting_tip(wells, starting_tip_name)
+                    # Drop any wells that come before the starting tip.
+                    first_bit = layout.bits_by_well_name.get(starting_tip_name)
+                    if first_bit is None:
+                        return None
+                    clean_tips &= ~((1 << first_bit) - 1)
 
-                for well_name, tip_state in wells.items():
-                    if tip_state == TipRackWellState.CLEAN:
-                        return well_name
+                if clean_tips:
+                    return _lowest_well_name(layout, clean_tips)
         return None
 
     def get_pipette_channels(self, pipette_id: str) -> int:
@@ -423,21 +314,115 @@ class TipView(HasState[TipState]):
             True if the labware is a tip rack and the well has a clean tip,
             otherwise False.
         """
-        tip_rack = self._state.tips_by_labware_id.get(labware_id)
-        well_state = tip_rack.get(well_name) if tip_rack else None
-
-        return well_state == TipRackWellState.CLEAN
-
-
-def _drop_wells_before_starting_tip(
-    wells: TipRackStateByWellName, starting_tip_name: str
-) -> TipRackStateByWellName:
-    """Drop any wells that come before the starting tip and return the remaining ones after."""
-    seen_starting_well = False
-    remaining_wells = {}
-    for well_name, tip_state in wells.items():
-        if well_name == starting_tip_name:
-            seen_starting_well = True
-        if seen_starting_well:
-            remaining_wells[well_name] = tip_state
-    return remaining_wells
+        layout = self._state.layout_by_labware_id.get(labware_id)
+        bit = layout.bits_by_well_name.get(well_name) if layout else None
+        if bit is None:
+            return False
+
+        return not self._state.used_tips_by_labware_id[labware_id] & (1 << bit)
+
+
+def _lowest_well_name(layout: _TipRackLayout, wells: int) -> str:
+    """Get the name of the well at the lowest set bit of a nonzero mask."""
+    well_name = layout.well_names_by_bit[(wells & -wells).bit_length() - 1]
+    assert well_name is not None
+    return well_name
+
+
+def _shift(mask: int, bits: int) -> int:
+    return mask << bits if bits >= 0 else mask >> -bits
+
+
+def _find_tip_cluster(  # noqa: C901
+    layout: _TipRackLayout,
+    used_tips: int,
+    active_columns: int,
+    active_rows: int,
+    left_to_right: bool,
+    top_to_bottom: bool,
+    skip_mixed_clusters: bool,
+) -> Optional[str]:
+    """Find the first clean cluster of tips for a nozzle configuration.
+
+    Candidate clusters are visited column by column, in the given directions, by
+    their "critical" well: the corner that the search reaches last. A cluster
+    extends back from its critical well towards where the search started, and
+    is returned as the name of its critical well.
+
+    Rather than testing each cluster in turn, every cluster is classified at once
+    by shifting whole-rack bitmasks: a cluster is entirely in a mask if its
+    critical well's bit survives ANDing the mask with copies of itself shifted
+    by every other well's offset from the critical well.
+
+    If the search comes to a cluster with a mix of clean and used tips, it moves
+    on if ``skip_mixed_clusters`` is set, or if the cluster's row or column
+    farthest from its critical well is all used, since the pipette can still
+    progress past it in that direction. Otherwise, there is no valid tip
+    selection left and the search ends without a result.
+    """
+    row_count = layout.row_count
+    column_count = layout.column_count
+    if active_columns > column_count or active_rows > row_count:
+        return None
+
+    # The offsets, in bits, from a critical well to its neighbors in the cluster.
+    column_step = -row_count if left_to_right else row_count
+    row_step = -1 if top_to_bottom else 1
+
+    def _in_rows(mask: int) -> int:
+        # Wells whose cluster column is entirely in mask.
+        result = mask
+        for row in range(1, active_rows):
+            result &= _shift(mask, -row * row_step)
+        return result
+
+    def _in_columns(mask: int) -> int:
+        # Wells whose cluster row is entirely in mask.
+        result = mask
+        for column in range(1, active_columns):
+            result &= _shift(mask, -column * column_step)
+        return result
+
+    # Critical wells whose cluster fits within the tip rack.
+    if left_to_right:
+        critical_columns = layout.columns_mask(active_columns - 1, column_count - 1)
+    else:
+        critical_columns = layout.columns_mask(0, column_count - active_columns)
+    if top_to_bottom:
+        critical_rows = layout.rows_mask(active_rows - 1, row_count - 1)
+    else:
+        critical_rows = layout.rows_mask(0, row_count - active_rows)
+    critical_wells = (
+        critical_columns & critical_rows & _in_columns(_in_rows(layout.all_wells_mask))
+    )
+
+    clean_clusters = (
+        _in_columns(_in_rows(layout.all_wells_mask & ~used_tips)) & critical_wells
+    )
+    candidates = clean_clusters
+    if not skip_mixed_clusters:
+        used_rows = _in_rows(used_tips)
+        used_columns = _in_columns(used_tips)
+        used_clusters = _in_columns(used_rows)
+        final_column_used = _shift(used_rows, -(active_columns - 1) * column_step)
+        final_row_used = _shift(used_columns, -(active_rows - 1) * row_step)
+        candidates |= critical_wells & ~(
+            clean_clusters | used_clusters | final_column_used | final_row_used
+        )
+    if not candidates:
+        return None
+
+    # Visit columns in search order, then rows within the first column that has a candidate.
+    if left_to_right:
+        column = ((candidates & -candidates).bit_length() - 1) // row_count
+    else:
+        column = (candidates.bit_length() - 1) // row_count
+    column_candidates = candidates & layout.column_masks[column]
+    if top_to_bottom:
+        bit = (column_candidates & -column_candidates).bit_length() - 1
+    else:
+        bit = column_candidates.bit_length() - 1
+
+    if not clean_clusters & (1 << bit):
+        return None
+    return layout.well_names_by_bit[bit]
@@ -1,7 +1,12 @@
 """Basic well data state and store."""
 
+import math
 from dataclasses import dataclass
-from typing import Dict, List, Union, Iterator, Optional, Tuple, overload, TypeVar
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.typing import NDArray
 
 from opentrons.protocol_engine.types import (
     ProbedHeightInfo,
@@ -20,14 +25,213 @@ from ..actions.get_state_update import get_state_updates
 LabwareId = str
 WellName = str
 
+_INITIAL_CAPACITY = 96
+
+
+class _LabwareWells:
+    """Liquid tracking for the wells of one labware, stored as columns.
+
+    Each well that has ever been tracked gets an ordinal, in the order it was
+    first tracked, which indexes every column. A well has a loaded volume,
+    probed height, or probed volume only if its ``has_*`` flag is set, and
+    NaN stands in for a volume or height of None.
+    """
+
+    def __init__(self, labware_id: LabwareId) -> None:
+        self.labware_id = labware_id
+        self.well_names: List[WellName] = []
+        self.ordinals_by_well_name: Dict[WellName, int] = {}
+
+        self.has_loaded_volume = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self.loaded_volume = np.full(_INITIAL_CAPACITY, np.nan)
+        self.last_loaded = np.empty(_INITIAL_CAPACITY, dtype=object)
+        self.operations_since_load = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+        self.has_probed_height = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self.probed_height = np.full(_INITIAL_CAPACITY, np.nan)
+        self.has_probed_volume = np.zeros(_INITIAL_CAPACITY, dtype=bool)
+        self.probed_volume = np.full(_INITIAL_CAPACITY, np.nan)
+        # Probed heights and volumes are always recorded together.
+        self.last_probed = np.empty(_INITIAL_CAPACITY, dtype=object)
+        self.operations_since_probe = np.zeros(_INITIAL_CAPACITY, dtype=np.int64)
+
+        # Summaries of every tracked well, dropped whenever a well changes.
+        self._summaries: Optional[List[WellInfoSummary]] = None
+
+    def get_ordinal(self, well_name: WellName) -> Optional[int]:
+        """Get a well's ordinal, or None if it has never been tracked."""
+        return self.ordinals_by_well_name.get(well_name)
+
+    def add_well(self, well_name: WellName) -> int:
+        """Get a well's ordinal, allocating a new one if it has never been tracked."""
+        ordinal = self.ordinals_by_well_name.get(well_name)
+        if ordinal is None:
+            ordinal = len(self.well_names)
+            if ordinal == len(self.has_loaded_volume):
+                self._grow()
+            self.well_names.append(well_name)
+            self.ordinals_by_well_name[well_name] = ordinal
+        return ordinal
+
+    def set_loaded_volumes(
+        self,
+        volumes: Dict[WellName, float],
+        last_loaded: datetime,
+    ) -> None:
+        """Record volumes loaded into wells."""
+        for well_name, volume in volumes.items():
+            ordinal = self.add_well(well_name)
+            self.has_loaded_volume[ordinal] = True
+            self.loaded_volume[ordinal] = _nan_from_clear(volume)
+            self.last_loaded[ordinal] = last_loaded
+            self.operations_since_load[ordinal] = 0
+        self._summaries = None
+
+    def set_probed(
+        self,
+        well_name: WellName,
+        height: float | update_types.ClearType,
+        volume: float | update_types.ClearType,
+        last_probed: datetime,
+    ) -> None:
+        """Record the results of probing a well."""
+        ordinal = self.add_well(well_name)
+        self.has_probed_height[ordinal] = True
+        self.probed_height[ordinal] = _nan_from_clear(height)
+        self.has_probed_volume[ordinal] = True
+        self.probed_volume[ordinal] = _nan_from_clear(volume)
+        self.last_probed[ordinal] = last_probed
+        self.operations_since_probe[ordinal] = 0
+        self._summaries = None
+
+    def operate(
+        self,
+        well_names: List[WellName],
+        volume_added: float | update_types.ClearType,
+    ) -> None:
+        """Record liquid being added to or removed from wells."""
+        ordinals = np.array(
+            [
+                ordinal
+                for ordinal in map(self.get_ordinal, well_names)
+                if ordinal is not None
+            ],
+            dtype=np.intp,
+        )
+        if len(ordinals) == 0:
+            return
+
+        # A well can appear more than once, so accumulate with ufunc.at().
+        loaded = ordinals[self.has_loaded_volume[ordinals]]
+        if volume_added is update_types.CLEAR:
+            self.has_loaded_volume[loaded] = False
+        else:
+            assert not np.isnan(self.loaded_volume[loaded]).any()
+            np.add.at(self.loaded_volume, loaded, volume_added)
+            np.add.at(self.operations_since_load, loaded, 1)
+
+        self.has_probed_height[ordinals] = False
+
+        probed = ordinals[self.has_probed_volume[ordinals]]
+        if volume_added is update_types.CLEAR:
+            self.has_probed_volume[probed] = False
+        else:
+            # An unknown probed volume stays unknown, since NaN + x is NaN.
+            np.add.at(self.probed_volume, probed, volume_added)
+            np.add.at(self.operations_since_probe, probed, 1)
+        self._summaries = None
+
+    def get_liquid_info(self, well_name: WellName) -> WellLiquidInfo:
+        """Get all the liquid info for a well."""
+        ordinal = self.get_ordinal(well_name)
+        if ordinal is None:
+            return WellLiquidInfo(
+                loaded_volume=None, probed_height=None, probed_volume=None
+            )
+        return WellLiquidInfo(
+            loaded_volume=LoadedVolumeInfo(
+                volume=_none_from_nan(self.loaded_volume[ordinal]),
+                last_loaded=self.last_loaded[ordinal],
+                operations_since_load=int(self.operations_since_load[ordinal]),
+            )
+            if self.has_loaded_volume[ordinal]
+            else None,
+            probed_height=ProbedHeightInfo(
+                height=_none_from_nan(self.probed_height[ordinal]),
+                last_probed=self.last_probed[ordinal],
+            )
+            if self.has_probed_height[ordinal]
+            else None,
+            probed_volume=ProbedVolumeInfo(
+                volume=_none_from_nan(self.probed_volume[ordinal]),
+                last_probed=self.last_probed[ordinal],
+                operations_since_probe=int(self.operations_since_probe[ordinal]),
+            )
+            if self.has_probed_volume[ordinal]
+            else None,
+        )
+
+    def get_summaries(self) -> List[WellInfoSummary]:
+        """Get summaries of every tracked well, in the order they were first tracked."""
+        if self._summaries is None:
+            count = len(self.well_names)
+            has_loaded_volume = self.has_loaded_volume[:count]
+            has_probed_height = self.has_probed_height[:count]
+            has_probed_volume = self.has_probed_volume[:count]
+            ordinals = np.flatnonzero(
+                has_loaded_volume | has_probed_height | has_probed_volume
+            )
+            loaded_volumes = _none_where_missing(
+                self.loaded_volume[ordinals], has_loaded_volume[ordinals]
+            )
+            probed_heights = _none_where_missing(
+                self.probed_height[ordinals], has_probed_height[ordinals]
+            )
+            probed_volumes = _none_where_missing(
+                self.probed_volume[ordinals], has_probed_volume[ordinals]
+            )
+            self._summaries = [
+                WellInfoSummary.construct(
+                    labware_id=self.labware_id,
+                    well_name=self.well_names[ordinal],
+                    loaded_volume=loaded_volume,
+                    probed_height=probed_height,
+                    probed_volume=probed_volume,
+                )
+                for ordinal, loaded_volume, probed_height, probed_volume in zip(
+                    ordinals.tolist(), loaded_volumes, probed_heights, probed_volumes
+                )
+            ]
+        return self._summaries
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.has_loaded_volume)
+        for name, fill in _COLUMN_FILLS.items():
+            column = getattr(self, name)
+            grown = np.full(capacity, fill, dtype=column.dtype)
+            grown[: len(column)] = column
+            setattr(self, name, grown)
+
+
+_COLUMN_FILLS = {
+    "has_loaded_volume": False,
+    "loaded_volume": np.nan,
+    "last_loaded": None,
+    "operations_since_load": 0,
+    "has_probed_height": False,
+    "probed_height": np.nan,
+    "has_probed_volume": False,
+    "probed_volume": np.nan,
+    "last_probed": None,
+    "operations_since_probe": 0,
+}
+
 
 @dataclass
 class WellState:
     """State of all wells."""
 
-    loaded_volumes: Dict[LabwareId, Dict[WellName, LoadedVolumeInfo]]
-    probed_heights: Dict[LabwareId, Dict[WellName, ProbedHeightInfo]]
-    probed_volumes: Dict[LabwareId, Dict[WellName, ProbedVolumeInfo]]
+    wells_by_labware_id: Dict[LabwareId, _LabwareWells]
 
 
 class WellStore(HasState[WellState], HandlesActions):
@@ -35,9 +239,14 @@ class WellStore(HasState[WellState], HandlesActions):
 
     _state: WellState
 
+    handled_action_types = ()
+    handled_state_update_fields = frozenset(
+        {"liquid_loaded", "liquid_probed", "liquid_operated"}
+    )
+
     def __init__(self) -> None:
         """Initialize a well store and its state."""
-        self._state = WellState(loaded_volumes={}, probed_heights={}, probed_volumes={})
+        self._state = WellState(wells_by_labware_id={})
 
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
@@ -49,90 +258,36 @@ class WellStore(HasState[WellState], HandlesActions):
             if state_update.liquid_operated != update_types.NO_CHANGE:
                 self._handle_liquid_operated_update(state_update.liquid_operated)
 
+    def _get_or_add_labware(self, labware_id: LabwareId) -> _LabwareWells:
+        labware_wells = self._state.wells_by_labware_id.get(labware_id)
+        if labware_wells is None:
+            labware_wells = _LabwareWells(labware_id)
+            self._state.wells_by_labware_id[labware_id] = labware_wells
+        return labware_wells
+
     def _handle_liquid_loaded_update(
         self, state_update: update_types.LiquidLoadedUpdate
     ) -> None:
-        labware_id = state_update.labware_id
-        if labware_id not in self._state.loaded_volumes:
-            self._state.loaded_volumes[labware_id] = {}
-        for well, volume in state_update.volumes.items():
-            self._state.loaded_volumes[labware_id][well] = LoadedVolumeInfo(
-                volume=_none_from_clear(volume),
-                last_loaded=state_update.last_loaded,
-                operations_since_load=0,
-            )
+        self._get_or_add_labware(state_update.labware_id).set_loaded_volumes(
+            state_update.volumes, state_update.last_loaded
+        )
 
     def _handle_liquid_probed_update(
         self, state_update: update_types.LiquidProbedUpdate
     ) -> None:
-        labware_id = state_update.labware_id
-        well_name = state_update.well_name
-        if labware_id not in self._state.probed_heights:
-            self._state.probed_heights[labware_id] = {}
-        if labware_id not in self._state.probed_volumes:
-            self._state.probed_volumes[labware_id] = {}
-        self._state.probed_heights[labware_id][well_name] = ProbedHeightInfo(
-            height=_none_from_clear(state_update.height),
+        self._get_or_add_labware(state_update.labware_id).set_probed(
+            well_name=state_update.well_name,
+            height=state_update.height,
+            volume=state_update.volume,
             last_probed=state_update.last_probed,
         )
-        self._state.probed_volumes[labware_id][well_name] = ProbedVolumeInfo(
-            volume=_none_from_clear(state_update.volume),
-            last_probed=state_update.last_probed,
-            operations_since_probe=0,
-        )
 
     def _handle_liquid_operated_update(
         self, state_update: update_types.LiquidOperatedUpdate
     ) -> None:
-        for well_name in state_update.well_names:
-            self._handle_well_operated(
-                state_update.labware_id, well_name, state_update.volume_added
-            )
-
-    def _handle_well_operated(
-        self,
-        labware_id: str,
-        well_name: str,
-        volume_added: float | update_types.ClearType,
-    ) -> None:
-        if (
-            labware_id in self._state.loaded_volumes
-            and well_name in self._state.loaded_volumes[labware_id]
-        ):
-            if volume_added is update_types.CLEAR:
-                del self._state.loaded_volumes[labware_id][well_name]
-            else:
-                prev_loaded_vol_info = self._state.loaded_volumes[labware_id][well_name]
-                assert prev_loaded_vol_info.volume is not None
-                self._state.loaded_volumes[labware_id][well_name] = LoadedVolumeInfo(
-                    volume=prev_loaded_vol_info.volume + volume_added,
-                    last_loaded=prev_loaded_vol_info.last_loaded,
-                    operations_since_load=prev_loaded_vol_info.operations_since_load
-                    + 1,
-                )
-        if (
-            labware_id in self._state.probed_heights
-            and well_name in self._state.probed_heights[labware_id]
-        ):
-            del self._state.probed_heights[labware_id][well_name]
-        if (
-            labware_id in self._state.probed_volumes
-            and well_name in self._state.probed_volumes[labware_id]
-        ):
-            if volume_added is update_types.CLEAR:
-                del self._state.probed_volumes[labware_id][well_name]
-            else:
-                prev_probed_vol_info = self._state.probed_volumes[labware_id][well_name]
-                if prev_probed_vol_info.volume is None:
-                    new_vol_info: float | None = None
-                else:
-                    new_vol_info = prev_probed_vol_info.volume + volume_added
-                self._state.probed_volumes[labware_id][well_name] = ProbedVolumeInfo(
-                    volume=new_vol_info,
-                    last_probed=prev_probed_vol_info.last_probed,
-                    operations_since_probe=prev_probed_vol_info.operations_since_probe
-                    + 1,
-                )
+        labware_wells = self._state.wells_by_labware_id.get(state_update.labware_id)
+        if labware_wells is not None:
+            labware_wells.operate(state_update.well_names, state_update.volume_added)
 
 
 class WellView(HasState[WellState]):
@@ -150,95 +305,36 @@ class WellView(HasState[WellState]):
 
     def get_well_liquid_info(self, labware_id: str, well_name: str) -> WellLiquidInfo:
         """Return all the liquid info for a well."""
-        if (
-            labware_id not in self._state.loaded_volumes
-            or well_name not in self._state.loaded_volumes[labware_id]
-        ):
-            loaded_volume_info = None
-        else:
-            loaded_volume_info = self._state.loaded_volumes[labware_id][well_name]
-        if (
-            labware_id not in self._state.probed_heights
-            or well_name not in self._state.probed_heights[labware_id]
-        ):
-            probed_height_info = None
-        else:
-            probed_height_info = self._state.probed_heights[labware_id][well_name]
-        if (
-            labware_id not in self._state.probed_volumes
-            or well_name not in self._state.probed_volumes[labware_id]
-        ):
-            probed_volume_info = None
-        else:
-            probed_volume_info = self._state.probed_volumes[labware_id][well_name]
-        return WellLiquidInfo(
-            loaded_volume=loaded_volume_info,
-            probed_height=probed_height_info,
-            probed_volume=probed_volume_info,
-        )
+        labware_wells = self._state.wells_by_labware_id.get(labware_id)
+        if labware_wells is None:
+            return WellLiquidInfo(
+                loaded_volume=None, probed_height=None, probed_volume=None
+            )
+        return labware_wells.get_liquid_info(well_name)
 
     def get_all(self) -> List[WellInfoSummary]:
         """Get all well liquid info summaries."""
-
-        def _all_well_combos() -> Iterator[Tuple[str, str, str]]:
-            for labware, lv_wells in self._state.loaded_volumes.items():
-                for well_name in lv_wells.keys():
-                    yield f"{labware}{well_name}", labware, well_name
-            for labware, ph_wells in self._state.probed_heights.items():
-                for well_name in ph_wells.keys():
-                    yield f"{labware}{well_name}", labware, well_name
-            for labware, pv_wells in self._state.probed_volumes.items():
-                for well_name in pv_wells.keys():
-                    yield f"{labware}{well_name}", labware, well_name
-
-        wells = {
-            key: (labware_id, well_name)
-            for key, labware_id, well_name in _all_well_combos()
-        }
         return [
-            self._summarize_well(labware_id, well_name)
-            for labware_id, well_name in wells.values()
+            summary
+            for labware_wells in self._state.wells_by_labware_id.values()
+            for summary in labware_wells.get_summaries()
         ]
 
-    def _summarize_well(self, labware_id: str, well_name: str) -> WellInfoSummary:
-        well_liquid_info = self.get_well_liquid_info(labware_id, well_name)
-        return WellInfoSummary(
-            labware_id=labware_id,
-            well_name=well_name,
-            loaded_volume=_volume_from_info(well_liquid_info.loaded_volume),
-            probed_volume=_volume_from_info(well_liquid_info.probed_volume),
-            probed_height=_height_from_info(well_liquid_info.probed_height),
-        )
-
-
-@overload
-def _volume_from_info(info: Optional[ProbedVolumeInfo]) -> Optional[float]:
-    ...
-
-
-@overload
-def _volume_from_info(info: Optional[LoadedVolumeInfo]) -> Optional[float]:
-    ...
-
-
-def _volume_from_info(
-    info: Union[ProbedVolumeInfo, LoadedVolumeInfo, None],
-) -> Optional[float]:
-    if info is None:
-        return None
-    return info.volume
-
 
-def _height_from_info(info: Optional[ProbedHeightInfo]) -> Optional[float]:
-    if info is None:
-        return None
-    return info.height
+def _nan_from_clear(value: float | update_types.ClearType) -> float:
+    if value is update_types.CLEAR:
+        return math.nan
+    return value
 
 
-MaybeClear = TypeVar("MaybeClear")
+def _none_from_nan(value: float) -> Optional[float]:
+    return None if math.isnan(value) else float(value)
 
 
-def _none_from_clear(inval: MaybeClear | update_types.ClearType) -> MaybeClear | None:
-    if inval == update_types.CLEAR:
-        return None
-    return inval
+def _none_where_missing(
+    values: NDArray[np.float64], present: NDArray[np.bool_]
+) -> List[Optional[float]]:
+    return [
+        None if not is_present or math.isnan(value) else value
+        for value, is_present in zip(values.tolist(), present.tolist())
+    ]
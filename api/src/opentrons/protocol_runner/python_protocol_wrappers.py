@@ -90,6 +90,7 @@ class ProtocolContextCreator:
     """Interface to construct Protocol API v2 contexts."""
 
     _USE_SIMULATING_CORE = False
+    _PIPELINE_ENGINE_COMMANDS = False
 
     def __init__(
         self,
@@ -132,6 +133,7 @@ class ProtocolContextCreator:
             equipment_broker=equipment_broker,
             extra_labware=extra_labware,
             use_simulating_core=self._USE_SIMULATING_CORE,
+            pipeline_engine_commands=self._PIPELINE_ENGINE_COMMANDS,
             bundled_data=bundled_data,
         )
 
@@ -141,9 +143,13 @@ class SimulatingContextCreator(ProtocolContextCreator):
 
     Avoids some calls to the hardware API for performance.
     See `opentrons.protocols.context.simulator`.
+
+    Also sends Protocol Engine commands in batches where it can, instead of
+    waiting for each one. See `ChildThreadTransport.submit_command()`.
     """
 
     _USE_SIMULATING_CORE = True
+    _PIPELINE_ENGINE_COMMANDS = True
 
 
 class PythonProtocolExecutor:
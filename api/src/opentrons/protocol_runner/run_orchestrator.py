@@ -325,6 +325,10 @@ class RunOrchestrator:
         """Get the current execution status of the engine."""
         return self._protocol_engine.state_view.commands.get_status()
 
+    def get_state_version(self) -> int:
+        """Get a counter that increases every time the engine's state changes."""
+        return self._protocol_engine.state_view.get_version()
+
     def get_is_run_terminal(self) -> bool:
         """Get whether engine is in a terminal state."""
         return self._protocol_engine.state_view.commands.get_is_terminal()
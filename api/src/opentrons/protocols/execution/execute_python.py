@@ -158,6 +158,8 @@ def exec_run(
     new_globs["__context"] = context
     try:
         exec("run(__context)", new_globs)
+        # The protocol isn't done until the commands it left pending are.
+        context._core.flush_commands()
     except (
         SmoothieAlarm,
         asyncio.CancelledError,
@@ -166,4 +168,10 @@ def exec_run(
         # this is a protocol cancel and shouldn't have special logging
         raise
     except Exception as e:
+        try:
+            # Commands the protocol left pending ran before this error, so if one
+            # of them fails, its error is the one to report.
+            context._core.flush_commands()
+        except Exception as command_error:
+            _raise_pretty_protocol_error(exception=command_error, filename=filename)
         _raise_pretty_protocol_error(exception=e, filename=filename)
@@ -101,6 +101,11 @@ def save_definition(
     with open(def_path, "w") as f:
         json.dump(labware_def, f)
 
+    # Imported here because the cache module depends on this one.
+    from .labware_definition_cache import get_labware_definition_cache
+
+    get_labware_definition_cache().invalidate(load_name, namespace)
+
 
 def verify_definition(
     contents: Union[AnyStr, LabwareDefinition, Dict[str, Any]]
@@ -207,17 +212,38 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        if namespace == OPENTRONS_NAMESPACE:
+            labware_def_bytes = _load_opentrons_labware_definition(
+                load_name, checked_version
+            )
+        else:
+            def_path = _get_path_to_labware(load_name, namespace, checked_version)
+            with open(def_path, "rb") as f:
+                labware_def_bytes = f.read()
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
-    return labware_def  # type: ignore[no-any-return]
+    return json.loads(labware_def_bytes.decode("utf-8"))  # type: ignore[no-any-return]
+
+
+def _load_opentrons_labware_definition(load_name: str, version: int) -> bytes:
+    # Go through load_shared_data() instead of _get_path_to_labware() so the
+    # definition comes out of the shared data bundle, if there is one, without
+    # touching the file system.
+    for schema_version in ["3", "2"]:
+        try:
+            return load_shared_data(
+                STANDARD_DEFS_PATH / schema_version / load_name / f"{version}.json"
+            )
+        except FileNotFoundError:
+            pass
+    raise FileNotFoundError(
+        f'Labware "{load_name}" not found with version {version} in shared data.'
+    )
 
 
 def _get_path_to_labware(
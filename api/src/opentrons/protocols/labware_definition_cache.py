@@ -0,0 +1,157 @@
+"""A process-wide cache of parsed labware definitions.
+
+Parsing a labware definition into a `LabwareDefinition` model is expensive
+compared to how often protocols load the same labware, so this keeps recently
+used definitions around, keyed by load name, namespace, and version.
+"""
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Tuple
+
+from opentrons.protocols.api_support.constants import OPENTRONS_NAMESPACE
+from opentrons.protocols.models import LabwareDefinition
+
+from .labware import get_labware_definition, _get_path_to_labware
+
+# The total size of the cached definitions' JSON files. A typical definition's file
+# is tens of kilobytes, so this fits a few hundred of them.
+DEFAULT_MAX_SIZE_BYTES = 16 * 1024 * 1024
+
+_Key = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class _FileStamp:
+    mtime_ns: int
+    size_bytes: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    definition: LabwareDefinition
+    size_bytes: int
+    # The definition's file as of when it was read, to tell if it has changed since.
+    # None for definitions that can't change.
+    file_stamp: Optional[_FileStamp]
+
+
+class LabwareDefinitionCache:
+    """A bounded, thread-safe, least-recently-used cache of labware definitions.
+
+    Definitions outside the Opentrons namespace are custom labware, which can be
+    changed on disk; a cached one is only used while its file's modification
+    time and size are unchanged.
+
+    Cached definitions are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES) -> None:
+        self._max_size_bytes = max_size_bytes
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = Lock()
+
+    @property
+    def hits(self) -> int:
+        """How many lookups were answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """How many lookups had to read and parse the definition."""
+        return self._misses
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the cached definitions' files."""
+        return self._size_bytes
+
+    def get(self, load_name: str, namespace: str, version: int) -> LabwareDefinition:
+        """Get a labware definition, reading and parsing it only if necessary.
+
+        Raises:
+            FileNotFoundError: There is no such labware definition.
+        """
+        key = (load_name.lower(), namespace.lower(), version)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and (
+            entry.file_stamp is None
+            or entry.file_stamp == _get_file_stamp(_get_path_to_labware(*key))
+        ):
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                self._hits += 1
+            return entry.definition
+
+        # Read and parse outside of the lock so lookups of other labware don't
+        # have to wait. Concurrent misses on the same labware just parse it twice.
+        path = _get_path_to_labware(*key)
+        file_stamp = _get_file_stamp(path)
+        definition = LabwareDefinition.parse_obj(
+            get_labware_definition(load_name, namespace, version)
+        )
+
+        with self._lock:
+            self._misses += 1
+            self._remove(key)
+            if file_stamp.size_bytes <= self._max_size_bytes:
+                self._entries[key] = _Entry(
+                    definition=definition,
+                    size_bytes=file_stamp.size_bytes,
+                    # Opentrons definitions are part of this software and never change.
+                    file_stamp=None if key[1] == OPENTRONS_NAMESPACE else file_stamp,
+                )
+                self._size_bytes += file_stamp.size_bytes
+            while self._size_bytes > self._max_size_bytes:
+                self._remove(next(iter(self._entries)))
+
+        return definition
+
+    def invalidate(self, load_name: str, namespace: str) -> None:
+        """Forget all cached versions of a labware definition."""
+        load_name = load_name.lower()
+        namespace = namespace.lower()
+        with self._lock:
+            for key in [
+                key for key in self._entries if key[:2] == (load_name, namespace)
+            ]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Forget all cached definitions and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _remove(self, key: _Key) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+
+def _get_file_stamp(path: Path) -> _FileStamp:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _FileStamp(mtime_ns=-1, size_bytes=0)
+    return _FileStamp(mtime_ns=stat.st_mtime_ns, size_bytes=stat.st_size)
+
+
+_cache = LabwareDefinitionCache()
+
+
+def get_labware_definition_cache() -> LabwareDefinitionCache:
+    """Get the cache shared by everything in this process."""
+    return _cache
@@ -80,6 +80,42 @@ def test_malformed_calibration(
         io.read_cal_file(malformed_calibration_path)
 
 
+def test_read_cal_file_cached(
+    tmp_path: Path, calibration: typing.Dict[str, typing.Any]
+) -> None:
+    """Reading a file again should return an equal copy of the data."""
+    io.save_to_file(tmp_path, "my_calibration", calibration)
+    file_path = tmp_path / "my_calibration.json"
+
+    first_read = io.read_cal_file(file_path)
+    first_read["status"]["markedBad"] = True
+    second_read = io.read_cal_file(file_path)
+
+    assert second_read["status"]["markedBad"] is False
+    assert second_read == io.read_cal_file(file_path)
+
+
+def test_read_cal_file_after_changes(
+    tmp_path: Path, calibration: typing.Dict[str, typing.Any]
+) -> None:
+    """Reading a file should see changes made to it since it was last read."""
+    io.save_to_file(tmp_path, "my_calibration", calibration)
+    file_path = tmp_path / "my_calibration.json"
+    assert io.read_cal_file(file_path)["tiprack"] == "mytiprack"
+
+    io.save_to_file(tmp_path, "my_calibration", {**calibration, "tiprack": "other"})
+    assert io.read_cal_file(file_path)["tiprack"] == "other"
+
+    file_path.write_text(
+        json.dumps({**calibration, "tiprack": "changed elsewhere"}), encoding="utf-8"
+    )
+    assert io.read_cal_file(file_path)["tiprack"] == "changed elsewhere"
+
+    io.delete_file(file_path)
+    with pytest.raises(FileNotFoundError):
+        io.read_cal_file(file_path)
+
+
 def test_deserialize_pydantic_model_valid() -> None:
     serialized = b'{"integer_field": 123, "! aliased field !": "abc"}'
     assert io.deserialize_pydantic_model(
@@ -20,6 +20,12 @@ def test_hash_labware_def() -> None:
     assert helpers.hash_labware_def(def1a) == helpers.hash_labware_def(def1b)  # type: ignore[arg-type]
     # different data should not match
     assert helpers.hash_labware_def(def1a) != helpers.hash_labware_def(def2)  # type: ignore[arg-type]
+    # hashing the same definitions again should give the same results
+    assert helpers.hash_labware_def(def1a) == helpers.hash_labware_def(def1b)  # type: ignore[arg-type]
+    assert helpers.hash_labware_def(def1a) != helpers.hash_labware_def(def2)  # type: ignore[arg-type]
+    # a definition that's modified after it was hashed should hash differently
+    def1a["importantStuff"] = [1.1, 0.000033, 1 / 3]
+    assert helpers.hash_labware_def(def1a) == helpers.hash_labware_def(def2)  # type: ignore[arg-type]
 
 
 @pytest.mark.parametrize(
@@ -470,3 +470,49 @@ async def test_auto_recover_on_error(
             await smoothie.move({"X": 10})
         mocked_send.assert_called_once()
         mocked_home.assert_called_once()
+
+
+async def test_look_ahead_alarm_at_barrier(
+    mock_connection: AsyncMock, sim_gpio: GPIODriverLike
+) -> None:
+    """An alarm from a queued move, reported at the next barrier, homes the axis."""
+    from opentrons.config import robot_configs
+
+    smoothie = driver_3_0.SmoothieDriver(
+        connection=mock_connection,
+        config=robot_configs.load_ot2(),
+        gpio_chardev=sim_gpio,
+        look_ahead=True,
+    )
+    cmd_list = []
+
+    async def write_mock(command: CommandBuilder, retries: int, timeout: float) -> str:
+        cmd_list.append(command.build().strip())
+        if cmd_list == [
+            "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+            "M400",
+        ]:
+            raise AlarmResponse(port="", response="ALARM: Hard limit +X")
+        elif constants.GCODE.HOMING_STATUS in command:
+            return "X:0 Y:1 Z:1 A:1 B:1 C:1"
+        return "ok"
+
+    mock_connection.send_command.side_effect = write_mock
+
+    await smoothie.move({"X": 10})
+    with patch.object(smoothie, "home") as mocked_home:
+        with pytest.raises(SmoothieError):
+            await smoothie.delay(1)
+        mocked_home.assert_called_once_with("X")
+
+    assert cmd_list == [
+        # queued move, with no M400
+        "M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4 P0.005 G0 X10",
+        # the delay waits for the queued move, which failed
+        "M400",
+        # recover from failure, without waiting for the failed move again
+        "M999",
+        "M400",
+        "G28.6",
+        "M400",
+    ]
@@ -15,6 +15,7 @@ from typing import (
     Set,
     Tuple,
     Any,
+    Iterable,
     Iterator,
     AsyncIterator,
     ContextManager,
@@ -43,6 +44,7 @@ from opentrons.config.types import (
 from opentrons.config.robot_configs import build_config_ot3
 from opentrons_hardware.firmware_bindings.arbitration_id import ArbitrationId
 from opentrons_hardware.firmware_bindings.constants import (
+    MessageId,
     NodeId,
     PipetteName as FirmwarePipetteName,
     USBTarget,
@@ -117,9 +119,26 @@ class MockCanMessageNotifier:
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
         """Add listener."""
-        self._listeners.append((listener, filter))
+
+        def _filter(arbitration_id: ArbitrationId) -> bool:
+            return (
+                (filter is None or filter(arbitration_id))
+                and (
+                    message_ids is None
+                    or arbitration_id.parts.message_id in message_ids
+                )
+                and (
+                    originating_node_ids is None
+                    or arbitration_id.parts.originating_node_id in originating_node_ids
+                )
+            )
+
+        self._listeners.append((listener, _filter))
 
     def notify(self, message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
         """Notify."""
@@ -371,7 +390,7 @@ async def test_home_execute(
     with mock.patch(  # type: ignore [call-overload]
         "opentrons.hardware_control.backends.ot3controller.MoveGroupRunner",
         spec=MoveGroupRunner,
-        **config
+        **config,
     ) as mock_runner:
         present_axes = set(ax for ax in axes if controller.axis_is_present(ax))
 
@@ -1405,7 +1424,7 @@ async def test_controller_move(
     with mock.patch(  # type: ignore [call-overload]
         "opentrons.hardware_control.backends.ot3controller.MoveGroupRunner",
         spec=MoveGroupRunner,
-        **config
+        **config,
     ):
         await controller.move(origin_pos, target_pos, 100)
         position = await controller.update_position()
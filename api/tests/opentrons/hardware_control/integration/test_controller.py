@@ -1,13 +1,19 @@
-from typing import AsyncGenerator, Iterator
+import asyncio
+from typing import Any, AsyncGenerator, Iterator, List
 import pytest
 
+from opentrons.config import feature_flags as ff
 from opentrons.config.types import RobotConfig
 from opentrons import _find_smoothie_file
 from opentrons.config.robot_configs import build_config
-from opentrons.hardware_control import Controller
+from opentrons.drivers.command_builder import CommandBuilder
+from opentrons.hardware_control import API, Controller
 from opentrons.hardware_control.emulation.settings import Settings
+from opentrons.hardware_control.modules import TempDeck
 from opentrons.types import Mount
 
+from .build_module import build_module
+
 
 @pytest.fixture
 async def subject(
@@ -51,3 +57,83 @@ async def test_move(subject: Controller) -> None:
     updated_position = await subject.update_position()
 
     assert updated_position == {"X": 1, "Z": 2, "Y": 3, "A": 4, "B": 5, "C": 6}
+
+
+@pytest.fixture
+async def look_ahead_api(
+    emulation_app: Iterator[None],
+    emulator_settings: Settings,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncGenerator[API, None]:
+    monkeypatch.setattr(ff, "smoothie_look_ahead", lambda: True)
+    conf = build_config({})
+    port = f"socket://127.0.0.1:{emulator_settings.smoothie.port}"
+    assert isinstance(conf, RobotConfig)
+    hc = await Controller.build(config=conf)
+    await hc.connect(port=port)
+    yield API(backend=hc, loop=asyncio.get_running_loop(), config=conf)
+    await hc._smoothie_driver.disconnect()
+
+
+@pytest.fixture
+async def events(
+    look_ahead_api: API, monkeypatch: pytest.MonkeyPatch
+) -> AsyncGenerator[List[str], None]:
+    """The gcodes the Smoothie has finished, in order."""
+    backend = look_ahead_api._backend
+    assert isinstance(backend, Controller)
+    await backend.home()
+    connection = backend._smoothie_driver._connection
+    assert connection is not None
+    send_command = connection.send_command
+    finished: List[str] = []
+
+    async def _send_command(command: CommandBuilder, **kwargs: Any) -> str:
+        response = await send_command(command=command, **kwargs)
+        finished.append(str(command).strip())
+        return response
+
+    monkeypatch.setattr(connection, "send_command", _send_command)
+    yield finished
+
+
+async def test_delay_waits_for_queued_moves(
+    look_ahead_api: API, events: List[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A delay after queued moves starts once M400 has finished."""
+    do_delay = look_ahead_api.do_delay
+
+    async def _do_delay(duration_s: float) -> None:
+        events.append("delay")
+        await do_delay(duration_s)
+
+    monkeypatch.setattr(look_ahead_api, "do_delay", _do_delay)
+    await look_ahead_api._backend.move({"X": 10, "Y": 20})
+    await look_ahead_api.delay(0)
+    assert events[-2:] == ["M400", "delay"]
+
+
+async def test_module_command_waits_for_queued_moves(
+    look_ahead_api: API,
+    events: List[str],
+    emulator_settings: Settings,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A module command after queued moves is sent once M400 has finished."""
+    tempdeck = await build_module(
+        TempDeck,
+        port=emulator_settings.temperature_proxy.driver_port,
+        execution_manager=look_ahead_api.execution_manager,
+    )
+    try:
+        # Don't pass the command on, so the emulator's state doesn't
+        # change under the tempdeck tests.
+        async def _deactivate() -> None:
+            events.append("deactivate")
+
+        monkeypatch.setattr(tempdeck._driver, "deactivate", _deactivate)
+        await look_ahead_api._backend.move({"X": 10, "Y": 20})
+        await tempdeck.deactivate()
+        assert events[-2:] == ["M400", "deactivate"]
+    finally:
+        await tempdeck.cleanup()
@@ -23,13 +23,37 @@ async def subject(emulator_settings: Settings) -> AsyncGenerator[SmoothieDriver,
     await d.disconnect()
 
 
+@pytest.fixture
+async def look_ahead_subject(
+    emulator_settings: Settings,
+) -> AsyncGenerator[SmoothieDriver, None]:
+    """Smoothie driver in look-ahead mode connected to emulator."""
+    d = await SmoothieDriver.build(
+        port=f"socket://127.0.0.1:{emulator_settings.smoothie.port}",
+        config=build_config_ot2({}),
+        look_ahead=True,
+    )
+    yield d
+    await d.disconnect()
+
+
+def _attach_spy(driver: SmoothieDriver) -> MagicMock:
+    assert driver._connection is not None
+    spy = MagicMock(wraps=driver._connection.send_data)
+    driver._connection.send_data = spy  # type: ignore[method-assign]
+    return spy
+
+
 @pytest.fixture
 def spy(subject: SmoothieDriver) -> MagicMock:
     """Attach a spy to gcode sender."""
-    assert subject._connection is not None
-    spy = MagicMock(wraps=subject._connection.send_data)
-    subject._connection.send_data = spy  # type: ignore[method-assign]
-    return spy
+    return _attach_spy(subject)
+
+
+@pytest.fixture
+def look_ahead_spy(look_ahead_subject: SmoothieDriver) -> MagicMock:
+    """Attach a spy to the look-ahead driver's gcode sender."""
+    return _attach_spy(look_ahead_subject)
 
 
 async def test_dwell_and_activate_axes(subject: SmoothieDriver, spy: MagicMock) -> None:
@@ -440,3 +464,73 @@ async def test_do_relative_splits_during_home_for(
         "G90 M52 M54 M92 B1.0 C1.0 G4 P0.01 G0 F24000",
         "M400",
     ]
+
+
+async def test_look_ahead_streams_moves(
+    look_ahead_subject: SmoothieDriver, look_ahead_spy: MagicMock
+) -> None:
+    """Gantry moves are queued without M400 until a plunger move needs them done."""
+    await look_ahead_subject.home()
+    look_ahead_spy.reset_mock()
+
+    await look_ahead_subject.move({"X": 10, "Y": 20, "Z": 30})
+    await look_ahead_subject.move({"Z": 40})
+    await look_ahead_subject.move({"X": 50, "Y": 60}, speed=100)
+    await look_ahead_subject.move({"B": 2})
+    expected = [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.8 G4 P0.005 G0 X10 Y20 Z30",
+        # the current doesn't change, so it isn't sent again
+        "G0 Z40",
+        "G0 F6000 G0 X50 Y60 G0 F24000",
+        # the plunger move waits for the queued moves
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005 G0 B2",
+        "M400",
+        "M907 A0.1 B0.05 C0.05 X0.3 Y0.3 Z0.1 G4 P0.005",
+        "M400",
+    ]
+    command_log = [x.kwargs["data"].strip() for x in look_ahead_spy.call_args_list]
+    assert command_log == expected
+
+
+async def test_look_ahead_position_at_barrier(
+    look_ahead_subject: SmoothieDriver, look_ahead_spy: MagicMock
+) -> None:
+    """Reading the position waits for the queued moves, which end at the target."""
+    await look_ahead_subject.home()
+    look_ahead_spy.reset_mock()
+
+    await look_ahead_subject.move({"X": 10, "Y": 20})
+    await look_ahead_subject.move({"X": 30, "Y": 40, "A": 5})
+    assert look_ahead_subject.position["X"] == 30
+    await look_ahead_subject.update_position()
+    command_log = [x.kwargs["data"].strip() for x in look_ahead_spy.call_args_list]
+    assert command_log == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        # the current changes, so it's sent with the dwell that waits for idle
+        "M907 A0.8 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 A5 X30 Y40",
+        "M400",
+        "M114.2",
+        "M400",
+    ]
+    assert look_ahead_subject.position["X"] == 30
+    assert look_ahead_subject.position["Y"] == 40
+    assert look_ahead_subject.position["A"] == 5
+
+
+async def test_look_ahead_wait_for_queued_moves(
+    look_ahead_subject: SmoothieDriver, look_ahead_spy: MagicMock
+) -> None:
+    """Waiting for the queued moves sends M400 once, and only if there are any."""
+    await look_ahead_subject.home()
+    await look_ahead_subject.wait_for_queued_moves()
+    look_ahead_spy.reset_mock()
+
+    await look_ahead_subject.move({"X": 10, "Y": 20})
+    await look_ahead_subject.wait_for_queued_moves()
+    await look_ahead_subject.wait_for_queued_moves()
+    command_log = [x.kwargs["data"].strip() for x in look_ahead_spy.call_args_list]
+    assert command_log == [
+        "M907 A0.1 B0.05 C0.05 X1.25 Y1.25 Z0.1 G4 P0.005 G0 X10 Y20",
+        "M400",
+    ]
@@ -43,6 +43,28 @@ async def test_state_machine() -> None:
     assert await exec_mgr.get_state() == ExecutionState.RUNNING
 
 
+async def test_wait_for_motion() -> None:
+    """
+    Test that an execution manager waits for motion through the
+    barrier it was given, if any
+    """
+    exec_mgr = ExecutionManager()
+    await exec_mgr.wait_for_motion()
+
+    calls = []
+
+    async def barrier() -> None:
+        calls.append("barrier")
+
+    exec_mgr.set_motion_barrier(barrier)
+    await exec_mgr.wait_for_motion()
+    assert calls == ["barrier"]
+
+    exec_mgr.set_motion_barrier(None)
+    await exec_mgr.wait_for_motion()
+    assert calls == ["barrier"]
+
+
 async def test_cancel_tasks() -> None:
     """
     Test that an execution manager cancels all un-protected
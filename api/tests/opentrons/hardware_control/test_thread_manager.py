@@ -7,6 +7,7 @@ import pytest
 
 from opentrons.hardware_control.modules import ModuleAtPort, SimulatingModule
 from opentrons.hardware_control.thread_manager import (
+    CallBridger,
     ThreadManagerException,
     ThreadManager,
 )
@@ -88,6 +89,48 @@ async def test_wraps_instance() -> None:
     assert thread_manager.wraps_instance(API)
 
 
+class Bridged:
+    """Test object for bridging calls."""
+
+    def __init__(self) -> None:
+        """Initialize an instance."""
+        self.value = 1
+
+    @property
+    def doubled(self) -> int:
+        """A property that changes with the value."""
+        return self.value * 2
+
+    def get_value(self) -> int:
+        """A sync method."""
+        return self.value
+
+    async def get_value_async(self) -> int:
+        """An async method."""
+        return self.value
+
+
+async def test_call_bridger_caches_methods() -> None:
+    """It should reuse its method wrappers but look up everything else each time."""
+    loop = asyncio.get_running_loop()
+    bridged = Bridged()
+    subject = CallBridger(bridged, loop)
+
+    assert subject.get_value is subject.get_value
+    assert subject.get_value_async is subject.get_value_async
+    assert await subject.get_value_async() == 1
+
+    bridged.value = 2
+    assert subject.value == 2
+    assert subject.doubled == 4
+    assert subject.get_value() == 2
+    assert await subject.get_value_async() == 2
+
+    # An instance attribute set after a method was cached should still win.
+    bridged.get_value = lambda: 3  # type: ignore[method-assign]
+    assert subject.get_value() == 3
+
+
 class Blocker:
     """Test object for nonblocking construction."""
 
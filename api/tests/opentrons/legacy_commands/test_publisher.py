@@ -15,8 +15,10 @@ from opentrons.legacy_commands.publisher import (
 
 @pytest.fixture
 def broker(decoy: Decoy) -> LegacyBroker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=LegacyBroker)
+    """Return a mocked out Broker with a subscriber."""
+    broker = decoy.mock(cls=LegacyBroker)
+    decoy.when(broker.is_observed("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: LegacyBroker) -> None:
@@ -325,3 +327,100 @@ def test_publish_context_with_error(decoy: Decoy, broker: LegacyBroker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_decorator_keyword_args(decoy: Decoy, broker: LegacyBroker) -> None:
+    """It should map keyword arguments to the command creator."""
+
+    def _get_command_payload(foo: str, bar: int) -> Dict[str, Any]:
+        return {"name": "some_command", "payload": {"foo": foo, "bar": bar}}
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)  # type: ignore[arg-type]
+        def act(self, foo: str, *, bar: int = 42) -> None:
+            pass
+
+    subject = _Subject(broker=broker)
+    subject.act(foo="hello", bar=43)
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=matchers.DictMatching(
+                {"$": "before", "payload": {"foo": "hello", "bar": 43}}
+            ),
+        ),
+    )
+
+
+def test_publish_decorator_var_args(decoy: Decoy, broker: LegacyBroker) -> None:
+    """It should map arguments of methods that take *args and **kwargs."""
+
+    def _get_command_payload(foo: str, bar: int) -> Dict[str, Any]:
+        return {"name": "some_command", "payload": {"foo": foo, "bar": bar}}
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)  # type: ignore[arg-type]
+        def act(self, foo: str, *args: Any, bar: int = 42, **kwargs: Any) -> None:
+            pass
+
+    subject = _Subject(broker=broker)
+    subject.act("hello", 1, 2, baz=3)
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=matchers.DictMatching(
+                {"$": "before", "payload": {"foo": "hello", "bar": 42}}
+            ),
+        ),
+    )
+
+
+def test_publish_decorator_unobserved(decoy: Decoy, broker: LegacyBroker) -> None:
+    """It should not build or publish messages that nothing would see."""
+    _act = decoy.mock(name="_act")
+    _get_command_payload = decoy.mock(name="_get_command_payload")
+    decoy.when(broker.is_observed("command")).then_return(False)
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str) -> int:
+            _act(foo)
+            return 42
+
+    subject = _Subject(broker=broker)
+
+    assert subject.act("hello") == 42
+    decoy.verify(_act("hello"))
+    decoy.verify(_get_command_payload(), times=0, ignore_extra_args=True)
+    decoy.verify(broker.publish(), times=0, ignore_extra_args=True)
+
+
+def test_publish_context_lazy(decoy: Decoy, broker: LegacyBroker) -> None:
+    """It should only build a command with a factory if something would see it."""
+    _get_command_payload = decoy.mock(name="_get_command_payload")
+    command = cast(
+        CommandDict,
+        {"name": "some_command", "payload": {"foo": "hello", "bar": 42}},
+    )
+    decoy.when(_get_command_payload()).then_return(command)
+
+    with publish_context(broker=broker, command=_get_command_payload):
+        pass
+
+    decoy.verify(
+        broker.publish(
+            topic="command",
+            message=matchers.DictMatching(
+                {"$": "before", "name": "some_command", "id": matchers.IsA(str)}
+            ),
+        ),
+    )
+
+    decoy.when(broker.is_observed("command")).then_return(False)
+
+    with publish_context(broker=broker, command=_get_command_payload):
+        pass
+
+    decoy.verify(_get_command_payload(), times=1)
@@ -1586,6 +1586,16 @@ def test_home(
     decoy.verify(mock_engine_client.execute_command(cmd.HomeParams(axes=None)), times=1)
 
 
+def test_flush_commands(
+    decoy: Decoy,
+    mock_engine_client: EngineClient,
+    subject: ProtocolCore,
+) -> None:
+    """It should flush the engine client's pending commands."""
+    subject.flush_commands()
+    decoy.verify(mock_engine_client.flush_commands(), times=1)
+
+
 def test_is_simulating(
     decoy: Decoy,
     mock_engine_client: EngineClient,
@@ -1608,13 +1618,17 @@ def test_set_rail_lights(
 
 
 def test_get_rail_lights(
-    decoy: Decoy, mock_sync_hardware_api: SyncHardwareAPI, subject: ProtocolCore
+    decoy: Decoy,
+    mock_engine_client: EngineClient,
+    mock_sync_hardware_api: SyncHardwareAPI,
+    subject: ProtocolCore,
 ) -> None:
-    """It should get rails light state."""
+    """It should get rails light state, once any pending commands have set it."""
     decoy.when(mock_sync_hardware_api.get_lights()).then_return({"rails": True})
 
     result = subject.get_rail_lights_on()
     assert result is True
+    decoy.verify(mock_engine_client.flush_commands(), times=1)
 
 
 def test_get_deck_definition(
@@ -42,8 +42,10 @@ def mock_core_map(decoy: Decoy) -> LoadedCoreMap:
 
 @pytest.fixture
 def mock_broker(decoy: Decoy) -> LegacyBroker:
-    """Get a mock command message broker."""
-    return decoy.mock(cls=LegacyBroker)
+    """Get a mock command message broker with a subscriber."""
+    broker = decoy.mock(cls=LegacyBroker)
+    decoy.when(broker.is_observed("command")).then_return(True)
+    return broker
 
 
 @pytest.fixture
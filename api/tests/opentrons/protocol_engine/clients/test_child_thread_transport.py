@@ -1,9 +1,10 @@
 """Tests for am ChildThreadTransport."""
 import threading
+import traceback
 from asyncio import get_running_loop
 from datetime import datetime
 from functools import partial
-from typing import Any
+from typing import Any, List
 
 import pytest
 from decoy import Decoy
@@ -13,6 +14,7 @@ from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 
 from opentrons.protocol_engine import ProtocolEngine, commands, DeckPoint
 from opentrons.protocol_engine.errors import ProtocolCommandFailedError, ErrorOccurrence
+from opentrons.protocol_engine.error_recovery_policy import ErrorRecoveryType
 from opentrons.protocol_engine.clients.transports import ChildThreadTransport
 
 
@@ -124,3 +126,177 @@ async def test_call_method(
     result = await get_running_loop().run_in_executor(None, _act)
     assert result == labware_uri
     assert calling_thread_id == threading.current_thread().ident
+
+
+def _comment(command_request: commands.CommentCreate) -> commands.Comment:
+    return commands.Comment(
+        id=f"{command_request.params.message}-id",
+        key=f"{command_request.params.message}-key",
+        status=commands.CommandStatus.SUCCEEDED,
+        params=command_request.params,
+        result=commands.CommentResult(),
+        createdAt=datetime.now(),
+    )
+
+
+async def test_submit_command_pipelined(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+) -> None:
+    """It should hold submitted commands back until the engine's state is read."""
+    subject = ChildThreadTransport(
+        engine=engine, loop=get_running_loop(), pipeline_commands=True
+    )
+    requests = [
+        commands.CommentCreate(params=commands.CommentParams(message=message))
+        for message in ["hello", "world"]
+    ]
+    executed = []
+
+    async def _execute(request: commands.CommentCreate) -> commands.Comment:
+        executed.append(request)
+        return _comment(request)
+
+    decoy.when(
+        await engine.add_and_execute_command_wait_for_recovery(request=requests[0])
+    ).then_do(_execute)
+    decoy.when(
+        await engine.add_and_execute_command_wait_for_recovery(request=requests[1])
+    ).then_do(_execute)
+
+    for request in requests:
+        await get_running_loop().run_in_executor(
+            None, partial(subject.submit_command, request)
+        )
+    assert executed == []
+
+    await get_running_loop().run_in_executor(None, lambda: subject.state)
+    assert executed == requests
+
+
+def _submit_failing_then_ok(
+    subject: ChildThreadTransport,
+    failing_request: commands.CommentCreate,
+    ok_request: commands.CommentCreate,
+) -> None:
+    subject.submit_command(failing_request)  # The failing command's line.
+    subject.submit_command(ok_request)
+    subject.flush_commands()
+
+
+async def test_submit_command_pipelined_failure(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+) -> None:
+    """It should raise a pending command's error as if it was raised where it was submitted."""
+    subject = ChildThreadTransport(
+        engine=engine, loop=get_running_loop(), pipeline_commands=True
+    )
+    failing_request = commands.CommentCreate(
+        params=commands.CommentParams(message="oh no")
+    )
+    ok_request = commands.CommentCreate(params=commands.CommentParams(message="ok"))
+    error = ErrorOccurrence(
+        id="error-id",
+        errorType="PrettyBadError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="Things are not looking good.",
+        errorCode="1234",
+    )
+
+    decoy.when(
+        await engine.add_and_execute_command_wait_for_recovery(request=failing_request)
+    ).then_return(
+        commands.Comment(
+            id="cmd-id",
+            key="cmd-key",
+            params=failing_request.params,
+            status=commands.CommandStatus.FAILED,
+            error=error,
+            createdAt=datetime.now(),
+        )
+    )
+    decoy.when(
+        engine.state_view.commands.get_error_recovery_type("cmd-id")
+    ).then_return(ErrorRecoveryType.FAIL_RUN)
+
+    with pytest.raises(ProtocolCommandFailedError) as exc_info:
+        await get_running_loop().run_in_executor(
+            None,
+            partial(_submit_failing_then_ok, subject, failing_request, ok_request),
+        )
+
+    submitted_from = [
+        frame
+        for frame in traceback.extract_tb(exc_info.value.__traceback__)
+        if frame.name == "_submit_failing_then_ok"
+    ][-1]
+    assert submitted_from.line == (
+        "subject.submit_command(failing_request)  # The failing command's line."
+    )
+    decoy.verify(
+        await engine.add_and_execute_command_wait_for_recovery(request=ok_request),
+        times=0,
+    )
+
+
+async def test_submit_command_pipelined_fallible(
+    decoy: Decoy,
+    engine: ProtocolEngine,
+) -> None:
+    """It should execute a command that can fail right away, after any pending ones."""
+    subject = ChildThreadTransport(
+        engine=engine, loop=get_running_loop(), pipeline_commands=True
+    )
+    comment_request = commands.CommentCreate(
+        params=commands.CommentParams(message="hello")
+    )
+    fallible_request = commands.heater_shaker.WaitForTemperatureCreate(
+        params=commands.heater_shaker.WaitForTemperatureParams(moduleId="module-id")
+    )
+    error = ErrorOccurrence(
+        id="error-id",
+        errorType="PrettyBadError",
+        createdAt=datetime(year=2021, month=1, day=1),
+        detail="Things are not looking good.",
+        errorCode="1234",
+    )
+    executed: List[commands.CommandCreate] = []
+
+    async def _execute_comment(request: commands.CommentCreate) -> commands.Comment:
+        executed.append(request)
+        return _comment(request)
+
+    async def _execute_fallible(
+        request: commands.heater_shaker.WaitForTemperatureCreate,
+    ) -> commands.heater_shaker.WaitForTemperature:
+        executed.append(request)
+        return commands.heater_shaker.WaitForTemperature(
+            id="cmd-id",
+            key="cmd-key",
+            params=request.params,
+            status=commands.CommandStatus.FAILED,
+            error=error,
+            createdAt=datetime.now(),
+        )
+
+    decoy.when(
+        await engine.add_and_execute_command_wait_for_recovery(request=comment_request)
+    ).then_do(_execute_comment)
+    decoy.when(
+        await engine.add_and_execute_command_wait_for_recovery(request=fallible_request)
+    ).then_do(_execute_fallible)
+    decoy.when(
+        engine.state_view.commands.get_error_recovery_type("cmd-id")
+    ).then_return(ErrorRecoveryType.FAIL_RUN)
+
+    await get_running_loop().run_in_executor(
+        None, partial(subject.submit_command, comment_request)
+    )
+    assert executed == []
+
+    with pytest.raises(ProtocolCommandFailedError):
+        await get_running_loop().run_in_executor(
+            None, partial(subject.submit_command, fallible_request)
+        )
+    assert executed == [comment_request, fallible_request]
@@ -40,7 +40,15 @@ def test_execute_command(
     params = commands.CommentParams(message="hewwo")
     expected_request = commands.CommentCreate(params=params)
     subject.execute_command(params)
-    decoy.verify(transport.execute_command_wait_for_recovery(request=expected_request))
+    decoy.verify(transport.submit_command(expected_request))
+
+
+def test_flush_commands(
+    decoy: Decoy, transport: ChildThreadTransport, subject: SyncClient
+) -> None:
+    """It should flush the transport's pending commands."""
+    subject.flush_commands()
+    decoy.verify(transport.flush_commands())
 
 
 def test_execute_command_without_recovery(
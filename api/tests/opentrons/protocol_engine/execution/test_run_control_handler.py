@@ -4,6 +4,7 @@ from time import monotonic as time_monotonic
 import pytest
 from decoy import Decoy, matchers
 
+from opentrons.hardware_control import HardwareControlAPI
 from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state.config import Config
@@ -36,11 +37,13 @@ def mock_action_dispatcher(decoy: Decoy) -> ActionDispatcher:
 def subject(
     mock_state_store: StateStore,
     mock_action_dispatcher: ActionDispatcher,
+    hardware_api: HardwareControlAPI,
 ) -> RunControlHandler:
     """Create a RunControlHandler with its dependencies mocked out."""
     return RunControlHandler(
         state_store=mock_state_store,
         action_dispatcher=mock_action_dispatcher,
+        hardware_api=hardware_api,
     )
 
 
@@ -48,12 +51,14 @@ async def test_pause(
     decoy: Decoy,
     mock_state_store: StateStore,
     mock_action_dispatcher: ActionDispatcher,
+    hardware_api: HardwareControlAPI,
     subject: RunControlHandler,
 ) -> None:
-    """It should be able to execute a pause."""
+    """It should wait for the queued moves, then pause."""
     decoy.when(mock_state_store.config).then_return(_make_config(ignore_pause=False))
     await subject.wait_for_resume()
     decoy.verify(
+        await hardware_api.wait_for_queued_moves(),
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
         await mock_state_store.wait_for(
             condition=mock_state_store.commands.get_is_running
@@ -76,6 +81,18 @@ async def test_pause_analysis(
     )
 
 
+async def test_wait_for_duration_waits_for_queued_moves(
+    decoy: Decoy,
+    mock_state_store: StateStore,
+    hardware_api: HardwareControlAPI,
+    subject: RunControlHandler,
+) -> None:
+    """It should start the delay once the queued moves are done."""
+    decoy.when(mock_state_store.config).then_return(_make_config(ignore_pause=False))
+    await subject.wait_for_duration(seconds=0)
+    decoy.verify(await hardware_api.wait_for_queued_moves(), times=1)
+
+
 async def test_wait_for_duration(
     decoy: Decoy,
     mock_state_store: StateStore,
@@ -878,6 +878,33 @@ def test_get_all_obstacle_highest_z_with_fixtures(
     assert result == 1337.0
 
 
+def test_get_all_obstacle_highest_z_cached(
+    decoy: Decoy,
+    mock_labware_view: LabwareView,
+    mock_module_view: ModuleView,
+    mock_addressable_area_view: AddressableAreaView,
+    subject: GeometryView,
+) -> None:
+    """It should reuse the highest Z until labware, modules, or the deck change."""
+    module = LoadedModule.construct(id="module-id")  # type: ignore[call-arg]
+
+    decoy.when(mock_labware_view.get_generation()).then_return(1)
+    decoy.when(mock_module_view.get_generation()).then_return(1)
+    decoy.when(mock_addressable_area_view.get_generation()).then_return(1)
+    decoy.when(mock_labware_view.get_all()).then_return([])
+    decoy.when(mock_addressable_area_view.get_all_cutout_fixtures()).then_return([])
+    decoy.when(mock_module_view.get_all()).then_return([module])
+    decoy.when(mock_module_view.get_overall_height("module-id")).then_return(42.0)
+
+    assert subject.get_all_obstacle_highest_z() == 42.0
+
+    decoy.when(mock_module_view.get_overall_height("module-id")).then_return(1337.0)
+    assert subject.get_all_obstacle_highest_z() == 42.0
+
+    decoy.when(mock_module_view.get_generation()).then_return(2)
+    assert subject.get_all_obstacle_highest_z() == 1337.0
+
+
 def test_get_highest_z_in_slot_with_single_labware(
     decoy: Decoy,
     mock_labware_view: LabwareView,
@@ -430,6 +430,38 @@ def test_handle_hs_temperature_commands(heater_shaker_v1_def: ModuleDefinition)
     }
 
 
+def test_generation(heater_shaker_v1_def: ModuleDefinition) -> None:
+    """It should only change its generation when modules are loaded or calibrated."""
+    load_module_cmd = commands.LoadModule.construct(  # type: ignore[call-arg]
+        params=commands.LoadModuleParams(
+            model=ModuleModel.HEATER_SHAKER_MODULE_V1,
+            location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        ),
+        result=commands.LoadModuleResult(
+            moduleId="module-id",
+            model=ModuleModel.HEATER_SHAKER_MODULE_V1,
+            serialNumber="serial-number",
+            definition=heater_shaker_v1_def,
+        ),
+    )
+    set_temp_cmd = hs_commands.SetTargetTemperature.construct(  # type: ignore[call-arg]
+        params=hs_commands.SetTargetTemperatureParams(moduleId="module-id", celsius=42),
+        result=hs_commands.SetTargetTemperatureResult(),
+    )
+    subject = ModuleStore(
+        config=_OT2_STANDARD_CONFIG,
+        deck_fixed_labware=[],
+    )
+    initial_generation = subject.state.generation
+
+    subject.handle_action(actions.SucceedCommandAction(command=load_module_cmd))
+    loaded_generation = subject.state.generation
+    assert loaded_generation != initial_generation
+
+    subject.handle_action(actions.SucceedCommandAction(command=set_temp_cmd))
+    assert subject.state.generation == loaded_generation
+
+
 def test_handle_hs_shake_commands(heater_shaker_v1_def: ModuleDefinition) -> None:
     """It should update heater-shaker's `is_plate_shaking` correctly."""
     load_module_cmd = commands.LoadModule.construct(  # type: ignore[call-arg]
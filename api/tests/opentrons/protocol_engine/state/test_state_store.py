@@ -8,10 +8,27 @@ from decoy import Decoy
 from opentrons_shared_data.deck.types import DeckDefinitionV5
 from opentrons.util.change_notifier import ChangeNotifier
 
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import (
+    Action,
+    AddLiquidAction,
+    PlayAction,
+    ResetTipsAction,
+    SucceedCommandAction,
+)
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state._abstract_store import (
+    HandlesActions,
+    get_changed_state_update_fields,
+)
 from opentrons.protocol_engine.state.config import Config
+from opentrons.protocol_engine.state.liquids import LiquidStore
+from opentrons.protocol_engine.state.pipettes import PipetteStore
 from opentrons.protocol_engine.state.state import State, StateStore
-from opentrons.protocol_engine.types import DeckType
+from opentrons.protocol_engine.state.tips import TipStore
+from opentrons.protocol_engine.state.wells import WellStore
+from opentrons.protocol_engine.types import DeckType, Liquid
+
+from .command_fixtures import create_comment_command
 
 
 @pytest.fixture
@@ -91,6 +108,67 @@ def test_notify_on_state_change(
     decoy.verify(change_notifier.notify(), times=1)
 
 
+def test_version_increases_on_state_change(subject: StateStore) -> None:
+    """It should bump the state version whenever state changes."""
+    assert subject.get_version() == 0
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    assert subject.get_version() == 1
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=2)))
+    assert subject.get_version() == 2
+
+
+_PLAY = PlayAction(requested_at=datetime(year=2021, month=1, day=1))
+_ADD_LIQUID = AddLiquidAction(
+    liquid=Liquid.construct(id="liquid-id", displayName="water", description="")
+)
+_RESET_TIPS = ResetTipsAction(labware_id="tip-rack-id")
+_PLAIN_COMMENT = SucceedCommandAction(command=create_comment_command())
+_TIPS_USED = SucceedCommandAction(
+    command=create_comment_command(),
+    state_update=update_types.StateUpdate(
+        tips_used=update_types.TipsUsedUpdate(
+            pipette_id="pipette-id", labware_id="tip-rack-id", well_name="A1"
+        )
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    ("substore_cls", "action", "expected"),
+    [
+        (TipStore, _RESET_TIPS, True),
+        (TipStore, _TIPS_USED, True),
+        (TipStore, _PLAY, False),
+        (TipStore, _PLAIN_COMMENT, False),
+        (LiquidStore, _ADD_LIQUID, True),
+        (LiquidStore, _TIPS_USED, False),
+        (PipetteStore, _PLAIN_COMMENT, False),
+        (WellStore, _TIPS_USED, False),
+    ],
+)
+def test_substores_declare_handled_actions(
+    substore_cls: Callable[[], HandlesActions],
+    action: Action,
+    expected: bool,
+) -> None:
+    """Substores should only claim the actions and state updates they react to."""
+    subject = substore_cls()
+    assert subject.handles(action, get_changed_state_update_fields(action)) == expected
+
+
+def test_skips_unaffected_substores(subject: StateStore) -> None:
+    """It should only dispatch actions to substores that declare they handle them."""
+    subject.handle_action(
+        AddLiquidAction(
+            liquid=Liquid.construct(id="liquid-id", displayName="water", description="")
+        )
+    )
+
+    assert subject.liquid.get_all() == [
+        Liquid.construct(id="liquid-id", displayName="water", description="")
+    ]
+
+
 async def test_wait_for(
     decoy: Decoy,
     change_notifier: ChangeNotifier,
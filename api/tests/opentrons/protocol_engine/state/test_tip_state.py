@@ -1,9 +1,10 @@
 """Tests for tip state store and selectors."""
+import random
 from collections import OrderedDict
 
 import pytest
 
-from typing import Optional
+from typing import List, Optional, Set
 
 from opentrons_shared_data.labware.labware_definition import (
     LabwareDefinition,
@@ -15,6 +16,7 @@ from opentrons_shared_data.pipette.pipette_definition import ValidNozzleMaps
 from opentrons.hardware_control.nozzle_manager import NozzleMap
 from opentrons.protocol_engine import actions, commands
 from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state._well_math import wells_covered_dense
 from opentrons.protocol_engine.state.tips import TipStore, TipView
 from opentrons.protocol_engine.types import DeckSlotLocation, FlowRates
 from opentrons.protocol_engine.resources.pipette_data_provider import (
@@ -23,11 +25,15 @@ from opentrons.protocol_engine.resources.pipette_data_provider import (
 from opentrons.types import DeckSlotName, Point
 from opentrons_shared_data.pipette.types import PipetteNameType
 from ..pipette_fixtures import (
+    EIGHT_CHANNEL_COLS,
+    EIGHT_CHANNEL_MAP,
+    EIGHT_CHANNEL_ROWS,
     NINETY_SIX_MAP,
     NINETY_SIX_COLS,
     NINETY_SIX_ROWS,
     get_default_nozzle_map,
 )
+from . import tip_search_oracle
 
 _tip_rack_parameters = LabwareParameters.construct(isTiprack=True)  # type: ignore[call-arg]
 
@@ -1335,3 +1341,263 @@ def test_next_tip_automatic_tip_tracking_tiprack_limits(
     for _ in range(96):
         _get_next_and_pickup(map)
     assert _get_next_and_pickup(map) is None
+
+
+def _load_single_channel_pipette(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+) -> None:
+    """Load a single-channel pipette, which uses up one tip at a time."""
+    config_update = update_types.PipetteConfigUpdate(
+        pipette_id="pipette-id",
+        serial_number="pipette-serial",
+        config=LoadedStaticPipetteData(
+            channels=1,
+            max_volume=15,
+            min_volume=3,
+            model="gen a",
+            display_name="display name",
+            flow_rates=FlowRates(
+                default_aspirate={},
+                default_dispense={},
+                default_blow_out={},
+            ),
+            tip_configuration_lookup_table={15: supported_tip_fixture},
+            nominal_tip_overlap={},
+            nozzle_offset_z=1.23,
+            home_position=4.56,
+            nozzle_map=get_default_nozzle_map(PipetteNameType.P300_SINGLE_GEN2),
+            back_left_corner_offset=Point(x=1, y=2, z=3),
+            front_right_corner_offset=Point(x=4, y=5, z=6),
+            pipette_lld_settings={},
+        ),
+    )
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            state_update=update_types.StateUpdate(pipette_config=config_update),
+            command=_dummy_command(),
+        )
+    )
+
+
+def _use_tip(subject: TipStore, well_name: str) -> None:
+    subject.handle_action(
+        actions.SucceedCommandAction(
+            command=_dummy_command(),
+            state_update=update_types.StateUpdate(
+                tips_used=update_types.TipsUsedUpdate(
+                    pipette_id="pipette-id",
+                    labware_id="cool-labware",
+                    well_name=well_name,
+                )
+            ),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "used_wells, expected_next_tip",
+    [
+        # The search starts with the cluster in the back right corner.
+        ([], "E10"),
+        # Clusters whose front row is used can be skipped by moving back.
+        (
+            [f"{row}{column}" for row in "EFGH" for column in ["10", "11", "12"]],
+            "A10",
+        ),
+        # Clusters whose right column is used can be skipped by moving left.
+        ([f"{row}12" for row in "ABCDEFGH"], "E9"),
+        # A used tip in the middle of a cluster leaves no valid tip selection.
+        (["F11"], None),
+    ],
+)
+def test_next_tip_partial_configuration_mixed_clusters(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    load_labware_action: actions.SucceedCommandAction,
+    used_wells: list[str],
+    expected_next_tip: Optional[str],
+) -> None:
+    """A 96-channel partial configuration should only progress past used tips it can avoid."""
+    subject.handle_action(load_labware_action)
+    nozzle_map = NozzleMap.build(
+        physical_nozzles=NINETY_SIX_MAP,
+        physical_rows=NINETY_SIX_ROWS,
+        physical_columns=NINETY_SIX_COLS,
+        starting_nozzle="A1",
+        back_left_nozzle="A1",
+        front_right_nozzle="D3",
+        valid_nozzle_maps=ValidNozzleMaps(
+            maps={
+                "A1_D3": [
+                    well_name
+                    for row in list(NINETY_SIX_ROWS.values())[:4]
+                    for well_name in row[:3]
+                ]
+            }
+        ),
+    )
+    _load_single_channel_pipette(subject, supported_tip_fixture)
+    for well_name in used_wells:
+        _use_tip(subject, well_name)
+
+    result = TipView(subject.state).get_next_tip(
+        labware_id="cool-labware",
+        num_tips=0,
+        starting_tip_name=None,
+        nozzle_map=nozzle_map,
+    )
+
+    assert result == expected_next_tip
+    for well_name in used_wells:
+        assert not TipView(subject.state).has_clean_tip("cool-labware", well_name)
+
+
+def _corner_nozzle_map(
+    physical_rows: "OrderedDict[str, List[str]]",
+    physical_columns: "OrderedDict[str, List[str]]",
+    physical_nozzles: "OrderedDict[str, Point]",
+    starting_nozzle: str,
+    row_count: int,
+    column_count: int,
+) -> NozzleMap:
+    """Build a nozzle map of the block of nozzles in the starting nozzle's corner."""
+    row_names = list(physical_rows.keys())
+    column_names = list(physical_columns.keys())
+    if starting_nozzle[0] == row_names[0]:
+        row_names = row_names[:row_count]
+    else:
+        row_names = row_names[-row_count:]
+    if starting_nozzle[1:] == column_names[0]:
+        column_names = column_names[:column_count]
+    else:
+        column_names = column_names[-column_count:]
+    nozzles = [f"{row}{column}" for row in row_names for column in column_names]
+    return NozzleMap.build(
+        physical_nozzles=physical_nozzles,
+        physical_rows=physical_rows,
+        physical_columns=physical_columns,
+        starting_nozzle=starting_nozzle,
+        back_left_nozzle=nozzles[0],
+        front_right_nozzle=nozzles[-1],
+        valid_nozzle_maps=ValidNozzleMaps(maps={"Block": nozzles}),
+    )
+
+
+_EQUIVALENCE_NOZZLE_MAPS = [
+    get_default_nozzle_map(PipetteNameType.P300_SINGLE_GEN2),
+    *(
+        _corner_nozzle_map(
+            EIGHT_CHANNEL_ROWS,
+            EIGHT_CHANNEL_COLS,
+            EIGHT_CHANNEL_MAP,
+            starting_nozzle,
+            row_count,
+            1,
+        )
+        for starting_nozzle in ["A1", "H1"]
+        for row_count in [1, 2, 4, 7, 8]
+    ),
+    *(
+        _corner_nozzle_map(
+            NINETY_SIX_ROWS,
+            NINETY_SIX_COLS,
+            NINETY_SIX_MAP,
+            starting_nozzle,
+            row_count,
+            column_count,
+        )
+        for starting_nozzle in ["A1", "A12", "H1", "H12"]
+        for row_count, column_count in [
+            (1, 1),
+            (2, 3),
+            (4, 3),
+            (8, 1),
+            (8, 3),
+            (3, 8),
+            (1, 12),
+            (2, 12),
+            (8, 12),
+        ]
+    ),
+]
+
+
+def _assert_next_tip_matches(
+    subject: TipStore,
+    columns: List[List[str]],
+    used_wells: Set[str],
+    num_tips: int,
+    starting_tip_name: Optional[str],
+    nozzle_map: Optional[NozzleMap],
+) -> Optional[str]:
+    result = TipView(subject.state).get_next_tip(
+        labware_id="cool-labware",
+        num_tips=num_tips,
+        starting_tip_name=starting_tip_name,
+        nozzle_map=nozzle_map,
+    )
+    wells = {
+        well_name: tip_search_oracle.TipRackWellState.CLEAN
+        for column in columns
+        for well_name in column
+    }
+    wells.update(dict.fromkeys(used_wells, tip_search_oracle.TipRackWellState.USED))
+    expected = tip_search_oracle.get_next_tip(
+        wells=wells,
+        columns=columns,
+        num_tips=num_tips,
+        starting_tip_name=starting_tip_name,
+        nozzle_map=nozzle_map,
+    )
+    assert result == expected, (sorted(used_wells), nozzle_map)
+    return result
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_next_tip_matches_per_well_search(
+    subject: TipStore,
+    supported_tip_fixture: pipette_definition.SupportedTipsDefinition,
+    load_labware_action: actions.SucceedCommandAction,
+    labware_definition: LabwareDefinition,
+    seed: int,
+) -> None:
+    """It should find the same tip as the per-well search it replaced.
+
+    Each run picks up tips with a random sequence of pipette configurations,
+    with used tips scattered in between, and checks every lookup on the way.
+    """
+    rng = random.Random(seed)
+    columns = labware_definition.ordering
+    all_wells = [well_name for column in columns for well_name in column]
+    used_wells: Set[str] = set()
+    subject.handle_action(load_labware_action)
+    _load_single_channel_pipette(subject, supported_tip_fixture)
+
+    def _use_tips(well_names: List[str]) -> None:
+        for well_name in well_names:
+            _use_tip(subject, well_name)
+        used_wells.update(well_names)
+
+    for _ in range(60):
+        step = rng.random()
+        if step < 0.05:
+            subject.handle_action(actions.ResetTipsAction(labware_id="cool-labware"))
+            used_wells.clear()
+        elif step < 0.2:
+            _use_tips([rng.choice(all_wells)])
+        elif step < 0.35:
+            num_tips = rng.choice([1, 8, 96])
+            starting_tip_name = rng.choice([None, *all_wells])
+            result = _assert_next_tip_matches(
+                subject, columns, used_wells, num_tips, starting_tip_name, None
+            )
+            if result is not None and num_tips == 1:
+                _use_tips([result])
+        else:
+            nozzle_map = rng.choice(_EQUIVALENCE_NOZZLE_MAPS)
+            result = _assert_next_tip_matches(
+                subject, columns, used_wells, nozzle_map.tip_count, None, nozzle_map
+            )
+            if result is not None:
+                _use_tips(list(wells_covered_dense(nozzle_map, result, columns)))
@@ -2,9 +2,14 @@
 
 import pytest
 from datetime import datetime
-from opentrons.protocol_engine.state.wells import WellStore
+from opentrons.protocol_engine.state.wells import WellStore, WellView
 from opentrons.protocol_engine.actions.actions import SucceedCommandAction
 from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.types import (
+    LoadedVolumeInfo,
+    ProbedHeightInfo,
+    ProbedVolumeInfo,
+)
 
 from .command_fixtures import (
     create_liquid_probe_command,
@@ -41,15 +46,15 @@ def test_handles_liquid_probe_success(subject: WellStore) -> None:
         )
     )
 
-    assert len(subject.state.probed_heights) == 1
-    assert len(subject.state.probed_volumes) == 1
-
-    assert subject.state.probed_heights[labware_id][well_name].height == 15.0
-    assert subject.state.probed_heights[labware_id][well_name].last_probed == timestamp
-    assert subject.state.probed_volumes[labware_id][well_name].volume == 30.0
-    assert subject.state.probed_volumes[labware_id][well_name].last_probed == timestamp
-    assert (
-        subject.state.probed_volumes[labware_id][well_name].operations_since_probe == 0
+    well_liquid_info = WellView(subject.state).get_well_liquid_info(
+        labware_id, well_name
+    )
+    assert well_liquid_info.loaded_volume is None
+    assert well_liquid_info.probed_height == ProbedHeightInfo(
+        height=15.0, last_probed=timestamp
+    )
+    assert well_liquid_info.probed_volume == ProbedVolumeInfo(
+        volume=30.0, last_probed=timestamp, operations_since_probe=0
     )
 
 
@@ -76,22 +81,18 @@ def test_handles_load_liquid_success(subject: WellStore) -> None:
         )
     )
 
-    assert len(subject.state.loaded_volumes) == 1
-    assert len(subject.state.loaded_volumes[labware_id]) == 2
+    view = WellView(subject.state)
+    assert len(view.get_all()) == 2
 
-    assert subject.state.loaded_volumes[labware_id][well_name_1].volume == 30.0
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_1].last_loaded == timestamp
-    )
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_1].operations_since_load == 0
+    assert view.get_well_liquid_info(
+        labware_id, well_name_1
+    ).loaded_volume == LoadedVolumeInfo(
+        volume=30.0, last_loaded=timestamp, operations_since_load=0
     )
-    assert subject.state.loaded_volumes[labware_id][well_name_2].volume == 100.0
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_2].last_loaded == timestamp
-    )
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_2].operations_since_load == 0
+    assert view.get_well_liquid_info(
+        labware_id, well_name_2
+    ).loaded_volume == LoadedVolumeInfo(
+        volume=100.0, last_loaded=timestamp, operations_since_load=0
     )
 
 
@@ -158,22 +159,18 @@ def test_handles_load_liquid_and_aspirate(subject: WellStore) -> None:
         )
     )
 
-    assert len(subject.state.loaded_volumes) == 1
-    assert len(subject.state.loaded_volumes[labware_id]) == 2
+    view = WellView(subject.state)
+    assert len(view.get_all()) == 2
 
-    assert subject.state.loaded_volumes[labware_id][well_name_1].volume == 20.0
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_1].last_loaded == timestamp
-    )
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_1].operations_since_load == 1
+    assert view.get_well_liquid_info(
+        labware_id, well_name_1
+    ).loaded_volume == LoadedVolumeInfo(
+        volume=20.0, last_loaded=timestamp, operations_since_load=1
     )
-    assert subject.state.loaded_volumes[labware_id][well_name_2].volume == 80.0
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_2].last_loaded == timestamp
-    )
-    assert (
-        subject.state.loaded_volumes[labware_id][well_name_2].operations_since_load == 2
+    assert view.get_well_liquid_info(
+        labware_id, well_name_2
+    ).loaded_volume == LoadedVolumeInfo(
+        volume=80.0, last_loaded=timestamp, operations_since_load=2
     )
 
 
@@ -220,11 +217,59 @@ def test_handles_liquid_probe_and_aspirate(subject: WellStore) -> None:
         )
     )
 
-    assert len(subject.state.probed_heights[labware_id]) == 0
-    assert len(subject.state.probed_volumes) == 1
+    well_liquid_info = WellView(subject.state).get_well_liquid_info(
+        labware_id, well_name
+    )
+    assert well_liquid_info.probed_height is None
+    assert well_liquid_info.probed_volume == ProbedVolumeInfo(
+        volume=20.0, last_probed=timestamp, operations_since_probe=1
+    )
+
+
+def test_handles_many_wells_and_repeated_wells(subject: WellStore) -> None:
+    """It should track any number of wells, and apply an operation once per listed well."""
+    labware_id = "labware-id"
+    well_names = [
+        f"{row}{column}" for column in range(1, 25) for row in "ABCDEFGHIJKLMNOP"
+    ]
+    timestamp = datetime(year=2020, month=1, day=2)
+
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_load_liquid_command(labware_id=labware_id),
+            state_update=update_types.StateUpdate(
+                liquid_loaded=update_types.LiquidLoadedUpdate(
+                    labware_id=labware_id,
+                    volumes={well_name: 50.0 for well_name in well_names},
+                    last_loaded=timestamp,
+                )
+            ),
+        )
+    )
+    subject.handle_action(
+        SucceedCommandAction(
+            command=create_aspirate_command(
+                pipette_id="pipette-id",
+                volume=10.0,
+                flow_rate=1.0,
+                labware_id=labware_id,
+                well_name="P24",
+            ),
+            state_update=update_types.StateUpdate(
+                liquid_operated=update_types.LiquidOperatedUpdate(
+                    labware_id=labware_id,
+                    well_names=["P24", "P24", "not-loaded"],
+                    volume_added=-10.0,
+                )
+            ),
+        )
+    )
 
-    assert subject.state.probed_volumes[labware_id][well_name].volume == 20.0
-    assert subject.state.probed_volumes[labware_id][well_name].last_probed == timestamp
-    assert (
-        subject.state.probed_volumes[labware_id][well_name].operations_since_probe == 1
+    view = WellView(subject.state)
+    assert len(view.get_all()) == 384
+    assert view.get_well_liquid_info(
+        labware_id, "P24"
+    ).loaded_volume == LoadedVolumeInfo(
+        volume=30.0, last_loaded=timestamp, operations_since_load=2
     )
+    assert view.get_well_liquid_info(labware_id, "not-loaded").loaded_volume is None
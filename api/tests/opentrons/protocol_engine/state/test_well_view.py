@@ -1,31 +1,55 @@
 """Well view tests."""
 from datetime import datetime
-from opentrons.protocol_engine.types import (
-    LoadedVolumeInfo,
-    ProbedHeightInfo,
-    ProbedVolumeInfo,
-)
 import pytest
-from opentrons.protocol_engine.state.wells import WellState, WellView
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import SucceedCommandAction
+from opentrons.protocol_engine.state import update_types
+from opentrons.protocol_engine.state.wells import WellStore, WellView
+from opentrons.protocol_engine.types import WellInfoSummary
 
 
 @pytest.fixture
-def subject() -> WellView:
-    """Get a well view test subject."""
-    loaded_volume_info = LoadedVolumeInfo(
-        volume=30.0, last_loaded=datetime.now(), operations_since_load=0
-    )
-    probed_height_info = ProbedHeightInfo(height=5.5, last_probed=datetime.now())
-    probed_volume_info = ProbedVolumeInfo(
-        volume=25.0, last_probed=datetime.now(), operations_since_probe=0
+def store() -> WellStore:
+    """Get a well store with some liquid info in it."""
+    store = WellStore()
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                liquid_loaded=update_types.LiquidLoadedUpdate(
+                    labware_id="labware_id_1",
+                    volumes={"well_name": 30.0},
+                    last_loaded=datetime.now(),
+                )
+            )
+        )
     )
-    state = WellState(
-        loaded_volumes={"labware_id_1": {"well_name": loaded_volume_info}},
-        probed_heights={"labware_id_2": {"well_name": probed_height_info}},
-        probed_volumes={"labware_id_2": {"well_name": probed_volume_info}},
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                liquid_probed=update_types.LiquidProbedUpdate(
+                    labware_id="labware_id_2",
+                    well_name="well_name",
+                    height=5.5,
+                    volume=25.0,
+                    last_probed=datetime.now(),
+                )
+            )
+        )
     )
+    return store
 
-    return WellView(state)
+
+@pytest.fixture
+def subject(store: WellStore) -> WellView:
+    """Get a well view test subject."""
+    return WellView(store.state)
+
+
+def _succeed(state_update: update_types.StateUpdate) -> SucceedCommandAction:
+    return SucceedCommandAction(
+        command=commands.Comment.construct(),  # type: ignore[call-arg]
+        state_update=state_update,
+    )
 
 
 def test_get_well_liquid_info(subject: WellView) -> None:
@@ -56,3 +80,36 @@ def test_get_all(subject: WellView) -> None:
     assert summaries[0].loaded_volume == 30.0
     assert summaries[1].probed_height == 5.5
     assert summaries[1].probed_volume == 25.0
+
+
+def test_get_all_after_update(store: WellStore, subject: WellView) -> None:
+    """It should only return summaries that reflect the latest updates."""
+    subject.get_all()
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                liquid_operated=update_types.LiquidOperatedUpdate(
+                    labware_id="labware_id_1",
+                    well_names=["well_name"],
+                    volume_added=-10.0,
+                )
+            )
+        )
+    )
+    store.handle_action(
+        _succeed(
+            update_types.StateUpdate(
+                liquid_operated=update_types.LiquidOperatedUpdate(
+                    labware_id="labware_id_2",
+                    well_names=["well_name"],
+                    volume_added=update_types.CLEAR,
+                )
+            )
+        )
+    )
+
+    assert subject.get_all() == [
+        WellInfoSummary(
+            labware_id="labware_id_1", well_name="well_name", loaded_volume=20.0
+        )
+    ]
@@ -8,6 +8,7 @@ disk into the runner, and the protocols are run to completion. From
 there, the ProtocolEngine state is inspected to check that
 everything was loaded and run as expected.
 """
+import textwrap
 from datetime import datetime
 from decoy import matchers
 from pathlib import Path
@@ -381,3 +382,45 @@ async def test_runner_with_python_and_run_time_parameters(
     )
 
     assert expected_command in commands_result
+
+
+async def test_runner_with_python_catching_command_error(tmp_path: Path) -> None:
+    """It should raise a failed command's error where a Python protocol can catch it."""
+    protocol_file = tmp_path / "protocol.py"
+    protocol_file.write_text(
+        textwrap.dedent(
+            """
+            requirements = {"apiLevel": "2.20"}
+
+            def run(protocol):
+                heater_shaker = protocol.load_module("heaterShakerModuleV1", 1)
+                try:
+                    heater_shaker.wait_for_temperature()
+                except Exception:
+                    protocol.comment("Caught it.")
+                heater_shaker.deactivate_heater()
+            """
+        )
+    )
+    protocol_source = await ProtocolReader().read_saved(
+        files=[protocol_file],
+        directory=None,
+    )
+
+    subject = await create_simulating_orchestrator(
+        robot_type="OT-2 Standard", protocol_config=protocol_source.config
+    )
+    result = await subject.run(
+        deck_configuration=[],
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+    )
+
+    assert result.state_summary.errors == []
+    assert [(command.commandType, command.status) for command in result.commands] == [
+        ("home", commands.CommandStatus.SUCCEEDED),
+        ("loadModule", commands.CommandStatus.SUCCEEDED),
+        ("heaterShaker/waitForTemperature", commands.CommandStatus.FAILED),
+        ("comment", commands.CommandStatus.SUCCEEDED),
+        ("heaterShaker/deactivateHeater", commands.CommandStatus.SUCCEEDED),
+    ]
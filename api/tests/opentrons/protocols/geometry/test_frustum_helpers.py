@@ -5,6 +5,7 @@ from typing import Any, List
 from opentrons_shared_data.labware.labware_definition import (
     ConicalFrustum,
     CuboidalFrustum,
+    InnerWellGeometry,
     SphericalSegment,
 )
 from opentrons.protocol_engine.state.frustum_helpers import (
@@ -21,6 +22,8 @@ from opentrons.protocol_engine.state.frustum_helpers import (
     _height_from_volume_spherical,
     height_at_volume_within_section,
     _get_segment_capacity,
+    find_height_at_well_volume,
+    find_volume_at_well_height,
 )
 from opentrons.protocol_engine.errors.exceptions import InvalidLiquidHeightFound
 
@@ -338,3 +341,78 @@ def test_height_at_volume_within_section(well: List[Any]) -> None:
             segment, _get_segment_capacity(segment), segment_height
         )
         assert isclose(height, segment_height)
+
+
+def _tube_geometry() -> InnerWellGeometry:
+    return InnerWellGeometry(
+        sections=[
+            CuboidalFrustum(
+                shape="cuboidal",
+                topXDimension=8.0,
+                topYDimension=9.0,
+                bottomXDimension=7.0,
+                bottomYDimension=8.0,
+                topHeight=40.0,
+                bottomHeight=30.0,
+            ),
+            ConicalFrustum(
+                shape="conical",
+                topDiameter=7.0,
+                bottomDiameter=5.0,
+                topHeight=30.0,
+                bottomHeight=3.0,
+            ),
+            SphericalSegment(
+                shape="spherical",
+                radiusOfCurvature=3.0,
+                topHeight=3.0,
+                bottomHeight=0.0,
+            ),
+        ]
+    )
+
+
+def test_find_height_at_well_volume_round_trip() -> None:
+    """Test that heights and volumes found from each other agree."""
+    geometry = _tube_geometry()
+    for i in range(401):
+        target_height = i / 10
+        volume = find_volume_at_well_height(target_height, geometry)
+        assert isclose(
+            find_height_at_well_volume(volume, geometry),
+            target_height,
+            abs_tol=1e-3,
+        )
+
+
+def test_find_height_at_well_volume_conical() -> None:
+    """Test that heights in conical sections use the right radius at each end."""
+    geometry = _tube_geometry()
+    bottom_volume = find_volume_at_well_height(3.0, geometry)
+    for target_height in [1.0, 5.5, 13.0, 26.5]:
+        volume = _volume_from_height_circular(
+            target_height=target_height,
+            total_frustum_height=27.0,
+            bottom_radius=2.5,
+            top_radius=3.5,
+        )
+        assert isclose(
+            find_volume_at_well_height(3.0 + target_height, geometry),
+            bottom_volume + volume,
+        )
+        assert isclose(
+            find_height_at_well_volume(bottom_volume + volume, geometry),
+            3.0 + target_height,
+            abs_tol=1e-3,
+        )
+
+
+def test_find_height_at_well_volume_out_of_range() -> None:
+    """Test that volumes outside of the well are rejected."""
+    geometry = _tube_geometry()
+    max_volume = find_volume_at_well_height(40.0, geometry)
+    assert find_height_at_well_volume(max_volume, geometry) == 40.0
+    with pytest.raises(InvalidLiquidHeightFound):
+        find_height_at_well_volume(max_volume + 1, geometry)
+    with pytest.raises(InvalidLiquidHeightFound):
+        find_height_at_well_volume(-1, geometry)
@@ -0,0 +1,86 @@
+"""Tests for opentrons.protocols.labware_definition_cache."""
+import copy
+from pathlib import Path
+
+import pytest
+
+from opentrons.protocols import labware
+from opentrons.protocols.labware_definition_cache import (
+    LabwareDefinitionCache,
+    get_labware_definition_cache,
+)
+from opentrons.protocols.models import LabwareDefinition
+
+
+@pytest.fixture
+def user_defs_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point custom labware definitions at a temporary directory."""
+    monkeypatch.setattr(labware, "USER_DEFS_PATH", tmp_path)
+    return tmp_path
+
+
+def test_caches_standard_definitions() -> None:
+    """It should only parse a standard definition the first time it's requested."""
+    subject = LabwareDefinitionCache()
+
+    first = subject.get("opentrons_96_tiprack_300ul", "opentrons", 1)
+    second = subject.get("OPENTRONS_96_TIPRACK_300UL", "opentrons", 1)
+
+    assert first == LabwareDefinition.parse_obj(
+        labware.get_labware_definition("opentrons_96_tiprack_300ul", "opentrons", 1)
+    )
+    assert second is first
+    assert subject.misses == 1
+    assert subject.hits == 1
+    assert subject.size_bytes > 0
+
+
+def test_raises_for_missing_definitions() -> None:
+    """It should raise and not cache anything for an unknown labware."""
+    subject = LabwareDefinitionCache()
+
+    with pytest.raises(FileNotFoundError):
+        subject.get("not_a_real_labware", "opentrons", 1)
+
+    assert subject.size_bytes == 0
+
+
+def test_evicts_least_recently_used_definitions() -> None:
+    """It should stay within its size budget by evicting old definitions."""
+    sizing_cache = LabwareDefinitionCache()
+    sizing_cache.get("opentrons_96_tiprack_300ul", "opentrons", 1)
+    sizing_cache.get("nest_96_wellplate_100ul_pcr_full_skirt", "opentrons", 1)
+    subject = LabwareDefinitionCache(max_size_bytes=sizing_cache.size_bytes - 1)
+
+    subject.get("opentrons_96_tiprack_300ul", "opentrons", 1)
+    subject.get("nest_96_wellplate_100ul_pcr_full_skirt", "opentrons", 1)
+    subject.get("opentrons_96_tiprack_300ul", "opentrons", 1)
+
+    assert subject.size_bytes < sizing_cache.size_bytes
+    assert subject.hits == 0
+    assert subject.misses == 3
+
+
+def test_rereads_changed_custom_definitions(user_defs_path: Path) -> None:
+    """It should notice when a custom labware definition changes on disk."""
+    subject = get_labware_definition_cache()
+    custom_def = copy.deepcopy(
+        labware.get_labware_definition("opentrons_96_tiprack_300ul", "opentrons", 1)
+    )
+    custom_def["namespace"] = "custom_beta"
+    custom_def["parameters"]["loadName"] = "my_custom_tiprack"
+    labware.save_definition(custom_def)
+
+    first = subject.get("my_custom_tiprack", "custom_beta", 1)
+    assert subject.get("my_custom_tiprack", "custom_beta", 1) is first
+
+    custom_def["metadata"]["displayName"] = "My Renamed Tip Rack"
+    labware.save_definition(custom_def, force=True)
+
+    result = subject.get("my_custom_tiprack", "custom_beta", 1)
+    assert result.metadata.displayName == "My Renamed Tip Rack"
+
+    (user_defs_path / "custom_beta" / "my_custom_tiprack" / "1.json").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        subject.get("my_custom_tiprack", "custom_beta", 1)
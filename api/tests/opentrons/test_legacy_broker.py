@@ -1,5 +1,6 @@
 """Tests for `LegacyBroker`."""
 
+import logging
 from typing import List, NamedTuple, cast
 
 from opentrons.legacy_commands.types import CommandMessage
@@ -77,3 +78,21 @@ def test_legacy_broker() -> None:
     fake_obj.method_a(0, "2")
 
     assert calls == expected, "No calls expected after unsubscribe()"
+
+
+def test_legacy_broker_is_observed() -> None:
+    """It should report whether messages would be received or logged."""
+    broker = _FakeClass().broker
+    broker.logger = logging.getLogger("test_legacy_broker_is_observed")
+    broker.logger.setLevel(logging.WARNING)
+
+    assert broker.is_observed("command") is False
+
+    unsubscribe = broker.subscribe("command", lambda message: None)
+    assert broker.is_observed("command") is True
+
+    unsubscribe()
+    assert broker.is_observed("command") is False
+
+    broker.logger.setLevel(logging.INFO)
+    assert broker.is_observed("command") is True
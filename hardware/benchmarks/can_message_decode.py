@@ -0,0 +1,111 @@
+"""Benchmark for decoding received CAN messages.
+
+Decodes a stream of frames the way `CanMessenger` does on its receive path
+(look up the message definition by id, build the payload, then build the
+message) and reports how many frames per second that sustains:
+
+* reflective: the payload is built from its dataclass fields each time, as
+  `BinarySerializable.build()` used to work.
+* precompiled: the current `BinarySerializable.build()`, which uses a
+  `struct.Struct` compiled once per payload class.
+
+Usage:
+    python benchmarks/can_message_decode.py [--frames N]
+"""
+import argparse
+import struct
+import time
+from dataclasses import fields
+from typing import Callable, List, Tuple, Type
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.constants import MessageId
+from opentrons_hardware.firmware_bindings.messages import (
+    get_definition,
+    message_definitions as defs,
+)
+from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
+
+# The bulk of traffic while a Flex is moving and probing.
+_RECEIVED_MESSAGES: List[Type[MessageDefinition]] = [
+    defs.MoveCompleted,
+    defs.ReadFromSensorResponse,
+    defs.MotorPositionResponse,
+    defs.Acknowledgement,
+]
+
+_Build = Callable[[Type[utils.BinarySerializable], bytes], utils.BinarySerializable]
+
+
+def _reflective_build(
+    cls: Type[utils.BinarySerializable], data: bytes
+) -> utils.BinarySerializable:
+    format_string = f"{cls.ENDIAN}{''.join(v.type.FORMAT for v in fields(cls))}"
+    size = struct.calcsize(format_string)
+    b = struct.unpack(format_string, data[:size])
+    args = {
+        v.name: v.type.build(b[i])
+        for i, v in enumerate(fields(cls))
+        if not (v.name == "message_index")
+    }
+    message_index = next(
+        (
+            v.type.build(b[i])
+            for i, v in enumerate(fields(cls))
+            if v.name == "message_index"
+        ),
+        None,
+    )
+    ret_instance = cls(**args)
+    if message_index is not None:
+        ret_instance.message_index = message_index  # type: ignore[attr-defined]
+    return ret_instance
+
+
+def _precompiled_build(
+    cls: Type[utils.BinarySerializable], data: bytes
+) -> utils.BinarySerializable:
+    return cls.build(data)
+
+
+def _build_frames(count: int) -> List[Tuple[int, bytes]]:
+    frames = []
+    for i in range(count):
+        definition = _RECEIVED_MESSAGES[i % len(_RECEIVED_MESSAGES)]
+        # CAN FD pads frames up to the next valid length, so there are extra bytes.
+        data = bytes(definition.payload_type.get_size() + 2)
+        frames.append((int(definition.message_id), data))
+    return frames
+
+
+def _decode_all(frames: List[Tuple[int, bytes]], build: _Build) -> float:
+    start = time.perf_counter()
+    for message_id, data in frames:
+        message_definition = get_definition(MessageId(message_id))
+        assert message_definition is not None
+        message_definition(
+            payload=build(message_definition.payload_type, data)  # type: ignore[arg-type]
+        )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print how many frames per second were decoded."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200_000)
+    args = parser.parse_args()
+
+    frames = _build_frames(args.frames)
+    # Warm up lookups and codecs so only steady-state decoding is measured.
+    _decode_all(frames[: len(_RECEIVED_MESSAGES)], _precompiled_build)
+
+    reflective = _decode_all(frames, _reflective_build)
+    precompiled = _decode_all(frames, _precompiled_build)
+
+    print(f"{args.frames} frames")
+    print(f"reflective:  {args.frames / reflective:10.0f} frames/s")
+    print(f"precompiled: {args.frames / precompiled:10.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
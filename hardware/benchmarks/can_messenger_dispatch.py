@@ -0,0 +1,158 @@
+"""Benchmark for dispatching received CAN messages to CanMessenger listeners.
+
+Feeds a stream of sensor readings and move completions, like the traffic
+during a liquid probe, through `CanMessenger`'s receive loop with a number of
+sensor listeners attached, and reports how many frames per second that
+sustains:
+
+* filtered: every listener is added with a filter function, which is called
+  for every received frame.
+* indexed: every listener is added with the message IDs and originating nodes
+  that it's for, so each frame is only offered to the listeners registered
+  for it.
+
+Usage:
+    python benchmarks/can_messenger_dispatch.py [--frames N] [--listeners N]
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from opentrons_hardware.drivers.can_bus.abstract_driver import AbstractCanDriver
+from opentrons_hardware.drivers.can_bus.can_messenger import CanMessenger
+from opentrons_hardware.firmware_bindings.arbitration_id import (
+    ArbitrationId,
+    ArbitrationIdParts,
+)
+from opentrons_hardware.firmware_bindings.constants import (
+    FunctionCode,
+    MessageId,
+    NodeId,
+)
+from opentrons_hardware.firmware_bindings.message import CanMessage
+from opentrons_hardware.firmware_bindings.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages import (
+    message_definitions as defs,
+)
+
+_SENSOR_NODES = [NodeId.head_l, NodeId.head_r, NodeId.gripper_g, NodeId.gantry_x]
+
+
+class _ReplayDriver(AbstractCanDriver):
+    """A driver that receives a fixed list of frames, then stops."""
+
+    def __init__(self, frames: List[CanMessage]) -> None:
+        self._frames = iter(frames)
+
+    async def send(self, message: CanMessage) -> None:
+        pass
+
+    async def read(self) -> CanMessage:
+        try:
+            return next(self._frames)
+        except StopIteration:
+            raise StopAsyncIteration()
+
+    def shutdown(self) -> None:
+        pass
+
+
+def _frame(definition: MessageDefinition, node: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=definition.message_id,
+                node_id=NodeId.host,
+                function_code=FunctionCode.network_management,
+                originating_node_id=node,
+            )
+        ),
+        data=bytes(definition.payload_type.get_size()),
+    )
+
+
+def _build_frames(count: int) -> List[CanMessage]:
+    kinds = [
+        _frame(defs.ReadFromSensorResponse, NodeId.head_l),  # type: ignore[arg-type]
+        _frame(defs.ReadFromSensorResponse, NodeId.head_l),  # type: ignore[arg-type]
+        _frame(defs.ReadFromSensorResponse, NodeId.head_l),  # type: ignore[arg-type]
+        _frame(defs.MoveCompleted, NodeId.head_l),  # type: ignore[arg-type]
+    ]
+    return [kinds[i % len(kinds)] for i in range(count)]
+
+
+def _listener(message: MessageDefinition, arbitration_id: ArbitrationId) -> None:
+    pass
+
+
+def _add_listeners(messenger: CanMessenger, count: int, indexed: bool) -> None:
+    # Like a move group runner, which handles move completions from any node.
+    if indexed:
+        messenger.add_listener(_listener, message_ids=[MessageId.move_completed])
+    else:
+        messenger.add_listener(
+            _listener,
+            lambda arbitration_id: bool(
+                arbitration_id.parts.message_id == MessageId.move_completed
+            ),
+        )
+
+    # Like sensor scheduler listeners, which each handle one sensor's messages.
+    for i in range(count):
+        node = _SENSOR_NODES[i % len(_SENSOR_NODES)]
+        message_id = (
+            MessageId.read_sensor_response
+            if (i // len(_SENSOR_NODES)) % 2 == 0
+            else MessageId.error_message
+        )
+
+        if indexed:
+            messenger.add_listener(
+                lambda message, arbitration_id: None,
+                message_ids=[message_id],
+                originating_node_ids=[node],
+            )
+        else:
+
+            def _filter(
+                arbitration_id: ArbitrationId,
+                node: NodeId = node,
+                message_id: MessageId = message_id,
+            ) -> bool:
+                return (
+                    NodeId(arbitration_id.parts.originating_node_id) == node
+                    and MessageId(arbitration_id.parts.message_id) == message_id
+                )
+
+            messenger.add_listener(lambda message, arbitration_id: None, _filter)
+
+
+async def _dispatch_all(
+    frames: List[CanMessage], listeners: int, indexed: bool
+) -> float:
+    messenger = CanMessenger(_ReplayDriver(frames))
+    _add_listeners(messenger, listeners, indexed)
+    start = time.perf_counter()
+    await messenger._read_task()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print how many frames per second were dispatched."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--listeners", type=int, default=12, help="sensor listeners")
+    args = parser.parse_args()
+
+    frames = _build_frames(args.frames)
+    filtered = asyncio.run(_dispatch_all(frames, args.listeners, indexed=False))
+    indexed = asyncio.run(_dispatch_all(frames, args.listeners, indexed=True))
+
+    print(f"{args.frames} frames, {args.listeners} listeners")
+    print(f"filtered: {args.frames / filtered:10.0f} frames/s")
+    print(f"indexed:  {args.frames / indexed:10.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark for blending moves with MoveManager.plan_motion().
+
+Plans the same target list with both planners and reports how long each
+takes, after checking that they produced the same moves:
+
+* per-move: move_utils.build_move() and all_blended() on one move at a time,
+  which plan_motion() uses for short lists of moves.
+* array: move_arrays, which blends every move at once and which plan_motion()
+  uses for longer lists of moves.
+
+Target lists are read from a file in the format of
+opentrons_hardware/scripts/motion_params.json, or generated at random.
+
+Usage:
+    python benchmarks/motion_planning.py [--params-file-path PATH] [--targets N]
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning import move_manager
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisConstraints,
+    Coordinates,
+    Move,
+    MoveTarget,
+    SystemConstraints,
+)
+
+_AXES = ["X", "Y", "Z", "A", "B", "C"]
+# The params file format doesn't include a max speed for each axis.
+_DEFAULT_MAX_SPEED = 500
+
+_Plan = Tuple[Coordinates[str, float], List[MoveTarget[str]], int]
+
+
+def _plan(
+    manager: move_manager.MoveManager[str],
+    blend: Callable[[List[Move[str]], int], bool],
+    origin: Coordinates[str, float],
+    target_list: List[MoveTarget[str]],
+    iteration_limit: int,
+) -> Tuple[bool, List[List[Move[str]]]]:
+    # plan_motion() picks a planner by how many moves there are, so call each
+    # planner directly.
+    manager._clear_blend_log()
+    to_blend = manager._get_initial_moves_from_targets(origin, target_list)
+    converged = blend(to_blend, iteration_limit)
+    return converged, manager._blend_log
+
+
+def _load_plan(params_file_path: str) -> Tuple[SystemConstraints[str], _Plan]:
+    with open(params_file_path, "r") as f:
+        params: Dict[str, Any] = json.load(f)
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            **{"max_speed": _DEFAULT_MAX_SPEED, **params["constraints"][axis]}
+        )
+        for axis in _AXES
+    }
+    origin = dict(zip(_AXES, params["origin"]))
+    target_list = [
+        MoveTarget.build(dict(zip(_AXES, target["coordinates"])), target["max_speed"])
+        for target in params["target_list"]
+    ]
+    return constraints, (origin, target_list, params["iteration_limit"])
+
+
+def _generate_plan(target_count: int) -> Tuple[SystemConstraints[str], _Plan]:
+    rng = random.Random(0)
+    constraints: SystemConstraints[str] = {
+        axis: AxisConstraints.build(
+            max_acceleration=rng.randint(500, 5000),
+            max_speed_discont=rng.randint(11, 50),
+            max_direction_change_speed_discont=rng.randint(5, 10),
+            max_speed=_DEFAULT_MAX_SPEED,
+        )
+        for axis in _AXES
+    }
+    origin = {axis: 200.0 for axis in _AXES}
+    position = dict(origin)
+    target_list = []
+    for _ in range(target_count):
+        # Mostly gantry moves, with the occasional move of the other axes.
+        moving = _AXES[:3] if rng.random() < 0.8 else _AXES
+        position = {
+            axis: value + (rng.uniform(-50, 50) if axis in moving else 0)
+            for axis, value in position.items()
+        }
+        target_list.append(MoveTarget.build(position, rng.uniform(20, 400)))
+    return constraints, (origin, target_list, 20)
+
+
+def _check_same(per_move: List[List[Move[str]]], array: List[List[Move[str]]]) -> None:
+    assert [len(moves) for moves in per_move] == [len(moves) for moves in array]
+    for per_move_move, array_move in zip(
+        (m for moves in per_move for m in moves), (m for moves in array for m in moves)
+    ):
+        for per_move_block, array_block in zip(per_move_move.blocks, array_move.blocks):
+            assert np.allclose(
+                [per_move_block.distance, per_move_block.initial_speed],
+                [array_block.distance, array_block.initial_speed],
+                rtol=1e-9,
+                atol=1e-9,
+            ), f"{per_move_move} != {array_move}"
+
+
+def main() -> None:
+    """Run the benchmark and print how long each planner took."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--params-file-path", "-p", type=str)
+    source.add_argument("--targets", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.params_file_path:
+        constraints, (origin, target_list, iteration_limit) = _load_plan(
+            args.params_file_path
+        )
+    else:
+        constraints, (origin, target_list, iteration_limit) = _generate_plan(
+            args.targets
+        )
+    manager = move_manager.MoveManager(constraints=constraints)
+
+    per_move_times = []
+    array_times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        per_move_converged, per_move_log = _plan(
+            manager, manager._blend_by_move, origin, target_list, iteration_limit
+        )
+        per_move_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        array_converged, array_log = _plan(
+            manager, manager._blend_as_arrays, origin, target_list, iteration_limit
+        )
+        array_times.append(time.perf_counter() - start)
+
+    assert per_move_converged == array_converged
+    _check_same(per_move_log, array_log)
+
+    print(
+        f"{len(target_list)} targets, {len(array_log[-1])} moves, "
+        f"{len(array_log)} iteration(s), converged: {array_converged}"
+    )
+    print(f"per-move: {min(per_move_times) * 1000:8.2f} ms")
+    print(f"array:    {min(array_times) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
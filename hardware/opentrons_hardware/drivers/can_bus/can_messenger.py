@@ -1,12 +1,17 @@
 """Can messenger class."""
 from __future__ import annotations
 import asyncio
+import time
+from collections import defaultdict
+from dataclasses import dataclass
 from inspect import Traceback
 from typing import (
     Optional,
     Callable,
     Tuple,
     Dict,
+    FrozenSet,
+    Iterable,
     Union,
     List,
     cast,
@@ -42,7 +47,10 @@ from opentrons_hardware.firmware_bindings.messages.messages import (
     MessageDefinition,
     get_definition,
 )
-from opentrons_hardware.firmware_bindings.utils import BinarySerializableException
+from opentrons_hardware.firmware_bindings.utils import (
+    BinarySerializable,
+    BinarySerializableException,
+)
 
 log = logging.getLogger(__name__)
 
@@ -55,6 +63,34 @@ MessageListenerCallbackFilter = Callable[[ArbitrationId], bool]
 """A function used to filter incoming messages. Returns true to accept message."""
 
 
+@dataclass
+class _RegisteredListener:
+    """A listener and the messages it was added for."""
+
+    listener: MessageListenerCallback
+    filter: Optional[MessageListenerCallbackFilter]
+    message_ids: Optional[FrozenSet[int]]
+    originating_node_ids: Optional[FrozenSet[int]]
+    name: str
+
+    def is_for(self, originating_node_id: int, message_id: int) -> bool:
+        """Whether the listener was added for messages with these IDs."""
+        return (self.message_ids is None or message_id in self.message_ids) and (
+            self.originating_node_ids is None
+            or originating_node_id in self.originating_node_ids
+        )
+
+
+@dataclass(frozen=True)
+class CanMessengerStats:
+    """What a CanMessenger has received since it was started."""
+
+    frames_received: int
+    frames_per_second: float
+    dispatch_seconds: Dict[str, float]
+    """Total time spent in listeners' callbacks, by listener name."""
+
+
 _AckResponses = Union[ErrorMessage, Acknowledgement]
 _AckPacket = Tuple[ArbitrationId, _AckResponses]
 _Acks = List[_AckPacket]
@@ -135,12 +171,7 @@ class AcknowledgeListener:
     async def send_and_verify_recieved(self) -> ErrorCode:
         """Send the message and wait for an Ack."""
         try:
-            self._can_messenger.add_listener(
-                self,
-                lambda arbitration_id: bool(
-                    arbitration_id.parts.message_id in _AckIdFilter
-                ),
-            )
+            self._can_messenger.add_listener(self, message_ids=_AckIdFilter)
             self._event.clear()
             if self._exclusive:
                 await self._can_messenger.send_exclusive(self._node_id, self._message)
@@ -186,10 +217,14 @@ class CanMessenger:
             driver: The can bus driver to use.
         """
         self._drive = driver
-        self._listeners: Dict[
-            MessageListenerCallback,
-            Tuple[MessageListenerCallback, Optional[MessageListenerCallbackFilter]],
-        ] = {}
+        self._listeners: Dict[MessageListenerCallback, _RegisteredListener] = {}
+        # The listeners for each (originating node, message ID) received so far,
+        # in the order they were added. Lists are replaced rather than modified,
+        # so that a listener can add or remove listeners while being called.
+        self._dispatch_table: Dict[Tuple[int, int], List[_RegisteredListener]] = {}
+        self._frames_received = 0
+        self._started_at: Optional[float] = None
+        self._dispatch_seconds: Dict[str, float] = defaultdict(float)
         self._task: Optional[asyncio.Task[None]] = None
         self._access_lock = asyncio.Lock()
         self._exclusive_condvar = asyncio.Condition(self._access_lock)
@@ -229,10 +264,11 @@ class CanMessenger:
             )
         )
         data = message.payload.serialize()
-        log.debug(
-            f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
-            f"payload: {message.payload}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Sending -->\n\tarbitration_id: {arbitration_id},\n\t"
+                f"payload: {message.payload}"
+            )
         try:
             await self._drive.send(
                 message=CanMessage(arbitration_id=arbitration_id, data=data)
@@ -327,6 +363,9 @@ class CanMessenger:
         if self._task:
             log.warning("can messenger task already running.")
             return
+        self._frames_received = 0
+        self._started_at = time.monotonic()
+        self._dispatch_seconds.clear()
         self._task = asyncio.get_event_loop().create_task(self._read_task_shield())
 
     async def stop(self) -> None:
@@ -340,18 +379,82 @@ class CanMessenger:
         else:
             log.warning("task not running.")
 
+    @property
+    def stats(self) -> CanMessengerStats:
+        """What this messenger has received since it was started."""
+        elapsed = (
+            time.monotonic() - self._started_at if self._started_at is not None else 0
+        )
+        return CanMessengerStats(
+            frames_received=self._frames_received,
+            frames_per_second=self._frames_received / elapsed if elapsed else 0.0,
+            dispatch_seconds=dict(self._dispatch_seconds),
+        )
+
     def add_listener(
         self,
         listener: MessageListenerCallback,
         filter: Optional[MessageListenerCallbackFilter] = None,
+        *,
+        message_ids: Optional[Iterable[MessageId]] = None,
+        originating_node_ids: Optional[Iterable[NodeId]] = None,
     ) -> None:
-        """Add a message listener."""
-        self._listeners[listener] = listener, filter
+        """Add a message listener.
+
+        Args:
+            listener: Called with each received message that it's added for.
+            filter: Optional function of the arbitration id. The listener is
+                only called for messages it accepts.
+            message_ids: If given, the listener is only called for messages
+                with these ids.
+            originating_node_ids: If given, the listener is only called for
+                messages from these nodes.
+
+        Received messages are looked up by message id and originating node, so
+        prefer message_ids and originating_node_ids to a filter that checks the
+        same thing, which has to be called for every received message.
+        """
+        self.remove_listener(listener)
+        registered = _RegisteredListener(
+            listener=listener,
+            filter=filter,
+            message_ids=(
+                frozenset(int(i) for i in message_ids)
+                if message_ids is not None
+                else None
+            ),
+            originating_node_ids=(
+                frozenset(int(n) for n in originating_node_ids)
+                if originating_node_ids is not None
+                else None
+            ),
+            name=getattr(listener, "__qualname__", type(listener).__qualname__),
+        )
+        self._listeners[listener] = registered
+        for key, listeners in self._dispatch_table.items():
+            if registered.is_for(*key):
+                self._dispatch_table[key] = listeners + [registered]
 
     def remove_listener(self, listener: MessageListenerCallback) -> None:
         """Remove a message listener."""
-        if listener in self._listeners:
-            self._listeners.pop(listener)
+        registered = self._listeners.pop(listener, None)
+        if registered is None:
+            return
+        for key, listeners in self._dispatch_table.items():
+            if registered in listeners:
+                self._dispatch_table[key] = [
+                    r for r in listeners if r is not registered
+                ]
+
+    def _listeners_for(
+        self, originating_node_id: int, message_id: int
+    ) -> List[_RegisteredListener]:
+        key = (originating_node_id, message_id)
+        listeners = self._dispatch_table.get(key)
+        if listeners is None:
+            listeners = [r for r in self._listeners.values() if r.is_for(*key)]
+            self._dispatch_table[key] = listeners
+        return listeners
 
     async def _read_task_shield(self) -> None:
         while True:
@@ -366,35 +469,49 @@ class CanMessenger:
     async def _read_task(self) -> None:
         """Read task."""
         async for message in self._drive:
-            message_definition = get_definition(
-                MessageId(message.arbitration_id.parts.message_id)
-            )
+            self._frames_received += 1
+            parts = message.arbitration_id.parts
+            message_definition = get_definition(MessageId(parts.message_id))
             if message_definition:
                 try:
                     build = message_definition.payload_type.build(message.data)
-                    log.debug(
-                        f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
-                        f"payload: {build}"
-                    )
-                    handled = False
-                    for listener, filter in self._listeners.values():
-                        if filter and not filter(message.arbitration_id):
-                            continue
-                        listener(message_definition(payload=build), message.arbitration_id)  # type: ignore[arg-type]
-                        handled = True
-                    if not handled:
-                        if (
-                            message.arbitration_id.parts.message_id
-                            == MessageId.error_message
-                        ):
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(
+                            f"Received <--\n\tarbitration_id: {message.arbitration_id},\n\t"
+                            f"payload: {build}"
+                        )
+                    if not self._dispatch(
+                        message_definition, build, message.arbitration_id
+                    ):
+                        if parts.message_id == MessageId.error_message:
                             log.error(f"Asynchronous error message ignored: {message}")
                         else:
-                            log.info(f"Message ignored: {message}")
+                            log.info("Message ignored: %s", message)
                 except BinarySerializableException:
                     log.exception(f"Failed to build from {message}")
             else:
                 log.error(f"Message {message} is not recognized.")
 
+    def _dispatch(
+        self,
+        message_definition: Type[MessageDefinition],
+        payload: BinarySerializable,
+        arbitration_id: ArbitrationId,
+    ) -> bool:
+        """Call the listeners for a received message, and return whether there were any."""
+        parts = arbitration_id.parts
+        handled = False
+        for registered in self._listeners_for(
+            parts.originating_node_id, parts.message_id
+        ):
+            if registered.filter and not registered.filter(arbitration_id):
+                continue
+            start = time.perf_counter()
+            registered.listener(message_definition(payload=payload), arbitration_id)  # type: ignore[arg-type]
+            self._dispatch_seconds[registered.name] += time.perf_counter() - start
+            handled = True
+        return handled
+
     @property
     def exclusive_writer(self) -> asyncio.Lock:
         """A caller may acquire this context manager to temporarily gain exclusive control of the bus.
@@ -1,6 +1,5 @@
 """Message types."""
-from functools import lru_cache
-from typing import Union, Optional, Type
+from typing import Dict, Union, Optional, Type
 
 from typing_extensions import get_args
 
@@ -117,7 +116,17 @@ MessageDefinition = Union[
 ]
 
 
-@lru_cache(maxsize=None)
+def _build_definitions_by_id() -> Dict[MessageId, Type[MessageDefinition]]:
+    definitions_by_id: Dict[MessageId, Type[MessageDefinition]] = {}
+    for definition in get_args(MessageDefinition):
+        # If two definitions share an id, the one listed first wins.
+        definitions_by_id.setdefault(definition.message_id, definition)
+    return definitions_by_id
+
+
+_definitions_by_id = _build_definitions_by_id()
+
+
 def get_definition(message_id: MessageId) -> Optional[Type[MessageDefinition]]:
     """Get the message type for a message id.
 
@@ -127,10 +136,4 @@ def get_definition(message_id: MessageId) -> Optional[Type[MessageDefinition]]:
     Returns: The message definition for a type
 
     """
-    # Dumb linear search, but the result is memoized.
-    for i in get_args(MessageDefinition):
-        if i.message_id == message_id:
-            # get args returns Tuple[Any...]
-            return i  # type: ignore[no-any-return]
-
-    return None
+    return _definitions_by_id.get(message_id)
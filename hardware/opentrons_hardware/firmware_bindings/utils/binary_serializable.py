@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 import struct
-from dataclasses import dataclass, fields, astuple
-from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence
+from dataclasses import dataclass, fields
+from typing import TypeVar, Generic, Type, Optional, Dict, Any, Sequence, Tuple
 
 from opentrons_shared_data.errors.exceptions import (
     InternalMessageFormatError,
@@ -166,6 +166,22 @@ class Int8Field(IntFieldBase):
     FORMAT = "b"
 
 
+@dataclass(frozen=True)
+class _Codec:
+    """What a BinarySerializable subclass needs to (de)serialize itself."""
+
+    packer: struct.Struct
+    field_names: Tuple[str, ...]
+    field_types: Tuple[Type[BinaryFieldBase[Any]], ...]
+    # Whether there's a message_index field, which has to be set after construction.
+    has_message_index: bool
+
+
+# Codecs are looked up on every message sent or received, so they're built once
+# per class and kept here rather than derived from the dataclass fields each time.
+_codecs: Dict[Type[BinarySerializable], _Codec] = {}
+
+
 @dataclass
 class BinarySerializable:
     """Base class of a dataclass that can be serialized/deserialized into bytes.
@@ -185,10 +201,11 @@ class BinarySerializable:
         Returns:
             Byte buffer
         """
-        string = self._get_format_string()
-        vals = [x.value for x in astuple(self)]
+        codec = self._get_codec()
         try:
-            return struct.pack(string, *vals)
+            return codec.packer.pack(
+                *(getattr(self, name).value for name in codec.field_names)
+            )
         except struct.error as e:
             raise SerializationException(e)
 
@@ -209,33 +226,42 @@ class BinarySerializable:
         Returns:
             cls
         """
+        codec = cls._get_codec()
         try:
-            format_string = cls._get_format_string()
-            size = cls.get_size()
             # ignore bytes beyond the size of message.
-            b = struct.unpack(format_string, data[:size])
+            b = codec.packer.unpack_from(data)
             # we have to do message index special until we update to python 3.10 since we can't make it a kw_only arg
             # 3.10 has an updated dataclass field option that will make this go away, see payloads.py
             args = {
-                v.name: v.type.build(b[i])
-                for i, v in enumerate(fields(cls))
-                if not (v.name == "message_index")
+                name: field_type.build(value)
+                for name, field_type, value in zip(
+                    codec.field_names, codec.field_types, b
+                )
             }
-            message_index = next(
-                (
-                    v.type.build(b[i])
-                    for i, v in enumerate(fields(cls))
-                    if v.name == "message_index"
-                ),
-                None,
-            )
+            if not codec.has_message_index:
+                return cls(**args)
+            message_index = args.pop("message_index")
             ret_instance = cls(**args)
-            if message_index is not None:
-                ret_instance.message_index = message_index  # type: ignore[attr-defined]
+            ret_instance.message_index = message_index  # type: ignore[attr-defined]
             return ret_instance
         except struct.error as e:
             raise InvalidFieldException("Bad data for field", data, e)
 
+    @classmethod
+    def _get_codec(cls) -> _Codec:
+        codec = _codecs.get(cls)
+        if codec is None:
+            dataclass_fields = fields(cls)
+            field_names = tuple(v.name for v in dataclass_fields)
+            codec = _Codec(
+                packer=struct.Struct(cls._get_format_string()),
+                field_names=field_names,
+                field_types=tuple(v.type for v in dataclass_fields),
+                has_message_index="message_index" in field_names,
+            )
+            _codecs[cls] = codec
+        return codec
+
     @classmethod
     def _get_format_string(cls) -> str:
         """Get the `struct` format string for this class.
@@ -258,7 +284,7 @@ class BinarySerializable:
     @classmethod
     def get_size(cls) -> int:
         """Get the size of the serializable in bytes."""
-        return struct.calcsize(cls._get_format_string())
+        return cls._get_codec().packer.size
 
 
 class LittleEndianMixIn:
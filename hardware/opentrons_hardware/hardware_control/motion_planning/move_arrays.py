@@ -0,0 +1,525 @@
+"""Array-backed moves, for blending a whole list of moves at once.
+
+The functions in move_utils plan one move at a time, one axis at a time. Here
+the same moves are held as arrays with a row per move and a column per axis,
+so each step of blending runs over every move in the list at once.
+
+Each function here mirrors the move_utils function it's named after and
+produces the same results, so changes to one must be made to the other.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Generic, List, Sequence, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from opentrons_hardware.hardware_control.motion_planning.move_utils import (
+    FLOAT_THRESHOLD,
+)
+from opentrons_hardware.hardware_control.motion_planning.types import (
+    AxisKey,
+    Block,
+    Coordinates,
+    Move,
+    SystemConstraints,
+)
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+@dataclasses.dataclass(frozen=True)
+class ConstraintArrays:
+    """System constraints, with one entry per axis."""
+
+    max_acceleration: "NDArray[np.float64]"
+    max_speed_discont: "NDArray[np.float64]"
+    max_direction_change_speed_discont: "NDArray[np.float64]"
+
+    @classmethod
+    def build(
+        cls, constraints: SystemConstraints[AxisKey], axes: Sequence[AxisKey]
+    ) -> ConstraintArrays:
+        """Build ConstraintArrays for some axes, in order."""
+        return cls(
+            max_acceleration=np.array(
+                [constraints[axis].max_acceleration for axis in axes], dtype=np.float64
+            ),
+            max_speed_discont=np.array(
+                [constraints[axis].max_speed_discont for axis in axes],
+                dtype=np.float64,
+            ),
+            max_direction_change_speed_discont=np.array(
+                [constraints[axis].max_direction_change_speed_discont for axis in axes],
+                dtype=np.float64,
+            ),
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class MoveArrays(Generic[AxisKey]):
+    """A list of moves, as arrays with a row per move.
+
+    Per-axis arrays have a column per axis, in the order of `axes`. Per-block
+    arrays have a column per block.
+    """
+
+    axes: Tuple[AxisKey, ...]
+    # The moves' original unit vectors, to hand back out in built moves.
+    unit_vector_maps: Sequence[Coordinates[AxisKey, np.float64]]
+    unit_vectors: "NDArray[np.float64]"
+    distances: "NDArray[np.float64]"
+    max_speeds: "NDArray[np.float64]"
+    block_distances: "NDArray[np.float64]"
+    # The distances the blocks' final speeds and times were computed from.
+    # build_blocks() trims blocks after building them without recomputing those.
+    block_build_distances: "NDArray[np.float64]"
+    block_initial_speeds: "NDArray[np.float64]"
+    block_accelerations: "NDArray[np.float64]"
+    block_final_speeds: "NDArray[np.float64]"
+    block_times: "NDArray[np.float64]"
+
+    @classmethod
+    def from_moves(cls, moves: Sequence[Move[AxisKey]]) -> MoveArrays[AxisKey]:
+        """Build MoveArrays from moves that all move along the same axes."""
+        axes = tuple(moves[0].unit_vector.keys())
+
+        def _block_values(attribute: str) -> "NDArray[np.float64]":
+            return np.array(
+                [[getattr(block, attribute) for block in m.blocks] for m in moves],
+                dtype=np.float64,
+            )
+
+        block_distances = _block_values("distance")
+        return cls(
+            axes=axes,
+            unit_vector_maps=[m.unit_vector for m in moves],
+            unit_vectors=np.array(
+                [[m.unit_vector[axis] for axis in axes] for m in moves],
+                dtype=np.float64,
+            ),
+            distances=np.array([m.distance for m in moves], dtype=np.float64),
+            max_speeds=np.array([m.max_speed for m in moves], dtype=np.float64),
+            block_distances=block_distances,
+            block_build_distances=block_distances,
+            block_initial_speeds=_block_values("initial_speed"),
+            block_accelerations=_block_values("acceleration"),
+            block_final_speeds=_block_values("final_speed"),
+            block_times=_block_values("time"),
+        )
+
+    def to_moves(self) -> List[Move[AxisKey]]:
+        """Build a Move for each row."""
+        moves = []
+        for row, unit_vector in enumerate(self.unit_vector_maps):
+            blocks = []
+            for column in range(3):
+                block = Block(
+                    distance=self.block_build_distances[row, column],
+                    initial_speed=self.block_initial_speeds[row, column],
+                    acceleration=self.block_accelerations[row, column],
+                )
+                block.distance = self.block_distances[row, column]
+                blocks.append(block)
+            moves.append(
+                Move(
+                    unit_vector=unit_vector,
+                    distance=self.distances[row],
+                    max_speed=self.max_speeds[row],
+                    blocks=(blocks[0], blocks[1], blocks[2]),
+                )
+            )
+        return moves
+
+    @property
+    def initial_speeds(self) -> "NDArray[np.float64]":
+        """Each move's initial speed, like Move.initial_speed."""
+        moving = self.block_distances != 0
+        speeds = self.block_initial_speeds
+        return np.where(
+            moving[:, 0],
+            speeds[:, 0],
+            np.where(
+                moving[:, 1], speeds[:, 1], np.where(moving[:, 2], speeds[:, 2], 0.0)
+            ),
+        )
+
+    @property
+    def final_speeds(self) -> "NDArray[np.float64]":
+        """Each move's final speed, like Move.final_speed."""
+        moving = self.block_distances != 0
+        speeds = self.block_final_speeds
+        return np.where(
+            moving[:, 2],
+            speeds[:, 2],
+            np.where(
+                moving[:, 1], speeds[:, 1], np.where(moving[:, 0], speeds[:, 0], 0.0)
+            ),
+        )
+
+    def rows(self, rows: slice) -> MoveArrays[AxisKey]:
+        """Get some of the moves."""
+        return dataclasses.replace(
+            self,
+            unit_vector_maps=self.unit_vector_maps[rows],
+            unit_vectors=self.unit_vectors[rows],
+            distances=self.distances[rows],
+            max_speeds=self.max_speeds[rows],
+            block_distances=self.block_distances[rows],
+            block_build_distances=self.block_build_distances[rows],
+            block_initial_speeds=self.block_initial_speeds[rows],
+            block_accelerations=self.block_accelerations[rows],
+            block_final_speeds=self.block_final_speeds[rows],
+            block_times=self.block_times[rows],
+        )
+
+    def with_dummy_start_end(self) -> MoveArrays[AxisKey]:
+        """Add dummy moves to the start and end, like Move.build_dummy()."""
+        dummy = Move.build_dummy(self.axes)
+        dummy_unit_vector = np.zeros((1, len(self.axes)))
+        dummy_unit_vector[0, 0] = 1.0
+        zero_row = np.zeros(1)
+        zero_blocks = np.zeros((1, 3))
+
+        def _pad(
+            values: "NDArray[np.float64]", dummy_row: "NDArray[np.float64]"
+        ) -> "NDArray[np.float64]":
+            return np.concatenate((dummy_row, values, dummy_row))
+
+        return dataclasses.replace(
+            self,
+            unit_vector_maps=[
+                dummy.unit_vector,
+                *self.unit_vector_maps,
+                dummy.unit_vector,
+            ],
+            unit_vectors=_pad(self.unit_vectors, dummy_unit_vector),
+            distances=_pad(self.distances, zero_row),
+            max_speeds=_pad(self.max_speeds, zero_row),
+            block_distances=_pad(self.block_distances, zero_blocks),
+            block_build_distances=_pad(self.block_build_distances, zero_blocks),
+            block_initial_speeds=_pad(self.block_initial_speeds, zero_blocks),
+            block_accelerations=_pad(self.block_accelerations, zero_blocks),
+            block_final_speeds=_pad(self.block_final_speeds, zero_blocks),
+            block_times=_pad(self.block_times, zero_blocks),
+        )
+
+
+def _less_or_close(
+    constraint: "NDArray[np.float64]", values: "NDArray[np.float64]"
+) -> "NDArray[np.bool_]":
+    """Check values against a constraint, like move_utils.check_less_or_close."""
+    return (np.abs(values) <= constraint) | np.isclose(values, constraint)
+
+
+def _block_final_speeds(
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Like Block.final_speed."""
+    speeds_squared = initial_speeds**2 + accelerations * distances * 2
+    # Rounding can make this slightly negative when it should be zero.
+    return np.sqrt(np.where(speeds_squared < 0, 0.0, speeds_squared))
+
+
+def _block_times(
+    initial_speeds: "NDArray[np.float64]",
+    accelerations: "NDArray[np.float64]",
+    distances: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Like Block.time."""
+    return np.where(
+        accelerations != 0,
+        (final_speeds - initial_speeds) / accelerations,
+        np.where(initial_speeds == 0, 0.0, distances / initial_speeds),
+    )
+
+
+def find_initial_speed(
+    constraints: ConstraintArrays,
+    moves: MoveArrays[AxisKey],
+    prev_moves: MoveArrays[AxisKey],
+) -> "NDArray[np.float64]":
+    """Get each move's initial speed."""
+    initial_speeds = moves.initial_speeds
+    prev_components = np.where(
+        (prev_moves.distances > FLOAT_THRESHOLD)[:, np.newaxis],
+        prev_moves.unit_vectors,
+        0.0,
+    )
+    prev_final_speeds = prev_moves.final_speeds
+    # Each axis's limit depends on the limits of the axes before it, so go in order.
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        prev_axis_components = prev_components[:, axis]
+        moving = ~(np.abs(axis_components * initial_speeds) < FLOAT_THRESHOLD)
+        discont = constraints.max_speed_discont[axis]
+        axis_constrained_speeds = np.where(
+            (prev_axis_components == 0) | (prev_final_speeds == 0),
+            # If we're previously stopped, we can use maximum speed discontinuity
+            np.abs(discont / axis_components),
+            np.where(
+                prev_axis_components * axis_components > 0,
+                # Moving the same direction, so try to start at the previous
+                # move's final speed
+                np.abs(
+                    np.maximum(
+                        np.abs(prev_final_speeds * prev_axis_components), discont
+                    )
+                    / axis_components
+                ),
+                # Changing directions
+                np.abs(
+                    constraints.max_direction_change_speed_discont[axis]
+                    / axis_components
+                ),
+            ),
+        )
+        initial_speeds = np.where(
+            moving, np.minimum(axis_constrained_speeds, initial_speeds), initial_speeds
+        )
+    return initial_speeds
+
+
+def find_final_speed(
+    constraints: ConstraintArrays,
+    moves: MoveArrays[AxisKey],
+    next_moves: MoveArrays[AxisKey],
+) -> "NDArray[np.float64]":
+    """Get each move's final speed."""
+    final_speeds = moves.final_speeds
+    next_components = np.where(
+        (next_moves.distances > FLOAT_THRESHOLD)[:, np.newaxis],
+        next_moves.unit_vectors,
+        0.0,
+    )
+    next_initial_speeds = next_moves.initial_speeds
+    # Each axis's limit depends on the limits of the axes before it, so go in order.
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        next_axis_components = next_components[:, axis]
+        moving = ~(np.abs(axis_components * final_speeds) < FLOAT_THRESHOLD)
+        discont = constraints.max_speed_discont[axis]
+        axis_speed_limits = np.where(
+            (next_axis_components == 0) | (next_initial_speeds == 0),
+            # If we're stopping, we can stop from our speed discontinuity
+            np.abs(discont / axis_components),
+            np.where(
+                next_axis_components * axis_components > 0,
+                # Continuing in the same direction, so go as fast as we can
+                np.abs(
+                    np.maximum(
+                        discont, np.abs(next_initial_speeds * next_axis_components)
+                    )
+                    / axis_components
+                ),
+                # Changing directions
+                np.abs(
+                    constraints.max_direction_change_speed_discont[axis]
+                    / axis_components
+                ),
+            ),
+        )
+        final_speeds = np.where(
+            moving, np.minimum(axis_speed_limits, final_speeds), final_speeds
+        )
+    return final_speeds
+
+
+def achievable_final(
+    constraints: ConstraintArrays,
+    moves: MoveArrays[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+) -> "NDArray[np.float64]":
+    """Make sure each move's final speed is achievable from its initial speed."""
+    for axis in range(len(moves.axes)):
+        axis_components = moves.unit_vectors[:, axis]
+        # using the equation v_f^2  = v_i^2 + 2as
+        max_axis_final_velocity_sq = (initial_speeds * axis_components) ** 2 + (
+            2 * constraints.max_acceleration[axis] * moves.distances
+        )
+        max_axis_final_velocity = (
+            np.copysign(
+                np.sqrt(max_axis_final_velocity_sq) / axis_components,
+                final_speeds - initial_speeds,
+            )
+            + initial_speeds
+        )
+        # take the smaller of the absolute values, like apply_constraint()
+        final_speeds = np.where(
+            axis_components != 0,
+            np.copysign(
+                np.minimum(np.abs(max_axis_final_velocity), np.abs(final_speeds)),
+                final_speeds,
+            ),
+            final_speeds,
+        )
+    return final_speeds
+
+
+def build_blocks(
+    moves: MoveArrays[AxisKey],
+    initial_speeds: "NDArray[np.float64]",
+    final_speeds: "NDArray[np.float64]",
+    constraints: ConstraintArrays,
+) -> MoveArrays[AxisKey]:
+    """Build the blocks of each move, returning the built moves."""
+    max_speeds = moves.max_speeds
+    assert np.all(
+        (np.abs(initial_speeds) <= max_speeds)
+        | np.isclose(np.abs(initial_speeds), max_speeds)
+    ), f"initial speeds {initial_speeds} exceed max speeds {max_speeds}"
+    assert np.all(
+        (np.abs(final_speeds) <= max_speeds)
+        | np.isclose(np.abs(final_speeds), max_speeds)
+    ), f"final speeds {final_speeds} exceed max speeds {max_speeds}"
+
+    unit_vectors = moves.unit_vectors
+    distances = moves.distances
+    max_acc = np.where(unit_vectors != 0, constraints.max_acceleration, 0.0)
+    acc_v = np.linalg.norm(max_acc, axis=1)[:, np.newaxis] * unit_vectors
+    # Each axis's scaling applies to the whole vector, so go in order.
+    for axis in range(len(moves.axes)):
+        a_i = acc_v[:, axis]
+        max_acc_i = max_acc[:, axis]
+        acc_v = np.where(
+            (np.abs(a_i) > max_acc_i)[:, np.newaxis],
+            acc_v * (max_acc_i / a_i)[:, np.newaxis],
+            acc_v,
+        )
+    max_acceleration = np.linalg.norm(acc_v, axis=1)
+
+    initial_speed_sq = initial_speeds**2
+    final_speed_sq = final_speeds**2
+
+    max_achievable_speed = np.sqrt(
+        0.5 * (2 * max_acceleration * distances + initial_speed_sq + final_speed_sq)
+    )
+    max_speed_sq = np.minimum(max_achievable_speed, max_speeds) ** 2
+
+    first_distances = np.abs(max_speed_sq - initial_speed_sq) / (2 * max_acceleration)
+    first_final_speeds = _block_final_speeds(
+        initial_speeds, max_acceleration, first_distances
+    )
+    final_distances = np.abs(max_speed_sq - final_speed_sq) / (2 * max_acceleration)
+    final_final_speeds = _block_final_speeds(
+        first_final_speeds, -max_acceleration, final_distances
+    )
+
+    # See move_utils.build_blocks() for why some moves have to be trimmed down.
+    trimmed_max_speed_sq = np.maximum(initial_speed_sq, final_speed_sq)
+    trim = first_distances + final_distances > (distances + FLOAT_THRESHOLD)
+    trimmed_first_distances = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - initial_speed_sq) / (2 * max_acceleration),
+        first_distances,
+    )
+    trimmed_final_distances = np.where(
+        trim,
+        np.abs(trimmed_max_speed_sq - final_speed_sq) / (2 * max_acceleration),
+        final_distances,
+    )
+
+    coast = trimmed_first_distances + trimmed_final_distances < (
+        distances - FLOAT_THRESHOLD
+    )
+    coast_distances = np.where(
+        coast, distances - trimmed_first_distances - trimmed_final_distances, 0.0
+    )
+    coast_initial_speeds = np.where(coast, first_final_speeds, 0.0)
+    coast_accelerations = np.zeros_like(distances)
+    coast_final_speeds = _block_final_speeds(
+        coast_initial_speeds, coast_accelerations, coast_distances
+    )
+
+    block_build_distances = np.stack(
+        (first_distances, coast_distances, final_distances), axis=1
+    )
+    block_initial_speeds = np.stack(
+        (initial_speeds, coast_initial_speeds, first_final_speeds), axis=1
+    )
+    block_accelerations = np.stack(
+        (max_acceleration, coast_accelerations, -max_acceleration), axis=1
+    )
+    block_final_speeds = np.stack(
+        (first_final_speeds, coast_final_speeds, final_final_speeds), axis=1
+    )
+    return dataclasses.replace(
+        moves,
+        block_distances=np.stack(
+            (trimmed_first_distances, coast_distances, trimmed_final_distances), axis=1
+        ),
+        block_build_distances=block_build_distances,
+        block_initial_speeds=block_initial_speeds,
+        block_accelerations=block_accelerations,
+        block_final_speeds=block_final_speeds,
+        block_times=_block_times(
+            block_initial_speeds,
+            block_accelerations,
+            block_build_distances,
+            block_final_speeds,
+        ),
+    )
+
+
+def build_moves(
+    moves: MoveArrays[AxisKey], constraints: ConstraintArrays
+) -> MoveArrays[AxisKey]:
+    """Build every move but the first and last from its neighbors.
+
+    This is move_utils.build_move() for every move at once.
+    """
+    prev_moves = moves.rows(slice(None, -2))
+    next_moves = moves.rows(slice(2, None))
+    moves = moves.rows(slice(1, -1))
+    # Axes a move doesn't move along divide by zero, but aren't used.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        initial_speeds = find_initial_speed(constraints, moves, prev_moves)
+        final_speeds = find_final_speed(constraints, moves, next_moves)
+        final_speeds = achievable_final(
+            constraints, moves, initial_speeds, final_speeds
+        )
+        return build_blocks(moves, initial_speeds, final_speeds, constraints)
+
+
+def all_blended(constraints: ConstraintArrays, moves: MoveArrays[AxisKey]) -> bool:
+    """Check if the moves are all blended."""
+    if len(moves.distances) < 2:
+        return True
+
+    # have these actually had their blocks built?
+    block_distance_sums = (
+        moves.block_distances[:, 0]
+        + moves.block_distances[:, 1]
+        + moves.block_distances[:, 2]
+    )
+    if np.any(
+        (np.abs(block_distance_sums - moves.distances) > FLOAT_THRESHOLD)
+        | ~np.isclose(block_distance_sums, moves.distances)
+    ):
+        return False
+
+    # do their junction velocities match constraints?
+    first = moves.rows(slice(None, -1))
+    second = moves.rows(slice(1, None))
+    final_speeds = first.block_final_speeds[:, -1:] * first.unit_vectors
+    initial_speeds = second.block_initial_speeds[:, :1] * second.unit_vectors
+    discont = constraints.max_speed_discont
+    direction_change_discont = constraints.max_direction_change_speed_discont
+    junction_ok = np.where(
+        first.unit_vectors * second.unit_vectors > 0,
+        # if they're in the same direction, either the junction speeds exactly
+        # match, or they're both under the discontinuity limit
+        (np.abs(initial_speeds - final_speeds) < FLOAT_THRESHOLD)
+        | _less_or_close(discont, final_speeds)
+        | _less_or_close(discont, initial_speeds),
+        # if they're in different directions, then the junction has to be at or
+        # under the speed change discontinuity
+        _less_or_close(direction_change_discont, final_speeds)
+        | _less_or_close(direction_change_discont, initial_speeds),
+    )
+    return bool(np.all(junction_ok))
@@ -1,7 +1,7 @@
 """Move manager."""
 import logging
 from typing import List, Tuple, Generic
-from opentrons_hardware.hardware_control.motion_planning import move_utils
+from opentrons_hardware.hardware_control.motion_planning import move_arrays, move_utils
 from opentrons_hardware.hardware_control.motion_planning.types import (
     Coordinates,
     Move,
@@ -13,6 +13,10 @@ from opentrons_hardware.hardware_control.motion_planning.types import (
 
 log = logging.getLogger(__name__)
 
+# Blending moves as arrays has a fixed cost per iteration that only pays off for
+# lists of at least this many moves. Most plans are a single move.
+_ARRAY_BLENDING_MIN_MOVES = 4
+
 
 class MoveManager(Generic[AxisKey]):
     """A manager that handles a list of moves for the hardware control system."""
@@ -67,6 +71,24 @@ class MoveManager(Generic[AxisKey]):
         self._clear_blend_log()
         to_blend = self._get_initial_moves_from_targets(origin, target_list)
         assert to_blend, "Check target list"
+        if len(to_blend) - 2 >= _ARRAY_BLENDING_MIN_MOVES:
+            converged = self._blend_as_arrays(to_blend, iteration_limit)
+        else:
+            converged = self._blend_by_move(to_blend, iteration_limit)
+        if converged:
+            log.debug(
+                f"built {len(self._blend_log[-1])} moves with "
+                f"{sum(list(m.nonzero_blocks for m in self._blend_log[-1]))} "
+                f"non-zero blocks after {len(self._blend_log)} iteration(s)"
+            )
+            return True, self._blend_log
+        log.error("Could not converge!")
+        return False, self._blend_log
+
+    def _blend_by_move(
+        self, to_blend: List[Move[AxisKey]], iteration_limit: int
+    ) -> bool:
+        """Blend moves one at a time, adding each iteration to the blend log."""
         for i in range(iteration_limit):
             log.debug(f"Motion blending iteration: {i}")
             blend_log = []
@@ -86,16 +108,32 @@ class MoveManager(Generic[AxisKey]):
                         self._blend_log.append(blend_log)
                     break
             if move_utils.all_blended(self._constraints, self._blend_log[i]):
-                log.debug(
-                    f"built {len(self._blend_log[i])} moves with "
-                    f"{sum(list(m.nonzero_blocks for m in self._blend_log[i]))} "
-                    f"non-zero blocks after {i+1} iteration(s)"
-                )
-                return True, self._blend_log
+                return True
             else:
                 self._blend_log[i] = self._add_dummy_start_end_to_moves(
                     self._blend_log[i]
                 )
                 to_blend = self._blend_log[-1]
-        log.error("Could not converge!")
-        return False, self._blend_log
+        return False
+
+    def _blend_as_arrays(
+        self, to_blend: List[Move[AxisKey]], iteration_limit: int
+    ) -> bool:
+        """Blend all moves at once, adding each iteration to the blend log.
+
+        This gives the same moves as _blend_by_move(), up to floating-point rounding.
+        """
+        moves = move_arrays.MoveArrays.from_moves(to_blend)
+        constraints = move_arrays.ConstraintArrays.build(self._constraints, moves.axes)
+        for i in range(iteration_limit):
+            log.debug(f"Motion blending iteration: {i}")
+            moves = move_arrays.build_moves(moves, constraints)
+            self._blend_log.append(moves.to_moves())
+            if move_arrays.all_blended(constraints, moves):
+                return True
+            else:
+                self._blend_log[i] = self._add_dummy_start_end_to_moves(
+                    self._blend_log[i]
+                )
+                moves = moves.with_dummy_start_end()
+        return False
@@ -404,7 +404,9 @@ class MoveGroupRunner:
         """Run all the move groups."""
         scheduler = MoveScheduler(self._move_groups, start_at_index)
         try:
-            can_messenger.add_listener(scheduler)
+            can_messenger.add_listener(
+                scheduler, message_ids=MoveScheduler.HANDLED_MESSAGE_IDS
+            )
             completions = await scheduler.run(can_messenger)
         finally:
             can_messenger.remove_listener(scheduler)
@@ -414,6 +416,14 @@ class MoveGroupRunner:
 class MoveScheduler:
     """A message listener that manages the sending of execute move group messages."""
 
+    HANDLED_MESSAGE_IDS = [
+        MoveCompleted.message_id,
+        TipActionResponse.message_id,
+        ErrorMessage.message_id,
+        ReadMotorDriverErrorStatusResponse.message_id,
+    ]
+    """The ids of the messages that __call__ handles."""
+
     def __init__(self, move_groups: MoveGroups, start_at_index: int = 0) -> None:
         """Constructor."""
         # For each move group create a set identifying the node and seq id.
@@ -0,0 +1,109 @@
+"""A bounded buffer of timestamped sensor readings."""
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from opentrons_hardware.firmware_bindings.constants import SensorType
+from .types import SensorDataType, sensor_fixed_point_conversion
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+DEFAULT_SAMPLE_CAPACITY = 2**16
+"""How many readings a buffer holds by default before it overwrites the oldest."""
+
+
+class SensorSampleBuffer:
+    """A preallocated ring buffer of timestamped raw sensor readings.
+
+    Readings are kept as the fixed-point integers that the firmware sends, in
+    arrays that are allocated once. Once the buffer holds `capacity` readings,
+    each new reading overwrites the oldest one, so a long capture uses a fixed
+    amount of memory and keeps its most recent readings.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SAMPLE_CAPACITY) -> None:
+        """Build an empty buffer."""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._timestamps: "NDArray[np.float64]" = np.zeros(capacity, dtype=np.float64)
+        self._values: "NDArray[np.int64]" = np.zeros(capacity, dtype=np.int64)
+        self._next = 0
+        self._size = 0
+        self._dropped = 0
+
+    def __len__(self) -> int:
+        """The number of readings in the buffer."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """The most readings the buffer holds at once."""
+        return self._capacity
+
+    @property
+    def dropped(self) -> int:
+        """The number of readings that were overwritten since the buffer was cleared."""
+        return self._dropped
+
+    def append(self, timestamp: float, value: int) -> None:
+        """Add a raw reading."""
+        index = self._next
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        self._next = (index + 1) % self._capacity
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            self._dropped += 1
+
+    def extend(self, timestamp: float, values: "NDArray[np.int64]") -> None:
+        """Add raw readings that all arrived at the same time."""
+        count = len(values)
+        overwritten = max(0, self._size + count - self._capacity)
+        if count >= self._capacity:
+            self._timestamps[:] = timestamp
+            self._values[:] = values[count - self._capacity :]
+            self._next = 0
+        else:
+            first = min(count, self._capacity - self._next)
+            self._timestamps[self._next : self._next + first] = timestamp
+            self._values[self._next : self._next + first] = values[:first]
+            self._timestamps[: count - first] = timestamp
+            self._values[: count - first] = values[first:]
+            self._next = (self._next + count) % self._capacity
+        self._size = min(self._capacity, self._size + count)
+        self._dropped += overwritten
+
+    def clear(self) -> None:
+        """Remove all readings."""
+        self._next = 0
+        self._size = 0
+        self._dropped = 0
+
+    def _make_contiguous(self) -> None:
+        # Once the buffer has wrapped, rotate it so the oldest reading is first.
+        if self._size == self._capacity and self._next != 0:
+            self._timestamps[:] = np.roll(self._timestamps, -self._next)
+            self._values[:] = np.roll(self._values, -self._next)
+            self._next = 0
+
+    def as_arrays(self) -> Tuple["NDArray[np.float64]", "NDArray[np.int64]"]:
+        """Get the timestamps and raw readings, oldest first.
+
+        The arrays are views of the buffer rather than copies, so they're only
+        valid until the next reading is added. Copy them to keep them longer.
+        """
+        self._make_contiguous()
+        return self._timestamps[: self._size], self._values[: self._size]
+
+    def as_floats(self) -> "NDArray[np.float64]":
+        """Get a new array of the readings converted to floats, oldest first."""
+        _, values = self.as_arrays()
+        return values / sensor_fixed_point_conversion
+
+    def as_sensor_data(self, sensor_type: SensorType) -> List[SensorDataType]:
+        """Get the readings as SensorDataTypes, oldest first."""
+        _, values = self.as_arrays()
+        return [SensorDataType.build(int(v), sensor_type) for v in values]
@@ -2,9 +2,11 @@
 import time
 import asyncio
 
+import numpy as np
+
 from typing import Optional, AsyncIterator, Any, Sequence, List, Union
 from contextlib import asynccontextmanager, suppress
-from logging import getLogger
+from logging import getLogger, INFO
 
 from opentrons_hardware.drivers.can_bus.can_messenger import (
     CanMessenger,
@@ -16,6 +18,7 @@ from opentrons_hardware.firmware_bindings.messages import (
     MessageDefinition,
 )
 from opentrons_hardware.firmware_bindings.constants import (
+    MessageId,
     SensorOutputBinding,
     SensorThresholdMode,
 )
@@ -47,6 +50,7 @@ from opentrons_hardware.firmware_bindings.messages.fields import (
 from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     BindSensorOutputRequest,
 )
+from .sample_buffer import DEFAULT_SAMPLE_CAPACITY, SensorSampleBuffer
 from .sensor_abc import AbstractSensorDriver
 from .scheduler import SensorScheduler
 from . import SENSOR_LOG_NAME
@@ -227,15 +231,29 @@ class SensorDriver(AbstractSensorDriver):
 
 
 class LogListener:
-    """Capture incoming sensor messages."""
+    """Capture incoming sensor messages.
+
+    Readings are kept with the time they were received in a SensorSampleBuffer,
+    which holds up to `capacity` readings and then overwrites the oldest.
+    """
 
     def __init__(
         self,
         messenger: CanMessenger,
         sensor: Union[PressureSensor, CapacitiveSensor],
+        capacity: int = DEFAULT_SAMPLE_CAPACITY,
+        log_every: int = 1,
     ) -> None:
-        """Build the capturer."""
-        self.response_queue: asyncio.Queue[SensorDataType] = asyncio.Queue()
+        """Build the capturer.
+
+        Args:
+            messenger: The messenger to listen on.
+            sensor: The sensor to capture readings from.
+            capacity: The most readings to hold at once.
+            log_every: Log one in this many received messages of readings to
+                the sensor log, or 0 to not log readings.
+        """
+        self.samples = SensorSampleBuffer(capacity)
         self.tool = sensor.sensor.node_id
         self.start_time = 0.0
         self.event: Any = None
@@ -243,26 +261,46 @@ class LogListener:
         self.sensor = sensor
         self.type = sensor.sensor.sensor_type
         self.id = sensor.sensor.sensor_id
+        self._log_every = log_every
+        self._messages_received = 0
 
     def get_data(self) -> Optional[List[SensorDataType]]:
-        """Return the sensor data captured by this listener."""
-        if self.response_queue.empty():
+        """Return the sensor data captured by this listener, and clear it."""
+        if not self.samples:
             return None
-        data: List[SensorDataType] = []
-        while not self.response_queue.empty():
-            data.append(self.response_queue.get_nowait())
+        data = self.samples.as_sensor_data(self.type)
+        self.samples.clear()
         return data
 
     async def __aenter__(self) -> None:
         """Start logging sensor readings."""
-        self.messenger.add_listener(self, None)
+        self.messenger.add_listener(
+            self,
+            message_ids=[
+                MessageId.read_sensor_response,
+                MessageId.batch_read_sensor_response,
+                MessageId.acknowledgement,
+            ],
+            originating_node_ids=[self.tool],
+        )
         self.start_time = time.time()
         SENSOR_LOG.info(f"Data capture for {self.tool.name} started {self.start_time}")
 
     async def __aexit__(self, *args: Any) -> None:
         """Finish the capture."""
         self.messenger.remove_listener(self)
-        SENSOR_LOG.info(f"Data capture for {self.tool.name} ended {time.time()}")
+        SENSOR_LOG.info(
+            f"Data capture for {self.tool.name} ended {time.time()}: "
+            f"{len(self.samples)} readings held, {self.samples.dropped} overwritten"
+        )
+
+    def _should_log(self) -> bool:
+        self._messages_received += 1
+        return (
+            self._log_every > 0
+            and (self._messages_received - 1) % self._log_every == 0
+            and SENSOR_LOG.isEnabledFor(INFO)
+        )
 
     def set_stop_ack(self, message_index: int = 0) -> None:
         """Tell the Listener which message index to wait for."""
@@ -288,35 +326,29 @@ class LogListener:
             return
         if isinstance(message, message_definitions.ReadFromSensorResponse):
             if (
-                message.payload.sensor_id.value is not self.id
-                or message.payload.sensor is not self.type
+                message.payload.sensor_id.value != self.id
+                or message.payload.sensor.value != self.type
             ):
                 # ignore sensor responses from other sensors
                 return
-            data = sensor_types.SensorDataType.build(
-                message.payload.sensor_data, message.payload.sensor
-            )
-            self.response_queue.put_nowait(data)
-            SENSOR_LOG.info(
-                f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data}"
-            )
+            value = int(message.payload.sensor_data.value)
+            self.samples.append(time.time(), value)
+            if self._should_log():
+                SENSOR_LOG.info(
+                    f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: "
+                    f"{value / sensor_types.sensor_fixed_point_conversion}"
+                )
         if isinstance(message, message_definitions.BatchReadFromSensorResponse):
             data_length = message.payload.data_length.value
-            data_bytes = message.payload.sensor_data.value
-            data_ints = [
-                int.from_bytes(data_bytes[i * 4 : i * 4 + 4], byteorder="little")
-                for i in range(data_length)
-            ]
-            data_floats = [
-                sensor_types.SensorDataType.build(d, message.payload.sensor)
-                for d in data_ints
-            ]
-
-            for d in data_floats:
-                self.response_queue.put_nowait(d)
-            SENSOR_LOG.info(
-                f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: {data_floats}"
-            )
+            values = np.frombuffer(
+                message.payload.sensor_data.value, dtype="<u4", count=data_length
+            ).astype(np.int64)
+            self.samples.extend(time.time(), values)
+            if self._should_log():
+                SENSOR_LOG.info(
+                    f"Revieved from {arbitration_id}: {message.payload.sensor_id}:{message.payload.sensor}: "
+                    f"{(values / sensor_types.sensor_fixed_point_conversion).tolist()}"
+                )
         if isinstance(message, message_definitions.Acknowledgement):
             if (
                 self.event is not None
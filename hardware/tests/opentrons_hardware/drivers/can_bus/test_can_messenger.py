@@ -454,3 +454,63 @@ async def test_waitable_callback_context_with_filter() -> None:
     with WaitableCallback(mock_messenger, some_func) as callback:
         mock_messenger.add_listener.assert_called_once_with(callback, some_func)
     mock_messenger.remove_listener.assert_called_once_with(callback)
+
+
+def _received_message(message_id: MessageId, originating_node_id: NodeId) -> CanMessage:
+    return CanMessage(
+        arbitration_id=ArbitrationId(
+            parts=ArbitrationIdParts(
+                message_id=message_id,
+                node_id=0,
+                function_code=0,
+                originating_node_id=originating_node_id,
+            )
+        ),
+        data=b"\x00\x00\x00\x01\1",
+    )
+
+
+async def test_listen_messages_by_id(
+    subject: CanMessenger, incoming_messages: Queue[CanMessage]
+) -> None:
+    """It should only call listeners added for a message's id and originating node."""
+    for message_id, node in [
+        (MessageId.get_move_group_request, NodeId.gantry_x),
+        (MessageId.get_move_group_request, NodeId.gantry_y),
+        (MessageId.heartbeat_request, NodeId.gantry_x),
+    ]:
+        incoming_messages.put_nowait(_received_message(message_id, node))
+
+    by_message = Mock(spec=MessageListenerCallback)
+    by_node = Mock(spec=MessageListenerCallback)
+    by_both = Mock(spec=MessageListenerCallback)
+    removed = Mock(spec=MessageListenerCallback)
+    subject.add_listener(by_message, message_ids=[MessageId.get_move_group_request])
+    subject.add_listener(by_node, originating_node_ids=[NodeId.gantry_x])
+    subject.add_listener(
+        by_both,
+        message_ids=[MessageId.get_move_group_request],
+        originating_node_ids=[NodeId.gantry_y],
+    )
+    subject.add_listener(removed, message_ids=[MessageId.heartbeat_request])
+    subject.remove_listener(removed)
+
+    subject.start()
+    while not incoming_messages.empty():
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    await subject.stop()
+
+    assert [c.args[0] for c in by_message.call_args_list] == [
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1))),
+        GetMoveGroupRequest(payload=MoveGroupRequestPayload(group_id=UInt8Field(1))),
+    ]
+    assert [c.args[1].parts.message_id for c in by_node.call_args_list] == [
+        MessageId.get_move_group_request,
+        MessageId.heartbeat_request,
+    ]
+    assert [c.args[1].parts.originating_node_id for c in by_both.call_args_list] == [
+        NodeId.gantry_y
+    ]
+    removed.assert_not_called()
+    assert subject.stats.frames_received == 3
@@ -3,7 +3,10 @@ import pytest
 from typing_extensions import get_args
 from dataclasses import fields
 
-from opentrons_hardware.firmware_bindings.messages.messages import MessageDefinition
+from opentrons_hardware.firmware_bindings.messages.messages import (
+    MessageDefinition,
+    get_definition,
+)
 
 
 @pytest.mark.parametrize("message_definition", get_args(MessageDefinition))
@@ -23,3 +26,14 @@ def test_payload_types(message_definition: MessageDefinition) -> None:
     assert payload_type_type is not None
     assert payload_type is not None
     assert payload_type == payload_type_type
+
+
+@pytest.mark.parametrize("message_definition", get_args(MessageDefinition))
+def test_get_definition(message_definition: MessageDefinition) -> None:
+    """It should look up each message definition by its message id."""
+    assert get_definition(message_definition.message_id) is message_definition
+
+
+def test_get_definition_unknown() -> None:
+    """It should return None for a message id without a definition."""
+    assert get_definition(0xFFFF) is None  # type: ignore[arg-type]
@@ -0,0 +1,94 @@
+"""Tests for BinarySerializable."""
+from dataclasses import dataclass
+
+import pytest
+
+from opentrons_hardware.firmware_bindings import utils
+from opentrons_hardware.firmware_bindings.messages import payloads
+
+
+@dataclass
+class _Payload(utils.BinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int16Field
+    third: utils.UInt32Field
+
+
+@dataclass
+class _LittleEndianPayload(utils.LittleEndianBinarySerializable):
+    first: utils.UInt8Field
+    second: utils.Int16Field
+    third: utils.UInt32Field
+
+
+@dataclass(eq=False)
+class _IndexedPayload(payloads.EmptyPayload):
+    value: utils.UInt16Field
+
+
+@dataclass
+class _InvalidPayload(utils.BinarySerializable):
+    value: int
+
+
+def test_serialize_and_build() -> None:
+    """It should pack fields big endian and build them back."""
+    subject = _Payload(
+        first=utils.UInt8Field(1),
+        second=utils.Int16Field(-2),
+        third=utils.UInt32Field(0x01020304),
+    )
+
+    data = subject.serialize()
+
+    assert data == b"\x01\xff\xfe\x01\x02\x03\x04"
+    assert _Payload.get_size() == 7
+    # Extra bytes, like CAN FD padding, are ignored.
+    assert _Payload.build(data + b"\x00\x00") == subject
+
+
+def test_little_endian() -> None:
+    """It should pack fields little endian if asked to."""
+    subject = _LittleEndianPayload(
+        first=utils.UInt8Field(1),
+        second=utils.Int16Field(-2),
+        third=utils.UInt32Field(0x01020304),
+    )
+
+    assert subject.serialize() == b"\x01\xfe\xff\x04\x03\x02\x01"
+    assert _LittleEndianPayload.build(subject.serialize()) == subject
+
+
+def test_build_too_short() -> None:
+    """It should raise if there aren't enough bytes for every field."""
+    with pytest.raises(utils.InvalidFieldException):
+        _Payload.build(b"\x01\x02")
+
+
+def test_serialize_out_of_range() -> None:
+    """It should raise if a value doesn't fit in its field."""
+    subject = _Payload(
+        first=utils.UInt8Field(256),
+        second=utils.Int16Field(0),
+        third=utils.UInt32Field(0),
+    )
+
+    with pytest.raises(utils.BinarySerializableException):
+        subject.serialize()
+
+
+def test_message_index() -> None:
+    """It should build a message_index field, which isn't an init argument."""
+    data = b"\x00\x00\x00\x07\x00\x2a"
+
+    subject = _IndexedPayload.build(data)
+
+    assert subject.value == utils.UInt16Field(42)
+    assert subject.message_index == utils.UInt32Field(7)
+    assert subject.serialize() == data
+
+
+def test_invalid_field() -> None:
+    """It should raise if a field isn't a binary field."""
+    with pytest.raises(utils.InvalidFieldException):
+        _InvalidPayload.get_size()
@@ -210,3 +210,82 @@ def test_close_move_plan(
     )
 
     assert converged, f"Failed to converge: {blend_log}"
+
+
+@st.composite
+def generate_winding_path(
+    draw: st.DrawFn,
+) -> Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]]:
+    """Generate a path of many targets that change direction along each axis."""
+    origin = draw(generate_coordinates())
+    target_list: List[MoveTarget[str]] = []
+    prev_coord = origin
+    for _ in range(draw(st.integers(min_value=4, max_value=12))):
+        position = {
+            axis: value
+            + np.float64(
+                draw(st.floats(min_value=1.0, max_value=100.0))
+                * draw(st.sampled_from([-1, 1]))
+            )
+            for axis, value in prev_coord.items()
+        }
+        target_list.append(
+            MoveTarget.build(
+                position, np.float64(draw(st.floats(min_value=10, max_value=500)))
+            )
+        )
+        prev_coord = position
+    return origin, target_list
+
+
+@given(
+    constraints=st.lists(generate_axis_constraint(), min_size=6, max_size=6),
+    path=generate_winding_path(),
+)
+def test_blend_as_arrays_matches_blend_by_move(
+    constraints: List[AxisConstraints],
+    path: Tuple[Coordinates[str, np.float64], List[MoveTarget[str]]],
+) -> None:
+    """Blending moves as arrays should give the same moves as one at a time."""
+    origin, targets = path
+    manager = move_manager.MoveManager(constraints=dict(zip(SIXAXES, constraints)))
+    to_blend = manager._get_initial_moves_from_targets(origin, targets)
+
+    # todo(mm, 2024-05-21): We should test through the public interface of the subject,
+    # not through its private attributes.
+    manager._clear_blend_log()
+    by_move_converged = manager._blend_by_move(to_blend, 20)
+    by_move_log = manager._blend_log
+    manager._clear_blend_log()
+    as_arrays_converged = manager._blend_as_arrays(to_blend, 20)
+    as_arrays_log = manager._blend_log
+
+    assert as_arrays_converged == by_move_converged
+    assert [len(moves) for moves in as_arrays_log] == [
+        len(moves) for moves in by_move_log
+    ]
+    for as_arrays_moves, by_move_moves in zip(as_arrays_log, by_move_log):
+        for as_arrays_move, by_move_move in zip(as_arrays_moves, by_move_moves):
+            assert as_arrays_move.unit_vector == by_move_move.unit_vector
+            assert as_arrays_move.nonzero_blocks == by_move_move.nonzero_blocks
+            for as_arrays_block, by_move_block in zip(
+                as_arrays_move.blocks, by_move_move.blocks
+            ):
+                assert np.allclose(
+                    [
+                        as_arrays_block.distance,
+                        as_arrays_block.initial_speed,
+                        as_arrays_block.acceleration,
+                        as_arrays_block.final_speed,
+                        as_arrays_block.time,
+                    ],
+                    [
+                        by_move_block.distance,
+                        by_move_block.initial_speed,
+                        by_move_block.acceleration,
+                        by_move_block.final_speed,
+                        by_move_block.time,
+                    ],
+                    rtol=1e-9,
+                    atol=1e-9,
+                )
@@ -0,0 +1,79 @@
+"""Tests for the sensor sample buffer."""
+from typing import List
+
+import numpy as np
+import pytest
+
+from opentrons_hardware.firmware_bindings.constants import SensorType
+from opentrons_hardware.sensors.sample_buffer import SensorSampleBuffer
+from opentrons_hardware.sensors.types import SensorDataType
+
+
+def test_append_and_export() -> None:
+    """It should keep readings in order, and export views of them."""
+    subject = SensorSampleBuffer(capacity=4)
+    subject.append(1.0, 65536)
+    subject.append(2.0, -32768)
+
+    timestamps, values = subject.as_arrays()
+    assert timestamps.tolist() == [1.0, 2.0]
+    assert values.tolist() == [65536, -32768]
+    assert np.shares_memory(values, subject.as_arrays()[1])
+    assert subject.as_floats().tolist() == [1.0, -0.5]
+    assert subject.as_sensor_data(SensorType.pressure) == [
+        SensorDataType.build(65536, SensorType.pressure),
+        SensorDataType.build(-32768, SensorType.pressure),
+    ]
+
+
+def test_overwrites_oldest() -> None:
+    """It should keep only the most recent readings once it's full."""
+    subject = SensorSampleBuffer(capacity=4)
+    for i in range(6):
+        subject.append(float(i), i)
+
+    timestamps, values = subject.as_arrays()
+    assert len(subject) == 4
+    assert subject.dropped == 2
+    assert timestamps.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert values.tolist() == [2, 3, 4, 5]
+
+    subject.append(6.0, 6)
+    assert subject.as_arrays()[1].tolist() == [3, 4, 5, 6]
+
+
+@pytest.mark.parametrize(
+    ["already_held", "count", "expected", "dropped"],
+    [
+        (0, 3, [100, 101, 102], 0),
+        (2, 3, [0, 1, 100, 101, 102], 0),
+        (4, 3, [2, 3, 100, 101, 102], 2),
+        (1, 7, [102, 103, 104, 105, 106], 3),
+    ],
+)
+def test_extend(
+    already_held: int, count: int, expected: List[int], dropped: int
+) -> None:
+    """It should add a batch of readings, wrapping around if it has to."""
+    subject = SensorSampleBuffer(capacity=5)
+    for i in range(already_held):
+        subject.append(0.0, i)
+
+    subject.extend(1.0, np.arange(100, 100 + count, dtype=np.int64))
+
+    timestamps, values = subject.as_arrays()
+    assert values.tolist() == expected
+    assert timestamps.tolist()[-min(count, 5) :] == [1.0] * min(count, 5)
+    assert subject.dropped == dropped
+
+
+def test_clear() -> None:
+    """It should forget its readings."""
+    subject = SensorSampleBuffer(capacity=2)
+    for i in range(3):
+        subject.append(float(i), i)
+    subject.clear()
+
+    assert len(subject) == 0
+    assert subject.dropped == 0
+    assert subject.as_arrays()[1].tolist() == []
@@ -28,6 +28,7 @@ from opentrons_hardware.firmware_bindings.messages.message_definitions import (
     SetSensorThresholdRequest,
     WriteToSensorRequest,
     ReadFromSensorResponse,
+    BatchReadFromSensorResponse,
     SensorThresholdResponse,
     BindSensorOutputRequest,
     PeripheralStatusRequest,
@@ -39,12 +40,14 @@ from opentrons_hardware.firmware_bindings.messages.payloads import (
     ReadFromSensorRequestPayload,
     WriteToSensorRequestPayload,
     ReadFromSensorResponsePayload,
+    BatchReadFromSensorResponsePayload,
     SensorThresholdResponsePayload,
     BindSensorOutputRequestPayload,
     PeripheralStatusResponsePayload,
     BaselineSensorResponsePayload,
 )
 from opentrons_hardware.firmware_bindings.messages.fields import (
+    BatchSensorDataField,
     SensorTypeField,
     SensorIdField,
     SensorOutputBindingField,
@@ -57,7 +60,7 @@ from opentrons_hardware.sensors.sensor_types import (
     BaseSensorType,
     ThresholdSensorType,
 )
-from opentrons_hardware.sensors.sensor_driver import SensorDriver
+from opentrons_hardware.sensors.sensor_driver import SensorDriver, LogListener
 from opentrons_hardware.firmware_bindings.constants import SensorOutputBinding
 
 
@@ -692,3 +695,48 @@ async def test_peripheral_status(
     mock_messenger.send.side_effect = responder
     status = await sensor_driver.get_device_status(mock_messenger, sensor_type, timeout)
     assert status
+
+
+def test_log_listener_captures_readings(pressure_sensor: PressureSensor) -> None:
+    """It should capture readings from its own sensor into its sample buffer."""
+    subject = LogListener(mock.Mock(spec=CanMessenger), pressure_sensor, log_every=0)
+    arbitration_id = ArbitrationId(
+        parts=ArbitrationIdParts(
+            message_id=ReadFromSensorResponse.message_id,
+            node_id=NodeId.host,
+            function_code=0,
+            originating_node_id=NodeId.pipette_left,
+        )
+    )
+
+    for sensor_id, value in [(SensorId.S0, 65536), (SensorId.S1, 1)]:
+        subject(
+            ReadFromSensorResponse(
+                payload=ReadFromSensorResponsePayload(
+                    sensor=SensorTypeField(SensorType.pressure),
+                    sensor_id=SensorIdField(sensor_id),
+                    sensor_data=Int32Field(value),
+                )
+            ),
+            arbitration_id,
+        )
+    batch = [32768, 131072]
+    subject(
+        BatchReadFromSensorResponse(
+            payload=BatchReadFromSensorResponsePayload(
+                sensor=SensorTypeField(SensorType.pressure),
+                sensor_id=SensorIdField(SensorId.S0),
+                data_length=UInt8Field(len(batch)),
+                sensor_data=BatchSensorDataField(
+                    b"".join(v.to_bytes(4, "little") for v in batch).ljust(56, b"\0")
+                ),
+            )
+        ),
+        arbitration_id,
+    )
+
+    assert subject.samples.as_floats().tolist() == [1.0, 0.5, 2.0]
+    assert subject.get_data() == [
+        SensorDataType.build(v, SensorType.pressure) for v in [65536, 32768, 131072]
+    ]
+    assert subject.get_data() is None
@@ -0,0 +1,149 @@
+"""Benchmark for persisting a long run's commands with RunStore.
+
+Builds a synthetic run with many completed commands and measures how long
+the blocking `RunStore.update_run_state()` call takes to finalize it:
+
+* row-by-row: one INSERT round trip per command, as finalization used to work.
+* bulk: the current `update_run_state()`, which inserts with executemany().
+* incremental: the run's commands are appended in batches with
+  `append_commands()` while it "runs", so finalization only writes the summary.
+
+Usage:
+    python benchmarks/run_store_commands.py [--commands N]
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+import sqlalchemy
+
+from opentrons.protocol_engine import StateSummary, EngineStatus
+from opentrons.protocol_engine import commands as pe_commands
+
+from robot_server.persistence.database import sql_engine_ctx
+from robot_server.persistence.pydantic import pydantic_to_json
+from robot_server.persistence.tables import metadata, run_command_table
+from robot_server.runs.run_store import RunStore
+
+
+_APPEND_BATCH_SIZE = 500
+
+
+def _build_commands(count: int) -> List[pe_commands.Command]:
+    created_at = datetime(year=2024, month=1, day=1, tzinfo=timezone.utc)
+    return [
+        pe_commands.Comment(
+            id=f"command-{i}",
+            key=f"command-key-{i}",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=created_at,
+            startedAt=created_at,
+            completedAt=created_at,
+            params=pe_commands.CommentParams(message=f"step {i}"),
+            result=pe_commands.CommentResult(),
+            intent=pe_commands.CommandIntent.PROTOCOL,
+        )
+        for i in range(count)
+    ]
+
+
+def _build_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        labwareOffsets=[],
+        pipettes=[],
+        modules=[],
+        liquids=[],
+        wells=[],
+        files=[],
+        hasEverEnteredErrorRecovery=False,
+    )
+
+
+def _insert_row_by_row(
+    sql_engine: sqlalchemy.engine.Engine,
+    run_id: str,
+    commands: List[pe_commands.Command],
+) -> None:
+    insert_command = sqlalchemy.insert(run_command_table)
+    with sql_engine.begin() as transaction:
+        transaction.execute(
+            sqlalchemy.delete(run_command_table).where(
+                run_command_table.c.run_id == run_id
+            )
+        )
+        for index, command in enumerate(commands):
+            transaction.execute(
+                insert_command,
+                {
+                    "run_id": run_id,
+                    "index_in_run": index,
+                    "command_id": command.id,
+                    "command": pydantic_to_json(command),
+                    "command_intent": "protocol",
+                },
+            )
+
+
+def main() -> None:
+    """Run the benchmark and print how long finalizing the run took."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commands", type=int, default=50_000)
+    args = parser.parse_args()
+
+    commands = _build_commands(args.commands)
+    summary = _build_summary()
+    created_at = datetime.now(tz=timezone.utc)
+
+    with tempfile.TemporaryDirectory() as tmp_dir, sql_engine_ctx(
+        Path(tmp_dir) / "robot_server.db"
+    ) as sql_engine:
+        metadata.create_all(sql_engine)
+        subject = RunStore(sql_engine=sql_engine)
+
+        subject.insert(run_id="row-by-row", created_at=created_at, protocol_id=None)
+        start = time.perf_counter()
+        _insert_row_by_row(sql_engine, "row-by-row", commands)
+        row_by_row = time.perf_counter() - start
+
+        subject.insert(run_id="bulk", created_at=created_at, protocol_id=None)
+        start = time.perf_counter()
+        subject.update_run_state(
+            run_id="bulk", summary=summary, commands=commands, run_time_parameters=[]
+        )
+        bulk = time.perf_counter() - start
+
+        subject.insert(run_id="incremental", created_at=created_at, protocol_id=None)
+        longest_append = 0.0
+        for batch_start in range(0, len(commands), _APPEND_BATCH_SIZE):
+            start = time.perf_counter()
+            subject.append_commands(
+                run_id="incremental",
+                commands=commands[batch_start : batch_start + _APPEND_BATCH_SIZE],
+            )
+            longest_append = max(longest_append, time.perf_counter() - start)
+        start = time.perf_counter()
+        subject.update_run_state(
+            run_id="incremental",
+            summary=summary,
+            commands=commands,
+            run_time_parameters=[],
+        )
+        incremental = time.perf_counter() - start
+
+    print(f"{args.commands} commands")
+    print(f"row-by-row finalize:  {row_by_row:8.3f} s")
+    print(f"bulk finalize:        {bulk:8.3f} s")
+    print(
+        f"incremental finalize: {incremental:8.3f} s"
+        f" (longest {_APPEND_BATCH_SIZE}-command append: {longest_append:.3f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -81,7 +81,13 @@ async def _lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         exit_stack.push_async_callback(clean_up_persistence, app.state)
 
-        exit_stack.enter_context(set_up_notification_client(app.state))
+        exit_stack.enter_context(
+            set_up_notification_client(
+                app.state,
+                coalesce_window=settings.notification_coalesce_window,
+                min_publish_interval=settings.notification_min_publish_interval,
+            )
+        )
         initialize_pe_publisher_notifier(app.state)
 
         yield  # Start handling HTTP requests.
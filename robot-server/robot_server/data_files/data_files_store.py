@@ -14,8 +14,8 @@ from robot_server.persistence.tables import (
     data_files_table,
     analysis_csv_rtp_table,
     run_csv_rtp_table,
+    DataFileSourceSQLEnum,
 )
-from robot_server.persistence.tables.schema_7 import DataFileSourceSQLEnum
 
 from .models import DataFileSource, FileIdNotFoundError, FileInUseError
 
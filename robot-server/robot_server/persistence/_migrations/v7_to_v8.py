@@ -0,0 +1,108 @@
+"""Migrate the persistence directory from schema 7 to 8.
+
+Summary of changes from schema 7:
+
+- Adds a new non_fixit_index_in_run column to the commands table, and an index on it,
+  so clients can page through a run's commands without its fixit commands.
+"""
+
+from pathlib import Path
+from contextlib import ExitStack
+import shutil
+
+import sqlalchemy
+
+from ..database import sql_engine_ctx
+from ..tables import schema_8
+from .._folder_migrator import Migration
+
+from ..file_and_directory_names import (
+    DB_FILE,
+)
+
+
+class Migration7to8(Migration):  # noqa: D101
+    def migrate(self, source_dir: Path, dest_dir: Path) -> None:
+        """Migrate the persistence directory from schema 7 to 8."""
+        # Copy over all existing directories and files to new version
+        for item in source_dir.iterdir():
+            if item.is_dir():
+                shutil.copytree(src=item, dst=dest_dir / item.name)
+            else:
+                shutil.copy(src=item, dst=dest_dir / item.name)
+
+        dest_db_file = dest_dir / DB_FILE
+
+        # Append the new column to existing commands in v7 database
+        with ExitStack() as exit_stack:
+            dest_engine = exit_stack.enter_context(sql_engine_ctx(dest_db_file))
+
+            schema_8.metadata.create_all(dest_engine)
+
+            dest_transaction = exit_stack.enter_context(dest_engine.begin())
+
+            new_column = schema_8.run_command_table.c.non_fixit_index_in_run
+            column_type = new_column.type.compile(dest_engine.dialect)
+            dest_transaction.execute(
+                f"ALTER TABLE {schema_8.run_command_table.name}"
+                f" ADD COLUMN {new_column.key} {column_type}"
+            )
+
+            _migrate_command_table_with_new_non_fixit_index_col(
+                dest_transaction=dest_transaction
+            )
+
+            # create_all() skips indexes of tables that already exist.
+            for index in schema_8.run_command_table.indexes:
+                if index.name == "ix_run_run_id_non_fixit_index_in_run":
+                    index.create(dest_transaction)
+
+
+def _migrate_command_table_with_new_non_fixit_index_col(
+    dest_transaction: sqlalchemy.engine.Connection,
+) -> None:
+    """Number each run's non-fixit commands in the new 'non_fixit_index_in_run' column."""
+    select_commands = (
+        sqlalchemy.select(
+            schema_8.run_command_table.c.row_id,
+            schema_8.run_command_table.c.run_id,
+        )
+        .where(
+            sqlalchemy.or_(
+                schema_8.run_command_table.c.command_intent.is_(None),
+                schema_8.run_command_table.c.command_intent != "fixit",
+            )
+        )
+        .order_by(
+            schema_8.run_command_table.c.run_id,
+            schema_8.run_command_table.c.index_in_run,
+        )
+    )
+
+    new_values = []
+    run_id = None
+    non_fixit_index_in_run = 0
+    for row in dest_transaction.execute(select_commands).all():
+        if row.run_id != run_id:
+            run_id = row.run_id
+            non_fixit_index_in_run = 0
+        new_values.append(
+            {
+                "target_row_id": row.row_id,
+                "non_fixit_index_in_run": non_fixit_index_in_run,
+            }
+        )
+        non_fixit_index_in_run += 1
+
+    if new_values:
+        dest_transaction.execute(
+            sqlalchemy.update(schema_8.run_command_table)
+            .where(
+                schema_8.run_command_table.c.row_id
+                == sqlalchemy.bindparam("target_row_id")
+            )
+            .values(
+                non_fixit_index_in_run=sqlalchemy.bindparam("non_fixit_index_in_run")
+            ),
+            new_values,
+        )
@@ -1,7 +1,7 @@
 """SQL database schemas."""
 
 # Re-export the latest schema.
-from .schema_7 import (
+from .schema_8 import (
     metadata,
     protocol_table,
     analysis_table,
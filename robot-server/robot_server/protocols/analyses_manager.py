@@ -13,6 +13,7 @@ from robot_server.protocols.analysis_models import (
     AnalysisStatus,
     AnalysisSummary,
 )
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols import protocol_analyzer
 from robot_server.protocols.protocol_store import ProtocolResource
@@ -31,9 +32,23 @@ class FailedToInitializeAnalyzer(Exception):
 class AnalysesManager:
     """A Collaborator that manages and provides an interface to Protocol Analyzers."""
 
-    def __init__(self, analysis_store: AnalysisStore, task_runner: TaskRunner) -> None:
+    def __init__(
+        self,
+        analysis_store: AnalysisStore,
+        task_runner: TaskRunner,
+        analysis_executor: Optional[AnalysisExecutor] = None,
+    ) -> None:
+        """Initialize the manager.
+
+        Params:
+            analysis_store: Where to store analyses.
+            task_runner: What to run analyses in the background with.
+            analysis_executor: The worker processes to simulate protocols in.
+                If `None`, protocols are simulated in this process.
+        """
         self._analysis_store = analysis_store
         self._task_runner = task_runner
+        self._analysis_executor = analysis_executor
 
     async def initialize_analyzer(
         self,
@@ -86,17 +101,48 @@ class AnalysesManager:
         analysis_id: str,
         analyzer: protocol_analyzer.ProtocolAnalyzer,
     ) -> AnalysisSummary:
-        """Start an analysis of the given protocol resource with verified run time parameters."""
+        """Start an analysis of the given protocol resource with verified run time parameters.
+
+        If the analysis store has already analyzed the same protocol content with
+        the same parameters, under any protocol ID, that analysis is reused and
+        the returned summary is already completed.
+        """
         run_time_parameters = analyzer.get_verified_run_time_parameters()
-        self._analysis_store.add_pending(
-            protocol_id=analyzer.protocol_resource.protocol_id,
-            analysis_id=analysis_id,
+        protocol_id = analyzer.protocol_resource.protocol_id
+        cache_key = self._analysis_store.get_cache_key(
+            protocol_source=analyzer.protocol_resource.source,
             run_time_parameters=run_time_parameters,
+            run_time_param_paths=analyzer.run_time_param_paths,
         )
-        self._task_runner.run(
-            analyzer.analyze,
+        if await self._analysis_store.add_from_cache(
+            protocol_id=protocol_id,
             analysis_id=analysis_id,
+            cache_key=cache_key,
+            run_time_parameters=run_time_parameters,
+        ):
+            return AnalysisSummary(
+                id=analysis_id,
+                status=AnalysisStatus.COMPLETED,
+                runTimeParameters=run_time_parameters,
+            )
+
+        self._analysis_store.add_pending(
+            protocol_id=protocol_id,
+            analysis_id=analysis_id,
+            run_time_parameters=run_time_parameters,
+            cache_key=cache_key,
         )
+        if self._analysis_executor is None:
+            self._task_runner.run(
+                analyzer.analyze,
+                analysis_id=analysis_id,
+            )
+        else:
+            self._task_runner.run(
+                analyzer.analyze_in_worker,
+                analysis_id=analysis_id,
+                executor=self._analysis_executor,
+            )
         return AnalysisSummary(
             id=analysis_id,
             status=AnalysisStatus.PENDING,
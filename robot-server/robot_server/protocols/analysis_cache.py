@@ -0,0 +1,217 @@
+"""A content-addressed cache of completed protocol analyses."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import List, Optional
+
+import anyio
+
+from opentrons.protocol_engine.types import (
+    CSVParameter,
+    CSVRuntimeParamPaths,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import ProtocolSource
+
+from robot_server.persistence.pydantic import json_to_pydantic, pydantic_to_json
+
+from .analysis_models import AnalysisResult, CompletedAnalysis
+
+_log = getLogger(__name__)
+
+_ENTRY_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class AnalysisCacheStats:
+    """How well an `AnalysisCache` has been doing since it was created."""
+
+    hits: int
+    misses: int
+    entries: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that found a cached analysis."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class AnalysisCache:
+    """A persistent cache of completed analyses, keyed by what went into them.
+
+    An analysis is determined by the protocol's files (including any custom
+    labware), the run-time parameter values and CSV files that it was analyzed
+    with, and the version of the analyzer. `AnalysisStore` keeps analyses per
+    protocol ID, so re-uploading a protocol that was deleted, or uploading the
+    same protocol under a new ID, would otherwise analyze it all over again.
+    This cache finds the earlier result by content instead.
+
+    Each entry is a JSON file named by its key. Entries don't belong to any
+    protocol, so they outlive protocol deletion. Once there are more than
+    `max_entries`, the least recently used ones are removed.
+    """
+
+    def __init__(
+        self, directory: Path, analyzer_version: str, max_entries: int
+    ) -> None:
+        """Initialize the cache, creating its directory if needed.
+
+        Params:
+            directory: Where to keep cached analyses.
+            analyzer_version: Mixed into every key, so that changing the
+                analyzer version invalidates everything analyzed before.
+            max_entries: How many analyses to keep.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self._directory = directory
+        self._analyzer_version = analyzer_version
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> AnalysisCacheStats:
+        """Hit and miss counts since the cache was created."""
+        return AnalysisCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._entry_paths()),
+        )
+
+    def get_key(
+        self,
+        protocol_source: ProtocolSource,
+        run_time_parameters: List[RunTimeParameter],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> str:
+        """Return the key for analyzing a protocol with the given parameters.
+
+        Params:
+            protocol_source: The protocol. Its content hash covers every one of
+                its files, including custom labware definitions.
+            run_time_parameters: The verified run-time parameters, with
+                defaults filled in.
+            run_time_param_paths: The files for CSV parameters. These are keyed
+                by their contents rather than by their file IDs.
+        """
+        primitive_values = sorted(
+            (param.variableName, param.value)
+            for param in run_time_parameters
+            if not isinstance(param, CSVParameter)
+        )
+        csv_file_hashes = sorted(
+            (variable_name, hashlib.sha256(path.read_bytes()).hexdigest())
+            for variable_name, path in (run_time_param_paths or {}).items()
+        )
+        key_material = json.dumps(
+            {
+                "analyzerVersion": self._analyzer_version,
+                "robotType": protocol_source.robot_type,
+                "contentHash": protocol_source.content_hash,
+                "runTimeParameterValues": primitive_values,
+                "csvFileHashes": csv_file_hashes,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[CompletedAnalysis]:
+        """Return the cached analysis for the given key, if there is one."""
+        path = self._entry_path(key)
+
+        def read_and_parse() -> Optional[CompletedAnalysis]:
+            try:
+                serialized = path.read_text(encoding="utf-8")
+                # Mark the entry as recently used so it's evicted last.
+                os.utime(path)
+            except FileNotFoundError:
+                return None
+            return json_to_pydantic(CompletedAnalysis, serialized)
+
+        try:
+            analysis = await anyio.to_thread.run_sync(read_and_parse, cancellable=True)
+        except Exception:
+            _log.exception(f"Discarding unreadable cached analysis {key}.")
+            path.unlink(missing_ok=True)
+            analysis = None
+
+        if analysis is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        lookups = self._hits + self._misses
+        _log.info(
+            f"Analysis cache {'miss' if analysis is None else 'hit'} for {key};"
+            f" {self._hits} hits over {lookups} lookups."
+        )
+        return analysis
+
+    async def add(self, key: str, analysis: CompletedAnalysis) -> None:
+        """Cache a completed analysis, evicting the least recently used ones.
+
+        Only analyses that came out `OK` are cached. Failures are cheap to
+        reproduce, and might have been caused by something other than the
+        protocol's content.
+
+        The cache is best-effort: if the entry can't be written, the error is
+        logged rather than raised.
+        """
+        if analysis.result != AnalysisResult.OK:
+            return
+
+        path = self._entry_path(key)
+
+        def serialize_and_write() -> None:
+            # Write a uniquely named temporary file and rename it into place, so
+            # that readers never see a partially written entry, and concurrent
+            # writers of the same key don't trip over each other.
+            temporary_file = tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self._directory,
+                suffix=".tmp",
+                delete=False,
+            )
+            temporary_path = Path(temporary_file.name)
+            try:
+                with temporary_file:
+                    temporary_file.write(pydantic_to_json(analysis))
+                temporary_path.replace(path)
+            except BaseException:
+                temporary_path.unlink(missing_ok=True)
+                raise
+            self._evict()
+
+        try:
+            await anyio.to_thread.run_sync(serialize_and_write, cancellable=True)
+        except Exception:
+            _log.exception(f"Failed to cache analysis {key}.")
+
+    def _evict(self) -> None:
+        entry_paths = self._entry_paths()
+        excess = len(entry_paths) - self._max_entries
+        if excess <= 0:
+            return
+        entry_paths.sort(key=_mtime)
+        for entry_path in entry_paths[:excess]:
+            entry_path.unlink(missing_ok=True)
+
+    def _entry_paths(self) -> List[Path]:
+        return list(self._directory.glob(f"*{_ENTRY_SUFFIX}"))
+
+    def _entry_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_ENTRY_SUFFIX}"
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
@@ -0,0 +1,333 @@
+"""Run protocol analyses in worker processes, away from the server's event loop."""
+import asyncio
+import logging
+import multiprocessing
+import resource
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from typing import Dict, List, Optional, Set
+
+from opentrons.protocol_engine import (
+    Command,
+    ErrorOccurrence,
+    LoadedLabware,
+    LoadedModule,
+    LoadedPipette,
+    Liquid,
+)
+from opentrons.protocol_engine.types import (
+    CSVRuntimeParamPaths,
+    PrimitiveRunTimeParamValuesType,
+    RunTimeParameter,
+)
+from opentrons.protocol_reader import ProtocolSource
+import opentrons.protocol_runner.create_simulating_orchestrator as simulating_runner
+from opentrons.protocol_runner import RunOrchestrator
+from opentrons.protocol_runner.run_orchestrator import ParseMode
+import opentrons.util.helpers as datetime_helper
+
+import robot_server.errors.error_mappers as em
+
+log = logging.getLogger(__name__)
+
+
+class AnalysisCancelledError(Exception):
+    """Error recorded when an analysis is cancelled before it finishes."""
+
+    def __init__(self) -> None:
+        """Initialize the error's message."""
+        super().__init__("Analysis was cancelled.")
+
+
+class AnalysisTimeBudgetExceededError(Exception):
+    """Error recorded when an analysis runs for longer than it's allowed to."""
+
+    def __init__(self, time_budget: float) -> None:
+        """Initialize the error's message."""
+        super().__init__(
+            f"Analysis did not finish within its time budget of {time_budget} seconds."
+        )
+
+
+class AnalysisWorkerDiedError(Exception):
+    """Error recorded when a worker process exits without sending a result."""
+
+    def __init__(self, exit_code: Optional[int]) -> None:
+        """Initialize the error's message."""
+        super().__init__(
+            f"Analysis worker process exited unexpectedly with code {exit_code}."
+            " It may have run out of memory."
+        )
+
+
+@dataclass(frozen=True)
+class AnalysisOutcome:
+    """The results of simulating a protocol, ready to store as a completed analysis.
+
+    See `AnalysisStore.update()` for what each field means.
+    """
+
+    run_time_parameters: List[RunTimeParameter]
+    commands: List[Command]
+    labware: List[LoadedLabware]
+    modules: List[LoadedModule]
+    pipettes: List[LoadedPipette]
+    errors: List[ErrorOccurrence]
+    liquids: List[Liquid]
+
+    @classmethod
+    def from_error(
+        cls, error: BaseException, run_time_parameters: List[RunTimeParameter]
+    ) -> "AnalysisOutcome":
+        """Get the outcome of an analysis that failed with the given error."""
+        return cls(
+            run_time_parameters=run_time_parameters,
+            commands=[],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[
+                ErrorOccurrence.from_failed(
+                    id="internal-error",
+                    createdAt=datetime_helper.utc_now(),
+                    error=em.map_unexpected_error(error=error),
+                )
+            ],
+            liquids=[],
+        )
+
+
+async def _simulate(
+    protocol_source: ProtocolSource,
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: Optional[CSVRuntimeParamPaths],
+) -> AnalysisOutcome:
+    orchestrator: Optional[RunOrchestrator] = None
+    try:
+        orchestrator = await simulating_runner.create_simulating_orchestrator(
+            robot_type=protocol_source.robot_type,
+            protocol_config=protocol_source.config,
+        )
+        await orchestrator.load(
+            protocol_source=protocol_source,
+            parse_mode=ParseMode.NORMAL,
+            run_time_param_values=run_time_param_values,
+            run_time_param_paths=run_time_param_paths,
+        )
+        result = await orchestrator.run(deck_configuration=[])
+    except BaseException as error:
+        return AnalysisOutcome.from_error(
+            error=error,
+            run_time_parameters=(
+                orchestrator.get_run_time_parameters()
+                if orchestrator is not None
+                else []
+            ),
+        )
+    return AnalysisOutcome(
+        run_time_parameters=result.parameters,
+        commands=result.commands,
+        labware=result.state_summary.labware,
+        modules=result.state_summary.modules,
+        pipettes=result.state_summary.pipettes,
+        errors=result.state_summary.errors,
+        liquids=result.state_summary.liquids,
+    )
+
+
+def _run_worker(
+    connection: Connection,
+    protocol_source: ProtocolSource,
+    run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+    run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    memory_budget: Optional[int],
+) -> None:
+    """Simulate a protocol and send its `AnalysisOutcome` over `connection`.
+
+    This is the entry point of a worker process.
+    """
+    if memory_budget is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_budget, memory_budget))
+
+    async def simulate_and_send() -> None:
+        outcome = await _simulate(
+            protocol_source=protocol_source,
+            run_time_param_values=run_time_param_values,
+            run_time_param_paths=run_time_param_paths,
+        )
+        # Send as soon as possible. The server doesn't need to wait for the
+        # simulation to be torn down, and kills the worker once it has this.
+        connection.send(outcome)
+        connection.close()
+
+    asyncio.run(simulate_and_send())
+
+
+def _receive(connection: Connection) -> AnalysisOutcome:
+    # This owns the connection, so that closing it can't race with receiving.
+    with connection:
+        outcome: AnalysisOutcome = connection.recv()
+    return outcome
+
+
+def _get_context() -> BaseContext:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Importing this module imports the protocol runner, so every worker is
+        # forked with it already imported instead of importing it again.
+        context.set_forkserver_preload([__name__])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class AnalysisExecutor:
+    """Run protocol analyses in a bounded number of worker processes.
+
+    Simulating a long Python protocol would otherwise hold the GIL and the event
+    loop away from HTTP requests, notifications and live runs. Each analysis runs
+    in a fresh worker process, so a worker that's cancelled, runs over its time
+    budget, or runs out of memory can be killed without affecting the server or
+    other analyses. Analyses beyond `max_workers` wait for a worker in the order
+    they were started.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        time_budget: Optional[float] = None,
+        memory_budget: Optional[int] = None,
+    ) -> None:
+        """Initialize the executor.
+
+        Params:
+            max_workers: How many analyses may run at the same time.
+            time_budget: How long, in seconds, an analysis may run for once it has
+                a worker, or `None` for no limit.
+            memory_budget: How much address space, in bytes, each worker process
+                may use, or `None` for no limit.
+        """
+        self._time_budget = time_budget
+        self._memory_budget = memory_budget
+        self._worker_slots = asyncio.Semaphore(max_workers)
+        self._context = _get_context()
+        self._queued: Set[str] = set()
+        self._running: Set[str] = set()
+        self._tasks: Dict[str, "asyncio.Task[object]"] = {}
+        self._cancelled: Set[str] = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """How many analyses are waiting for a worker process."""
+        return len(self._queued)
+
+    @property
+    def running_count(self) -> int:
+        """How many analyses are running in worker processes."""
+        return len(self._running)
+
+    def cancel(self, analysis_id: str) -> None:
+        """Cancel an analysis, whether it's waiting for a worker or running in one.
+
+        Its `analyze()` call will return an outcome with an `AnalysisCancelledError`.
+        Does nothing if the analysis isn't in this executor.
+        """
+        task = self._tasks.get(analysis_id)
+        if task is not None:
+            self._cancelled.add(analysis_id)
+            task.cancel()
+
+    async def analyze(
+        self,
+        analysis_id: str,
+        protocol_source: ProtocolSource,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> AnalysisOutcome:
+        """Simulate a protocol in a worker process and return the outcome.
+
+        Params:
+            analysis_id: The ID of the analysis, for cancelling it and for logs.
+            protocol_source: The protocol to simulate.
+            run_time_param_values: Run-time parameter values to simulate with.
+            run_time_param_paths: Run-time parameter CSV files to simulate with.
+            run_time_parameters: The verified run-time parameters, to record if
+                the analysis fails before the worker can report them itself.
+
+        Returns:
+            The outcome of the analysis. Failures, including running over budget
+            and being cancelled with `cancel()`, are recorded in its errors.
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        self._tasks[analysis_id] = task
+        self._queued.add(analysis_id)
+        log.info(
+            f'Queued analysis "{analysis_id}".'
+            f" Analyses waiting for a worker: {self.queue_depth}."
+        )
+        try:
+            async with self._worker_slots:
+                self._queued.discard(analysis_id)
+                self._running.add(analysis_id)
+                return await self._analyze_in_worker(
+                    protocol_source=protocol_source,
+                    run_time_param_values=run_time_param_values,
+                    run_time_param_paths=run_time_param_paths,
+                )
+        except asyncio.CancelledError:
+            if analysis_id not in self._cancelled:
+                raise
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            return AnalysisOutcome.from_error(
+                error=AnalysisCancelledError(), run_time_parameters=run_time_parameters
+            )
+        except (AnalysisTimeBudgetExceededError, AnalysisWorkerDiedError) as error:
+            log.warning(f'Analysis "{analysis_id}" failed: {error}')
+            return AnalysisOutcome.from_error(
+                error=error, run_time_parameters=run_time_parameters
+            )
+        finally:
+            self._queued.discard(analysis_id)
+            self._running.discard(analysis_id)
+            self._cancelled.discard(analysis_id)
+            del self._tasks[analysis_id]
+
+    async def _analyze_in_worker(
+        self,
+        protocol_source: ProtocolSource,
+        run_time_param_values: Optional[PrimitiveRunTimeParamValuesType],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> AnalysisOutcome:
+        receiver, sender = self._context.Pipe(duplex=False)
+        worker = self._context.Process(  # type: ignore[attr-defined]
+            target=_run_worker,
+            kwargs={
+                "connection": sender,
+                "protocol_source": protocol_source,
+                "run_time_param_values": run_time_param_values,
+                "run_time_param_paths": run_time_param_paths,
+                "memory_budget": self._memory_budget,
+            },
+            daemon=True,
+        )
+        worker.start()
+        # Only the worker should hold the sending end open, so that receiving
+        # fails instead of waiting forever if the worker dies.
+        sender.close()
+        try:
+            return await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(None, _receive, receiver),
+                timeout=self._time_budget,
+            )
+        except asyncio.TimeoutError:
+            assert self._time_budget is not None
+            raise AnalysisTimeBudgetExceededError(self._time_budget) from None
+        except EOFError:
+            worker.join()
+            raise AnalysisWorkerDiedError(worker.exitcode) from None
+        finally:
+            if worker.is_alive():
+                worker.kill()
+            worker.join()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import sqlalchemy
 from logging import getLogger
+from pathlib import Path
 from typing import Dict, List, Optional
 from typing_extensions import Final
 
@@ -11,6 +12,7 @@ from opentrons_shared_data.errors import ErrorCodes
 from opentrons.protocol_engine.types import (
     RunTimeParameter,
     CSVParameter,
+    CSVRuntimeParamPaths,
 )
 from opentrons.protocol_engine import (
     Command,
@@ -21,6 +23,7 @@ from opentrons.protocol_engine import (
     Liquid,
 )
 from opentrons.protocol_engine.protocol_engine import code_in_error_tree
+from opentrons.protocol_reader import ProtocolSource
 
 from .analysis_models import (
     AnalysisSummary,
@@ -33,6 +36,7 @@ from .analysis_models import (
 
 from .completed_analysis_store import CompletedAnalysisStore, CompletedAnalysisResource
 from .analysis_memcache import MemoryCache
+from .analysis_cache import AnalysisCache
 from .rtp_resources import PrimitiveParameterResource, CSVParameterResource
 
 _log = getLogger(__name__)
@@ -64,6 +68,8 @@ _log = getLogger(__name__)
 _CURRENT_ANALYZER_VERSION: Final = "2"
 # We have a reasonable limit for a memory cache of analyses.
 _CACHE_MAX_SIZE: Final = 32
+# How many analyses to keep in the content-addressed analysis cache on disk.
+_ANALYSIS_CACHE_MAX_ENTRIES: Final = 20
 
 
 class AnalysisNotFoundError(ValueError):
@@ -102,12 +108,17 @@ class AnalysisStore:
 
     Pending analyses don't make sense to persist across reboots,
     so they're only kept in-memory, and lost when the store instance is destroyed.
+
+    If given a directory for it, successful analyses are also kept in an
+    `AnalysisCache`, so that analyzing the same protocol content with the same
+    parameters again can reuse them, even under a different protocol ID.
     """
 
     def __init__(
         self,
         sql_engine: sqlalchemy.engine.Engine,
         completed_store: Optional[CompletedAnalysisStore] = None,
+        analysis_cache_directory: Optional[Path] = None,
     ) -> None:
         """Initialize the `AnalysisStore`."""
         self._pending_store = _PendingAnalysisStore()
@@ -116,12 +127,84 @@ class AnalysisStore:
             memory_cache=MemoryCache(_CACHE_MAX_SIZE, str, CompletedAnalysisResource),
             current_analyzer_version=_CURRENT_ANALYZER_VERSION,
         )
+        self._analysis_cache = (
+            AnalysisCache(
+                directory=analysis_cache_directory,
+                analyzer_version=_CURRENT_ANALYZER_VERSION,
+                max_entries=_ANALYSIS_CACHE_MAX_ENTRIES,
+            )
+            if analysis_cache_directory is not None
+            else None
+        )
+
+    def get_cache_key(
+        self,
+        protocol_source: ProtocolSource,
+        run_time_parameters: List[RunTimeParameter],
+        run_time_param_paths: Optional[CSVRuntimeParamPaths],
+    ) -> Optional[str]:
+        """Return the analysis cache key for analyzing a protocol, if caching is enabled.
+
+        See `AnalysisCache.get_key()`.
+        """
+        if self._analysis_cache is None:
+            return None
+        return self._analysis_cache.get_key(
+            protocol_source=protocol_source,
+            run_time_parameters=run_time_parameters,
+            run_time_param_paths=run_time_param_paths,
+        )
+
+    async def add_from_cache(
+        self,
+        protocol_id: str,
+        analysis_id: str,
+        cache_key: Optional[str],
+        run_time_parameters: List[RunTimeParameter],
+    ) -> bool:
+        """Add a completed analysis copied from the analysis cache, if it has one.
+
+        Args:
+            protocol_id: The protocol to add the analysis to.
+            analysis_id: The ID of the new analysis.
+                Must be unique across *all* protocols, not just this one.
+            cache_key: The key from `get_cache_key()`.
+            run_time_parameters: The verified run-time parameters of this request.
+                These replace the cached analysis's, which may refer to
+                different CSV file IDs with the same contents.
+
+        Returns:
+            Whether a cached analysis was found and added.
+        """
+        if self._analysis_cache is None or cache_key is None:
+            return False
+        cached_analysis = await self._analysis_cache.get(cache_key)
+        if cached_analysis is None:
+            return False
+
+        completed_analysis = cached_analysis.copy(
+            update={"id": analysis_id, "runTimeParameters": run_time_parameters}
+        )
+        await self._completed_store.make_room_and_add(
+            completed_analysis_resource=CompletedAnalysisResource(
+                id=analysis_id,
+                protocol_id=protocol_id,
+                analyzer_version=_CURRENT_ANALYZER_VERSION,
+                completed_analysis=completed_analysis,
+            ),
+            primitive_rtp_resources=self._extract_primitive_run_time_params(
+                completed_analysis
+            ),
+            csv_rtp_resources=self._extract_csv_run_time_params(completed_analysis),
+        )
+        return True
 
     def add_pending(
         self,
         protocol_id: str,
         analysis_id: str,
         run_time_parameters: Optional[List[RunTimeParameter]],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Add a new pending analysis to the store.
 
@@ -131,6 +214,9 @@ class AnalysisStore:
                 a pending analysis.
             analysis_id: The ID of the new analysis.
                 Must be unique across *all* protocols, not just this one.
+            run_time_parameters: The verified run-time parameters of the analysis.
+            cache_key: If given, the analysis is added to the analysis cache
+                under this key once it completes successfully.
 
         Returns:
             A summary of the just-added analysis.
@@ -139,6 +225,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analysis_id=analysis_id,
             run_time_parameters=run_time_parameters or [],
+            cache_key=cache_key,
         )
 
     async def update(
@@ -170,6 +257,7 @@ class AnalysisStore:
             robot_type: See `CompletedAnalysis.robotType`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
+        cache_key = self._pending_store.get_cache_key(analysis_id=analysis_id)
 
         # No protocol ID means there was no pending analysis with the given analysis ID.
         assert (
@@ -217,9 +305,11 @@ class AnalysisStore:
             primitive_rtp_resources=primitive_rtp_resources,
             csv_rtp_resources=csv_rtp_resources,
         )
-
         self._pending_store.remove(analysis_id=analysis_id)
 
+        if self._analysis_cache is not None and cache_key is not None:
+            await self._analysis_cache.add(cache_key, completed_analysis)
+
     async def save_initialization_failed_analysis(
         self,
         protocol_id: str,
@@ -434,12 +524,14 @@ class _PendingAnalysisStore:
         self._analyses_by_id: Dict[str, PendingAnalysis] = {}
         self._analysis_ids_by_protocol_id: Dict[str, str] = {}
         self._protocol_ids_by_analysis_id: Dict[str, str] = {}
+        self._cache_keys_by_analysis_id: Dict[str, str] = {}
 
     def add(
         self,
         protocol_id: str,
         analysis_id: str,
         run_time_parameters: List[RunTimeParameter],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Add a new pending analysis and associate it with the given protocol."""
         assert (
@@ -454,6 +546,8 @@ class _PendingAnalysisStore:
         self._analyses_by_id[analysis_id] = new_pending_analysis
         self._analysis_ids_by_protocol_id[protocol_id] = analysis_id
         self._protocol_ids_by_analysis_id[analysis_id] = protocol_id
+        if cache_key is not None:
+            self._cache_keys_by_analysis_id[analysis_id] = cache_key
 
     def remove(self, analysis_id: str) -> None:
         """Remove the pending analysis with the given ID.
@@ -465,6 +559,7 @@ class _PendingAnalysisStore:
         del self._analyses_by_id[analysis_id]
         del self._analysis_ids_by_protocol_id[protocol_id]
         del self._protocol_ids_by_analysis_id[analysis_id]
+        self._cache_keys_by_analysis_id.pop(analysis_id, None)
 
     def get(self, analysis_id: str) -> Optional[PendingAnalysis]:
         return self._analyses_by_id.get(analysis_id, None)
@@ -481,6 +576,10 @@ class _PendingAnalysisStore:
         """Return the ID of the protocol that's associated with the given analysis."""
         return self._protocol_ids_by_analysis_id.get(analysis_id, None)
 
+    def get_cache_key(self, analysis_id: str) -> Optional[str]:
+        """Return the analysis cache key that the given analysis should be added under."""
+        return self._cache_keys_by_analysis_id.get(analysis_id, None)
+
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
@@ -23,9 +23,13 @@ from robot_server.persistence.fastapi_dependencies import (
     get_sql_engine,
     get_active_persistence_directory,
 )
-from robot_server.persistence.file_and_directory_names import PROTOCOLS_DIRECTORY
+from robot_server.persistence.file_and_directory_names import (
+    ANALYSIS_CACHE_DIRECTORY,
+    PROTOCOLS_DIRECTORY,
+)
 from robot_server.settings import get_settings
 from .analyses_manager import AnalysesManager
+from .analysis_executor import AnalysisExecutor
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
@@ -97,12 +101,16 @@ async def get_protocol_store(
 async def get_analysis_store(
     app_state: Annotated[AppState, Depends(get_app_state)],
     sql_engine: Annotated[SQLEngine, Depends(get_sql_engine)],
+    persistence_directory: Annotated[Path, Depends(get_active_persistence_directory)],
 ) -> AnalysisStore:
     """Get a singleton AnalysisStore to keep track of created analyses."""
     analysis_store = _analysis_store_accessor.get_from(app_state)
 
     if analysis_store is None:
-        analysis_store = AnalysisStore(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(
+            sql_engine=sql_engine,
+            analysis_cache_directory=persistence_directory / ANALYSIS_CACHE_DIRECTORY,
+        )
         _analysis_store_accessor.set_on(app_state, analysis_store)
 
     return analysis_store
@@ -117,8 +125,19 @@ async def get_analyses_manager(
     analyses_manager = _analyses_manager_accessor.get_from(app_state)
 
     if analyses_manager is None:
+        settings = get_settings()
         analyses_manager = AnalysesManager(
-            analysis_store=analysis_store, task_runner=task_runner
+            analysis_store=analysis_store,
+            task_runner=task_runner,
+            analysis_executor=(
+                AnalysisExecutor(
+                    max_workers=settings.analysis_worker_processes,
+                    time_budget=settings.analysis_time_budget,
+                    memory_budget=settings.analysis_memory_budget,
+                )
+                if settings.analysis_worker_processes > 0
+                else None
+            ),
         )
         _analyses_manager_accessor.set_on(app_state, analyses_manager)
 
@@ -24,6 +24,7 @@ import robot_server.errors.error_mappers as em
 
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 
 log = logging.getLogger(__name__)
 
@@ -40,12 +41,19 @@ class ProtocolAnalyzer:
         self._analysis_store = analysis_store
         self._protocol_resource = protocol_resource
         self._orchestrator: Optional[RunOrchestrator] = None
+        self._run_time_param_values: Optional[PrimitiveRunTimeParamValuesType] = None
+        self._run_time_param_paths: Optional[CSVRuntimeParamPaths] = None
 
     @property
     def protocol_resource(self) -> ProtocolResource:
         """Return the protocol resource."""
         return self._protocol_resource
 
+    @property
+    def run_time_param_paths(self) -> Optional[CSVRuntimeParamPaths]:
+        """Return the files for CSV parameters that the orchestrator was loaded with."""
+        return self._run_time_param_paths
+
     def get_verified_run_time_parameters(self) -> List[RunTimeParameter]:
         """Get the validated RTPs with values set by the client."""
         assert self._orchestrator is not None
@@ -60,6 +68,8 @@ class ProtocolAnalyzer:
 
         Returns: The RunOrchestrator instance.
         """
+        self._run_time_param_values = run_time_param_values
+        self._run_time_param_paths = run_time_param_paths
         self._orchestrator = await simulating_runner.create_simulating_orchestrator(
             robot_type=self._protocol_resource.source.robot_type,
             protocol_config=self._protocol_resource.source.config,
@@ -109,6 +119,44 @@ class ProtocolAnalyzer:
             liquids=result.state_summary.liquids,
         )
 
+    @TrackingFunctions.track_analysis
+    async def analyze_in_worker(
+        self,
+        analysis_id: str,
+        executor: AnalysisExecutor,
+    ) -> None:
+        """Like `analyze()`, but simulate the protocol in one of executor's worker processes.
+
+        This method should only be called once the run orchestrator is loaded.
+        """
+        assert self._orchestrator is not None
+        run_time_parameters = self._orchestrator.get_run_time_parameters()
+        # The worker loads the protocol again, so this orchestrator was only needed
+        # for its run-time parameters. Stop it so that its queue worker doesn't
+        # outlive the analysis.
+        await self._orchestrator.stop()
+        outcome = await executor.analyze(
+            analysis_id=analysis_id,
+            protocol_source=self._protocol_resource.source,
+            run_time_param_values=self._run_time_param_values,
+            run_time_param_paths=self._run_time_param_paths,
+            run_time_parameters=run_time_parameters,
+        )
+
+        log.info(f'Completed analysis "{analysis_id}".')
+
+        await self._analysis_store.update(
+            analysis_id=analysis_id,
+            robot_type=self._protocol_resource.source.robot_type,
+            run_time_parameters=outcome.run_time_parameters,
+            commands=outcome.commands,
+            labware=outcome.labware,
+            modules=outcome.modules,
+            pipettes=outcome.pipettes,
+            errors=outcome.errors,
+            liquids=outcome.liquids,
+        )
+
     async def update_to_failed_analysis(
         self,
         analysis_id: str,
@@ -145,7 +193,7 @@ class ProtocolAnalyzer:
         or was not required, stop the orchestrator so that all its background tasks
         are stopped timely and do not block server shutdown.
         """
-        if self._orchestrator is not None:
+        if self._orchestrator is not None and not self._orchestrator.run_has_stopped():
             if self._orchestrator.get_is_okay_to_clear():
                 asyncio.run_coroutine_threadsafe(
                     self._orchestrator.stop(), asyncio.get_running_loop()
@@ -9,6 +9,7 @@ from robot_server.errors.error_responses import ErrorDetails, ErrorBody
 from robot_server.service.dependencies import get_current_time, get_unique_id
 from robot_server.service.json_api import RequestModel, SimpleBody, PydanticResponse
 from robot_server.service.task_runner import TaskRunner, get_task_runner
+from robot_server.settings import get_settings
 from robot_server.robot.control.dependencies import require_estop_in_good_state
 from robot_server.deck_configuration.fastapi_dependencies import (
     get_deck_configuration_store,
@@ -82,6 +83,7 @@ async def get_run_controller(
         run_store=run_store,
         runs_publisher=runs_publisher,
         maintenance_runs_publisher=maintenance_runs_publisher,
+        command_persist_interval=get_settings().run_command_persist_interval,
     )
 
 
@@ -1,8 +1,10 @@
 """Router for /runs commands endpoints."""
+import json
 import textwrap
-from typing import Annotated, Final, Literal, Optional, Union
+from typing import Annotated, Final, Iterable, Iterator, List, Literal, Optional, Union
 
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from opentrons.protocol_engine import (
     CommandPointer,
@@ -351,8 +353,7 @@ async def get_run_commands(
 # TODO (spp, 2024-05-01): explore alternatives to returning commands as list of strings.
 #                Options: 1. JSON Lines
 #                         2. Simple de-serialized commands list w/o pydantic model conversion
-@PydanticResponse.wrap_route(
-    commands_router.get,
+@commands_router.get(
     path="/runs/{runId}/commandsAsPreSerializedList",
     summary="Get all commands of a completed run as a list of pre-serialized commands",
     description=(
@@ -365,7 +366,10 @@ async def get_run_commands(
         " This is a faster alternative to fetching the full commands list using"
         " `GET /runs/{runId}/commands`. For large protocols (10k+ commands), the above"
         " endpoint can take minutes to respond, whereas this one should only take a few seconds."
+        " The response is streamed with chunked transfer encoding as it is read from the"
+        " database, so it has no `Content-Length`."
     ),
+    response_model=SimpleMultiBody[str],
     responses={
         status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
         status.HTTP_503_SERVICE_UNAVAILABLE: {
@@ -381,7 +385,7 @@ async def get_run_commands_as_pre_serialized_list(
         description="If `true`, return all commands (protocol, setup, fixit)."
         " If `false`, only return safe commands (protocol, setup).",
     ),
-) -> PydanticResponse[SimpleMultiBody[str]]:
+) -> StreamingResponse:
     """Get all commands of a completed run as a list of pre-serialized (string encoded) commands.
 
     Arguments:
@@ -391,7 +395,7 @@ async def get_run_commands_as_pre_serialized_list(
             " If `false`, only return safe commands.
     """
     try:
-        commands = run_data_manager.get_all_commands_as_preserialized_list(
+        command_chunks = run_data_manager.get_all_commands_as_preserialized_chunks(
             run_id=runId, include_fixit_commands=includeFixitCommands
         )
     except RunNotFoundError as e:
@@ -400,13 +404,37 @@ async def get_run_commands_as_pre_serialized_list(
         raise PreSerializedCommandsNotAvailable.from_exc(e).as_error(
             status.HTTP_503_SERVICE_UNAVAILABLE
         ) from e
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=commands, meta=MultiBodyMeta(cursor=0, totalLength=len(commands))
-        )
+    # Starlette iterates this synchronous generator in a worker thread, so the
+    # database reads don't block the event loop.
+    return StreamingResponse(
+        content=_render_pre_serialized_list_body(command_chunks),
+        media_type="application/json",
     )
 
 
+def _render_pre_serialized_list_body(
+    command_chunks: Iterable[List[str]],
+) -> Iterator[bytes]:
+    """Render a `SimpleMultiBody[str]` of pre-serialized commands, a chunk at a time.
+
+    This produces the same JSON as rendering the whole `SimpleMultiBody`, but
+    only ever holds one chunk of commands in memory. The commands are JSON-encoded
+    as strings without being parsed.
+    """
+    yield b'{"data": ['
+    total_length = 0
+    for chunk in command_chunks:
+        if not chunk:
+            continue
+        separator = ", " if total_length > 0 else ""
+        yield (separator + ", ".join(json.dumps(command) for command in chunk)).encode(
+            "utf-8"
+        )
+        total_length += len(chunk)
+    meta = MultiBodyMeta(cursor=0, totalLength=total_length)
+    yield f'], "meta": {meta.json()}}}'.encode("utf-8")
+
+
 @PydanticResponse.wrap_route(
     commands_router.get,
     path="/runs/{runId}/commands/{commandId}",
@@ -1,4 +1,6 @@
 """Control an active run with Actions."""
+import asyncio
+import contextlib
 import logging
 from datetime import datetime
 from typing import Optional
@@ -18,6 +20,8 @@ from robot_server.service.notifications import RunsPublisher, MaintenanceRunsPub
 
 log = logging.getLogger(__name__)
 
+_COMMAND_PERSIST_BATCH_SIZE = 500
+
 
 class RunActionNotAllowedError(RoboticsInteractionError):
     """Error raised when a given run action is not allowed."""
@@ -34,13 +38,28 @@ class RunController:
         run_store: RunStore,
         runs_publisher: RunsPublisher,
         maintenance_runs_publisher: MaintenanceRunsPublisher,
+        command_persist_interval: Optional[float] = None,
     ) -> None:
+        """Initialize a RunController.
+
+        Args:
+            run_id: The run to control.
+            task_runner: Runs the protocol in the background.
+            run_orchestrator_store: Holds the current run's orchestrator.
+            run_store: Persists run data.
+            runs_publisher: Publishes runs notifications.
+            maintenance_runs_publisher: Publishes maintenance runs notifications.
+            command_persist_interval: If set, how often, in seconds, to append
+                the run's completed commands to the run store while it runs.
+                If `None`, commands are only stored when the run is finalized.
+        """
         self._run_id = run_id
         self._task_runner = task_runner
         self._run_orchestrator_store = run_orchestrator_store
         self._run_store = run_store
         self._runs_publisher = runs_publisher
         self._maintenance_runs_publisher = maintenance_runs_publisher
+        self._command_persist_interval = command_persist_interval
 
     def create_action(
         self,
@@ -126,9 +145,20 @@ class RunController:
     async def _run_protocol_and_insert_result(
         self, deck_configuration: DeckConfigurationType
     ) -> None:
-        result = await self._run_orchestrator_store.run(
-            deck_configuration=deck_configuration,
+        persist_task = (
+            asyncio.create_task(self._persist_completed_commands_periodically())
+            if self._command_persist_interval is not None
+            else None
         )
+        try:
+            result = await self._run_orchestrator_store.run(
+                deck_configuration=deck_configuration,
+            )
+        finally:
+            if persist_task is not None:
+                persist_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await persist_task
         self._run_store.update_run_state(
             run_id=self._run_id,
             summary=result.state_summary,
@@ -136,3 +166,34 @@ class RunController:
             run_time_parameters=result.parameters,
         )
         self._runs_publisher.publish_pre_serialized_commands_notification(self._run_id)
+
+    async def _persist_completed_commands_periodically(self) -> None:
+        """Append the run's completed commands to the run store as the run goes.
+
+        This keeps the final `update_run_state()` from having to write every
+        command of a long run at once.
+        """
+        assert self._command_persist_interval is not None
+        while True:
+            await asyncio.sleep(self._command_persist_interval)
+            try:
+                self._persist_completed_commands()
+            except Exception:
+                log.exception(f'Failed to persist commands of run "{self._run_id}".')
+
+    def _persist_completed_commands(self) -> None:
+        while True:
+            start_index = self._run_store.get_persisted_command_count(self._run_id)
+            command_slice = self._run_orchestrator_store.get_command_slice(
+                cursor=start_index,
+                length=_COMMAND_PERSIST_BATCH_SIZE,
+                include_fixit_commands=True,
+            )
+            if command_slice.cursor != start_index:
+                # The cursor was clamped: there are no commands past start_index yet.
+                return
+            appended = self._run_store.append_commands(
+                run_id=self._run_id, commands=command_slice.commands
+            )
+            if appended < _COMMAND_PERSIST_BATCH_SIZE:
+                return
@@ -1,7 +1,7 @@
 """Manage current and historical run data."""
 
 from datetime import datetime
-from typing import List, Optional, Callable, Union, Mapping
+from typing import Iterator, List, Optional, Callable, Union, Mapping
 
 from opentrons_shared_data.labware.labware_definition import LabwareDefinition
 from opentrons_shared_data.errors.exceptions import InvalidStoredData, EnumeratedError
@@ -241,7 +241,8 @@ class RunDataManager:
         self._runs_publisher.start_publishing_for_run(
             get_current_command=self.get_current_command,
             get_recovery_target_command=self.get_recovery_target_command,
-            get_state_summary=self._get_good_state_summary,
+            get_status=self._get_good_status,
+            get_state_version=self._get_state_version,
             run_id=run_id,
         )
 
@@ -420,7 +421,10 @@ class RunDataManager:
 
         # Let exception propagate
         return self._run_store.get_commands_slice(
-            run_id=run_id, cursor=cursor, length=length, include_fixit_commands=True
+            run_id=run_id,
+            cursor=cursor,
+            length=length,
+            include_fixit_commands=include_fixit_commands,
         )
 
     def get_command_error_slice(
@@ -520,6 +524,24 @@ class RunDataManager:
         self, run_id: str, include_fixit_commands: bool
     ) -> List[str]:
         """Get all commands of a run in a serialized json list."""
+        self._raise_if_pre_serialized_commands_not_available(run_id)
+        return self._run_store.get_all_commands_as_preserialized_list(
+            run_id, include_fixit_commands
+        )
+
+    def get_all_commands_as_preserialized_chunks(
+        self, run_id: str, include_fixit_commands: bool
+    ) -> Iterator[List[str]]:
+        """Get all commands of a run as serialized json strings, in chunks.
+
+        See `RunStore.get_all_commands_as_preserialized_chunks()`.
+        """
+        self._raise_if_pre_serialized_commands_not_available(run_id)
+        return self._run_store.get_all_commands_as_preserialized_chunks(
+            run_id, include_fixit_commands
+        )
+
+    def _raise_if_pre_serialized_commands_not_available(self, run_id: str) -> None:
         if (
             run_id == self._run_orchestrator_store.current_run_id
             and not self._run_orchestrator_store.get_is_run_terminal()
@@ -527,9 +549,6 @@ class RunDataManager:
             raise PreSerializedCommandsNotAvailableError(
                 "Pre-serialized commands are only available after a run has ended."
             )
-        return self._run_store.get_all_commands_as_preserialized_list(
-            run_id, include_fixit_commands
-        )
 
     def set_error_recovery_rules(
         self, run_id: str, rules: List[ErrorRecoveryRule]
@@ -555,9 +574,17 @@ class RunDataManager:
         else:
             return self._run_store.get_state_summary(run_id=run_id)
 
-    def _get_good_state_summary(self, run_id: str) -> Optional[StateSummary]:
-        summary = self._get_state_summary(run_id)
-        return summary if isinstance(summary, StateSummary) else None
+    def _get_good_status(self, run_id: str) -> Optional[EngineStatus]:
+        # The current run's status is a cheap selector, unlike its whole state summary.
+        if run_id == self._run_orchestrator_store.current_run_id:
+            return self._run_orchestrator_store.get_status()
+        summary = self._run_store.get_state_summary(run_id=run_id)
+        return summary.status if isinstance(summary, StateSummary) else None
+
+    def _get_state_version(self, run_id: str) -> Optional[int]:
+        if run_id == self._run_orchestrator_store.current_run_id:
+            return self._run_orchestrator_store.get_state_version()
+        return None
 
     def _get_run_time_parameters(self, run_id: str) -> List[RunTimeParameter]:
         if run_id == self._run_orchestrator_store.current_run_id:
@@ -389,6 +389,10 @@ class RunOrchestratorStore:
         """Get the current execution status of the run."""
         return self.run_orchestrator.get_run_status()
 
+    def get_state_version(self) -> int:
+        """Get a counter that increases every time the run's engine state changes."""
+        return self.run_orchestrator.get_state_version()
+
     def get_is_run_terminal(self) -> bool:
         """Get whether run is in a terminal state."""
         return self.run_orchestrator.get_is_run_terminal()
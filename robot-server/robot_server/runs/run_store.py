@@ -4,15 +4,14 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from functools import lru_cache
-from typing import Dict, List, Optional, Literal, Union
+from typing import Dict, Iterator, List, Optional, Literal, Sequence, Union
 
 import sqlalchemy
-from sqlalchemy import and_
 from pydantic import ValidationError
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice, CommandIntent
-from opentrons.protocol_engine.commands import Command
+from opentrons.protocol_engine.commands import Command, CommandStatus
 from opentrons.protocol_engine.types import RunTimeParameter
 
 from opentrons_shared_data.errors.exceptions import (
@@ -43,6 +42,10 @@ log = logging.getLogger(__name__)
 
 _CACHE_ENTRIES = 32
 
+_PRESERIALIZED_COMMANDS_CHUNK_SIZE = 1000
+
+_COMPLETED_COMMAND_STATUSES = frozenset({CommandStatus.SUCCEEDED, CommandStatus.FAILED})
+
 
 @dataclass(frozen=True)
 class RunResource:
@@ -96,6 +99,17 @@ class CSVParameterRunResource:
     file_id: Optional[str]
 
 
+@dataclass(frozen=True)
+class _CommandCounts:
+    """How many commands of a run there are, with and without its fixit commands."""
+
+    total: int
+    non_fixit: int
+
+
+_NO_COMMANDS = _CommandCounts(total=0, non_fixit=0)
+
+
 class CommandNotFoundError(ValueError):
     """Error raised when a given command ID is not found in the store."""
 
@@ -113,6 +127,14 @@ class RunStore:
     ) -> None:
         """Initialize a RunStore with sql engine and notification client."""
         self._sql_engine = sql_engine
+        # For each run, how many of its leading commands are already stored in their
+        # final form and do not need to be written again. Commands are immutable
+        # once they have succeeded or failed, so this only ever covers those.
+        self._persisted_command_counts: Dict[str, _CommandCounts] = {}
+        # For each run, how many commands it has in the database. Filled in lazily
+        # and kept up to date as commands are written, so that paging through a
+        # run's commands doesn't have to count them on every request.
+        self._stored_command_counts: Dict[str, _CommandCounts] = {}
 
     def update_run_state(
         self,
@@ -123,6 +145,9 @@ class RunStore:
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
+        Commands already stored through `append_commands()` (or a previous call
+        to this method) are kept as-is; only the remainder is written.
+
         Args:
             run_id: The run to update
             summary: The run's equipment and status summary.
@@ -148,10 +173,14 @@ class RunStore:
             )
         )
 
-        delete_existing_commands = sqlalchemy.delete(run_command_table).where(
-            run_command_table.c.run_id == run_id
+        persisted_command_count = min(
+            self.get_persisted_command_count(run_id), len(commands)
+        )
+        persisted_command_counts = _count_commands(commands[:persisted_command_count])
+        delete_stale_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.index_in_run >= persisted_command_count,
         )
-        insert_command = sqlalchemy.insert(run_command_table)
 
         select_run_resource = sqlalchemy.select(*_run_columns).where(
             run_table.c.id == run_id
@@ -167,24 +196,21 @@ class RunStore:
                 raise RunNotFoundError(run_id=run_id)
 
             transaction.execute(update_run)
-            transaction.execute(delete_existing_commands)
-            for command_index, command in enumerate(commands):
-                transaction.execute(
-                    insert_command,
-                    {
-                        "run_id": run_id,
-                        "index_in_run": command_index,
-                        "command_id": command.id,
-                        "command": pydantic_to_json(command),
-                        "command_intent": str(command.intent.value)
-                        if command.intent
-                        else CommandIntent.PROTOCOL,
-                    },
-                )
+            transaction.execute(delete_stale_commands)
+            stored_command_counts = self._insert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                commands=commands[persisted_command_count:],
+                start=persisted_command_counts,
+            )
 
             run_row = transaction.execute(select_run_resource).one()
             action_rows = transaction.execute(select_actions).all()
 
+        self._persisted_command_counts[run_id] = _count_commands(
+            commands[: _count_completed_prefix(commands)]
+        )
+        self._stored_command_counts[run_id] = stored_command_counts
         self._clear_caches()
         maybe_run_resource = _convert_row_to_run(row=run_row, action_rows=action_rows)
         if not maybe_run_resource.ok:
@@ -212,6 +238,53 @@ class RunStore:
 
         self._clear_caches()
 
+    def get_persisted_command_count(self, run_id: str) -> int:
+        """Get how many of a run's leading commands are already stored for good.
+
+        This is where the next `append_commands()` call for the run will pick up.
+        """
+        return self._persisted_command_counts.get(run_id, _NO_COMMANDS).total
+
+    def append_commands(self, run_id: str, commands: Sequence[Command]) -> int:
+        """Incrementally store commands of an ongoing run as they complete.
+
+        This lets a run's commands be written a little at a time while it runs,
+        so that `update_run_state()` only has to write the remainder when the
+        run is finalized.
+
+        Args:
+            run_id: The run to add the commands to.
+            commands: The run's commands, starting from index
+                `get_persisted_command_count(run_id)`. Only the leading
+                commands that have already succeeded or failed are stored;
+                the rest are left for a later call.
+
+        Returns:
+            The number of commands that were stored.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found in the store.
+        """
+        completed_commands = commands[: _count_completed_prefix(commands)]
+        if not completed_commands:
+            return 0
+
+        start = self._persisted_command_counts.get(run_id, _NO_COMMANDS)
+        with self._sql_engine.begin() as transaction:
+            if not self._run_exists(run_id, transaction):
+                raise RunNotFoundError(run_id=run_id)
+            persisted_command_counts = self._insert_commands(
+                transaction=transaction,
+                run_id=run_id,
+                commands=completed_commands,
+                start=start,
+            )
+
+        self._persisted_command_counts[run_id] = persisted_command_counts
+        self._stored_command_counts[run_id] = persisted_command_counts
+        self._clear_caches()
+        return len(completed_commands)
+
     def get_all_csv_rtp(self) -> List[CSVParameterRunResource]:
         """Get all of the csv rtp from the run_csv_rtp_table."""
         select_all_csv_rtp = sqlalchemy.select(run_csv_rtp_table).order_by(
@@ -445,6 +518,8 @@ class RunStore:
                 If `None`, up to `length` elements at the end of the collection will
                 be returned.
             include_fixit_commands: Wether we should include fixit command intent in the result.
+                If not, the collection is the run's non-fixit commands, and
+                `cursor` is an index into that.
 
         Returns:
             A collection of commands as well as the actual cursor used and
@@ -453,51 +528,34 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
+        if include_fixit_commands:
+            index_column = run_command_table.c.index_in_run
+        else:
+            index_column = run_command_table.c.non_fixit_index_in_run
+
         with self._sql_engine.begin() as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
 
-            if include_fixit_commands:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    run_command_table.c.run_id == run_id
-                )
-            else:
-                select_count = sqlalchemy.select(sqlalchemy.func.count()).where(
-                    and_(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                )
-            count_result: int = transaction.execute(select_count).scalar_one()
+            command_counts = self._get_stored_command_counts(run_id, transaction)
+            count_result = (
+                command_counts.total
+                if include_fixit_commands
+                else command_counts.non_fixit
+            )
 
             actual_cursor = cursor if cursor is not None else count_result - length
             # Clamp to [0, count_result).
             actual_cursor = max(0, min(actual_cursor, count_result - 1))
-            if include_fixit_commands:
-                select_slice = (
-                    sqlalchemy.select(
-                        run_command_table.c.index_in_run, run_command_table.c.command
-                    )
-                    .where(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.index_in_run >= actual_cursor,
-                        run_command_table.c.index_in_run < actual_cursor + length,
-                    )
-                    .order_by(run_command_table.c.index_in_run)
-                )
-            else:
-                select_slice = (
-                    sqlalchemy.select(
-                        run_command_table.c.index_in_run, run_command_table.c.command
-                    )
-                    .where(
-                        run_command_table.c.run_id == run_id,
-                        run_command_table.c.index_in_run >= actual_cursor,
-                        run_command_table.c.index_in_run < actual_cursor + length,
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                    .order_by(run_command_table.c.index_in_run)
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    index_column >= actual_cursor,
+                    index_column < actual_cursor + length,
                 )
+                .order_by(index_column)
+            )
             slice_result = transaction.execute(select_slice).all()
 
         sliced_commands: List[Command] = [
@@ -515,27 +573,73 @@ class RunStore:
         self, run_id: str, include_fixit_commands: bool
     ) -> List[str]:
         """Get all commands of the run as a list of strings of json command objects."""
+        return [
+            command
+            for chunk in self.get_all_commands_as_preserialized_chunks(
+                run_id, include_fixit_commands
+            )
+            for command in chunk
+        ]
+
+    def get_all_commands_as_preserialized_chunks(
+        self,
+        run_id: str,
+        include_fixit_commands: bool,
+        chunk_size: int = _PRESERIALIZED_COMMANDS_CHUNK_SIZE,
+    ) -> Iterator[List[str]]:
+        """Get all commands of the run as strings of json command objects, in chunks.
+
+        Only one chunk is held in memory at a time, so callers can stream
+        the commands of arbitrarily long runs. Each chunk is read in its own
+        short transaction, to avoid holding the database locked while the
+        caller consumes the chunks.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found. This is raised
+                immediately, not upon iteration.
+        """
         with self._sql_engine.begin() as transaction:
             if not self._run_exists(run_id, transaction):
                 raise RunNotFoundError(run_id=run_id)
-            # TODO (tz, 8-21-24): consolidate into 1 query.
-            if include_fixit_commands:
-                select_commands = (
-                    sqlalchemy.select(run_command_table.c.command)
-                    .where(run_command_table.c.run_id == run_id)
-                    .order_by(run_command_table.c.index_in_run)
-                )
-            else:
-                select_commands = (
-                    sqlalchemy.select(run_command_table.c.command)
-                    .where(
-                        and_(run_command_table.c.run_id == run_id),
-                        run_command_table.c.command_intent != "fixit",
-                    )
-                    .order_by(run_command_table.c.index_in_run)
+
+        return self._iter_preserialized_command_chunks(
+            run_id=run_id,
+            include_fixit_commands=include_fixit_commands,
+            chunk_size=chunk_size,
+        )
+
+    def _iter_preserialized_command_chunks(
+        self,
+        run_id: str,
+        include_fixit_commands: bool,
+        chunk_size: int,
+    ) -> Iterator[List[str]]:
+        if include_fixit_commands:
+            index_column = run_command_table.c.index_in_run
+        else:
+            index_column = run_command_table.c.non_fixit_index_in_run
+
+        # Page by the indexed position instead of OFFSET, so each chunk is a
+        # range scan that doesn't revisit the rows before it.
+        next_index = 0
+        while True:
+            select_chunk = (
+                sqlalchemy.select(index_column, run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    index_column >= next_index,
                 )
-            commands_result = transaction.scalars(select_commands).all()
-        return commands_result
+                .order_by(index_column)
+                .limit(chunk_size)
+            )
+            with self._sql_engine.begin() as transaction:
+                rows = transaction.execute(select_chunk).all()
+            if not rows:
+                return
+            yield [row.command for row in rows]
+            if len(rows) < chunk_size:
+                return
+            next_index = rows[-1][0] + 1
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
@@ -592,6 +696,9 @@ class RunStore:
             transaction.execute(delete_csv_rtps)
             result = transaction.execute(delete_run)
 
+        self._persisted_command_counts.pop(run_id, None)
+        self._stored_command_counts.pop(run_id, None)
+
         if result.rowcount < 1:
             raise RunNotFoundError(run_id)
 
@@ -605,6 +712,52 @@ class RunStore:
         ).scalar_one()
         return result
 
+    def _get_stored_command_counts(
+        self, run_id: str, connection: sqlalchemy.engine.Connection
+    ) -> _CommandCounts:
+        command_counts = self._stored_command_counts.get(run_id)
+        if command_counts is None:
+            # COUNT(column) skips NULLs, which non_fixit_index_in_run is for fixits.
+            select_counts = sqlalchemy.select(
+                sqlalchemy.func.count(),
+                sqlalchemy.func.count(run_command_table.c.non_fixit_index_in_run),
+            ).where(run_command_table.c.run_id == run_id)
+            total, non_fixit = connection.execute(select_counts).one()
+            command_counts = _CommandCounts(total=total, non_fixit=non_fixit)
+            self._stored_command_counts[run_id] = command_counts
+        return command_counts
+
+    @staticmethod
+    def _insert_commands(
+        transaction: sqlalchemy.engine.Connection,
+        run_id: str,
+        commands: Sequence[Command],
+        start: _CommandCounts,
+    ) -> _CommandCounts:
+        """Insert commands following the `start` ones, and return the new counts."""
+        values = []
+        index_in_run = start.total
+        non_fixit_index_in_run = start.non_fixit
+        for command in commands:
+            is_fixit = command.intent == CommandIntent.FIXIT
+            values.append(
+                _convert_command_to_sql_values(
+                    run_id=run_id,
+                    index_in_run=index_in_run,
+                    non_fixit_index_in_run=None if is_fixit else non_fixit_index_in_run,
+                    command=command,
+                )
+            )
+            index_in_run += 1
+            if not is_fixit:
+                non_fixit_index_in_run += 1
+
+        if values:
+            # A single execute() with a list of parameter sets lets SQLAlchemy use the
+            # DBAPI's executemany(), instead of round-tripping once per command.
+            transaction.execute(sqlalchemy.insert(run_command_table), values)
+        return _CommandCounts(total=index_in_run, non_fixit=non_fixit_index_in_run)
+
     def _clear_caches(self) -> None:
         self.has.cache_clear()
         self.get.cache_clear()
@@ -712,3 +865,38 @@ def _convert_state_to_sql_values(
         "_updated_at": utc_now(),
         "run_time_parameters": pydantic_list_to_json(run_time_parameters),
     }
+
+
+def _convert_command_to_sql_values(
+    run_id: str,
+    index_in_run: int,
+    non_fixit_index_in_run: Optional[int],
+    command: Command,
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index_in_run,
+        "command_id": command.id,
+        "command": pydantic_to_json(command),
+        "command_intent": str(command.intent.value)
+        if command.intent
+        else CommandIntent.PROTOCOL,
+        "non_fixit_index_in_run": non_fixit_index_in_run,
+    }
+
+
+def _count_completed_prefix(commands: Sequence[Command]) -> int:
+    """Return how many leading commands have finished executing for good."""
+    for index, command in enumerate(commands):
+        if command.status not in _COMPLETED_COMMAND_STATUSES:
+            return index
+    return len(commands)
+
+
+def _count_commands(commands: Sequence[Command]) -> _CommandCounts:
+    return _CommandCounts(
+        total=len(commands),
+        non_fixit=sum(
+            1 for command in commands if command.intent != CommandIntent.FIXIT
+        ),
+    )
@@ -2,6 +2,8 @@
 import contextlib
 import random
 import logging
+import threading
+import time
 import paho.mqtt.client as mqtt
 from fastapi import Depends
 from typing import Annotated, Any, Dict, Generator, Optional
@@ -41,6 +43,11 @@ class NotificationClient:
         protocol_version: MQTT protocol version.
         default_qos: Default quality of service. QOS 1 is "at least once".
         retain_message: Whether the broker should hold a copy of the message for new clients.
+        coalesce_window: How long, in seconds, to hold back a refetch message so that
+            further refetch requests for the same topic can be merged into it.
+        min_publish_interval: The minimum time, in seconds, between two refetch
+            messages on the same topic. Requests that come in sooner are merged
+            into one message, sent once the interval has passed.
     """
 
     def __init__(
@@ -51,6 +58,8 @@ class NotificationClient:
         protocol_version: int = mqtt.MQTTv5,
         default_qos: MQTT_QOS = MQTT_QOS.QOS_1,
         retain_message: bool = False,
+        coalesce_window: float = 0.0,
+        min_publish_interval: float = 0.0,
     ) -> None:
         """Returns a configured MQTT client."""
         self._host = host
@@ -58,6 +67,17 @@ class NotificationClient:
         self._keepalive = keepalive
         self._default_qos = default_qos.value
         self._retain_message = retain_message
+        self._coalesce_window = coalesce_window
+        self._min_publish_interval = min_publish_interval
+        self._refetch_payload = NotifyRefetchBody.construct().json()
+        self._unsubscribe_payload = NotifyUnsubscribeBody.construct().json()
+        # Publishing can be requested from the event loop and from worker threads,
+        # and held-back messages are sent from timer threads.
+        self._lock = threading.Lock()
+        self._last_refetch_times: Dict[TopicName, float] = {}
+        self._pending_refetches: Dict[TopicName, threading.Timer] = {}
+        self._published_message_count = 0
+        self._coalesced_message_count = 0
         # MQTT is somewhat particular about the client_id format and will connect erratically
         # if an unexpected string is supplied. This clientId is derived from the paho-mqtt library.
         self._client_id: str = f"robot-server-{random.randint(0, 1000000)}"
@@ -79,26 +99,64 @@ class NotificationClient:
 
     def disconnect(self) -> None:
         """Disconnect the client from the MQTT broker."""
+        with self._lock:
+            pending_topics = list(self._pending_refetches)
+        for topic in pending_topics:
+            self._flush_pending_refetch(topic)
+        log.info(
+            f"Published {self.published_message_count} notifications"
+            f" and coalesced {self.coalesced_message_count}."
+        )
         self._client.loop_stop()
         self._client.disconnect()
 
+    @property
+    def published_message_count(self) -> int:
+        """The number of messages sent to the MQTT broker so far."""
+        return self._published_message_count
+
+    @property
+    def coalesced_message_count(self) -> int:
+        """The number of refetch messages merged into another one instead of being sent."""
+        return self._coalesced_message_count
+
     def publish_advise_refetch(
         self,
         topic: TopicName,
     ) -> None:
         """Publish a refetch message on a specific topic to the MQTT broker.
 
+        If a refetch message for the topic is already waiting to be sent, this
+        request is merged into it. Otherwise, the message is sent immediately,
+        unless the coalesce window or the topic's minimum publish interval
+        call for holding it back for a while.
+
         Args:
             topic: The topic to publish the message on.
         """
-        message = NotifyRefetchBody.construct()
-        payload = message.json()
-        self._client.publish(
-            topic=topic,
-            payload=payload,
-            qos=self._default_qos,
-            retain=self._retain_message,
-        )
+        with self._lock:
+            if topic in self._pending_refetches:
+                self._coalesced_message_count += 1
+                return
+
+            now = time.monotonic()
+            send_at = now + self._coalesce_window
+            last_refetch_time = self._last_refetch_times.get(topic)
+            if last_refetch_time is not None:
+                send_at = max(send_at, last_refetch_time + self._min_publish_interval)
+
+            if send_at > now:
+                timer = threading.Timer(
+                    send_at - now, self._flush_pending_refetch, args=(topic,)
+                )
+                timer.daemon = True
+                self._pending_refetches[topic] = timer
+                timer.start()
+                return
+
+            self._last_refetch_times[topic] = now
+
+        self._publish(topic=topic, payload=self._refetch_payload)
 
     def publish_advise_unsubscribe(
         self,
@@ -106,17 +164,35 @@ class NotificationClient:
     ) -> None:
         """Publish an unsubscribe message on a specific topic to the MQTT broker.
 
+        A refetch message still waiting to be sent on the topic is sent first,
+        so subscribers don't miss it.
+
         Args:
             topic: The topic to publish the message on.
         """
-        message = NotifyUnsubscribeBody.construct()
-        payload = message.json()
+        self._flush_pending_refetch(topic)
+        self._publish(topic=topic, payload=self._unsubscribe_payload)
+
+    def _flush_pending_refetch(self, topic: TopicName) -> None:
+        """Send the refetch message held back for `topic`, if there is one."""
+        with self._lock:
+            timer = self._pending_refetches.pop(topic, None)
+            if timer is None:
+                return
+            timer.cancel()
+            self._last_refetch_times[topic] = time.monotonic()
+
+        self._publish(topic=topic, payload=self._refetch_payload)
+
+    def _publish(self, topic: TopicName, payload: str) -> None:
         self._client.publish(
             topic=topic,
             payload=payload,
             qos=self._default_qos,
             retain=self._retain_message,
         )
+        with self._lock:
+            self._published_message_count += 1
 
     def _on_connect(
         self,
@@ -167,7 +243,11 @@ _notification_client_accessor: AppStateAccessor[NotificationClient] = AppStateAc
 
 
 @contextlib.contextmanager
-def set_up_notification_client(app_state: AppState) -> Generator[None, None, None]:
+def set_up_notification_client(
+    app_state: AppState,
+    coalesce_window: float = 0.0,
+    min_publish_interval: float = 0.0,
+) -> Generator[None, None, None]:
     """Set up the server's singleton `NotificationClient`.
 
     When this context manager is entered, the `NotificationClient` is initialized
@@ -175,8 +255,12 @@ def set_up_notification_client(app_state: AppState) -> Generator[None, None, Non
     `get_notification_client()`.
 
     When this context manager is exited, the `NotificationClient` is cleaned up.
+
+    See `NotificationClient` for `coalesce_window` and `min_publish_interval`.
     """
-    notification_client: NotificationClient = NotificationClient()
+    notification_client: NotificationClient = NotificationClient(
+        coalesce_window=coalesce_window, min_publish_interval=min_publish_interval
+    )
     _notification_client_accessor.set_on(app_state, notification_client)
 
     try:
@@ -2,7 +2,7 @@ from fastapi import Depends
 from dataclasses import dataclass
 from typing import Annotated, Callable, Optional
 
-from opentrons.protocol_engine import CommandPointer, StateSummary, EngineStatus
+from opentrons.protocol_engine import CommandPointer, EngineStatus
 
 from server_utils.fastapi_utils.app_state import (
     AppState,
@@ -21,16 +21,18 @@ class _RunHooks:
     run_id: str
     get_current_command: Callable[[str], Optional[CommandPointer]]
     get_recovery_target_command: Callable[[str], Optional[CommandPointer]]
-    get_state_summary: Callable[[str], Optional[StateSummary]]
+    get_status: Callable[[str], Optional[EngineStatus]]
+    get_state_version: Callable[[str], Optional[int]]
 
 
 @dataclass
 class _EngineStateSlice:
     """Protocol Engine state relevant to RunsPublisher."""
 
+    state_version: Optional[int] = None
     current_command: Optional[CommandPointer] = None
     recovery_target_command: Optional[CommandPointer] = None
-    state_summary_status: Optional[EngineStatus] = None
+    status: Optional[EngineStatus] = None
 
 
 class RunsPublisher:
@@ -46,11 +48,7 @@ class RunsPublisher:
         self._engine_state_slice: Optional[_EngineStateSlice] = None
 
         publisher_notifier.register_publish_callbacks(
-            [
-                self._handle_current_command_change,
-                self._handle_recovery_target_command_change,
-                self._handle_engine_status_change,
-            ]
+            [self._handle_engine_state_change]
         )
 
     def start_publishing_for_run(
@@ -58,20 +56,26 @@ class RunsPublisher:
         run_id: str,
         get_current_command: Callable[[str], Optional[CommandPointer]],
         get_recovery_target_command: Callable[[str], Optional[CommandPointer]],
-        get_state_summary: Callable[[str], Optional[StateSummary]],
+        get_status: Callable[[str], Optional[EngineStatus]],
+        get_state_version: Callable[[str], Optional[int]],
     ) -> None:
         """Initialize RunsPublisher with necessary information derived from the current run.
 
         Args:
             run_id: ID of the current run.
             get_current_command: Callback to get the currently executing command, if any.
-            get_state_summary: Callback to get the current run's state summary, if any.
+            get_recovery_target_command: Callback to get the current error recovery
+                target command, if any.
+            get_status: Callback to get the current run's engine status, if any.
+            get_state_version: Callback to get a counter that increases whenever
+                the run's engine state changes, if the run has one.
         """
         self._run_hooks = _RunHooks(
             run_id=run_id,
             get_current_command=get_current_command,
             get_recovery_target_command=get_recovery_target_command,
-            get_state_summary=get_state_summary,
+            get_status=get_status,
+            get_state_version=get_state_version,
         )
         self._engine_state_slice = _EngineStateSlice()
 
@@ -121,6 +125,26 @@ class RunsPublisher:
                 )
             )
 
+    async def _handle_engine_state_change(self) -> None:
+        """Publish refetch flags for whatever changed since the last engine state change.
+
+        Nothing is checked if the engine state version hasn't moved since last time.
+        """
+        if self._run_hooks is not None and self._engine_state_slice is not None:
+            new_state_version = self._run_hooks.get_state_version(
+                self._run_hooks.run_id
+            )
+            if (
+                new_state_version is not None
+                and self._engine_state_slice.state_version == new_state_version
+            ):
+                return
+            self._engine_state_slice.state_version = new_state_version
+
+            await self._handle_current_command_change()
+            await self._handle_recovery_target_command_change()
+            await self._handle_engine_status_change()
+
     async def _handle_current_command_change(self) -> None:
         """Publish a refetch flag if the current command has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
@@ -148,17 +172,11 @@ class RunsPublisher:
     async def _handle_engine_status_change(self) -> None:
         """Publish a refetch flag if the engine status has changed."""
         if self._run_hooks is not None and self._engine_state_slice is not None:
-            new_state_summary = self._run_hooks.get_state_summary(
-                self._run_hooks.run_id
-            )
+            new_status = self._run_hooks.get_status(self._run_hooks.run_id)
 
-            if (
-                new_state_summary is not None
-                and self._engine_state_slice.state_summary_status
-                != new_state_summary.status
-            ):
+            if new_status is not None and self._engine_state_slice.status != new_status:
                 self.publish_runs_advise_refetch(run_id=self._run_hooks.run_id)
-                self._engine_state_slice.state_summary_status = new_state_summary.status
+                self._engine_state_slice.status = new_status
 
 
 _runs_publisher_accessor: AppStateAccessor[RunsPublisher] = AppStateAccessor[
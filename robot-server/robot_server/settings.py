@@ -111,5 +111,64 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    run_command_persist_interval: typing.Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "If set, how often, in seconds, to incrementally store a protocol run's"
+            " completed commands in the database while the run is ongoing."
+            " This spreads the cost of storing a long run's commands across the run,"
+            " instead of storing all of them at once when the run ends."
+        ),
+    )
+
+    notification_coalesce_window: float = Field(
+        default=0.0,
+        ge=0,
+        description=(
+            "How long, in seconds, to hold back a notification refetch message so"
+            " that further refetch requests for the same topic can be merged into it."
+        ),
+    )
+
+    notification_min_publish_interval: float = Field(
+        default=0.1,
+        ge=0,
+        description=(
+            "The minimum time, in seconds, between two notification refetch messages"
+            " on the same topic. Requests that come in sooner are merged into one"
+            " message, sent once the interval has passed."
+        ),
+    )
+
+    analysis_worker_processes: int = Field(
+        default=2,
+        ge=0,
+        description=(
+            "How many protocol analyses may run at the same time, each in its own"
+            " worker process, so that they don't slow down the server."
+            " Further analyses wait for a free worker."
+            " If this is 0, analyses run in the server process instead."
+        ),
+    )
+
+    analysis_time_budget: typing.Optional[float] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "If set, how long, in seconds, a protocol analysis in a worker process"
+            " may run before it's stopped and recorded as failed."
+        ),
+    )
+
+    analysis_memory_budget: typing.Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "If set, how much memory, in bytes, a protocol analysis worker process"
+            " may allocate. Analyses that need more are recorded as failed."
+        ),
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
@@ -20,6 +20,7 @@ from robot_server.protocols.analysis_models import (
     AnalysisSummary,
     AnalysisStatus,
 )
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
@@ -207,6 +208,22 @@ async def test_start_analysis(
     decoy.when(analyzer.get_verified_run_time_parameters()).then_return(
         [bool_parameter]
     )
+    decoy.when(analyzer.run_time_param_paths).then_return({})
+    decoy.when(
+        analysis_store.get_cache_key(
+            protocol_source=protocol_resource.source,
+            run_time_parameters=[bool_parameter],
+            run_time_param_paths={},
+        )
+    ).then_return("cache-key")
+    decoy.when(
+        await analysis_store.add_from_cache(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            cache_key="cache-key",
+            run_time_parameters=[bool_parameter],
+        )
+    ).then_return(False)
     analysis_summary_result = await subject.start_analysis(
         analysis_id="analysis-id",
         analyzer=analyzer,
@@ -222,9 +239,122 @@ async def test_start_analysis(
             protocol_id="protocol-id",
             analysis_id="analysis-id",
             run_time_parameters=[bool_parameter],
+            cache_key="cache-key",
         ),
         task_runner.run(
             analyzer.analyze,
             analysis_id="analysis-id",
         ),
     )
+
+
+async def test_start_analysis_in_worker(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+) -> None:
+    """It should analyze in a worker process if it has an executor."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type=robot_type,
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analysis_executor = decoy.mock(cls=AnalysisExecutor)
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+    subject = AnalysesManager(
+        analysis_store=analysis_store,
+        task_runner=task_runner,
+        analysis_executor=analysis_executor,
+    )
+
+    await subject.start_analysis(analysis_id="analysis-id", analyzer=analyzer)
+
+    decoy.verify(
+        analysis_store.add_pending(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            run_time_parameters=[],
+            cache_key=None,
+        ),
+        task_runner.run(
+            analyzer.analyze_in_worker,
+            analysis_id="analysis-id",
+            executor=analysis_executor,
+        ),
+    )
+
+
+async def test_start_analysis_from_cache(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+    task_runner: TaskRunner,
+    subject: AnalysesManager,
+) -> None:
+    """It should reuse a cached analysis instead of analyzing the protocol again."""
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=ProtocolSource(
+            directory=Path("/dev/null"),
+            main_file=Path("/dev/null/abc.json"),
+            config=JsonProtocolConfig(schema_version=123),
+            files=[],
+            metadata={},
+            robot_type="OT-3 Standard",
+            content_hash="abc123",
+        ),
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analyzer = decoy.mock(cls=protocol_analyzer.ProtocolAnalyzer)
+    decoy.when(analyzer.protocol_resource).then_return(protocol_resource)
+    decoy.when(analyzer.get_verified_run_time_parameters()).then_return([])
+    decoy.when(analyzer.run_time_param_paths).then_return(None)
+    decoy.when(
+        analysis_store.get_cache_key(
+            protocol_source=protocol_resource.source,
+            run_time_parameters=[],
+            run_time_param_paths=None,
+        )
+    ).then_return("cache-key")
+    decoy.when(
+        await analysis_store.add_from_cache(
+            protocol_id="protocol-id",
+            analysis_id="analysis-id",
+            cache_key="cache-key",
+            run_time_parameters=[],
+        )
+    ).then_return(True)
+
+    result = await subject.start_analysis(analysis_id="analysis-id", analyzer=analyzer)
+
+    assert result == AnalysisSummary(
+        id="analysis-id",
+        status=AnalysisStatus.COMPLETED,
+        runTimeParameters=[],
+    )
+    decoy.verify(
+        analysis_store.add_pending(
+            protocol_id=matchers.Anything(),
+            analysis_id=matchers.Anything(),
+            run_time_parameters=matchers.Anything(),
+            cache_key=matchers.Anything(),
+        ),
+        times=0,
+    )
+    decoy.verify(
+        task_runner.run(matchers.Anything(), analysis_id="analysis-id"), times=0
+    )
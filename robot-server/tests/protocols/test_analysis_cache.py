@@ -0,0 +1,170 @@
+"""Tests for the content-addressed analysis cache."""
+import asyncio
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from opentrons.protocol_engine.types import BooleanParameter, RunTimeParameter
+from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
+
+from robot_server.protocols.analysis_cache import AnalysisCache
+from robot_server.protocols.analysis_models import (
+    AnalysisResult,
+    AnalysisStatus,
+    CompletedAnalysis,
+)
+
+
+def _protocol_source(content_hash: str) -> ProtocolSource:
+    return ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=123),
+        files=[],
+        metadata={},
+        robot_type="OT-3 Standard",
+        content_hash=content_hash,
+    )
+
+
+def _bool_params(value: bool) -> List[RunTimeParameter]:
+    return [
+        BooleanParameter(
+            displayName="Foo", variableName="foo", default=True, value=value
+        )
+    ]
+
+
+def _completed_analysis(
+    analysis_id: str, result: AnalysisResult = AnalysisResult.OK
+) -> CompletedAnalysis:
+    return CompletedAnalysis(
+        id=analysis_id,
+        status=AnalysisStatus.COMPLETED,
+        result=result,
+        robotType="OT-3 Standard",
+        runTimeParameters=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+
+
+@pytest.fixture
+def subject(tmp_path: Path) -> AnalysisCache:
+    """Get an AnalysisCache test subject."""
+    return AnalysisCache(
+        directory=tmp_path / "analysis_cache", analyzer_version="1", max_entries=2
+    )
+
+
+def test_key_depends_on_inputs(subject: AnalysisCache, tmp_path: Path) -> None:
+    """It should key analyses by protocol content, parameters, and CSV contents."""
+    csv_file = tmp_path / "a.csv"
+    renamed_csv_file = tmp_path / "b.csv"
+    csv_file.write_text("1,2,3")
+    renamed_csv_file.write_text("1,2,3")
+
+    key = subject.get_key(_protocol_source("abc"), _bool_params(True), None)
+
+    assert key == subject.get_key(_protocol_source("abc"), _bool_params(True), {})
+    assert key != subject.get_key(_protocol_source("def"), _bool_params(True), None)
+    assert key != subject.get_key(_protocol_source("abc"), _bool_params(False), None)
+
+    csv_key = subject.get_key(
+        _protocol_source("abc"), _bool_params(True), {"csv": csv_file}
+    )
+    assert csv_key != key
+    assert csv_key == subject.get_key(
+        _protocol_source("abc"), _bool_params(True), {"csv": renamed_csv_file}
+    )
+    renamed_csv_file.write_text("4,5,6")
+    assert csv_key != subject.get_key(
+        _protocol_source("abc"), _bool_params(True), {"csv": renamed_csv_file}
+    )
+
+    other_version = AnalysisCache(
+        directory=tmp_path / "other", analyzer_version="2", max_entries=2
+    )
+    assert key != other_version.get_key(
+        _protocol_source("abc"), _bool_params(True), None
+    )
+
+
+async def test_add_and_get(subject: AnalysisCache) -> None:
+    """It should return the analyses it has and count hits and misses."""
+    assert await subject.get("key") is None
+
+    await subject.add("key", _completed_analysis("analysis-id"))
+    assert await subject.get("key") == _completed_analysis("analysis-id")
+
+    stats = subject.stats
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+async def test_only_caches_ok_analyses(subject: AnalysisCache) -> None:
+    """It should not cache analyses that failed."""
+    await subject.add(
+        "key", _completed_analysis("analysis-id", result=AnalysisResult.NOT_OK)
+    )
+    assert await subject.get("key") is None
+
+
+async def test_evicts_least_recently_used(
+    subject: AnalysisCache, tmp_path: Path
+) -> None:
+    """It should remove the least recently used analyses once it's full."""
+    await subject.add("key-1", _completed_analysis("analysis-id-1"))
+    await subject.add("key-2", _completed_analysis("analysis-id-2"))
+    # Backdate both entries, then use key-1 so that key-2 is the least recently used.
+    for name in ["key-1.json", "key-2.json"]:
+        os.utime(tmp_path / "analysis_cache" / name, (0, 0))
+    assert await subject.get("key-1") is not None
+
+    await subject.add("key-3", _completed_analysis("analysis-id-3"))
+
+    assert await subject.get("key-2") is None
+    assert await subject.get("key-1") is not None
+    assert await subject.get("key-3") is not None
+
+
+async def test_discards_unreadable_entries(
+    subject: AnalysisCache, tmp_path: Path
+) -> None:
+    """It should treat a corrupt entry as a miss and remove it."""
+    entry = tmp_path / "analysis_cache" / "key.json"
+    entry.write_text("not json")
+
+    assert await subject.get("key") is None
+    assert not entry.exists()
+
+
+async def test_add_logs_write_errors(subject: AnalysisCache, tmp_path: Path) -> None:
+    """It should not raise if an entry can't be written."""
+    cache_directory = tmp_path / "analysis_cache"
+    cache_directory.rmdir()
+    cache_directory.write_text("not a directory")
+
+    await subject.add("key", _completed_analysis("analysis-id"))
+
+    assert subject.stats.entries == 0
+
+
+async def test_concurrent_adds_of_the_same_key(
+    subject: AnalysisCache, tmp_path: Path
+) -> None:
+    """It should let concurrent writers of one key each write a whole entry."""
+    await asyncio.gather(
+        *(subject.add("key", _completed_analysis("analysis-id")) for _ in range(5))
+    )
+
+    assert await subject.get("key") == _completed_analysis("analysis-id")
+    assert [path.name for path in (tmp_path / "analysis_cache").iterdir()] == [
+        "key.json"
+    ]
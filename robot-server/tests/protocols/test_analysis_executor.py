@@ -0,0 +1,182 @@
+"""Tests for the AnalysisExecutor, which simulates protocols in real worker processes."""
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from textwrap import dedent
+from typing import List
+
+import pytest
+from decoy import Decoy, matchers
+
+from opentrons.protocol_engine import commands as pe_commands
+from opentrons.protocol_engine.types import BooleanParameter, RunTimeParameter
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_executor import AnalysisExecutor
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.protocol_models import ProtocolKind
+from robot_server.protocols.protocol_store import ProtocolResource
+
+
+async def _read_protocol(tmp_path: Path, run_body: str) -> ProtocolSource:
+    protocol_path = tmp_path / "protocol.py"
+    protocol_path.write_text(
+        dedent(
+            """\
+            requirements = {"robotType": "Flex", "apiLevel": "2.20"}
+
+            def run(protocol):
+            """
+        )
+        + "".join(f"    {line}\n" for line in run_body.splitlines())
+    )
+    return await ProtocolReader().read_saved(files=[protocol_path], directory=None)
+
+
+async def _wait_for_running(subject: AnalysisExecutor, running_count: int) -> None:
+    while subject.running_count < running_count:
+        await asyncio.sleep(0.01)
+
+
+async def test_analyze(tmp_path: Path) -> None:
+    """It should simulate the protocol in a worker and return its results."""
+    protocol_source = await _read_protocol(
+        tmp_path, 'protocol.comment("hello")\nprotocol.comment("world")'
+    )
+    subject = AnalysisExecutor(max_workers=1)
+
+    outcome = await subject.analyze(
+        analysis_id="analysis-id",
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+        run_time_parameters=[],
+    )
+
+    assert outcome.errors == []
+    assert [
+        command.params.message
+        for command in outcome.commands
+        if isinstance(command, pe_commands.Comment)
+    ] == ["hello", "world"]
+    assert subject.queue_depth == 0
+    assert subject.running_count == 0
+
+
+async def test_time_budget(tmp_path: Path) -> None:
+    """It should stop an analysis that runs over its time budget and record an error."""
+    protocol_source = await _read_protocol(tmp_path, "import time\ntime.sleep(60)")
+    run_time_parameters: List[RunTimeParameter] = [
+        BooleanParameter(
+            displayName="Foo", variableName="Bar", default=True, value=False
+        )
+    ]
+    subject = AnalysisExecutor(max_workers=1, time_budget=0.5)
+
+    outcome = await subject.analyze(
+        analysis_id="analysis-id",
+        protocol_source=protocol_source,
+        run_time_param_values=None,
+        run_time_param_paths=None,
+        run_time_parameters=run_time_parameters,
+    )
+
+    assert outcome.commands == []
+    assert outcome.run_time_parameters == run_time_parameters
+    assert len(outcome.errors) == 1
+    assert "AnalysisTimeBudgetExceededError" in outcome.errors[0].detail
+
+
+async def test_cancel_queued_and_running(tmp_path: Path) -> None:
+    """It should queue analyses beyond its workers, and cancel them wherever they are."""
+    protocol_source = await _read_protocol(tmp_path, "import time\ntime.sleep(60)")
+    subject = AnalysisExecutor(max_workers=1)
+
+    tasks = [
+        asyncio.create_task(
+            subject.analyze(
+                analysis_id=analysis_id,
+                protocol_source=protocol_source,
+                run_time_param_values=None,
+                run_time_param_paths=None,
+                run_time_parameters=[],
+            )
+        )
+        for analysis_id in ["analysis-1", "analysis-2"]
+    ]
+    await asyncio.wait_for(_wait_for_running(subject, 1), timeout=30)
+    assert subject.running_count == 1
+    assert subject.queue_depth == 1
+
+    subject.cancel("analysis-2")
+    subject.cancel("analysis-1")
+    outcomes = await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+
+    for outcome in outcomes:
+        assert len(outcome.errors) == 1
+        assert "AnalysisCancelledError" in outcome.errors[0].detail
+    assert subject.running_count == 0
+    assert subject.queue_depth == 0
+
+
+async def test_cancelling_task_stops_worker(tmp_path: Path) -> None:
+    """It should stop the worker and propagate the cancellation if its task is cancelled."""
+    protocol_source = await _read_protocol(tmp_path, "import time\ntime.sleep(60)")
+    subject = AnalysisExecutor(max_workers=1)
+    task = asyncio.create_task(
+        subject.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_source,
+            run_time_param_values=None,
+            run_time_param_paths=None,
+            run_time_parameters=[],
+        )
+    )
+    await asyncio.wait_for(_wait_for_running(subject, 1), timeout=30)
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert subject.running_count == 0
+
+
+async def test_analyzer_stops_its_orchestrator(decoy: Decoy, tmp_path: Path) -> None:
+    """Analyzing in a worker shouldn't leave the in-process orchestrator running."""
+    protocol_source = await _read_protocol(tmp_path, 'protocol.comment("hello")')
+    analysis_store = decoy.mock(cls=AnalysisStore)
+    analyzer = ProtocolAnalyzer(
+        analysis_store=analysis_store,
+        protocol_resource=ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1),
+            source=protocol_source,
+            protocol_key=None,
+            protocol_kind=ProtocolKind.STANDARD,
+        ),
+    )
+    await analyzer.load_orchestrator(
+        run_time_param_values=None, run_time_param_paths=None
+    )
+
+    await analyzer.analyze_in_worker(
+        analysis_id="analysis-id", executor=AnalysisExecutor(max_workers=1)
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            robot_type="OT-3 Standard",
+            run_time_parameters=[],
+            commands=matchers.Anything(),
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        )
+    )
+    assert not [
+        task for task in asyncio.all_tasks() if "_run_commands" in repr(task.get_coro())
+    ]
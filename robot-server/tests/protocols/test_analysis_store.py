@@ -685,3 +685,117 @@ async def test_matching_rtp_values_in_analysis_with_no_rtps(
         )
         is False
     )
+
+
+async def test_add_from_cache_across_protocols(
+    sql_engine: SQLEngine, protocol_store: ProtocolStore, tmp_path: Path
+) -> None:
+    """It should reuse an analysis of the same content for a different protocol."""
+    subject = AnalysisStore(
+        sql_engine=sql_engine, analysis_cache_directory=tmp_path / "analysis_cache"
+    )
+    first_protocol = make_dummy_protocol_resource(protocol_id="protocol-id-1")
+    second_protocol = make_dummy_protocol_resource(protocol_id="protocol-id-2")
+    protocol_store.insert(first_protocol)
+    protocol_store.insert(second_protocol)
+    run_time_parameters: List[RunTimeParameter] = [mock_number_param("cool_param", 5)]
+    cache_key = subject.get_cache_key(
+        protocol_source=first_protocol.source,
+        run_time_parameters=run_time_parameters,
+        run_time_param_paths={},
+    )
+    assert cache_key is not None
+    assert cache_key == subject.get_cache_key(
+        protocol_source=second_protocol.source,
+        run_time_parameters=run_time_parameters,
+        run_time_param_paths=None,
+    )
+
+    assert not await subject.add_from_cache(
+        protocol_id="protocol-id-1",
+        analysis_id="analysis-id-1",
+        cache_key=cache_key,
+        run_time_parameters=run_time_parameters,
+    )
+    subject.add_pending(
+        protocol_id="protocol-id-1",
+        analysis_id="analysis-id-1",
+        run_time_parameters=run_time_parameters,
+        cache_key=cache_key,
+    )
+    await subject.update(
+        analysis_id="analysis-id-1",
+        robot_type="OT-2 Standard",
+        run_time_parameters=run_time_parameters,
+        labware=[],
+        pipettes=[],
+        modules=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+
+    assert await subject.add_from_cache(
+        protocol_id="protocol-id-2",
+        analysis_id="analysis-id-2",
+        cache_key=cache_key,
+        run_time_parameters=run_time_parameters,
+    )
+    result = await subject.get("analysis-id-2")
+    assert isinstance(result, CompletedAnalysis)
+    assert result.id == "analysis-id-2"
+    assert result.result == AnalysisResult.OK
+    assert result.runTimeParameters == run_time_parameters
+    assert subject.get_summaries_by_protocol("protocol-id-2") == [
+        AnalysisSummary(id="analysis-id-2", status=AnalysisStatus.COMPLETED)
+    ]
+    assert await subject.matching_rtp_values_in_analysis(
+        last_analysis_summary=AnalysisSummary(
+            id="analysis-id-2", status=AnalysisStatus.COMPLETED
+        ),
+        new_parameters=run_time_parameters,
+    )
+
+
+async def test_update_completes_analysis_if_caching_fails(
+    sql_engine: SQLEngine, protocol_store: ProtocolStore, tmp_path: Path
+) -> None:
+    """It should complete the analysis even if it can't be written to the cache."""
+    cache_directory = tmp_path / "analysis_cache"
+    subject = AnalysisStore(
+        sql_engine=sql_engine, analysis_cache_directory=cache_directory
+    )
+    protocol_resource = make_dummy_protocol_resource(protocol_id="protocol-id")
+    protocol_store.insert(protocol_resource)
+    cache_key = subject.get_cache_key(
+        protocol_source=protocol_resource.source,
+        run_time_parameters=[],
+        run_time_param_paths=None,
+    )
+    subject.add_pending(
+        protocol_id="protocol-id",
+        analysis_id="analysis-id",
+        run_time_parameters=[],
+        cache_key=cache_key,
+    )
+    cache_directory.rmdir()
+    cache_directory.write_text("not a directory")
+
+    await subject.update(
+        analysis_id="analysis-id",
+        robot_type="OT-2 Standard",
+        run_time_parameters=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+
+    result = await subject.get("analysis-id")
+    assert isinstance(result, CompletedAnalysis)
+    assert result.result == AnalysisResult.OK
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(id="analysis-id", status=AnalysisStatus.COMPLETED)
+    ]
@@ -27,6 +27,7 @@ from opentrons.protocol_runner.run_orchestrator import ParseMode
 
 import opentrons.util.helpers as datetime_helper
 
+from robot_server.protocols.analysis_executor import AnalysisExecutor, AnalysisOutcome
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_models import ProtocolKind
 from robot_server.protocols.protocol_store import ProtocolResource
@@ -215,6 +216,93 @@ async def test_analyze(
     )
 
 
+async def test_analyze_in_worker(
+    decoy: Decoy,
+    analysis_store: AnalysisStore,
+) -> None:
+    """It should analyze the protocol in the executor and store the outcome."""
+    robot_type: RobotType = "OT-3 Standard"
+    protocol_source = ProtocolSource(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/abc.json"),
+        config=JsonProtocolConfig(schema_version=123),
+        files=[],
+        metadata={},
+        robot_type=robot_type,
+        content_hash="abc123",
+    )
+    protocol_resource = ProtocolResource(
+        protocol_id="protocol-id",
+        created_at=datetime(year=2021, month=1, day=1),
+        source=protocol_source,
+        protocol_key="dummy-data-111",
+        protocol_kind=ProtocolKind.STANDARD,
+    )
+    analysis_command = pe_commands.WaitForResume(
+        id="command-id",
+        key="command-key",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2),
+        params=pe_commands.WaitForResumeParams(message="hello world"),
+    )
+    bool_parameter = pe_types.BooleanParameter(
+        displayName="Foo", variableName="Bar", default=True, value=False
+    )
+
+    orchestrator = decoy.mock(cls=protocol_runner.RunOrchestrator)
+    executor = decoy.mock(cls=AnalysisExecutor)
+    decoy.when(
+        await simulating_runner.create_simulating_orchestrator(
+            robot_type=robot_type,
+            protocol_config=JsonProtocolConfig(schema_version=123),
+        )
+    ).then_return(orchestrator)
+    decoy.when(orchestrator.get_run_time_parameters()).then_return([bool_parameter])
+    decoy.when(
+        await executor.analyze(
+            analysis_id="analysis-id",
+            protocol_source=protocol_source,
+            run_time_param_values={"rtp_var": 123},
+            run_time_param_paths={"my_file": Path("file-path")},
+            run_time_parameters=[bool_parameter],
+        )
+    ).then_return(
+        AnalysisOutcome(
+            run_time_parameters=[bool_parameter],
+            commands=[analysis_command],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        )
+    )
+    subject = ProtocolAnalyzer(
+        analysis_store=analysis_store, protocol_resource=protocol_resource
+    )
+    await subject.load_orchestrator(
+        run_time_param_values={"rtp_var": 123},
+        run_time_param_paths={"my_file": Path("file-path")},
+    )
+
+    await subject.analyze_in_worker(analysis_id="analysis-id", executor=executor)
+
+    decoy.verify(
+        await orchestrator.stop(),
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            robot_type=robot_type,
+            run_time_parameters=[bool_parameter],
+            commands=[analysis_command],
+            labware=[],
+            modules=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        ),
+    )
+
+
 async def test_analyze_updates_pending_on_error(
     decoy: Decoy,
     analysis_store: AnalysisStore,
@@ -13,7 +13,7 @@ from opentrons.protocol_engine import (
 )
 
 from robot_server.errors.error_responses import ApiError
-from robot_server.service.json_api import MultiBodyMeta
+from robot_server.service.json_api import MultiBodyMeta, SimpleMultiBody
 
 from robot_server.runs.command_models import (
     RequestModelWithCommandCreate,
@@ -29,6 +29,7 @@ from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_commands_as_pre_serialized_list,
     get_current_run_from_url,
 )
 
@@ -510,3 +511,54 @@ async def test_get_run_command_missing(
     assert exc_info.value.content["errors"][0]["detail"] == matchers.StringMatching(
         "oh no"
     )
+
+
+async def test_get_run_commands_as_pre_serialized_list(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should stream the pre-serialized commands as a SimpleMultiBody."""
+    command_chunks = [
+        ['{"id": "command-1"}', '{"id": "command-2"}'],
+        ['{"id": "command-3", "params": {"message": "\\"hi\\""}}'],
+    ]
+    decoy.when(
+        mock_run_data_manager.get_all_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=False
+        )
+    ).then_return(iter(command_chunks))
+
+    result = await get_run_commands_as_pre_serialized_list(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+        includeFixitCommands=False,
+    )
+    body = b"".join([chunk async for chunk in result.body_iterator])  # type: ignore[misc]
+
+    expected_commands = [command for chunk in command_chunks for command in chunk]
+    assert result.status_code == 200
+    assert body.decode("utf-8") == (
+        SimpleMultiBody.construct(
+            data=expected_commands,
+            meta=MultiBodyMeta(cursor=0, totalLength=len(expected_commands)),
+        ).json()
+    )
+
+
+async def test_get_run_commands_as_pre_serialized_list_not_found(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should 404 before streaming anything if the run doesn't exist."""
+    decoy.when(
+        mock_run_data_manager.get_all_commands_as_preserialized_chunks(
+            run_id="run-id", include_fixit_commands=True
+        )
+    ).then_raise(RunNotFoundError(run_id="run-id"))
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_as_pre_serialized_list(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+            includeFixitCommands=True,
+        )
+
+    assert exc_info.value.status_code == 404
@@ -1,4 +1,5 @@
 """Tests for RunController."""
+import asyncio
 from typing import List
 
 import pytest
@@ -6,6 +7,7 @@ from datetime import datetime
 from decoy import Decoy, matchers
 
 from opentrons.protocol_engine import (
+    CommandSlice,
     EngineStatus,
     StateSummary,
     commands as pe_commands,
@@ -230,6 +232,83 @@ async def test_create_play_action_to_start(
     )
 
 
+async def test_create_play_action_persists_commands_incrementally(
+    decoy: Decoy,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+    mock_run_store: RunStore,
+    mock_task_runner: TaskRunner,
+    mock_runs_publisher: RunsPublisher,
+    mock_maintenance_runs_publisher: MaintenanceRunsPublisher,
+    engine_state_summary: StateSummary,
+    run_time_parameters: List[RunTimeParameter],
+    protocol_commands: List[pe_commands.Command],
+    run_id: str,
+) -> None:
+    """It should append completed commands to the run store while the run runs."""
+    subject = RunController(
+        run_id=run_id,
+        run_orchestrator_store=mock_run_orchestrator_store,
+        run_store=mock_run_store,
+        task_runner=mock_task_runner,
+        runs_publisher=mock_runs_publisher,
+        maintenance_runs_publisher=mock_maintenance_runs_publisher,
+        command_persist_interval=0.001,
+    )
+    decoy.when(mock_run_orchestrator_store.run_was_started()).then_return(False)
+
+    subject.create_action(
+        action_id="some-action-id",
+        action_type=RunActionType.PLAY,
+        created_at=datetime(year=2021, month=1, day=1),
+        action_payload=[],
+    )
+
+    background_task_captor = matchers.Captor()
+    decoy.verify(mock_task_runner.run(background_task_captor, deck_configuration=[]))
+
+    decoy.when(mock_run_store.get_persisted_command_count(run_id)).then_return(0)
+    decoy.when(
+        mock_run_orchestrator_store.get_command_slice(
+            cursor=0, length=matchers.Anything(), include_fixit_commands=True
+        )
+    ).then_return(CommandSlice(commands=protocol_commands, cursor=0, total_length=1))
+
+    appended_commands: List[List[pe_commands.Command]] = []
+
+    def append_commands(run_id: str, commands: List[pe_commands.Command]) -> int:
+        appended_commands.append(commands)
+        return len(commands)
+
+    decoy.when(
+        mock_run_store.append_commands(run_id=run_id, commands=protocol_commands)
+    ).then_do(append_commands)
+
+    async def run(deck_configuration: object) -> RunResult:
+        await asyncio.sleep(0.05)
+        return RunResult(
+            commands=protocol_commands,
+            state_summary=engine_state_summary,
+            parameters=run_time_parameters,
+        )
+
+    decoy.when(await mock_run_orchestrator_store.run(deck_configuration=[])).then_do(
+        run
+    )
+
+    await background_task_captor.value(deck_configuration=[])
+
+    assert protocol_commands in appended_commands
+    decoy.verify(
+        mock_run_store.update_run_state(
+            run_id=run_id,
+            summary=engine_state_summary,
+            commands=protocol_commands,
+            run_time_parameters=run_time_parameters,
+        ),
+        times=1,
+    )
+
+
 def test_create_pause_action(
     decoy: Decoy,
     mock_run_orchestrator_store: RunOrchestratorStore,
@@ -1190,6 +1190,21 @@ def test_get_all_commands_as_preserialized_list(
     ]
 
 
+def test_get_all_commands_as_preserialized_chunks(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+    mock_run_orchestrator_store: RunOrchestratorStore,
+) -> None:
+    """It should return the pre-serialized commands in chunks."""
+    chunks = iter([['{"id": command-1}', '{"id": command-2}']])
+    decoy.when(mock_run_orchestrator_store.current_run_id).then_return(None)
+    decoy.when(
+        mock_run_store.get_all_commands_as_preserialized_chunks("run-id", True)
+    ).then_return(chunks)
+    assert subject.get_all_commands_as_preserialized_chunks("run-id", True) is chunks
+
+
 def test_get_all_commands_as_preserialized_list_errors_for_active_runs(
     decoy: Decoy,
     subject: RunDataManager,
@@ -1,4 +1,5 @@
 """Tests for robot_server.runs.run_store."""
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional, Type
@@ -289,6 +290,100 @@ async def test_update_run_state(
     )
 
 
+def test_append_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should store completed commands incrementally, then only the rest on update."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    running_command = protocol_commands[2].copy(
+        update={"status": pe_commands.CommandStatus.RUNNING, "result": None}
+    )
+
+    assert subject.get_persisted_command_count(run_id="run-id") == 0
+    assert (
+        subject.append_commands(
+            run_id="run-id",
+            commands=[protocol_commands[0], protocol_commands[1], running_command],
+        )
+        == 2
+    )
+    assert subject.get_persisted_command_count(run_id="run-id") == 2
+    assert [
+        command.id
+        for command in subject.get_commands_slice(
+            run_id="run-id", length=10, cursor=0, include_fixit_commands=True
+        ).commands
+    ] == ["pause-1", "pause-2"]
+
+    assert subject.append_commands(run_id="run-id", commands=[running_command]) == 0
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    commands_result = subject.get_commands_slice(
+        run_id="run-id",
+        length=len(protocol_commands),
+        cursor=0,
+        include_fixit_commands=True,
+    )
+    assert commands_result.commands == protocol_commands
+    assert subject.get_persisted_command_count(run_id="run-id") == len(
+        protocol_commands
+    )
+
+
+def test_append_commands_run_not_found(
+    subject: RunStore, protocol_commands: List[pe_commands.Command]
+) -> None:
+    """It should raise an error when appending commands to a missing run."""
+    with pytest.raises(RunNotFoundError, match="missing-run-id"):
+        subject.append_commands(run_id="missing-run-id", commands=protocol_commands)
+
+
+def test_update_run_state_rewrites_incomplete_commands(
+    subject: RunStore,
+    state_summary: StateSummary,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should rewrite commands that were not complete the last time they were stored."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    queued_command = protocol_commands[3].copy(
+        update={"status": pe_commands.CommandStatus.QUEUED, "result": None}
+    )
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=[*protocol_commands[:3], queued_command],
+        run_time_parameters=[],
+    )
+    assert subject.get_persisted_command_count(run_id="run-id") == 3
+
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+    assert (
+        subject.get_command(run_id="run-id", command_id=protocol_commands[3].id)
+        == protocol_commands[3]
+    )
+
+
 async def test_insert_and_get_csv_rtp(
     subject: RunStore,
     data_files_store: DataFilesStore,
@@ -872,6 +967,96 @@ def test_get_commands_slice_no_fixit_commands(
     ]
 
 
+@pytest.mark.parametrize(
+    ("input_cursor", "input_length", "expected_cursor", "expected_command_ids"),
+    [
+        (0, 2, 0, ["pause-1", "pause-2"]),
+        (1, 2, 1, ["pause-2", "pause-3"]),
+        (None, 2, 1, ["pause-2", "pause-3"]),
+        (999, 2, 2, ["pause-3"]),
+    ],
+)
+def test_get_commands_slice_no_fixit_commands_pages_contiguously(
+    subject: RunStore,
+    sql_engine: Engine,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+    input_cursor: Optional[int],
+    input_length: int,
+    expected_cursor: int,
+    expected_command_ids: List[str],
+) -> None:
+    """It should page through the non-fixit commands as if the fixits weren't there."""
+    fixit_command = protocol_commands[3]
+    commands = [
+        protocol_commands[0],
+        fixit_command,
+        protocol_commands[1],
+        fixit_command.copy(update={"id": "fixit-pause-2"}),
+        protocol_commands[2],
+    ]
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=commands,
+        run_time_parameters=[],
+    )
+
+    # A fresh store has to count the stored commands instead of using its cache.
+    for store in [subject, RunStore(sql_engine=sql_engine)]:
+        result = store.get_commands_slice(
+            run_id="run-id",
+            cursor=input_cursor,
+            length=input_length,
+            include_fixit_commands=False,
+        )
+
+        assert result.cursor == expected_cursor
+        assert result.total_length == 3
+        assert [
+            result_command.id for result_command in result.commands
+        ] == expected_command_ids
+
+
+def test_get_commands_slice_after_append_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should page through commands stored with append_commands()."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.append_commands(run_id="run-id", commands=protocol_commands[3:])
+    subject.append_commands(run_id="run-id", commands=protocol_commands[:3])
+
+    with_fixits = subject.get_commands_slice(
+        run_id="run-id", cursor=0, length=999, include_fixit_commands=True
+    )
+    without_fixits = subject.get_commands_slice(
+        run_id="run-id", cursor=1, length=999, include_fixit_commands=False
+    )
+
+    assert with_fixits.total_length == 4
+    assert [command.id for command in with_fixits.commands] == [
+        "fixit-pause-1",
+        "pause-1",
+        "pause-2",
+        "pause-3",
+    ]
+    assert without_fixits.total_length == 3
+    assert [command.id for command in without_fixits.commands] == [
+        "pause-2",
+        "pause-3",
+    ]
+
+
 def test_get_all_commands_as_preserialized_list(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
@@ -902,6 +1087,49 @@ def test_get_all_commands_as_preserialized_list(
     ]
 
 
+def test_get_all_commands_as_preserialized_chunks(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should read the pre-serialized commands a chunk at a time."""
+    subject.insert(
+        run_id="run-id",
+        protocol_id=None,
+        created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+        run_time_parameters=[],
+    )
+
+    with_fixits = subject.get_all_commands_as_preserialized_chunks(
+        run_id="run-id", include_fixit_commands=True, chunk_size=2
+    )
+    without_fixits = subject.get_all_commands_as_preserialized_chunks(
+        run_id="run-id", include_fixit_commands=False, chunk_size=2
+    )
+
+    assert [
+        [json.loads(command)["id"] for command in chunk] for chunk in with_fixits
+    ] == [["pause-1", "pause-2"], ["pause-3", "fixit-pause-1"]]
+    assert [
+        [json.loads(command)["id"] for command in chunk] for chunk in without_fixits
+    ] == [["pause-1", "pause-2"], ["pause-3"]]
+
+
+def test_get_all_commands_as_preserialized_chunks_run_not_found(
+    subject: RunStore,
+) -> None:
+    """It should raise RunNotFoundError without waiting for iteration."""
+    with pytest.raises(RunNotFoundError):
+        subject.get_all_commands_as_preserialized_chunks(
+            run_id="not-run-id", include_fixit_commands=True
+        )
+
+
 def test_get_all_commands_as_preserialized_list_no_fixit(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
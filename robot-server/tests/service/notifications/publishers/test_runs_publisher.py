@@ -49,10 +49,15 @@ async def test_initialize(
     run_id = "1234"
     get_current_command = AsyncMock()
     get_recovery_target_command = AsyncMock()
-    get_state_summary = AsyncMock()
+    get_status = AsyncMock()
+    get_state_version = AsyncMock()
 
     runs_publisher.start_publishing_for_run(
-        run_id, get_current_command, get_recovery_target_command, get_state_summary
+        run_id,
+        get_current_command,
+        get_recovery_target_command,
+        get_status,
+        get_state_version,
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -64,11 +69,13 @@ async def test_initialize(
         runs_publisher._run_hooks.get_recovery_target_command
         == get_recovery_target_command
     )
-    assert runs_publisher._run_hooks.get_state_summary == get_state_summary
+    assert runs_publisher._run_hooks.get_status == get_status
+    assert runs_publisher._run_hooks.get_state_version == get_state_version
     assert runs_publisher._engine_state_slice
     assert runs_publisher._engine_state_slice.current_command is None
     assert runs_publisher._engine_state_slice.recovery_target_command is None
-    assert runs_publisher._engine_state_slice.state_summary_status is None
+    assert runs_publisher._engine_state_slice.status is None
+    assert runs_publisher._engine_state_slice.state_version is None
 
     notification_client.publish_advise_refetch.assert_any_call(topic=topics.RUNS)
     notification_client.publish_advise_refetch.assert_any_call(
@@ -81,7 +88,7 @@ async def test_clean_up_current_run(
 ) -> None:
     """It should publish to appropriate topics at the end of a run."""
     runs_publisher.start_publishing_for_run(
-        "1234", AsyncMock(), AsyncMock(), AsyncMock()
+        "1234", AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock()
     )
 
     runs_publisher.clean_up_run(run_id="1234")
@@ -109,7 +116,8 @@ async def test_handle_current_command_change(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_version=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -144,7 +152,8 @@ async def test_handle_recovery_target_command_change(
         run_id="1234",
         get_current_command=AsyncMock(),
         get_recovery_target_command=lambda _: make_command_pointer("command1"),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_version=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -179,7 +188,8 @@ async def test_handle_engine_status_change(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_version=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -188,18 +198,14 @@ async def test_handle_engine_status_change(
     assert runs_publisher._engine_state_slice
 
     runs_publisher._run_hooks.run_id = "1234"
-    runs_publisher._run_hooks.get_state_summary = MagicMock(
-        return_value=MagicMock(status=EngineStatus.IDLE)
-    )
-    runs_publisher._engine_state_slice.state_summary_status = EngineStatus.IDLE
+    runs_publisher._run_hooks.get_status = MagicMock(return_value=EngineStatus.IDLE)
+    runs_publisher._engine_state_slice.status = EngineStatus.IDLE
 
     await runs_publisher._handle_engine_status_change()
 
     assert notification_client.publish_advise_refetch.call_count == 2
 
-    runs_publisher._run_hooks.get_state_summary.return_value = MagicMock(
-        status=EngineStatus.RUNNING
-    )
+    runs_publisher._run_hooks.get_status.return_value = EngineStatus.RUNNING
 
     await runs_publisher._handle_engine_status_change()
 
@@ -209,6 +215,50 @@ async def test_handle_engine_status_change(
     )
 
 
+async def test_handle_engine_state_change_skips_unchanged_versions(
+    runs_publisher: RunsPublisher, notification_client: Mock
+) -> None:
+    """It should only look at the run's state when the state version has moved."""
+    get_current_command = MagicMock(return_value=make_command_pointer("command1"))
+    get_recovery_target_command = MagicMock(return_value=None)
+    get_status = MagicMock(return_value=EngineStatus.RUNNING)
+    get_state_version = MagicMock(return_value=1)
+    runs_publisher.start_publishing_for_run(
+        run_id="1234",
+        get_current_command=get_current_command,
+        get_recovery_target_command=get_recovery_target_command,
+        get_status=get_status,
+        get_state_version=get_state_version,
+    )
+    notification_client.reset_mock()
+
+    await runs_publisher._handle_engine_state_change()
+
+    notification_client.publish_advise_refetch.assert_any_call(
+        topic=topics.RUNS_COMMANDS_LINKS
+    )
+    notification_client.publish_advise_refetch.assert_any_call(topic=topics.RUNS)
+    assert get_status.call_count == 1
+    notification_client.reset_mock()
+
+    await runs_publisher._handle_engine_state_change()
+
+    notification_client.publish_advise_refetch.assert_not_called()
+    assert get_current_command.call_count == 1
+    assert get_recovery_target_command.call_count == 1
+    assert get_status.call_count == 1
+
+    get_state_version.return_value = 2
+    get_current_command.return_value = make_command_pointer("command2")
+
+    await runs_publisher._handle_engine_state_change()
+
+    notification_client.publish_advise_refetch.assert_called_once_with(
+        topic=topics.RUNS_COMMANDS_LINKS
+    )
+    assert get_status.call_count == 2
+
+
 async def test_publish_pre_serialized_commannds_notif(
     runs_publisher: RunsPublisher, notification_client: Mock
 ) -> None:
@@ -217,7 +267,8 @@ async def test_publish_pre_serialized_commannds_notif(
         run_id="1234",
         get_current_command=lambda _: make_command_pointer("command1"),
         get_recovery_target_command=AsyncMock(),
-        get_state_summary=AsyncMock(),
+        get_status=AsyncMock(),
+        get_state_version=AsyncMock(),
     )
 
     # todo(mm, 2024-05-21): We should test through the public interface of the subject,
@@ -0,0 +1,111 @@
+"""Tests for the notification client."""
+import time
+from unittest.mock import Mock, call
+
+import paho.mqtt.client as mqtt
+
+from robot_server.service.json_api import NotifyRefetchBody, NotifyUnsubscribeBody
+from robot_server.service.notifications import topics
+from robot_server.service.notifications.notification_client import NotificationClient
+
+
+_REFETCH = NotifyRefetchBody.construct().json()
+_UNSUBSCRIBE = NotifyUnsubscribeBody.construct().json()
+
+
+def _make_subject(
+    coalesce_window: float = 0.0, min_publish_interval: float = 0.0
+) -> NotificationClient:
+    subject = NotificationClient(
+        coalesce_window=coalesce_window, min_publish_interval=min_publish_interval
+    )
+    # todo(mm, 2024-05-21): We should test through the public interface of the subject,
+    # not through its private attributes.
+    subject._client = Mock(spec_set=mqtt.Client)
+    return subject
+
+
+def _published(subject: NotificationClient) -> object:
+    return [
+        (c.kwargs["topic"], c.kwargs["payload"])
+        for c in subject._client.publish.call_args_list  # type: ignore[attr-defined]
+    ]
+
+
+def test_publish_immediately_without_limits() -> None:
+    """It should send every message right away if no limits are configured."""
+    subject = _make_subject()
+
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_refetch(topic=topics.RUNS)
+
+    assert _published(subject) == [(topics.RUNS, _REFETCH), (topics.RUNS, _REFETCH)]
+    assert subject.published_message_count == 2
+    assert subject.coalesced_message_count == 0
+
+
+def test_min_publish_interval_coalesces_refetches() -> None:
+    """It should merge refetches on a topic that come in faster than the interval."""
+    subject = _make_subject(min_publish_interval=0.05)
+
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_refetch(topic=topics.RUNS_COMMANDS_LINKS)
+
+    assert _published(subject) == [
+        (topics.RUNS, _REFETCH),
+        (topics.RUNS_COMMANDS_LINKS, _REFETCH),
+    ]
+
+    time.sleep(0.15)
+
+    assert _published(subject) == [
+        (topics.RUNS, _REFETCH),
+        (topics.RUNS_COMMANDS_LINKS, _REFETCH),
+        (topics.RUNS, _REFETCH),
+    ]
+    assert subject.published_message_count == 3
+    assert subject.coalesced_message_count == 1
+
+
+def test_coalesce_window_holds_back_refetches() -> None:
+    """It should hold back refetches for the window and send them once."""
+    subject = _make_subject(coalesce_window=0.05)
+
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_refetch(topic=topics.RUNS)
+
+    assert _published(subject) == []
+
+    time.sleep(0.15)
+
+    assert _published(subject) == [(topics.RUNS, _REFETCH)]
+    assert subject.coalesced_message_count == 1
+
+
+def test_unsubscribe_flushes_pending_refetch() -> None:
+    """It should send a held-back refetch before unsubscribing from its topic."""
+    subject = _make_subject(coalesce_window=10)
+
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.publish_advise_unsubscribe(topic=topics.RUNS)
+
+    assert _published(subject) == [
+        (topics.RUNS, _REFETCH),
+        (topics.RUNS, _UNSUBSCRIBE),
+    ]
+
+
+def test_disconnect_flushes_pending_refetches() -> None:
+    """It should send held-back refetches before disconnecting."""
+    subject = _make_subject(coalesce_window=10)
+
+    subject.publish_advise_refetch(topic=topics.RUNS)
+    subject.disconnect()
+
+    assert subject._client.method_calls[-3:] == [  # type: ignore[attr-defined]
+        call.publish(topic=topics.RUNS, payload=_REFETCH, qos=1, retain=False),
+        call.loop_stop(),
+        call.disconnect(),
+    ]
@@ -0,0 +1,107 @@
+"""A single-file bundle of shared data files, for fast lookups at runtime.
+
+Reading hundreds of small JSON files one at a time is slow on the robot's
+file system, so the package build compiles them into one bundle that is
+memory-mapped at runtime. Each entry is only read out of the bundle when it's
+looked up, so loading the bundle costs one small index read however many
+definitions it holds.
+
+The bundle format is:
+
+- An 8-byte magic number, ``OTSDBNDL``
+- The little-endian unsigned 32-bit format version and length of the index
+- The index: a JSON object mapping each entry's POSIX path, relative to the
+  shared data root, to its ``[offset, length]`` in the data section
+- The data section: every entry's contents, back to back
+"""
+import json
+import mmap
+import struct
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+BUNDLE_FILE_NAME = "shared_data.bundle"
+
+_MAGIC = b"OTSDBNDL"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<II")
+
+
+class InvalidBundleError(ValueError):
+    """Raised when a file is not a shared data bundle this code can read."""
+
+
+class SharedDataBundle:
+    """A read-only, memory-mapped shared data bundle."""
+
+    def __init__(self, bundle_path: Path) -> None:
+        """Open the bundle at ``bundle_path`` and read its index."""
+        with open(bundle_path, "rb") as f:
+            # The mapping stays valid after the file is closed.
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index, self._data_start = _read_index(self._data, bundle_path)
+
+    def __contains__(self, path: object) -> bool:
+        """Whether the bundle has an entry at a POSIX path."""
+        return path in self._index
+
+    def __len__(self) -> int:
+        """The number of entries in the bundle."""
+        return len(self._index)
+
+    def get(self, path: Union[str, PurePosixPath]) -> Optional[bytes]:
+        """Get the contents of an entry, or None if the bundle doesn't have it.
+
+        ``path`` is relative to the root of all shared data, like the paths
+        accepted by `opentrons_shared_data.load_shared_data`.
+        """
+        location = self._index.get(PurePosixPath(path).as_posix())
+        if location is None:
+            return None
+        offset, length = location
+        start = self._data_start + offset
+        return self._data[start : start + length]
+
+
+def _read_index(
+    data: mmap.mmap, bundle_path: Path
+) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    header_end = len(_MAGIC) + _HEADER.size
+    if data[: len(_MAGIC)] != _MAGIC or len(data) < header_end:
+        raise InvalidBundleError(f"{bundle_path} is not a shared data bundle.")
+    format_version, index_length = _HEADER.unpack(data[len(_MAGIC) : header_end])
+    if format_version != _FORMAT_VERSION:
+        raise InvalidBundleError(
+            f"{bundle_path} has unsupported bundle format version {format_version}."
+        )
+    index = json.loads(data[header_end : header_end + index_length])
+    return (
+        {path: (offset, length) for path, (offset, length) in index.items()},
+        header_end + index_length,
+    )
+
+
+def write_bundle(root: Path, files: Iterable[Path], bundle_path: Path) -> int:
+    """Compile shared data files into a bundle, returning how many it holds.
+
+    ``files`` must all be inside ``root``. JSON files are minified on the way in.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    contents = []
+    offset = 0
+    for file in sorted(files):
+        data = file.read_bytes()
+        if file.suffix == ".json":
+            data = json.dumps(json.loads(data), separators=(",", ":")).encode("utf-8")
+        index[file.relative_to(root).as_posix()] = (offset, len(data))
+        contents.append(data)
+        offset += len(data)
+
+    encoded_index = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    with open(bundle_path, "wb") as f:
+        f.write(_MAGIC)
+        f.write(_HEADER.pack(_FORMAT_VERSION, len(encoded_index)))
+        f.write(encoded_index)
+        for data in contents:
+            f.write(data)
+    return len(index)
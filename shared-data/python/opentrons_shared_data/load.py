@@ -4,6 +4,8 @@ import os
 from pathlib import Path
 from functools import lru_cache
 
+from .bundle import BUNDLE_FILE_NAME, SharedDataBundle
+
 log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
@@ -47,11 +49,53 @@ def get_shared_data_root() -> Path:
     raise SharedDataMissingError()
 
 
+@lru_cache(maxsize=1)
+def get_shared_data_bundle() -> typing.Optional[SharedDataBundle]:
+    """
+    Get the precompiled bundle of the shared data, if there is one.
+
+    Packaged shared data comes with a bundle built alongside it; shared data
+    used in place from the repo does not.
+    """
+    bundle_path = get_shared_data_root() / BUNDLE_FILE_NAME
+    try:
+        bundle = SharedDataBundle(bundle_path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        log.exception(f"Ignoring unreadable shared data bundle {bundle_path}")
+        return None
+    log.info(f"Using shared data bundle {bundle_path} with {len(bundle)} entries")
+    return bundle
+
+
 def load_shared_data(path: typing.Union[str, Path]) -> bytes:
     """
     Load file from shared data directory.
 
-    path is relative to the root of all shared data (ie. no "shared-data")
+    path is relative to the root of all shared data (ie. no "shared-data"),
+    or an absolute path inside it. Files in the shared data bundle are read
+    from the bundle without touching the directory tree.
     """
-    with open(get_shared_data_root() / path, "rb") as f:
+    root = get_shared_data_root()
+    bundle = get_shared_data_bundle()
+    if bundle is not None:
+        bundle_path = _get_path_in_bundle(root, path)
+        data = bundle.get(bundle_path) if bundle_path is not None else None
+        if data is not None:
+            return data
+
+    with open(root / path, "rb") as f:
         return f.read()
+
+
+def _get_path_in_bundle(
+    root: Path, path: typing.Union[str, Path]
+) -> typing.Optional[str]:
+    relative_path = Path(path)
+    if relative_path.is_absolute():
+        try:
+            relative_path = relative_path.relative_to(root)
+        except ValueError:
+            return None
+    return relative_path.as_posix()
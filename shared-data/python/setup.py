@@ -12,6 +12,7 @@ HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(os.path.join(HERE, "..", "..", "scripts"))
 
 from python_build_utils import normalize_version  # noqa: E402
+from opentrons_shared_data.bundle import BUNDLE_FILE_NAME, write_bundle  # noqa: E402
 
 # make stdout blocking since Travis sets it to nonblocking
 if os.name == "posix":
@@ -103,6 +104,20 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        # Compile the data files into one bundle, which is much faster to look
+        # definitions up in at runtime than the directory tree. Build it from
+        # the copied files so this works from an sdist, too.
+        data_dir = Path(self.build_lib) / "opentrons_shared_data" / DEST_BASE_PATH
+        bundle_path = data_dir / BUNDLE_FILE_NAME
+        self.mkpath(str(data_dir))
+        self.execute(
+            write_bundle,
+            args=(data_dir, list(data_dir.glob("**/*.json")), bundle_path),
+            msg=f"compiling data files into {bundle_path}",
+        )
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from opentrons_shared_data import load, load_shared_data
+from opentrons_shared_data.bundle import (
+    BUNDLE_FILE_NAME,
+    InvalidBundleError,
+    SharedDataBundle,
+    write_bundle,
+)
+
+
+@pytest.fixture
+def data_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Use a temporary directory as the shared data root."""
+    definition_dir = tmp_path / "labware" / "definitions" / "2" / "some_labware"
+    definition_dir.mkdir(parents=True)
+    (definition_dir / "1.json").write_text('{\n  "version": 1,\n  "wells": []\n}')
+    (definition_dir / "2.json").write_text('{"version": 2}')
+
+    monkeypatch.setenv(load.ENV_SHARED_DATA_PATH, str(tmp_path))
+    load.get_shared_data_root.cache_clear()
+    load.get_shared_data_bundle.cache_clear()
+    yield tmp_path
+    load.get_shared_data_root.cache_clear()
+    load.get_shared_data_bundle.cache_clear()
+
+
+def test_write_and_read_bundle(data_root: Path, tmp_path: Path) -> None:
+    bundle_path = tmp_path / "test.bundle"
+
+    assert write_bundle(data_root, data_root.glob("**/*.json"), bundle_path) == 2
+
+    subject = SharedDataBundle(bundle_path)
+    assert len(subject) == 2
+    assert "labware/definitions/2/some_labware/1.json" in subject
+    assert subject.get("labware/definitions/2/some_labware/1.json") == (
+        b'{"version":1,"wells":[]}'
+    )
+    assert json.loads(
+        subject.get(Path("labware/definitions/2/some_labware/2.json")) or b""
+    ) == {"version": 2}
+    assert subject.get("labware/definitions/2/some_labware/3.json") is None
+
+
+def test_invalid_bundle(tmp_path: Path) -> None:
+    bundle_path = tmp_path / "test.bundle"
+    bundle_path.write_bytes(b"definitely not a bundle")
+
+    with pytest.raises(InvalidBundleError):
+        SharedDataBundle(bundle_path)
+
+
+def test_load_shared_data_without_bundle(data_root: Path) -> None:
+    assert load.get_shared_data_bundle() is None
+    assert load_shared_data("labware/definitions/2/some_labware/2.json") == (
+        b'{"version": 2}'
+    )
+
+
+def test_load_shared_data_prefers_bundle(data_root: Path) -> None:
+    definition_path = data_root / "labware" / "definitions" / "2" / "some_labware"
+    write_bundle(data_root, [definition_path / "1.json"], data_root / BUNDLE_FILE_NAME)
+    (definition_path / "1.json").unlink()
+
+    assert load_shared_data("labware/definitions/2/some_labware/1.json") == (
+        b'{"version":1,"wells":[]}'
+    )
+    assert load_shared_data(definition_path / "1.json") == (b'{"version":1,"wells":[]}')
+    # Files that aren't in the bundle still come from the directory tree.
+    assert load_shared_data("labware/definitions/2/some_labware/2.json") == (
+        b'{"version": 2}'
+    )
+    with pytest.raises(FileNotFoundError):
+        load_shared_data("labware/definitions/2/some_labware/3.json")
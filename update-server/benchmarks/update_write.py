@@ -0,0 +1,105 @@
+"""Benchmark for unzipping, hashing and writing a system update's rootfs.
+
+Builds an update zip around a rootfs image, then writes it to a target the
+way an update does:
+
+* separate passes: unzip the rootfs next to the zip, hash it, then copy it to
+  the target, each in 1 KiB chunks, as updates used to.
+* streaming: unzip, hash and write the rootfs to the target in one pass with
+  large chunks, with ``write_update_file``.
+
+The target defaults to an image file in a temporary directory. To measure a
+real block device, attach an image to a loop device (``losetup -f --show
+image.img``) and pass it with ``--target``; everything on it is overwritten.
+
+Usage:
+    python benchmarks/update_write.py [--size-mb N] [--target PATH]
+"""
+import argparse
+import binascii
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from typing import Callable
+
+from otupdate.buildroot.update_actions import ROOTFS_NAME, write_file
+from otupdate.common.file_actions import hash_file, unzip_update, write_update_file
+
+
+def _build_update(directory: str, size: int) -> bytes:
+    # Half random and half zeros, so it deflates somewhat like a filesystem.
+    block = os.urandom(512 * 1024) + bytes(512 * 1024)
+    hasher = hashlib.sha256()
+    rootfs_path = os.path.join(directory, "rootfs-source.ext4")
+    with open(rootfs_path, "wb") as rootfs:
+        for _ in range(size // len(block)):
+            rootfs.write(block)
+            hasher.update(block)
+    with zipfile.ZipFile(
+        os.path.join(directory, "update", "ot2-system.zip"), "w", zipfile.ZIP_DEFLATED
+    ) as zf:
+        zf.write(rootfs_path, ROOTFS_NAME)
+    os.unlink(rootfs_path)
+    return binascii.hexlify(hasher.digest())
+
+
+def _separate_passes(zip_path: str, target: str, expected_hash: bytes) -> None:
+    files, sizes = unzip_update(zip_path, _ignore, [ROOTFS_NAME], [ROOTFS_NAME])
+    rootfs = files[ROOTFS_NAME]
+    assert rootfs
+    assert hash_file(rootfs, _ignore, file_size=sizes[ROOTFS_NAME]) == expected_hash
+    write_file(rootfs, target, _ignore)
+    os.unlink(rootfs)
+
+
+def _streaming(zip_path: str, target: str, expected_hash: bytes) -> None:
+    write_update_file(zip_path, ROOTFS_NAME, target, expected_hash, _ignore)
+
+
+def _ignore(progress: float) -> None:
+    pass
+
+
+def _time(
+    write: Callable[[str, str, bytes], None],
+    zip_path: str,
+    target: str,
+    expected_hash: bytes,
+) -> float:
+    start = time.perf_counter()
+    write(zip_path, target, expected_hash)
+    with open(target, "rb+") as target_file:
+        os.fsync(target_file.fileno())
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark and print how long each way of writing the update took."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256, help="rootfs size")
+    parser.add_argument("--target", help="device or image to write to")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        os.mkdir(os.path.join(directory, "update"))
+        size = args.size_mb * 1024 * 1024
+        expected_hash = _build_update(directory, size)
+        zip_path = os.path.join(directory, "update", "ot2-system.zip")
+        target = args.target or os.path.join(directory, "rootfs-partition.img")
+
+        separate = _time(_separate_passes, zip_path, target, expected_hash)
+        streaming = _time(_streaming, zip_path, target, expected_hash)
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"{args.size_mb} MiB rootfs to {args.target or 'an image file'}")
+    for name, elapsed in [("separate passes", separate), ("streaming", streaming)]:
+        print(f"{name:16}: {elapsed:6.2f}s ({args.size_mb / elapsed:7.1f} MiB/s)")
+
+
+if __name__ == "__main__":
+    main()
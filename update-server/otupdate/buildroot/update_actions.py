@@ -17,13 +17,14 @@ from typing import Callable, Generator, Optional
 from otupdate.common.constants import MODEL_OT2
 
 from otupdate.common.file_actions import (
+    FileMissing,
     InvalidPKGName,
     InvalidRobotType,
     load_version_file,
     unzip_update,
-    hash_file,
-    HashMismatch,
     verify_signature,
+    write_update_file,
+    STREAM_CHUNK_SIZE,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
 
@@ -50,8 +51,10 @@ class OT2UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the hash, signature and version files to filepath's directory
+        - Checks that the rootfs is in the zip, leaving it there to be streamed
+          straight to the partition by :py:meth:`write_update`, which checks
+          its hash
         - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
@@ -60,7 +63,7 @@ class OT2UpdateActions(UpdateActionsInterface):
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
 
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update zip file to write
 
         Will also raise an exception if validation fails
         """
@@ -72,16 +75,16 @@ class OT2UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress):
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress):
-            progress_callback(progress / 2.0 + 0.5)
+        files, _ = unzip_update(
+            filepath,
+            progress_callback,
+            UPDATE_FILES,
+            required,
+            leave_zipped=[ROOTFS_NAME],
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -91,55 +94,61 @@ class OT2UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidRobotType(msg)
 
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
         hashfile = files.get(ROOTFS_HASH_NAME)
         assert hashfile
-        packaged_hash = open(hashfile, "rb").read().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
 
         if cert_path:
             sigfile = files.get(ROOTFS_SIG_NAME)
             assert sigfile
             verify_signature(hashfile, sigfile, cert_path)
 
-        return rootfs
+        return filepath
 
     def write_update(
         self,
         rootfs_filepath: str,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = STREAM_CHUNK_SIZE,
         file_size: Optional[int] = None,
     ) -> Partition:
         """
         Write the new rootfs to the next root partition
 
         - Figure out, from the system, the correct root partition to write to
-        - Write the rootfs at ``rootfs_filepath`` there, with progress
+        - Unzip the rootfs from ``rootfs_filepath`` there, with progress,
+          checking its hash as it goes
 
-        :param rootfs_filepath: The path to a checked rootfs.ext4
+        :param rootfs_filepath: The path to an update zip checked by
+                                :py:meth:`validate_update`, with the rootfs
+                                hash file unzipped next to it
         :param progress_callback: A callback to call periodically with progress
                                   between 0 and 1.0. May never reach precisely
                                   1.0, best only for user information.
         :param chunk_size: The size of file chunks to copy in between progress
                            notifications
-        :param file_size: The total size of the update file (for generating
-                          progress percentage). If ``None``, generated with
-                          ``seek``/``tell``.
+        :param file_size: Unused; the size of the rootfs is read from the zip
         :returns: The root partition that the rootfs image was written to, e.g.
                   ``RootPartitions.TWO`` or ``RootPartitions.THREE``.
+
+        :raises HashMismatch: If the rootfs does not match its packaged hash.
+                              The partition is left with the bad image, but it
+                              is never committed.
         """
+        hashfile = os.path.join(os.path.dirname(rootfs_filepath), ROOTFS_HASH_NAME)
+        if not os.path.exists(hashfile):
+            raise FileMissing(f"File {ROOTFS_HASH_NAME} missing from update")
+        with open(hashfile, "rb") as fh:
+            packaged_hash = fh.read().strip()
         unused = _find_unused_partition()
         part_path = unused.value.path
-        write_file(rootfs_filepath, part_path, progress_callback, chunk_size, file_size)
+        write_update_file(
+            rootfs_filepath,
+            ROOTFS_NAME,
+            part_path,
+            packaged_hash,
+            progress_callback,
+            chunk_size=chunk_size,
+        )
         return unused.value
 
     @contextlib.contextmanager
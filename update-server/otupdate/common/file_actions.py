@@ -5,16 +5,36 @@ handling hash and sig checking
 
 import binascii
 import hashlib
+import io
 import json
 import logging
+import lzma
 import os
 import subprocess
-from typing import Callable, Sequence, Mapping, Optional, Tuple, List, Dict
+import time
+from typing import (
+    Callable,
+    Sequence,
+    Mapping,
+    Optional,
+    Tuple,
+    List,
+    Dict,
+    Union,
+    Iterable,
+    Iterator,
+    cast,
+)
 import tempfile
 import zipfile
 
 LOG = logging.getLogger(__name__)
 
+# Large enough that the per-chunk overhead of hashing, decompressing and
+# reporting progress is negligible, and a multiple of the erase block size of
+# the SD cards and eMMCs that we write root filesystems to.
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class FileMissing(ValueError):
     def __init__(self, message: str) -> None:
@@ -76,12 +96,25 @@ class InvalidRobotType(ValueError):
         return self.message
 
 
+class UpdateTooLarge(ValueError):
+    def __init__(self, message: str) -> None:
+        self.message = message
+        self.short = "Update Too Large"
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self.message}>"
+
+    def __str__(self) -> str:
+        return self.message
+
+
 def unzip_update(
     filepath: str,
     progress_callback: Callable[[float], None],
     acceptable_files: Sequence[str],
     mandatory_files: Sequence[str],
     chunk_size: int = 1024,
+    leave_zipped: Sequence[str] = (),
 ) -> Tuple[Mapping[str, Optional[str]], Mapping[str, int]]:
     """Unzip an update file
 
@@ -114,6 +147,10 @@ def unzip_update(
                             ``acceptable_files``.
     :param chunk_size: If specified, the size of the chunk to read and write.
                        If not specified, will default to 1024
+    :param leave_zipped: Files from ``acceptable_files`` to check for but not
+                         unzip, because they'll be streamed straight out of
+                         the zip later by :py:meth:`write_update_file`. Their
+                         paths are ``None`` but their sizes are filled in.
     :return: Two dictionaries, the first mapping file names to paths and the
              second mapping file names to sizes
 
@@ -130,7 +167,11 @@ def unzip_update(
         files = zf.infolist()
         remaining_filenames = [fn for fn in acceptable_files]
         for fi in files:
-            if fi.filename in acceptable_files:
+            if fi.filename in leave_zipped:
+                file_sizes[fi.filename] = fi.file_size
+                remaining_filenames.remove(fi.filename)
+                LOG.debug(f"Found {fi.filename} ({fi.file_size}B), leaving it zipped")
+            elif fi.filename in acceptable_files:
                 to_unzip.append(fi)
                 total_size += fi.file_size
                 remaining_filenames.remove(fi.filename)
@@ -205,6 +246,153 @@ def hash_file(
     return binascii.hexlify(hasher.digest())
 
 
+def write_update_file(
+    filepath: str,
+    filename: str,
+    dest_path: str,
+    expected_hash: bytes,
+    progress_callback: Callable[[float], None],
+    decompressor: Optional["lzma.LZMADecompressor"] = None,
+    max_size: Optional[int] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    algo: str = "sha256",
+) -> int:
+    """Unzip, hash and write a file from an update zip in a single pass
+
+    This streams ``filename`` out of the zip, hashes it as it was packaged,
+    optionally decompresses it, and writes it to ``dest_path``, so the image
+    is only read once and never lands anywhere but its destination. Writes are
+    made in whole multiples of ``chunk_size``, except for the last one.
+
+    Since the hash is only known once everything has been written, the
+    destination must be somewhere that's safe to hold an unverified image
+    until this returns, like the unused root partition.
+
+    This function is blocking and takes a while. It calls ``progress_callback``
+    with the fraction of the packaged file that's been processed so far.
+
+    :param filepath: The path to the update zip
+    :param filename: The name of the file in the zip to write
+    :param dest_path: The path to write to, e.g. a partition's block device
+    :param expected_hash: The packaged hash of ``filename``, as ascii hex
+    :param progress_callback: The callback to call with progress between 0 and
+                              1. May not ever be precisely 1.0.
+    :param decompressor: If specified, what to decompress the file with before
+                         writing it. The hash is still of the packaged file.
+                         It's drained ``chunk_size`` bytes at a time, so a
+                         highly compressed file can't balloon in memory.
+    :param max_size: If specified, the most bytes that may be written
+    :param chunk_size: The size of the chunks to read and write
+    :param algo: The algorithm to hash with. Can be anything used by
+                 :py:mod:`hashlib`
+    :returns: The number of bytes written
+
+    :raises FileMissing: If ``filename`` is not in the zip
+    :raises UpdateTooLarge: If more than ``max_size`` bytes would be written.
+                            Nothing past ``max_size`` is written.
+    :raises HashMismatch: If the file does not match ``expected_hash``
+    :raises EOFError: If the file ends before the end of the compressed stream
+    """
+    hasher = hashlib.new(algo)
+    buf = memoryview(bytearray(chunk_size))
+    have_read = 0
+    start = time.monotonic()
+    with zipfile.ZipFile(filepath, "r") as zf:
+        try:
+            fi = zf.getinfo(filename)
+        except KeyError:
+            raise FileMissing(f"File {filename} missing from zip")
+        LOG.info(
+            f"Writing {filename} ({fi.file_size}B) from {filepath} to {dest_path}"
+            f" in {chunk_size}B chunks"
+        )
+        # ZipFile.open() is typed as returning IO[bytes], which has no readinto()
+        src_file = cast(zipfile.ZipExtFile, zf.open(fi))
+        with src_file as src, open(dest_path, "wb", buffering=0) as dest:
+            writer = _ChunkedWriter(dest, chunk_size)
+            while True:
+                count = src.readinto(buf)
+                if not count:
+                    break
+                chunk = buf[:count]
+                hasher.update(chunk)
+                have_read += count
+                pieces: Iterable[Union[bytes, memoryview]] = (
+                    [chunk]
+                    if decompressor is None
+                    else _decompress(decompressor, chunk, chunk_size)
+                )
+                for out in pieces:
+                    if max_size is not None and writer.size + len(out) > max_size:
+                        raise UpdateTooLarge(
+                            f"{filename} is larger than {dest_path} ({max_size}B)"
+                        )
+                    writer.write(out)
+                progress_callback(have_read / (fi.file_size or 1))
+            writer.flush()
+
+    elapsed = time.monotonic() - start
+    LOG.info(
+        f"Wrote {writer.size}B to {dest_path} in {elapsed:.1f}s"
+        f" ({have_read / max(elapsed, 1e-9) / 1e6:.1f}MB/s of {filename})"
+    )
+    calculated_hash = binascii.hexlify(hasher.digest())
+    if calculated_hash != expected_hash:
+        msg = (
+            f"Hash mismatch: calculated {calculated_hash!r} != "
+            f"packaged {expected_hash!r}"
+        )
+        LOG.error(msg)
+        raise HashMismatch(msg)
+    if decompressor is not None and not decompressor.eof:
+        raise EOFError(f"{filename} ended before the end of its compressed stream")
+    return writer.size
+
+
+def _decompress(
+    decompressor: "lzma.LZMADecompressor", data: memoryview, max_length: int
+) -> Iterator[bytes]:
+    """Decompress ``data``, yielding at most ``max_length`` bytes at a time."""
+    yield decompressor.decompress(data, max_length=max_length)
+    while not (decompressor.needs_input or decompressor.eof):
+        yield decompressor.decompress(b"", max_length=max_length)
+
+
+class _ChunkedWriter:
+    """Writes to an unbuffered file in whole multiples of a chunk size.
+
+    Decompressed data comes out in irregular sizes, so it's collected here
+    until there's at least a whole chunk of it to write.
+    """
+
+    def __init__(self, dest: io.FileIO, chunk_size: int) -> None:
+        self._dest = dest
+        self._chunk_size = chunk_size
+        self._pending = bytearray()
+        self.size = 0
+
+    def write(self, data: Union[bytes, memoryview]) -> None:
+        self.size += len(data)
+        if not self._pending and len(data) % self._chunk_size == 0:
+            self._write_all(data)
+            return
+        self._pending += data
+        aligned = len(self._pending) - len(self._pending) % self._chunk_size
+        if aligned:
+            self._write_all(memoryview(self._pending)[:aligned])
+            del self._pending[:aligned]
+
+    def flush(self) -> None:
+        self._write_all(self._pending)
+        self._pending.clear()
+
+    def _write_all(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        # Unbuffered writes may be partial.
+        view = memoryview(data)
+        while view:
+            view = view[self._dest.write(view) :]
+
+
 def verify_signature(message_path: str, sigfile_path: str, cert_path: str) -> None:
     """
     Verify the signature (assumed, of the hash file)
@@ -6,16 +6,19 @@ import tempfile
 
 from otupdate.common.constants import MODEL_OT3
 from otupdate.common.file_actions import (
+    FileMissing,
+    HashMismatch,
     InvalidRobotType,
     unzip_update,
-    hash_file,
-    HashMismatch,
     InvalidPKGName,
+    UpdateTooLarge,
     verify_signature,
     load_version_file,
+    write_update_file,
+    STREAM_CHUNK_SIZE,
 )
 from otupdate.common.update_actions import UpdateActionsInterface, Partition
-from typing import Any, Callable, Generator, Optional, Tuple
+from typing import Callable, Generator, Optional, Tuple
 import enum
 import subprocess
 
@@ -107,42 +110,46 @@ class RootFSInterface:
 
     def write_update(
         self,
-        rootfs_filepath: str,
+        update_filepath: str,
         part: Partition,
         progress_callback: Callable[[float], None],
-        chunk_size: int = 1024,
+        chunk_size: int = STREAM_CHUNK_SIZE,
     ) -> Tuple[bool, str]:
-        total_size = 0
-        written_size = 0
+        """Decompress the rootfs from an update zip and write it to a partition.
+
+        The rootfs is streamed out of the zip, hashed, decompressed and written
+        in a single pass. Its hash is checked against the hash file that
+        ``OT3UpdateActions.validate_update`` unzipped next to the zip.
+
+        :raises HashMismatch: If the rootfs does not match its packaged hash.
+        :raises FileMissing: If the rootfs or its hash are missing.
+        """
+        hashfile = os.path.join(os.path.dirname(update_filepath), ROOTFS_HASH_NAME)
+        if not os.path.exists(hashfile):
+            raise FileMissing(f"File {ROOTFS_HASH_NAME} missing from update")
+        with open(hashfile, "rb") as fh:
+            packaged_hash = fh.readline().strip()
         try:
-            # the double pass here is
-            # temporary until we have
-            # xz size decoding working
-            with lzma.open(rootfs_filepath, "rb") as fsrc:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    total_size += len(chunk)
-                    if len(chunk) != chunk_size:
-                        break
-
-            # check that the uncompressed size is greater than the partition size
+            # The uncompressed size isn't known until the rootfs is
+            # decompressed, so check it against the partition size as we go.
             partition_size = PartitionManager.get_partition_size(part.path)
-            if total_size > partition_size:
-                msg = f"Write failed, update size ({total_size}) is larger than partition size {part.path} ({partition_size})."
-                LOG.error(msg)
-                return False, msg
-
-            with lzma.open(rootfs_filepath, "rb") as fsrc, open(
-                part.path, "wb"
-            ) as fdst:
-                while True:
-                    chunk = fsrc.read(chunk_size)
-                    fdst.write(chunk)
-                    written_size += chunk_size
-                    progress_callback(written_size / total_size)
-                    if len(chunk) != chunk_size:
-                        break
+            write_update_file(
+                update_filepath,
+                ROOTFS_NAME,
+                part.path,
+                packaged_hash,
+                progress_callback,
+                decompressor=lzma.LZMADecompressor(format=lzma.FORMAT_XZ),
+                max_size=partition_size,
+                chunk_size=chunk_size,
+            )
             return True, ""
+        except UpdateTooLarge as e:
+            msg = f"Write failed, update is larger than partition: {e}"
+            LOG.error(msg)
+            return False, msg
+        except (HashMismatch, FileMissing):
+            raise
         except Exception:
             LOG.exception("RootFSInterface::write_update exception reading")
             return False, "Unknown error"
@@ -163,8 +170,10 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> Optional[str]:
         """Worker for validation. Call in an executor (so it can return things)
 
-        - Unzips filepath to its directory
-        - Hashes the rootfs inside
+        - Unzips the hash, signature and version files to filepath's directory
+        - Checks that the rootfs is in the zip, leaving it there to be streamed
+          straight to the partition by :py:meth:`write_update`, which checks
+          its hash
         - If requested, checks the signature of the hash
         :param filepath: The path to the update zip file
         :param progress_callback: The function to call with progress between 0
@@ -173,7 +182,7 @@ class OT3UpdateActions(UpdateActionsInterface):
         :param cert_path: Path to an x.509 certificate to check the signature
                           against. If ``None``, signature checking is disabled
 
-        :returns str: Path to the rootfs file to update
+        :returns str: Path to the update zip file to write
 
         Will also raise an exception if validation fails
         """
@@ -185,16 +194,16 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidPKGName(msg)
 
-        def zip_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0)
-
         required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
         if cert_path:
             required.append(ROOTFS_SIG_NAME)
-        files, sizes = unzip_update(filepath, zip_callback, UPDATE_FILES, required)
-
-        def hash_callback(progress: Any) -> None:
-            progress_callback(progress / 2.0 + 0.5)
+        files, _ = unzip_update(
+            filepath,
+            progress_callback,
+            UPDATE_FILES,
+            required,
+            leave_zipped=[ROOTFS_NAME],
+        )
 
         version_file = str(files.get("VERSION.json"))
         version_dict = load_version_file(version_file)
@@ -204,28 +213,15 @@ class OT3UpdateActions(UpdateActionsInterface):
             LOG.error(msg)
             raise InvalidRobotType(msg)
 
-        rootfs = files.get(ROOTFS_NAME)
-        assert rootfs
-        rootfs_hash = hash_file(rootfs, hash_callback, file_size=sizes[ROOTFS_NAME])
         hashfile = files.get(ROOTFS_HASH_NAME)
         assert hashfile
-        packaged_hash = b""
-        with open(hashfile, "rb") as fh:
-            packaged_hash = fh.readline().strip()
-        if packaged_hash != rootfs_hash:
-            msg = (
-                f"Hash mismatch: calculated {rootfs_hash!r} != "
-                f"packaged {packaged_hash!r}"
-            )
-            LOG.error(msg)
-            raise HashMismatch(msg)
 
         if cert_path:
             sigfile = files.get(ROOTFS_SIG_NAME)
             assert sigfile
             verify_signature(hashfile, sigfile, cert_path)
 
-        return rootfs
+        return filepath
 
     def commit_update(self) -> None:
         """Switch the target boot partition."""
@@ -289,7 +285,8 @@ class OT3UpdateActions(UpdateActionsInterface):
     ) -> None:
         """Decompress and write update to partition
 
-        Function expects the update file to be a .xz compressed file
+        Function expects the update file to be an update zip containing a .xz
+        compressed rootfs, checked by :py:meth:`validate_update`
 
         """
 
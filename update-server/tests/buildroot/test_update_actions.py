@@ -19,59 +19,51 @@ from otupdate.common import file_actions
 def test_validate_hash_only(downloaded_update_file):
     updater = update_actions.OT2UpdateActions()
     cb = mock.Mock()
-    assert updater.validate_update(
-        downloaded_update_file,
-        cb,
-        None,
+    assert (
+        updater.validate_update(
+            downloaded_update_file,
+            cb,
+            None,
+        )
+        == downloaded_update_file
+    )
+    # We should have a callback call for the unzip of the hash file. The rootfs
+    # is left in the zip to be streamed to the partition by write_update.
+    assert cb.call_count == 1
+    assert not os.path.exists(
+        os.path.join(
+            os.path.dirname(downloaded_update_file), update_actions.ROOTFS_NAME
+        )
     )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
-    with zipfile.ZipFile(downloaded_update_file) as zf:
-        rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
-            rootfs_calls += 1
-    # only adding 1 extra call because we don’t have a signature file
-    calls = rootfs_calls + 1
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
 
 
 def test_validate(downloaded_update_file, testing_cert):
     cb = mock.Mock()
     updater = update_actions.OT2UpdateActions()
     cert_path = testing_cert
-    assert updater.validate_update(
-        downloaded_update_file,
-        cb,
-        cert_path,
+    assert (
+        updater.validate_update(
+            downloaded_update_file,
+            cb,
+            cert_path,
+        )
+        == downloaded_update_file
     )
-    # We should have a callback call for
-    # - the unzips (see test_unzip for calculation)
-    with zipfile.ZipFile(downloaded_update_file) as zf:
-        rootfs_size = zf.getinfo(update_actions.ROOTFS_NAME).file_size
-        rootfs_calls = rootfs_size // 1024
-        if rootfs_calls * 1024 != rootfs_size:
-            rootfs_calls += 1
-    calls = rootfs_calls + 2
-
-    # - the hashes, one for each chunk, the same chunks as unzip
-    calls += rootfs_calls
-    assert cb.call_count == calls
+    # We should have a callback call for the unzips of the hash and signature
+    assert cb.call_count == 2
 
 
 @pytest.mark.bad_hash
-def test_validate_catches_bad_hash(downloaded_update_file):
+def test_write_catches_bad_hash(downloaded_update_file, testing_partition):
     cb = mock.Mock()
     updater = update_actions.OT2UpdateActions()
+    update_file = updater.validate_update(
+        downloaded_update_file,
+        cb,
+        None,
+    )
     with pytest.raises(file_actions.HashMismatch):
-        updater.validate_update(
-            downloaded_update_file,
-            cb,
-            None,
-        )
+        updater.write_update(update_file, cb)
 
 
 @pytest.mark.bad_sig
@@ -122,11 +114,11 @@ def test_validate_catches_missing_image(downloaded_update_file, testing_cert):
         )
 
 
-def test_write_update(extracted_update_file, testing_partition):
+def test_write_update(downloaded_update_file, testing_partition):
     updater = update_actions.OT2UpdateActions()
-    img = os.path.join(extracted_update_file, "rootfs.ext4")
+    update_file = updater.validate_update(downloaded_update_file, mock.Mock(), None)
     cb = mock.Mock()
-    updater.write_update(img, cb)
+    updater.write_update(update_file, cb, chunk_size=1024)
 
     filesize = open(testing_partition).seek(0, 2)
 
@@ -139,12 +131,8 @@ def test_write_update(extracted_update_file, testing_partition):
     hasher = hashlib.sha256()
     hasher.update(open(testing_partition, "rb").read())
     hash_val = binascii.hexlify(hasher.digest())
-    assert (
-        hash_val
-        == open(os.path.join(extracted_update_file, "rootfs.ext4.hash"), "rb")
-        .read()
-        .strip()
-    )
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert hash_val == zf.read("rootfs.ext4.hash").strip()
 
 
 def test_commit_update(monkeypatch):
@@ -1,4 +1,7 @@
 from unittest import mock
+import binascii
+import hashlib
+import lzma
 import os
 import zipfile
 
@@ -95,3 +98,166 @@ def test_verify_signature_catches_bad_sig(extracted_update_file, testing_cert):
             os.path.join(extracted_update_file, "rootfs.ext4.hash.sig"),
             testing_cert,
         )
+
+
+def _write_zip(tmpdir, name, contents):
+    zip_path = os.path.join(tmpdir, "update.zip")
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(name, contents)
+    return zip_path
+
+
+def _hash(contents):
+    return binascii.hexlify(hashlib.sha256(contents).digest())
+
+
+@pytest.mark.parametrize("size", [0, 1000, 4096, 10000])
+def test_write_update_file(tmpdir, size):
+    contents = os.urandom(size)
+    zip_path = _write_zip(tmpdir, "rootfs.ext4", contents)
+    dest = os.path.join(tmpdir, "partition")
+    cb = mock.Mock()
+    written = file_actions.write_update_file(
+        zip_path, "rootfs.ext4", dest, _hash(contents), cb, chunk_size=4096
+    )
+    assert written == size
+    assert open(dest, "rb").read() == contents
+    assert cb.call_count == -(-size // 4096)
+
+
+def test_write_update_file_decompresses(tmpdir):
+    contents = bytes(range(256)) * 1000
+    compressed = lzma.compress(contents, format=lzma.FORMAT_XZ)
+    zip_path = _write_zip(tmpdir, "systemfs.xz", compressed)
+    dest = os.path.join(tmpdir, "partition")
+    file_actions.write_update_file(
+        zip_path,
+        "systemfs.xz",
+        dest,
+        _hash(compressed),
+        mock.Mock(),
+        decompressor=lzma.LZMADecompressor(format=lzma.FORMAT_XZ),
+        chunk_size=4096,
+    )
+    assert open(dest, "rb").read() == contents
+
+
+class _SpyDecompressor:
+    """Records the size of everything an LZMADecompressor outputs."""
+
+    def __init__(self):
+        self._decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_XZ)
+        self.output_sizes = []
+
+    def decompress(self, data, max_length=-1):
+        out = self._decompressor.decompress(data, max_length=max_length)
+        self.output_sizes.append(len(out))
+        return out
+
+    @property
+    def needs_input(self):
+        return self._decompressor.needs_input
+
+    @property
+    def eof(self):
+        return self._decompressor.eof
+
+
+def test_write_update_file_bounds_decompressed_chunks(tmpdir):
+    # Zeros compress to almost nothing, so one compressed chunk holds all of them.
+    contents = bytes(16 * 1024 * 1024)
+    compressed = lzma.compress(contents, format=lzma.FORMAT_XZ)
+    assert len(compressed) < 4096
+    zip_path = _write_zip(tmpdir, "systemfs.xz", compressed)
+    dest = os.path.join(tmpdir, "partition")
+    decompressor = _SpyDecompressor()
+    written = file_actions.write_update_file(
+        zip_path,
+        "systemfs.xz",
+        dest,
+        _hash(compressed),
+        mock.Mock(),
+        decompressor=decompressor,
+        chunk_size=4096,
+    )
+    assert written == len(contents)
+    assert open(dest, "rb").read() == contents
+    assert max(decompressor.output_sizes) == 4096
+
+
+def test_write_update_file_stops_decompressing_at_max_size(tmpdir):
+    contents = bytes(16 * 1024 * 1024)
+    compressed = lzma.compress(contents, format=lzma.FORMAT_XZ)
+    zip_path = _write_zip(tmpdir, "systemfs.xz", compressed)
+    dest = os.path.join(tmpdir, "partition")
+    decompressor = _SpyDecompressor()
+    with pytest.raises(file_actions.UpdateTooLarge):
+        file_actions.write_update_file(
+            zip_path,
+            "systemfs.xz",
+            dest,
+            _hash(compressed),
+            mock.Mock(),
+            decompressor=decompressor,
+            max_size=10000,
+            chunk_size=4096,
+        )
+    assert os.path.getsize(dest) <= 10000
+    assert sum(decompressor.output_sizes) <= 10000 + 4096
+
+
+def test_write_update_file_catches_truncated_stream(tmpdir):
+    compressed = lzma.compress(bytes(range(256)) * 1000, format=lzma.FORMAT_XZ)
+    truncated = compressed[: len(compressed) // 2]
+    zip_path = _write_zip(tmpdir, "systemfs.xz", truncated)
+    with pytest.raises(EOFError):
+        file_actions.write_update_file(
+            zip_path,
+            "systemfs.xz",
+            os.path.join(tmpdir, "partition"),
+            _hash(truncated),
+            mock.Mock(),
+            decompressor=lzma.LZMADecompressor(format=lzma.FORMAT_XZ),
+            chunk_size=4096,
+        )
+
+
+def test_write_update_file_catches_bad_hash(tmpdir):
+    zip_path = _write_zip(tmpdir, "rootfs.ext4", b"hello")
+    with pytest.raises(file_actions.HashMismatch):
+        file_actions.write_update_file(
+            zip_path,
+            "rootfs.ext4",
+            os.path.join(tmpdir, "partition"),
+            _hash(b"goodbye"),
+            mock.Mock(),
+        )
+
+
+def test_write_update_file_stops_at_max_size(tmpdir):
+    contents = os.urandom(10000)
+    zip_path = _write_zip(tmpdir, "rootfs.ext4", contents)
+    dest = os.path.join(tmpdir, "partition")
+    with pytest.raises(file_actions.UpdateTooLarge):
+        file_actions.write_update_file(
+            zip_path,
+            "rootfs.ext4",
+            dest,
+            _hash(contents),
+            mock.Mock(),
+            max_size=5000,
+            chunk_size=4096,
+        )
+    assert os.path.getsize(dest) <= 5000
+
+
+def test_write_update_file_requires_file(tmpdir):
+    zip_path = _write_zip(tmpdir, "rootfs.ext4", b"hello")
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.write_update_file(
+            zip_path,
+            "systemfs.xz",
+            os.path.join(tmpdir, "partition"),
+            _hash(b"hello"),
+            mock.Mock(),
+        )
@@ -1,20 +1,41 @@
 """Tests for OE Updater."""
+import binascii
+import hashlib
 import os
+import zipfile
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
+from otupdate.common.file_actions import HashMismatch
 from otupdate.common.update_actions import Partition
 from otupdate.openembedded.update_actions import (
     OT3UpdateActions,
     PartitionManager,
     RootFSInterface,
+    ROOTFS_HASH_NAME,
+    ROOTFS_NAME,
 )
 
 import lzma
 
 
+def write_update_zip(tmpdir, contents: bytes, bad_hash: bool = False) -> str:
+    """Write an update zip with an xz-compressed rootfs, with its hash unzipped next to it."""
+    compressed = lzma.compress(contents, format=lzma.FORMAT_XZ)
+    hashval = binascii.hexlify(hashlib.sha256(compressed).digest())
+    if bad_hash:
+        hashval = hashval[::-1]
+    zip_path = os.path.join(tmpdir, "system-update.zip")
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr(ROOTFS_NAME, compressed)
+        zf.writestr(ROOTFS_HASH_NAME, hashval + b"\n")
+    with open(os.path.join(tmpdir, ROOTFS_HASH_NAME), "wb") as fh:
+        fh.write(hashval + b"\n")
+    return zip_path
+
+
 # test valid partition switch
 
 
@@ -111,37 +132,43 @@ def test_lzma(testing_partition, tmpdir):
     """Test that lzma decompresses a .xz correctly.
 
     Updater::write_update has a callback to report progress. callback gets kicked
-    off on writing every chunk.
+    off on reading every chunk of the compressed rootfs.
 
-    This test uses callback call count to see if
+    This test uses the partition contents and the callback call count to see if
     the entire file decompresses correctly.
     """
-    rfs_path = os.path.join(tmpdir, "rootfs.xz")
-    with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
+    contents = os.urandom(400000)
+    zip_path = write_update_zip(tmpdir, contents)
     cb = mock.Mock()
     root_FS_intf = RootFSInterface()
     p = Partition(2, testing_partition, "/media/mmcblk0p2")
-    total_size = 0
     chunk_size = 1024 * 32
-    with lzma.open(rfs_path, "rb") as fsrc:
-        while True:
-            chunk = fsrc.read(chunk_size)
-            total_size += len(chunk)
-            if len(chunk) != chunk_size:
-                break
+    with zipfile.ZipFile(zip_path) as zf:
+        compressed_size = zf.getinfo(ROOTFS_NAME).file_size
     with mock.patch(
         "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
         mock.Mock(return_value=99999999),
     ):
-        success, msg = root_FS_intf.write_update(rfs_path, p, cb, chunk_size)
-        if total_size % chunk_size != 0:
-            calls = int(total_size / chunk_size) + 1
-        else:
-            calls = total_size / chunk_size
+        success, msg = root_FS_intf.write_update(zip_path, p, cb, chunk_size)
+        calls = -(-compressed_size // chunk_size)
         assert cb.call_count == calls
         assert success
         assert msg == ""
+    with open(testing_partition, "rb") as partition:
+        assert partition.read() == contents
+
+
+def test_write_update_catches_bad_hash(testing_partition, tmpdir):
+    """Test that a rootfs that doesn't match its hash fails to write."""
+    zip_path = write_update_zip(tmpdir, os.urandom(4000), bad_hash=True)
+    root_FS_intf = RootFSInterface()
+    p = Partition(2, testing_partition, "/media/mmcblk0p2")
+    with mock.patch(
+        "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
+        mock.Mock(return_value=99999999),
+    ):
+        with pytest.raises(HashMismatch):
+            root_FS_intf.write_update(zip_path, p, mock.Mock())
 
 
 def test_decomp_and_write_raises_runtime_error(
@@ -153,9 +180,7 @@ def test_decomp_and_write_raises_runtime_error(
         part_mngr=mock_partition_manager_valid_switch,
     )
 
-    rfs_path = os.path.join(tmpdir, "rootfs.xz")
-    with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
+    zip_path = write_update_zip(tmpdir, os.urandom(400000))
 
     with mock.patch(
         "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
@@ -163,7 +188,7 @@ def test_decomp_and_write_raises_runtime_error(
     ):
         # make sure we catch RunTime Exception if the update size is larger than the partition size
         try:
-            updater.decomp_and_write(rfs_path, lambda x: x(2))
+            updater.decomp_and_write(zip_path, lambda x: x(2))
             assert (
                 False
             ), "Did not raise RunTime error when update file is larger than partition."
@@ -173,25 +198,16 @@ def test_decomp_and_write_raises_runtime_error(
 
 def test_write_update_fails(testing_partition, tmpdir):
     """Test that we dont write update if update size is larger than partition size."""
-    rfs_path = os.path.join(tmpdir, "rootfs.xz")
-    with lzma.open(rfs_path, "w") as f:
-        f.write(os.urandom(400000))
+    zip_path = write_update_zip(tmpdir, os.urandom(400000))
     cb = mock.Mock()
     root_FS_intf = RootFSInterface()
     p = Partition(2, testing_partition, "/media/mmcblk0p2")
-    total_size = 0
     chunk_size = 1024 * 32
-    with lzma.open(rfs_path, "rb") as fsrc:
-        while True:
-            chunk = fsrc.read(chunk_size)
-            total_size += len(chunk)
-            if len(chunk) != chunk_size:
-                break
     with mock.patch(
         "otupdate.openembedded.update_actions.PartitionManager.get_partition_size",
         mock.Mock(return_value=1),
     ):
-        success, msg = root_FS_intf.write_update(rfs_path, p, cb, chunk_size)
+        success, msg = root_FS_intf.write_update(zip_path, p, cb, chunk_size)
         cb.assert_not_called()
         assert not success
         assert msg != ""